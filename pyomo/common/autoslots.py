@@ -71,6 +71,66 @@ def _deepcopy(obj, memo, _id):
     return deepcopy(obj, memo)
 
 
+_missing = object()
+_state_copy_plans = {}
+
+
+def _get_state_copy_plan(cls):
+    # Return a tuple of (slot name, mapper) pairs for classes that rely on
+    # the generic AutoSlots.Mixin __getstate__ / __setstate__
+    # implementations (or None if the class overrides either one).
+    if (
+        cls.__getstate__ is not AutoSlots.Mixin.__getstate__
+        or cls.__setstate__ is not AutoSlots.Mixin.__setstate__
+    ):
+        plan = None
+    else:
+        info = cls.__auto_slots__
+        plan = tuple(
+            (slot, info.slot_mappers.get(idx, None))
+            for idx, slot in enumerate(info.slots)
+        )
+    _state_copy_plans[cls] = plan
+    return plan
+
+
+def _copy_state_fields(obj, memo, new_object, plan):
+    # Equivalent to new_object.__setstate__(deepcopy(obj.__getstate__()))
+    # for classes using the generic AutoSlots.Mixin state methods.
+    setter = object.__setattr__
+    keep_alive = None
+    for slot, mapper in plan:
+        val = getattr(obj, slot)
+        if mapper is None:
+            if val.__class__ not in _atomic_types:
+                val = fast_deepcopy(val, memo)
+            setter(new_object, slot, val)
+            continue
+        val = mapper(True, val)
+        # The encoded value may be a temporary object: keep it alive
+        # until the deepcopy is finished (see __deepcopy_state__)
+        if keep_alive is None:
+            keep_alive = memo.setdefault('__auto_slots__', [])
+        keep_alive.append(val)
+        setter(new_object, slot, mapper(False, fast_deepcopy(val, memo)))
+    info = obj.__auto_slots__
+    if info.has_dict:
+        fields = {}
+        field_mappers = info.field_mappers
+        for name, val in obj.__dict__.items():
+            mapper = field_mappers.get(name, None)
+            if mapper is None:
+                fields[name] = fast_deepcopy(val, memo)
+                continue
+            val = mapper(True, val)
+            if keep_alive is None:
+                keep_alive = memo.setdefault('__auto_slots__', [])
+            keep_alive.append(val)
+            fields[name] = mapper(False, fast_deepcopy(val, memo))
+        new_object.__dict__.clear()
+        new_object.__dict__.update(fields)
+
+
 class _DeepcopyDispatcher(collections.defaultdict):
     def __missing__(self, key):
         if hasattr(key, '__deepcopy__'):
@@ -364,6 +424,23 @@ class AutoSlots(type):
             # away with only remembering the number of items in the
             # memo.
             #
+            # Most classes use the generic __getstate__/__setstate__, in
+            # which case we can copy the fields directly from this object
+            # into the new object without building (and deepcopying) the
+            # intermediate state list.
+            plan = _state_copy_plans.get(self.__class__, _missing)
+            if plan is _missing:
+                plan = _get_state_copy_plan(self.__class__)
+            if plan is not None:
+                memo_size = len(memo)
+                try:
+                    _copy_state_fields(self, memo, new_object, plan)
+                    return
+                except:
+                    # Undo any changes to the memo and fall back on the
+                    # (more cautious) generic implementation below
+                    for _ in range(len(memo) - memo_size):
+                        memo.popitem()
             state = self.__getstate__()
             # It is important to keep this temporary state alive (which
             # in turn keeps things like the temporary fields dict alive)
@@ -9,7 +9,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from pyomo.common.collections import ComponentMap, ComponentSet
 from pyomo.contrib.fbbt.expression_bounds_walker import ExpressionBoundsVisitor
 import pyomo.core.expr.relational_expr as relational_expr
@@ -22,6 +22,7 @@ from pyomo.core.expr.visitor import (
 from pyomo.core.expr.numvalue import nonpyomo_leaf_types, value
 from pyomo.core.expr.numvalue import is_fixed
 import pyomo.contrib.fbbt.interval as interval
+from pyomo.repn.linear import LinearRepnVisitor
 import math
 from pyomo.core.base.block import Block
 from pyomo.core.base.constraint import Constraint
@@ -38,6 +39,7 @@ from pyomo.common.config import (
     NonNegativeFloat,
     NonNegativeInt,
 )
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.numeric_types import native_types
 
 logger = logging.getLogger(__name__)
@@ -1380,6 +1382,11 @@ def _fbbt_block(m, config):
     This process is continued until no variable bounds are improved
     by more than tol.
 
+    If config.incremental is True (and numpy is available), the linear
+    constraints are propagated together using sparse (vectorized)
+    operations and only the constraints containing variables whose
+    bounds improved are revisited (see _IncrementalFBBT).
+
     Parameters
     ----------
     m: pyomo.core.base.block.Block or pyomo.core.base.PyomoModel.ConcreteModel
@@ -1392,6 +1399,18 @@ def _fbbt_block(m, config):
         A ComponentMap mapping from variables a tuple containing the lower and upper bounds, respectively, computed
         from FBBT.
     """
+    if config.incremental and numpy_available:
+        new_var_bounds = ComponentMap()
+        for _v in m.component_data_objects(
+            ctype=Var, active=True, descend_into=True, sort=True
+        ):
+            if _v.is_fixed():
+                _v.setlb(_v.value)
+                _v.setub(_v.value)
+                new_var_bounds[_v] = (_v.value, _v.value)
+        new_var_bounds.update(_IncrementalFBBT(m, config).run())
+        return new_var_bounds
+
     new_var_bounds = ComponentMap()
     var_to_con_map = ComponentMap()
     var_lbs = ComponentMap()
@@ -1464,6 +1483,297 @@ def _fbbt_block(m, config):
     return new_var_bounds
 
 
+class _IncrementalFBBT(object):
+    """Work-queue based FBBT for a block (see :func:`_fbbt_block`)
+
+    The active constraints are split into linear constraints (whose
+    bodies are collected into a sparse matrix and whose bounds are
+    propagated using vectorized NumPy operations) and all other
+    constraints (which are processed one at a time with
+    :func:`_fbbt_con`).  A variable-to-constraint incidence index is
+    built once; after the initial pass, only constraints that contain
+    a variable whose bounds improved by more than ``improvement_tol``
+    are revisited.
+
+    """
+
+    def __init__(self, m, config):
+        self.config = config
+        # Column (variable) data
+        self.var_list = []
+        self.var_index = {}
+        # Nonlinear constraints and the incidence index for them
+        self.nl_cons = []
+        self.nl_var_cons = []
+        # Linear constraints (rows) in COO form
+        self.lin_cons = []
+        rows = []
+        cols = []
+        coefs = []
+        row_lb = []
+        row_ub = []
+
+        visitor = LinearRepnVisitor({})
+        var_map = visitor.var_map
+        for c in m.component_data_objects(
+            ctype=Constraint, active=True, descend_into=config.descend_into, sort=True
+        ):
+            repn = self._linear_repn(visitor, c)
+            if repn is None:
+                nl_idx = len(self.nl_cons)
+                self.nl_cons.append(c)
+                for v in identify_variables(c.body):
+                    self.nl_var_cons[self._column(v)].append(nl_idx)
+                continue
+            row = len(self.lin_cons)
+            self.lin_cons.append(c)
+            lb = c.lb
+            ub = c.ub
+            row_lb.append(-interval.inf if lb is None else lb - repn.constant)
+            row_ub.append(interval.inf if ub is None else ub - repn.constant)
+            for vid, coef in repn.linear.items():
+                if not coef:
+                    continue
+                rows.append(row)
+                cols.append(self._column(var_map[vid]))
+                coefs.append(coef)
+
+        n = len(self.var_list)
+        self.var_lb = np.array(
+            [-interval.inf if v.lb is None else v.lb for v in self.var_list],
+            dtype=float,
+        )
+        self.var_ub = np.array(
+            [interval.inf if v.ub is None else v.ub for v in self.var_list], dtype=float
+        )
+        self.is_int = np.array(
+            [v.is_integer() or v.is_binary() for v in self.var_list], dtype=bool
+        )
+
+        n_rows = len(self.lin_cons)
+        self.row_lb = np.array(row_lb, dtype=float)
+        self.row_ub = np.array(row_ub, dtype=float)
+        self.row_active = np.ones(n_rows, dtype=bool)
+        self.nz_row = np.array(rows, dtype=np.intp)
+        self.nz_col = np.array(cols, dtype=np.intp)
+        self.nz_coef = np.array(coefs, dtype=float)
+        # Column-major (CSC) index into the nonzeros, used to find the
+        # rows that contain a variable
+        self.col_order = np.argsort(self.nz_col, kind='stable')
+        self.col_ptr = np.zeros(n + 1, dtype=np.intp)
+        np.cumsum(np.bincount(self.nz_col, minlength=n), out=self.col_ptr[1:])
+
+        self.n_cons = n_rows + len(self.nl_cons)
+
+    def _column(self, v):
+        idx = self.var_index.get(id(v), None)
+        if idx is None:
+            idx = self.var_index[id(v)] = len(self.var_list)
+            self.var_list.append(v)
+            self.nl_var_cons.append([])
+        return idx
+
+    @staticmethod
+    def _linear_repn(visitor, con):
+        # Return the LinearRepn of the constraint body, or None if the
+        # body is not linear (or cannot be processed by the linear
+        # fast path)
+        try:
+            repn = visitor.walk_expression(con.body)
+            con.lb, con.ub
+        except Exception:
+            return None
+        if repn.nonlinear is not None or not repn.linear:
+            return None
+        if repn.constant.__class__ not in native_types or any(
+            coef.__class__ not in native_types for coef in repn.linear.values()
+        ):
+            return None
+        return repn
+
+    def run(self):
+        config = self.config
+        tol = config.improvement_tol
+        max_fbbt = self.n_cons * config.max_iter
+        n_fbbt = 0
+
+        dirty_rows = self.row_active.copy()
+        nl_queue = deque(range(len(self.nl_cons)))
+        in_queue = [True] * len(self.nl_cons)
+
+        while dirty_rows.any() or nl_queue:
+            if dirty_rows.any():
+                n_fbbt += int(dirty_rows.sum())
+                improved = self._propagate_linear(dirty_rows)
+                dirty_rows[:] = False
+                self._mark_improved(improved, dirty_rows, nl_queue, in_queue)
+                if n_fbbt >= max_fbbt:
+                    break
+            while nl_queue:
+                if n_fbbt >= max_fbbt:
+                    break
+                idx = nl_queue.popleft()
+                in_queue[idx] = False
+                new_bounds = _fbbt_con(self.nl_cons[idx], config)
+                n_fbbt += 1
+                improved = []
+                for v, (lb, ub) in new_bounds.items():
+                    col = self.var_index.get(id(v), None)
+                    if col is None:
+                        continue
+                    if lb is not None and lb > self.var_lb[col]:
+                        if lb > self.var_lb[col] + tol:
+                            improved.append(col)
+                        self.var_lb[col] = lb
+                    if ub is not None and ub < self.var_ub[col]:
+                        if ub < self.var_ub[col] - tol:
+                            improved.append(col)
+                        self.var_ub[col] = ub
+                self._mark_improved(improved, dirty_rows, nl_queue, in_queue)
+            if n_fbbt >= max_fbbt:
+                break
+
+        new_var_bounds = ComponentMap()
+        for v, lb, ub in zip(self.var_list, self.var_lb.tolist(), self.var_ub.tolist()):
+            new_var_bounds[v] = (
+                None if lb == -interval.inf else lb,
+                None if ub == interval.inf else ub,
+            )
+        return new_var_bounds
+
+    def _mark_improved(self, improved, dirty_rows, nl_queue, in_queue):
+        if not len(improved):
+            return
+        col_ptr = self.col_ptr
+        for col in set(improved):
+            rows = self.nz_row[self.col_order[col_ptr[col] : col_ptr[col + 1]]]
+            dirty_rows[rows] = True
+            for idx in self.nl_var_cons[col]:
+                if not in_queue[idx]:
+                    in_queue[idx] = True
+                    nl_queue.append(idx)
+        dirty_rows &= self.row_active
+
+    def _propagate_linear(self, dirty_rows):
+        """Propagate bounds through all (dirty) linear rows at once
+
+        Returns the columns whose bounds improved by more than
+        ``improvement_tol``.
+        """
+        config = self.config
+        feas_tol = config.feasibility_tol
+        inf = interval.inf
+        n_rows = len(self.lin_cons)
+
+        nz = np.flatnonzero(dirty_rows[self.nz_row])
+        row = self.nz_row[nz]
+        col = self.nz_col[nz]
+        coef = self.nz_coef[nz]
+        pos = coef > 0
+
+        # Bounds on each term (coef * var)
+        xl = self.var_lb[col]
+        xu = self.var_ub[col]
+        t_min = np.where(pos, coef * xl, coef * xu)
+        t_max = np.where(pos, coef * xu, coef * xl)
+        inf_min = t_min == -inf
+        inf_max = t_max == inf
+        t_min[inf_min] = 0
+        t_max[inf_max] = 0
+
+        # Row activity: finite part and the number of infinite terms
+        sum_min = np.bincount(row, weights=t_min, minlength=n_rows)
+        sum_max = np.bincount(row, weights=t_max, minlength=n_rows)
+        n_inf_min = np.bincount(row, weights=inf_min, minlength=n_rows)
+        n_inf_max = np.bincount(row, weights=inf_max, minlength=n_rows)
+
+        act_min = np.where(n_inf_min > 0, -inf, sum_min)
+        act_max = np.where(n_inf_max > 0, inf, sum_max)
+        row_lb = self.row_lb
+        row_ub = self.row_ub
+        infeasible = dirty_rows & (
+            (act_min > row_ub + feas_tol) | (act_max < row_lb - feas_tol)
+        )
+        if infeasible.any():
+            raise InfeasibleConstraintException(
+                'Detected an infeasible constraint during FBBT: {0}'.format(
+                    self.lin_cons[np.flatnonzero(infeasible)[0]]
+                )
+            )
+        if config.deactivate_satisfied_constraints:
+            satisfied = dirty_rows & (act_max <= row_ub + feas_tol)
+            satisfied &= act_min >= row_lb - feas_tol
+            eq = row_lb == row_ub
+            satisfied[eq] &= act_max[eq] - act_min[eq] <= feas_tol
+            for i in np.flatnonzero(satisfied):
+                self.lin_cons[i].deactivate()
+            self.row_active[satisfied] = False
+
+        # Activity of the other terms in the row (excluding this term)
+        res_min = np.where(n_inf_min[row] - inf_min > 0, -inf, sum_min[row] - t_min)
+        res_max = np.where(n_inf_max[row] - inf_max > 0, inf, sum_max[row] - t_max)
+        # Implied bounds on the term, and then on the variable
+        term_lb = row_lb[row] - res_max
+        term_ub = row_ub[row] - res_min
+        new_lb = np.where(pos, term_lb, term_ub) / coef
+        new_ub = np.where(pos, term_ub, term_lb) / coef
+
+        lb = self.var_lb.copy()
+        ub = self.var_ub.copy()
+        np.maximum.at(lb, col, new_lb)
+        np.minimum.at(ub, col, new_ub)
+
+        changed = np.flatnonzero((lb > self.var_lb) | (ub < self.var_ub))
+        if not len(changed):
+            return changed
+        orig_lb = self.var_lb[changed]
+        orig_ub = self.var_ub[changed]
+        c_lb = lb[changed]
+        c_ub = ub[changed]
+
+        # Integer variables (see _FBBTVisitorRootToLeaf)
+        is_int = self.is_int[changed]
+        if is_int.any():
+            int_tol = config.integer_tol
+            with np.errstate(invalid='ignore'):
+                r_lb = np.maximum(np.floor(c_lb), np.ceil(c_lb - int_tol))
+                r_ub = np.minimum(np.ceil(c_ub), np.floor(c_ub + int_tol))
+            c_lb = np.where(is_int & (c_lb > -inf), np.maximum(r_lb, orig_lb), c_lb)
+            c_ub = np.where(is_int & (c_ub < inf), np.minimum(r_ub, orig_ub), c_ub)
+
+        crossed = c_lb > c_ub
+        if crossed.any():
+            if (c_lb[crossed] - feas_tol > c_ub[crossed]).any():
+                i = np.flatnonzero(crossed & (c_lb - feas_tol > c_ub))[0]
+                raise InfeasibleConstraintException(
+                    'Lower bound ({1}) computed for variable {0} is larger '
+                    'than the computed upper bound ({2}).'.format(
+                        self.var_list[changed[i]], c_lb[i], c_ub[i]
+                    )
+                )
+            c_lb[crossed] = np.maximum(c_lb[crossed] - feas_tol, orig_lb[crossed])
+            c_ub[crossed] = np.minimum(c_ub[crossed] + feas_tol, orig_ub[crossed])
+
+        tol = config.improvement_tol
+        improved = changed[(c_lb > orig_lb + tol) | (c_ub < orig_ub - tol)]
+        self.var_lb[changed] = c_lb
+        self.var_ub[changed] = c_ub
+        var_list = self.var_list
+        for i, new_lb, new_ub, old_lb, old_ub in zip(
+            changed.tolist(),
+            c_lb.tolist(),
+            c_ub.tolist(),
+            orig_lb.tolist(),
+            orig_ub.tolist(),
+        ):
+            v = var_list[i]
+            if new_lb != old_lb:
+                v.setlb(new_lb)
+            if new_ub != old_ub:
+                v.setub(new_ub)
+        return improved
+
+
 def fbbt(
     comp,
     deactivate_satisfied_constraints=False,
@@ -1472,6 +1782,7 @@ def fbbt(
     max_iter=10,
     improvement_tol=1e-4,
     descend_into=True,
+    incremental=False,
 ):
     """
     Perform FBBT on a constraint, block, or model. For more control,
@@ -1507,6 +1818,14 @@ def fbbt(
         every constraint in the Block. We then attempt to identify which constraints to repeat FBBT on based on the
         improvement in variable bounds. If the bounds on a variable improve by more than improvement_tol, then FBBT
         is performed on the constraints using that Var.
+    descend_into: bool or type
+        Used for Blocks only. Passed to component_data_objects when collecting the constraints in the Block.
+    incremental: bool
+        Used for Blocks only. If True, the linear constraints in the Block are collected into a sparse matrix
+        and bounds are propagated through all of them at once using vectorized (numpy) operations, while the
+        remaining constraints are processed one at a time from a work queue. After the first pass, only
+        constraints containing a variable whose bounds improved by more than improvement_tol are revisited.
+        This is typically much faster for large models with many linear constraints.
 
     Returns
     -------
@@ -1531,6 +1850,9 @@ def fbbt(
     config.declare('max_iter', mi_config)
     config.declare('improvement_tol', improvement_tol_config)
     config.declare('descend_into', descend_into_config)
+    config.declare(
+        'incremental', ConfigValue(default=incremental, domain=In({True, False}))
+    )
 
     new_var_bounds = ComponentMap()
     if comp.ctype == Constraint:
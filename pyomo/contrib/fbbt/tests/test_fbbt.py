@@ -33,6 +33,13 @@ class DummyExpr(ProductExpression):
     pass
 
 
+def incremental_fbbt(comp, **kwds):
+    return fbbt(comp, incremental=True, **kwds)
+
+
+python_tighteners = (fbbt, incremental_fbbt)
+
+
 class FbbtTestBase(object):
     """
     These tests are set up weird, but it is for a good reason.
@@ -1019,7 +1026,7 @@ class FbbtTestBase(object):
         m.c = pyo.Constraint(expr=m.x + m.y >= 0)
         self.tightener(m)
         self.assertTrue(m.c.active)
-        if self.tightener is fbbt:
+        if self.tightener in python_tighteners:
             self.tightener(m, deactivate_satisfied_constraints=True)
         else:
             self.it.config.deactivate_satisfied_constraints = True
@@ -1037,7 +1044,7 @@ class FbbtTestBase(object):
         m.c[1] = m.x[1] == m.x[2]
         m.x[2].setlb(-1)
         m.x[2].setub(1)
-        if self.tightener is fbbt:
+        if self.tightener in python_tighteners:
             self.tightener(m, max_iter=1)
         else:
             self.it.config.max_iter = 1
@@ -1059,7 +1066,7 @@ class FbbtTestBase(object):
         self.assertEqual(m.z.ub, None)
 
     def test_skip_unknown_expression1(self):
-        if self.tightener is not fbbt:
+        if self.tightener not in python_tighteners:
             raise unittest.SkipTest(
                 'Appsi FBBT does not support unknown expressions yet'
             )
@@ -1081,7 +1088,7 @@ class FbbtTestBase(object):
         self.assertIn("Unsupported expression type for FBBT", OUT.getvalue())
 
     def test_skip_unknown_expression2(self):
-        if self.tightener is not fbbt:
+        if self.tightener not in python_tighteners:
             raise unittest.SkipTest(
                 'Appsi FBBT does not support unknown expressions yet'
             )
@@ -1288,7 +1295,7 @@ class FbbtTestBase(object):
     @unittest.skipUnless(flib, 'Could not find the "asl_external_demo.so" library')
     @unittest.skipIf(is_pypy, 'Cannot evaluate external functions under pypy')
     def test_external_function(self):
-        if self.tightener is not fbbt:
+        if self.tightener not in python_tighteners:
             raise unittest.SkipTest(
                 'Appsi FBBT does not support unknown expressions yet'
             )
@@ -1390,3 +1397,53 @@ class TestFBBT(FbbtTestBase, unittest.TestCase):
                     _before_child_handlers.pop(t, None)
                 else:
                     _before_child_handlers[t] = fcn
+
+
+@unittest.skipUnless(numpy_available, 'Numpy is not available')
+class TestIncrementalFBBT(TestFBBT):
+    def setUp(self) -> None:
+        self.tightener = incremental_fbbt
+
+    def _build_model(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(20)
+        m.x = pyo.Var(m.I, bounds=(-10, 10))
+        m.y = pyo.Var(m.I)
+        m.z = pyo.Var(m.I, domain=pyo.Integers, bounds=(-20, 20))
+        m.lin = pyo.Constraint(
+            m.I, rule=lambda m, i: m.y[i] == 0.5 * m.x[i] + m.x[i % 20 + 1] - 1
+        )
+        m.int = pyo.Constraint(m.I, rule=lambda m, i: 3 * m.z[i] <= m.y[i] + 0.5)
+        m.nl = pyo.Constraint(
+            m.I, rule=lambda m, i: m.x[i] ** 2 + pyo.exp(m.y[i]) <= 5 + i
+        )
+        m.r = pyo.Constraint(expr=pyo.inequality(-3, sum(m.z.values()), 3))
+        return m
+
+    def test_matches_tree_fbbt(self):
+        m1 = self._build_model()
+        m2 = self._build_model()
+        new_bounds = incremental_fbbt(m1)
+        fbbt(m2)
+        for v1, v2 in zip(
+            m1.component_data_objects(pyo.Var, sort=True),
+            m2.component_data_objects(pyo.Var, sort=True),
+        ):
+            self.assertEqual(v1.name, v2.name)
+            for b1, b2 in zip(v1.bounds, v2.bounds):
+                if b2 is None:
+                    self.assertIsNone(b1)
+                else:
+                    self.assertAlmostEqual(b1, b2, places=6)
+            self.assertEqual(new_bounds[v1], v1.bounds)
+
+    def test_linear_infeasible(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(bounds=(0, 1))
+        m.y = pyo.Var(bounds=(0, 1))
+        m.c = pyo.Constraint(expr=m.x + 2 * m.y >= 4)
+        with self.assertRaisesRegex(
+            InfeasibleConstraintException,
+            'Detected an infeasible constraint during FBBT: c',
+        ):
+            self.tightener(m)
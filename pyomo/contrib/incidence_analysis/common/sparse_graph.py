@@ -0,0 +1,284 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""
+This module implements maximum matching, connected components, block
+triangularization, and the coarse Dulmage-Mendelsohn partition directly on
+SciPy sparse (biadjacency) matrices using ``scipy.sparse.csgraph``. No
+NetworkX graphs are constructed, which makes these functions suitable for
+very large incidence matrices. Like the other modules in this directory,
+it does not depend on the rest of the package.
+
+In all functions, rows and columns are the two bipartite sets of the graph
+and results are returned in terms of integer row and column coordinates.
+"""
+
+import heapq
+
+from pyomo.common.dependencies import numpy as np, scipy as sp
+
+
+def _to_csr(matrix):
+    # csgraph routines operate on CSR matrices; we only care about the
+    # sparsity structure, so all stored entries are treated as edges
+    # (including explicit zeros).
+    matrix = sp.sparse.csr_matrix(matrix)
+    return sp.sparse.csr_matrix(
+        (np.ones(len(matrix.indices), dtype=np.int8), matrix.indices, matrix.indptr),
+        shape=matrix.shape,
+    )
+
+
+def _matching_arrays(matrix, matching):
+    # Return arrays mapping rows to their matched column and columns to
+    # their matched row (-1 for unmatched nodes)
+    M, N = matrix.shape
+    if matching is None:
+        row_match = sp.sparse.csgraph.maximum_bipartite_matching(
+            matrix, perm_type="column"
+        )
+        row_match = np.asarray(row_match, dtype=np.intp)
+    else:
+        row_match = np.full(M, -1, dtype=np.intp)
+        if matching:
+            rows, cols = zip(*matching.items())
+            row_match[list(rows)] = cols
+    col_match = np.full(N, -1, dtype=np.intp)
+    matched = np.flatnonzero(row_match >= 0)
+    col_match[row_match[matched]] = matched
+    return row_match, col_match
+
+
+def maximum_matching(matrix):
+    """Return a maximum cardinality matching of the rows and columns of a
+    sparse matrix
+
+    Parameters
+    ----------
+    matrix: ``scipy.sparse`` matrix
+        Biadjacency matrix of the bipartite graph
+
+    Returns
+    -------
+    dict
+        Maps matched row coordinates to their matched column coordinates
+
+    """
+    row_match, _ = _matching_arrays(_to_csr(matrix), None)
+    rows = np.flatnonzero(row_match >= 0)
+    return dict(zip(rows.tolist(), row_match[rows].tolist()))
+
+
+def _group(labels, order, n_groups):
+    # Partition the (sorted) indices by label, returning groups in the
+    # order given by ``order`` (an array of labels)
+    idx = np.argsort(labels, kind="stable")
+    counts = np.bincount(labels, minlength=n_groups)
+    groups = np.split(idx, np.cumsum(counts)[:-1])
+    return [groups[label].tolist() for label in order]
+
+
+def connected_components(matrix):
+    """Partition the rows and columns of a sparse matrix into the connected
+    components of its bipartite graph
+
+    Components are returned in order of their first node, where rows
+    precede columns.
+
+    Returns
+    -------
+    row_blocks: list of lists
+        Partition of row coordinates
+    col_blocks: list of lists
+        Partition of column coordinates
+
+    """
+    matrix = _to_csr(matrix)
+    M, N = matrix.shape
+    bipartite = sp.sparse.bmat([[None, matrix], [matrix.T, None]], format="csr")
+    n_cc, labels = sp.sparse.csgraph.connected_components(bipartite, directed=False)
+    order = np.arange(n_cc)
+    return (_group(labels[:M], order, n_cc), _group(labels[M:], order, n_cc))
+
+
+def _topological_order(n_nodes, src, dst):
+    # Topological order of a DAG given by arrays of edges.  Ties are
+    # broken by node index.
+    indptr = np.zeros(n_nodes + 1, dtype=np.intp)
+    np.cumsum(np.bincount(src, minlength=n_nodes), out=indptr[1:])
+    succ = dst[np.argsort(src, kind="stable")].tolist()
+    indptr = indptr.tolist()
+    in_degree = np.bincount(dst, minlength=n_nodes).tolist()
+    heap = [i for i in range(n_nodes) if not in_degree[i]]
+    order = []
+    while heap:
+        node = heapq.heappop(heap)
+        order.append(node)
+        for s in succ[indptr[node] : indptr[node + 1]]:
+            in_degree[s] -= 1
+            if not in_degree[s]:
+                heapq.heappush(heap, s)
+    return order
+
+
+def block_triangularize(matrix, matching=None):
+    """Compute ordered partitions of the rows and columns of a square sparse
+    matrix that permute it to block lower triangular form
+
+    The diagonal blocks are the strongly connected components of the
+    bipartite graph projected onto the rows with respect to a perfect
+    matching, and are returned in a topological order. Within each block,
+    rows are sorted and columns are ordered by their matched rows.
+
+    Parameters
+    ----------
+    matrix: ``scipy.sparse`` matrix
+        Square matrix to permute
+    matching: dict
+        Optional perfect matching, mapping row coordinates to column
+        coordinates
+
+    Returns
+    -------
+    row_partition: list of lists
+        Partition of row coordinates
+    col_partition: list of lists
+        Partition of column coordinates
+
+    """
+    matrix = _to_csr(matrix)
+    M, N = matrix.shape
+    if M != N:
+        raise RuntimeError(
+            "block_triangularize does not support bipartite graphs with"
+            " bipartite sets of different cardinalities. Got sizes %s and"
+            " %s." % (M, N)
+        )
+    row_match, col_match = _matching_arrays(matrix, matching)
+    n_matched = int(np.count_nonzero(row_match >= 0))
+    if n_matched != M:
+        raise RuntimeError(
+            "block_triangularize does not support bipartite graphs without"
+            " a perfect matching. Got a graph with %s nodes per bipartite set"
+            " and a matching of cardinality %s." % (M, n_matched)
+        )
+    # Project onto the rows: row i must be solved before row j if j is
+    # incident on the column matched with i.
+    coo = matrix.tocoo()
+    src = col_match[coo.col]
+    dst = coo.row
+    projected = sp.sparse.csr_matrix(
+        (np.ones(len(src), dtype=np.int8), (src, dst)), shape=(M, M)
+    )
+    n_scc, labels = sp.sparse.csgraph.connected_components(
+        projected, directed=True, connection="strong"
+    )
+    cross = labels[src] != labels[dst]
+    scc_src = labels[src[cross]]
+    scc_dst = labels[dst[cross]]
+    if (scc_src > scc_dst).all():
+        # SciPy labels strongly connected components in the order in
+        # which they are completed, i.e., in reverse topological order.
+        order = np.arange(n_scc - 1, -1, -1)
+    else:
+        order = _topological_order(n_scc, scc_src, scc_dst)
+    row_partition = _group(labels, order, n_scc)
+    col_partition = [row_match[rows].tolist() for rows in row_partition]
+    return row_partition, col_partition
+
+
+def _reachable(n_nodes, src, dst, sources):
+    # Nodes reachable from any of the sources (excluding the sources),
+    # sorted by index
+    if not len(sources):
+        return np.empty(0, dtype=np.intp)
+    # Connect a "super-source" (node n_nodes) to all sources
+    src = np.concatenate((src, np.full(len(sources), n_nodes, dtype=np.intp)))
+    dst = np.concatenate((dst, sources))
+    graph = sp.sparse.csr_matrix(
+        (np.ones(len(src), dtype=np.int8), (src, dst)), shape=(n_nodes + 1, n_nodes + 1)
+    )
+    nodes = sp.sparse.csgraph.breadth_first_order(
+        graph, n_nodes, directed=True, return_predecessors=False
+    )
+    reached = np.zeros(n_nodes + 1, dtype=bool)
+    reached[nodes] = True
+    reached[sources] = False
+    return np.flatnonzero(reached[:n_nodes])
+
+
+def dulmage_mendelsohn(matrix, matching=None):
+    """The coarse Dulmage-Mendelsohn partition of the rows and columns of a
+    sparse matrix
+
+    Parameters
+    ----------
+    matrix: ``scipy.sparse`` matrix
+        Matrix to partition
+    matching: dict
+        Optional maximum cardinality matching, mapping row coordinates to
+        column coordinates
+
+    Returns
+    -------
+    row_partition: tuple of lists
+        Rows partitioned into unmatched, overconstrained, underconstrained,
+        and square subsets
+    col_partition: tuple of lists
+        Columns partitioned into unmatched, underconstrained,
+        overconstrained, and square subsets
+
+    """
+    matrix = _to_csr(matrix)
+    M, N = matrix.shape
+    row_match, col_match = _matching_arrays(matrix, matching)
+    coo = matrix.tocoo()
+    row = coo.row.astype(np.intp)
+    col = coo.col.astype(np.intp)
+
+    row_unmatched = np.flatnonzero(row_match < 0)
+    col_unmatched = np.flatnonzero(col_match < 0)
+
+    # Alternating paths from unmatched rows: row -> (incident column) ->
+    # row matched with that column
+    keep = col_match[col] >= 0
+    row_reachable = _reachable(M, row[keep], col_match[col[keep]], row_unmatched)
+    # Alternating paths from unmatched columns: column -> (incident row)
+    # -> column matched with that row
+    keep = row_match[row] >= 0
+    col_reachable = _reachable(N, col[keep], row_match[row[keep]], col_unmatched)
+
+    # Rows (columns) matched with the columns (rows) reachable from the
+    # unmatched columns (rows)
+    row_matched_with_reachable = col_match[col_reachable]
+    col_matched_with_reachable = row_match[row_reachable]
+
+    in_partition = np.zeros(M, dtype=bool)
+    in_partition[row_unmatched] = True
+    in_partition[row_reachable] = True
+    in_partition[row_matched_with_reachable] = True
+    row_other = np.flatnonzero(~in_partition)
+    col_other = row_match[row_other]
+
+    return (
+        (
+            row_unmatched.tolist(),
+            row_reachable.tolist(),
+            row_matched_with_reachable.tolist(),
+            row_other.tolist(),
+        ),
+        (
+            col_unmatched.tolist(),
+            col_reachable.tolist(),
+            col_matched_with_reachable.tolist(),
+            col_other.tolist(),
+        ),
+    )
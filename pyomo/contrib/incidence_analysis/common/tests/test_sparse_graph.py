@@ -0,0 +1,131 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import (
+    networkx_available,
+    numpy as np,
+    numpy_available,
+    scipy as sp,
+    scipy_available,
+)
+from pyomo.contrib.incidence_analysis.common import sparse_graph
+
+if networkx_available:
+    from pyomo.contrib.incidence_analysis.triangularize import (
+        block_triangularize as nx_block_triangularize,
+    )
+    from pyomo.contrib.incidence_analysis.dulmage_mendelsohn import (
+        dulmage_mendelsohn as nx_dulmage_mendelsohn,
+    )
+    from pyomo.contrib.incidence_analysis.connected import get_independent_submatrices
+
+
+def _random_matrix(M, N, density, seed):
+    return sp.sparse.random(M, N, density=density, random_state=seed, format="coo")
+
+
+@unittest.skipUnless(numpy_available, "numpy is not available")
+@unittest.skipUnless(scipy_available, "scipy is not available")
+class TestSparseGraph(unittest.TestCase):
+    def _assert_lower_triangular(self, matrix, row_partition, col_partition):
+        matrix = matrix.tocoo()
+        row_block = np.empty(matrix.shape[0], dtype=int)
+        col_block = np.empty(matrix.shape[1], dtype=int)
+        for idx, (rows, cols) in enumerate(zip(row_partition, col_partition)):
+            self.assertEqual(len(rows), len(cols))
+            row_block[rows] = idx
+            col_block[cols] = idx
+        self.assertTrue((col_block[matrix.col] <= row_block[matrix.row]).all())
+
+    def test_maximum_matching(self):
+        matrix = sp.sparse.coo_matrix(
+            ([1, 1, 1, 1], ([0, 0, 1, 2], [0, 1, 0, 2])), shape=(3, 3)
+        )
+        matching = sparse_graph.maximum_matching(matrix)
+        self.assertEqual(matching, {0: 1, 1: 0, 2: 2})
+
+    def test_block_triangularize(self):
+        # Rows 1 and 2 form a 2x2 block that depends on row 0. Row 3
+        # depends on the 2x2 block.
+        row = [0, 1, 1, 1, 2, 2, 3, 3]
+        col = [0, 0, 1, 2, 1, 2, 3, 2]
+        matrix = sp.sparse.coo_matrix((np.ones(len(row)), (row, col)), shape=(4, 4))
+        row_partition, col_partition = sparse_graph.block_triangularize(matrix)
+        self.assertEqual(row_partition, [[0], [1, 2], [3]])
+        self.assertEqual([sorted(cols) for cols in col_partition], [[0], [1, 2], [3]])
+        self._assert_lower_triangular(matrix, row_partition, col_partition)
+
+    def test_block_triangularize_not_square(self):
+        matrix = sp.sparse.identity(3, format="csr")[:, :2]
+        with self.assertRaisesRegex(RuntimeError, "different cardinalities"):
+            sparse_graph.block_triangularize(matrix)
+
+    def test_block_triangularize_structurally_singular(self):
+        matrix = sp.sparse.coo_matrix(([1, 1], ([0, 1], [0, 0])), shape=(2, 2))
+        with self.assertRaisesRegex(RuntimeError, "without a perfect matching"):
+            sparse_graph.block_triangularize(matrix)
+
+    def test_topological_order_fallback(self):
+        # 3 -> 1 -> 0, 2 -> 0
+        order = sparse_graph._topological_order(
+            4, np.array([3, 1, 2]), np.array([1, 0, 0])
+        )
+        self.assertEqual(order, [2, 3, 1, 0])
+
+    @unittest.skipUnless(networkx_available, "networkx is not available")
+    def test_compare_networkx(self):
+        for seed in range(100):
+            M = 2 + seed % 10
+            N = M if seed % 2 else 2 + (seed // 2) % 10
+            matrix = _random_matrix(M, N, 0.05 + 0.3 * (seed % 7) / 7, seed)
+
+            if M == N:
+                matrix = (matrix + sp.sparse.identity(M)).tocoo()
+                nx_rows, nx_cols = nx_block_triangularize(matrix)
+                rows, cols = sparse_graph.block_triangularize(matrix)
+                self.assertEqual(
+                    sorted(map(sorted, nx_rows)), sorted(map(sorted, rows))
+                )
+                self.assertEqual(
+                    sorted(map(sorted, nx_cols)), sorted(map(sorted, cols))
+                )
+                self._assert_lower_triangular(matrix, rows, cols)
+
+            # The unmatched and overconstrained (underconstrained) subsets
+            # depend on the matching, but their union does not.
+            nx_rdmp, nx_cdmp = nx_dulmage_mendelsohn(matrix)
+            rdmp, cdmp = sparse_graph.dulmage_mendelsohn(matrix)
+            self.assertEqual(set(nx_rdmp[0] + nx_rdmp[1]), set(rdmp[0] + rdmp[1]))
+            self.assertEqual(set(nx_rdmp[3]), set(rdmp[3]))
+            self.assertEqual(set(nx_cdmp[0] + nx_cdmp[1]), set(cdmp[0] + cdmp[1]))
+            self.assertEqual(set(nx_cdmp[3]), set(cdmp[3]))
+            # Corresponding subsets zip into pairs of the matching
+            nonzeros = set(zip(matrix.row.tolist(), matrix.col.tolist()))
+            for rows, cols in [
+                (rdmp[2], cdmp[1]),
+                (rdmp[1], cdmp[2]),
+                (rdmp[3], cdmp[3]),
+            ]:
+                self.assertEqual(len(rows), len(cols))
+                for pair in zip(rows, cols):
+                    self.assertIn(pair, nonzeros)
+
+            nx_rblocks, nx_cblocks = get_independent_submatrices(matrix)
+            rblocks, cblocks = sparse_graph.connected_components(matrix)
+            self.assertEqual(
+                sorted(zip(map(sorted, nx_rblocks), map(sorted, nx_cblocks))),
+                sorted(zip(rblocks, cblocks)),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -35,6 +35,19 @@ class IncidenceMethod(enum.Enum):
     """Use ``pyomo.repn.ampl.AMPLRepnVisitor``"""
 
 
+class IncidenceGraphBackend(enum.Enum):
+    """Data structures and algorithms used to store and analyze a cached
+    incidence graph"""
+
+    networkx = 0
+    """Store a ``networkx.Graph`` and use NetworkX algorithms"""
+
+    scipy = 1
+    """Store a ``scipy.sparse.csr_matrix`` and use ``scipy.sparse.csgraph``
+    algorithms
+    """
+
+
 class IncidenceOrder(enum.Enum):
 
     dulmage_mendelsohn_upper = 0
@@ -20,16 +20,23 @@ from pyomo.core.base.var import Var
 from pyomo.core.base.constraint import Constraint
 from pyomo.core.base.objective import Objective
 from pyomo.core.expr import EqualityExpression
+from pyomo.core.expr.visitor import identify_variables
 from pyomo.util.subsystems import create_subsystem_block
 from pyomo.common.collections import ComponentSet, ComponentMap
+from pyomo.common.config import InEnum
 from pyomo.common.dependencies import (
     attempt_import,
     networkx as nx,
+    numpy as np,
     scipy as sp,
     plotly,
 )
 from pyomo.common.deprecation import deprecated, deprecation_warning
-from pyomo.contrib.incidence_analysis.config import get_config_from_kwds
+from pyomo.common.modeling import NOTSET
+from pyomo.contrib.incidence_analysis.config import (
+    IncidenceGraphBackend,
+    get_config_from_kwds,
+)
 from pyomo.contrib.incidence_analysis.matching import maximum_matching
 from pyomo.contrib.incidence_analysis.connected import get_independent_submatrices
 from pyomo.contrib.incidence_analysis.triangularize import (
@@ -44,6 +51,7 @@ from pyomo.contrib.incidence_analysis.dulmage_mendelsohn import (
     ColPartition,
 )
 from pyomo.contrib.incidence_analysis.incidence import get_incident_variables
+from pyomo.contrib.incidence_analysis.common import sparse_graph
 from pyomo.contrib.pynumero.asl import AmplInterface
 
 pyomo_nlp, pyomo_nlp_available = attempt_import(
@@ -161,6 +169,10 @@ def extract_bipartite_subgraph(graph, nodes0, nodes1):
     return relabeled_subgraph
 
 
+def _get_fixed_state(variables):
+    return tuple(var.value if var.fixed else NOTSET for var in variables)
+
+
 def _generate_variables_in_constraints(constraints, **kwds):
     # Note: We construct a visitor here
     config = get_config_from_kwds(**kwds)
@@ -265,38 +277,55 @@ class IncidenceGraphInterface(object):
         If a PyomoNLP is provided, setting to ``False`` uses the
         ``evaluate_jacobian_eq`` method instead of ``evaluate_jacobian``
         rather than checking constraint expression types.
+    incremental: Bool, default ``False``
+        Whether to cache the variables incident on each constraint so that
+        the incidence graph can be brought up to date with :meth:`update`
+        after constraints are activated or deactivated or variables are
+        fixed or unfixed. Only supported if ``model`` is a BlockData.
+    backend: ``IncidenceGraphBackend``, default ``networkx``
+        Data structure used to store the cached incidence graph. With
+        ``IncidenceGraphBackend.scipy``, the graph is stored as a
+        ``scipy.sparse.csr_matrix`` and analyzed with ``scipy.sparse.csgraph``
+        algorithms, which avoids constructing NetworkX objects for large
+        graphs.
 
     """
 
-    def __init__(self, model=None, active=True, include_inequality=True, **kwds):
+    def __init__(
+        self,
+        model=None,
+        active=True,
+        include_inequality=True,
+        incremental=False,
+        backend=IncidenceGraphBackend.networkx,
+        **kwds,
+    ):
         """Construct an IncidenceGraphInterface object"""
         # If the user gives us a model or an NLP, we assume they want us
         # to cache the incidence graph for fast analysis later on.
         # WARNING: This cache will become invalid if the user alters their
-        # model.
+        # model (unless incremental=True and update() is called).
         self._config = get_config_from_kwds(**kwds)
+        self._backend = InEnum(IncidenceGraphBackend)(backend)
+        self._model = None
+        self._incident_cache = None
+        self._incident_lists = None
+        if incremental and not isinstance(model, BlockData):
+            raise ValueError(
+                "incremental=True is only supported when the incidence graph"
+                " is constructed from a Pyomo BlockData."
+            )
         if model is None:
             self._incidence_graph = None
             self._variables = None
             self._constraints = None
         elif isinstance(model, BlockData):
-            self._constraints = [
-                con
-                for con in model.component_data_objects(Constraint, active=active)
-                if include_inequality or isinstance(con.expr, EqualityExpression)
-            ]
-            self._variables = list(
-                _generate_variables_in_constraints(self._constraints, **self._config)
-            )
-            self._var_index_map = ComponentMap(
-                (var, i) for i, var in enumerate(self._variables)
-            )
-            self._con_index_map = ComponentMap(
-                (con, i) for i, con in enumerate(self._constraints)
-            )
-            self._incidence_graph = get_bipartite_incidence_graph(
-                self._variables, self._constraints, **self._config
-            )
+            self._model = model
+            self._active = active
+            self._include_inequality = include_inequality
+            if incremental:
+                self._incident_cache = ComponentMap()
+            self._build_from_model()
         elif pyomo_nlp_available and isinstance(model, pyomo_nlp.PyomoNLP):
             if not active:
                 raise ValueError(
@@ -327,10 +356,15 @@ class IncidenceGraphInterface(object):
                 incidence_matrix = nlp.evaluate_jacobian()
             else:
                 incidence_matrix = nlp.evaluate_jacobian_eq()
-            nxb = nx.algorithms.bipartite
-            self._incidence_graph = nxb.from_biadjacency_matrix(incidence_matrix)
+            if self._backend is IncidenceGraphBackend.scipy:
+                self._incidence_graph = sparse_graph._to_csr(incidence_matrix)
+            else:
+                nxb = nx.algorithms.bipartite
+                self._incidence_graph = nxb.from_biadjacency_matrix(incidence_matrix)
         elif isinstance(model, tuple):
             # model is a tuple of (nx.Graph, list[pyo.Var], list[pyo.Constraint])
+            # (or (csr_matrix, list[pyo.Var], list[pyo.Constraint]) if the
+            # scipy backend is used)
             # We could potentially accept a tuple (variables, constraints).
             # TODO: Disallow kwargs if this type of "model" is provided?
             nx_graph, variables, constraints = model
@@ -351,6 +385,116 @@ class IncidenceGraphInterface(object):
                 " or BlockData but got %s." % type(model)
             )
 
+    def _build_from_model(self):
+        constraints = [
+            con
+            for con in self._model.component_data_objects(
+                Constraint, active=self._active
+            )
+            if self._include_inequality or isinstance(con.expr, EqualityExpression)
+        ]
+        if self._incident_cache is None:
+            incident_lists = [
+                get_incident_variables(con.body, **self._config) for con in constraints
+            ]
+        else:
+            incident_lists = [
+                self._get_cached_incident_variables(con) for con in constraints
+            ]
+            if (
+                self._incident_lists is not None
+                and len(incident_lists) == len(self._incident_lists)
+                and all(
+                    c1 is c2 and l1 is l2
+                    for c1, c2, l1, l2 in zip(
+                        constraints,
+                        self._constraints,
+                        incident_lists,
+                        self._incident_lists,
+                    )
+                )
+            ):
+                # Nothing has changed since the graph was last built
+                return
+        self._incident_lists = incident_lists
+        var_index_map = ComponentMap()
+        for var_list in incident_lists:
+            for var in var_list:
+                if var not in var_index_map:
+                    var_index_map[var] = len(var_index_map)
+        self._variables = list(var_index_map)
+        self._constraints = constraints
+        self._var_index_map = var_index_map
+        self._con_index_map = ComponentMap(
+            (con, i) for i, con in enumerate(constraints)
+        )
+        M = len(constraints)
+        N = len(var_index_map)
+        if self._backend is IncidenceGraphBackend.scipy:
+            indptr = np.zeros(M + 1, dtype=np.intp)
+            np.cumsum([len(var_list) for var_list in incident_lists], out=indptr[1:])
+            indices = np.fromiter(
+                (var_index_map[var] for var_list in incident_lists for var in var_list),
+                dtype=np.intp,
+                count=indptr[-1],
+            )
+            self._incidence_graph = sp.sparse.csr_matrix(
+                (np.ones(len(indices)), indices, indptr), shape=(M, N)
+            )
+        else:
+            graph = nx.Graph()
+            graph.add_nodes_from(range(M), bipartite=0)
+            graph.add_nodes_from(range(M, M + N), bipartite=1)
+            graph.add_edges_from(
+                (i, M + var_index_map[var])
+                for i, var_list in enumerate(incident_lists)
+                for var in var_list
+            )
+            self._incidence_graph = graph
+
+    def _get_cached_incident_variables(self, con):
+        # The cached incident variables are valid as long as the constraint
+        # expression has not been replaced and no variable in the expression
+        # has been fixed, unfixed, or (while fixed) changed value.
+        expr = con.expr
+        cached = self._incident_cache.get(con, None)
+        if cached is not None:
+            cached_expr, all_vars, fixed_state, incident = cached
+            if cached_expr is expr and fixed_state == _get_fixed_state(all_vars):
+                return incident
+        all_vars = list(identify_variables(expr, include_fixed=True))
+        incident = get_incident_variables(con.body, **self._config)
+        self._incident_cache[con] = (
+            expr,
+            all_vars,
+            _get_fixed_state(all_vars),
+            incident,
+        )
+        return incident
+
+    def update(self):
+        """Update the cached incidence graph to reflect the current state of
+        the model
+
+        Constraints that have been activated or deactivated (or added or
+        removed) and variables that have been fixed or unfixed since the
+        graph was constructed are accounted for. Only constraints whose
+        expressions or fixed variables have changed are inspected again;
+        incident variables of the remaining constraints are taken from a
+        cache. Changes made with :meth:`remove_nodes` or :meth:`add_edge`
+        are discarded.
+
+        This method requires that the interface was constructed from a
+        model with ``incremental=True``.
+
+        """
+        if self._incident_cache is None:
+            raise RuntimeError(
+                "update() is only supported for an IncidenceGraphInterface"
+                " constructed from a model with incremental=True."
+            )
+        self._build_from_model()
+
     @property
     def variables(self):
         """The variables participating in the incidence graph"""
@@ -375,6 +519,8 @@ class IncidenceGraphInterface(object):
             raise RuntimeError(
                 "Cannot get number of edges (nonzeros) when nothing is cached"
             )
+        if self._backend is IncidenceGraphBackend.scipy:
+            return self._incidence_graph.nnz
         return len(self._incidence_graph.edges)
 
     @property
@@ -481,7 +627,16 @@ class IncidenceGraphInterface(object):
         return variables, constraints
 
     def _extract_subgraph(self, variables, constraints):
-        if self._incidence_graph is None:
+        if self._backend is IncidenceGraphBackend.scipy:
+            # With the scipy backend, "graphs" are CSR biadjacency matrices
+            if self._incidence_graph is None:
+                return get_structural_incidence_matrix(
+                    variables, constraints, **self._config
+                ).tocsr()
+            rows = [self._con_index_map[con] for con in constraints]
+            cols = [self._var_index_map[var] for var in variables]
+            return self._incidence_graph[rows, :][:, cols]
+        elif self._incidence_graph is None:
             # Note that we pass along self._config here, so any kwds used
             # in construction will apply to these incidence graphs.
             return get_bipartite_incidence_graph(variables, constraints, **self._config)
@@ -512,7 +667,7 @@ class IncidenceGraphInterface(object):
         """
         nx_subgraph = self._extract_subgraph(variables, constraints)
         subgraph = IncidenceGraphInterface(
-            (nx_subgraph, variables, constraints), **self._config
+            (nx_subgraph, variables, constraints), backend=self._backend, **self._config
         )
         return subgraph
 
@@ -526,6 +681,8 @@ class IncidenceGraphInterface(object):
         """
         if self._incidence_graph is None:
             return None
+        elif self._backend is IncidenceGraphBackend.scipy:
+            return self._incidence_graph.tocoo()
         else:
             M = len(self.constraints)
             N = len(self.variables)
@@ -584,6 +741,18 @@ class IncidenceGraphInterface(object):
                 " is not cached." % component
             )
         _check_unindexed([component])
+        if self._backend is IncidenceGraphBackend.scipy:
+            if component in self._var_index_map:
+                j = self._var_index_map[component]
+                adj = self._incidence_graph[:, [j]].nonzero()[0]
+                return [self.constraints[i] for i in adj]
+            elif component in self._con_index_map:
+                i = self._con_index_map[component]
+                adj = self._incidence_graph[[i], :].nonzero()[1]
+                return [self.variables[j] for j in adj]
+            raise RuntimeError(
+                "Cannot find component %s in the cached incidence graph." % component
+            )
         M = len(self.constraints)
         N = len(self.variables)
         if component in self._var_index_map:
@@ -613,6 +782,11 @@ class IncidenceGraphInterface(object):
         """
         variables, constraints = self._validate_input(variables, constraints)
         graph = self._extract_subgraph(variables, constraints)
+        if self._backend is IncidenceGraphBackend.scipy:
+            matching = sparse_graph.maximum_matching(graph)
+            return ComponentMap(
+                (constraints[i], variables[j]) for i, j in matching.items()
+            )
         con_nodes = list(range(len(constraints)))
         matching = maximum_matching(graph, top_nodes=con_nodes)
         # Matching maps constraint nodes to variable nodes. Here we need to
@@ -639,6 +813,11 @@ class IncidenceGraphInterface(object):
         """
         variables, constraints = self._validate_input(variables, constraints)
         graph = self._extract_subgraph(variables, constraints)
+        if self._backend is IncidenceGraphBackend.scipy:
+            row_blocks, col_blocks = sparse_graph.connected_components(graph)
+            con_blocks = [[constraints[i] for i in block] for block in row_blocks]
+            var_blocks = [[variables[j] for j in block] for block in col_blocks]
+            return var_blocks, con_blocks
         nxc = nx.algorithms.components
         M = len(constraints)
         N = len(variables)
@@ -671,13 +850,9 @@ class IncidenceGraphInterface(object):
 
         """
         variables, constraints = self._validate_input(variables, constraints)
-        graph = self._extract_subgraph(variables, constraints)
-
-        M = len(constraints)
-        con_nodes = list(range(M))
-        sccs = get_scc_of_projection(graph, con_nodes)
-        row_idx_map = {r: idx for idx, scc in enumerate(sccs) for r, _ in scc}
-        col_idx_map = {c - M: idx for idx, scc in enumerate(sccs) for _, c in scc}
+        row_partition, col_partition = self._block_triangularize(variables, constraints)
+        row_idx_map = {r: idx for idx, rows in enumerate(row_partition) for r in rows}
+        col_idx_map = {c: idx for idx, cols in enumerate(col_partition) for c in cols}
         con_block_map = ComponentMap(
             (constraints[i], idx) for i, idx in row_idx_map.items()
         )
@@ -744,14 +919,23 @@ class IncidenceGraphInterface(object):
 
         """
         variables, constraints = self._validate_input(variables, constraints)
-        graph = self._extract_subgraph(variables, constraints)
+        row_partition, col_partition = self._block_triangularize(variables, constraints)
+        var_partition = [[variables[j] for j in cols] for cols in col_partition]
+        con_partition = [[constraints[i] for i in rows] for rows in row_partition]
+        return var_partition, con_partition
 
+    def _block_triangularize(self, variables, constraints):
+        # Return the partitions of constraint and variable coordinates
+        # corresponding to the diagonal blocks of a block triangularization
+        graph = self._extract_subgraph(variables, constraints)
+        if self._backend is IncidenceGraphBackend.scipy:
+            return sparse_graph.block_triangularize(graph)
         M = len(constraints)
         con_nodes = list(range(M))
         sccs = get_scc_of_projection(graph, con_nodes)
-        var_partition = [[variables[j - M] for _, j in scc] for scc in sccs]
-        con_partition = [[constraints[i] for i, _ in scc] for scc in sccs]
-        return var_partition, con_partition
+        row_partition = [[i for i, _ in scc] for scc in sccs]
+        col_partition = [[j - M for _, j in scc] for scc in sccs]
+        return row_partition, col_partition
 
     @deprecated(
         msg=(
@@ -763,12 +947,9 @@ class IncidenceGraphInterface(object):
     )
     def get_diagonal_blocks(self, variables=None, constraints=None):
         variables, constraints = self._validate_input(variables, constraints)
-        graph = self._extract_subgraph(variables, constraints)
-        M = len(constraints)
-        con_nodes = list(range(M))
-        sccs = get_scc_of_projection(graph, con_nodes)
-        block_cons = [[constraints[i] for i, _ in scc] for scc in sccs]
-        block_vars = [[variables[j - M] for _, j in scc] for scc in sccs]
+        row_partition, col_partition = self._block_triangularize(variables, constraints)
+        block_cons = [[constraints[i] for i in rows] for rows in row_partition]
+        block_vars = [[variables[j] for j in cols] for cols in col_partition]
         return block_vars, block_cons
 
     def dulmage_mendelsohn(self, variables=None, constraints=None):
@@ -859,6 +1040,15 @@ class IncidenceGraphInterface(object):
         """
         variables, constraints = self._validate_input(variables, constraints)
         graph = self._extract_subgraph(variables, constraints)
+        if self._backend is IncidenceGraphBackend.scipy:
+            row_partition, col_partition = sparse_graph.dulmage_mendelsohn(graph)
+            con_partition = RowPartition(
+                *[[constraints[i] for i in subset] for subset in row_partition]
+            )
+            var_partition = ColPartition(
+                *[[variables[j] for j in subset] for subset in col_partition]
+            )
+            return var_partition, con_partition
         M = len(constraints)
         top_nodes = list(range(M))
         row_partition, col_partition = dulmage_mendelsohn(graph, top_nodes=top_nodes)
@@ -946,6 +1136,7 @@ class IncidenceGraphInterface(object):
         cons_to_include = [c for c in self.constraints if c not in c_exclude]
         incidence_graph = self._extract_subgraph(vars_to_include, cons_to_include)
         # update attributes
+        self._incident_lists = None
         self._variables = vars_to_include
         self._constraints = cons_to_include
         self._incidence_graph = incidence_graph
@@ -960,6 +1151,8 @@ class IncidenceGraphInterface(object):
         """Plot the bipartite incidence graph of variables and constraints"""
         variables, constraints = self._validate_input(variables, constraints)
         graph = self._extract_subgraph(variables, constraints)
+        if self._backend is IncidenceGraphBackend.scipy:
+            graph = nx.algorithms.bipartite.from_biadjacency_matrix(graph)
         M = len(constraints)
 
         left_nodes = list(range(M))
@@ -1050,6 +1243,22 @@ class IncidenceGraphInterface(object):
                 "%s is not a constraint in the incidence graph" % constraint
             )
 
+        # The graph no longer corresponds to the cached incident variables
+        self._incident_lists = None
+        if self._backend is IncidenceGraphBackend.scipy:
+            i = self._con_index_map[constraint]
+            j = self._var_index_map[variable]
+            if not self._incidence_graph[i, j]:
+                matrix = self._incidence_graph.tocoo()
+                self._incidence_graph = sp.sparse.csr_matrix(
+                    (
+                        np.append(matrix.data, 1.0),
+                        (np.append(matrix.row, i), np.append(matrix.col, j)),
+                    ),
+                    shape=matrix.shape,
+                )
+            return
+
         var_id = self._var_index_map[variable] + len(self._con_index_map)
         con_id = self._con_index_map[constraint]
 
@@ -9,18 +9,26 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import concurrent.futures
 import logging
 
+from pyomo.common.collections import ComponentMap
+from pyomo.common.dependencies import numpy as np
+from pyomo.common.numeric_types import native_complex_types, value
 from pyomo.core.base.constraint import Constraint
+from pyomo.core.expr.calculus.derivatives import differentiate
 from pyomo.util.calc_var_value import calculate_variable_from_constraint
-from pyomo.util.subsystems import TemporarySubsystemManager, generate_subsystem_blocks
+from pyomo.util.subsystems import (
+    TemporarySubsystemManager,
+    create_subsystem_block,
+    generate_subsystem_blocks,
+)
 from pyomo.contrib.incidence_analysis.interface import (
     IncidenceGraphInterface,
     _generate_variables_in_constraints,
 )
 from pyomo.contrib.incidence_analysis.config import IncidenceMethod
 
-
 _log = logging.getLogger(__name__)
 
 
@@ -92,7 +100,14 @@ def generate_strongly_connected_components(
 
 
 def solve_strongly_connected_components(
-    block, *, solver=None, solve_kwds=None, use_calc_var=True, calc_var_kwds=None
+    block,
+    *,
+    solver=None,
+    solve_kwds=None,
+    use_calc_var=True,
+    calc_var_kwds=None,
+    executor=None,
+    batch_calc_var=False,
 ):
     """Solve a square system of variables and equality constraints by
     solving strongly connected components individually.
@@ -107,6 +122,13 @@ def solve_strongly_connected_components(
     calculate_variable_from_constraint function, while higher-dimension
     blocks are solved using the user-provided solver object.
 
+    If an ``executor`` is provided or ``batch_calc_var`` is set, the
+    diagonal blocks are scheduled using the directed acyclic graph of
+    dependencies between them: all blocks whose predecessors have been
+    solved are solved together. Higher-dimension blocks are then submitted
+    to the executor, and one-by-one blocks are solved simultaneously with
+    a vectorized Newton method.
+
     Parameters
     ----------
     block: Pyomo Block
@@ -122,10 +144,21 @@ def solve_strongly_connected_components(
         square system solves
     calc_var_kwds: Dictionary
         Keyword arguments for calculate_variable_from_constraint
+    executor: ``concurrent.futures.Executor``
+        Executor used to solve independent higher-dimension blocks
+        concurrently (e.g., a ``ThreadPoolExecutor``). Note that
+        ``solver.solve`` may be called from several threads at the same
+        time.
+    batch_calc_var: Bool
+        Whether to solve independent one-by-one blocks together using a
+        vectorized Newton method. Blocks for which this method fails are
+        solved using calculate_variable_from_constraint.
 
     Returns
     -------
-    List of results objects returned by each call to solve
+    List of results objects returned by each call to solve (or ``None``
+    for one-by-one blocks solved with calculate_variable_from_constraint),
+    in the topological order of the diagonal blocks
 
     """
     if solve_kwds is None:
@@ -143,6 +176,19 @@ def solve_strongly_connected_components(
     constraints = igraph.constraints
     variables = igraph.variables
 
+    if executor is not None or batch_calc_var:
+        return _solve_scc_by_level(
+            igraph,
+            variables,
+            constraints,
+            solver,
+            solve_kwds,
+            use_calc_var,
+            calc_var_kwds,
+            executor,
+            batch_calc_var,
+        )
+
     res_list = []
     log_blocks = _log.isEnabledFor(logging.DEBUG)
     for scc, inputs in generate_strongly_connected_components(
@@ -158,16 +204,236 @@ def solve_strongly_connected_components(
                 )
             else:
                 if solver is None:
-                    var_names = [var.name for var in scc.vars.values()][:10]
-                    con_names = [con.name for con in scc.cons.values()][:10]
-                    raise RuntimeError(
-                        "An external solver is required if block has strongly\n"
-                        "connected components of size greater than one (is not"
-                        " a DAG).\nGot an SCC of size %sx%s including"
-                        " components:\n%s\n%s" % (N, N, var_names, con_names)
+                    _raise_solver_required(
+                        list(scc.vars.values()), list(scc.cons.values())
                     )
                 if log_blocks:
                     _log.debug(f"Solving {N}x{N} block.")
                 results = solver.solve(scc, **solve_kwds)
             res_list.append(results)
     return res_list
+
+
+def _raise_solver_required(variables, constraints):
+    N = len(variables)
+    var_names = [var.name for var in variables][:10]
+    con_names = [con.name for con in constraints][:10]
+    raise RuntimeError(
+        "An external solver is required if block has strongly\n"
+        "connected components of size greater than one (is not"
+        " a DAG).\nGot an SCC of size %sx%s including"
+        " components:\n%s\n%s" % (N, N, var_names, con_names)
+    )
+
+
+def _get_block_levels(igraph, var_blocks, con_blocks):
+    # Compute the "level" of each diagonal block in the DAG of blocks:
+    # blocks with no predecessors have level zero, and every other block
+    # has a level one greater than its highest predecessor. Blocks with
+    # the same level do not depend on each other.
+    var_block_map = ComponentMap(
+        (var, idx) for idx, vblock in enumerate(var_blocks) for var in vblock
+    )
+    levels = []
+    for idx, cblock in enumerate(con_blocks):
+        level = 0
+        for con in cblock:
+            for var in igraph.get_adjacent_to(con):
+                pred = var_block_map.get(var, idx)
+                if pred != idx and levels[pred] >= level:
+                    level = levels[pred] + 1
+        levels.append(level)
+    return levels
+
+
+def _solve_scc_by_level(
+    igraph,
+    variables,
+    constraints,
+    solver,
+    solve_kwds,
+    use_calc_var,
+    calc_var_kwds,
+    executor,
+    batch_calc_var,
+):
+    var_blocks, con_blocks = igraph.block_triangularize(
+        variables=variables, constraints=constraints
+    )
+    levels = _get_block_levels(igraph, var_blocks, con_blocks)
+    blocks_by_level = [[] for _ in range(max(levels, default=-1) + 1)]
+    for idx, level in enumerate(levels):
+        blocks_by_level[level].append(idx)
+
+    res_list = [None] * len(var_blocks)
+    log_blocks = _log.isEnabledFor(logging.DEBUG)
+    for level, block_indices in enumerate(blocks_by_level):
+        one_by_one = []
+        others = []
+        for idx in block_indices:
+            if len(var_blocks[idx]) == 1 and use_calc_var:
+                one_by_one.append(idx)
+            else:
+                others.append(idx)
+        if others and solver is None:
+            idx = others[0]
+            _raise_solver_required(var_blocks[idx], con_blocks[idx])
+        if log_blocks:
+            _log.debug(
+                f"Solving {len(block_indices)} independent blocks"
+                f" ({len(one_by_one)} 1x1 blocks) in level {level}."
+            )
+
+        # The inputs to every block in this level are variables in blocks
+        # from previous levels (or variables outside the system), so they
+        # can all be fixed at once while the blocks are solved.
+        subsystems = []
+        to_fix = []
+        for idx in others:
+            scc = create_subsystem_block(con_blocks[idx], var_blocks[idx])
+            subsystems.append(scc)
+            to_fix.extend(scc.input_vars.values())
+        with TemporarySubsystemManager(to_fix=to_fix, remove_bounds_on_fix=True):
+            if executor is None:
+                for idx, scc in zip(others, subsystems):
+                    res_list[idx] = solver.solve(scc, **solve_kwds)
+                futures = []
+            else:
+                futures = [
+                    executor.submit(solver.solve, scc, **solve_kwds)
+                    for scc in subsystems
+                ]
+            try:
+                one_by_one_vars = [var_blocks[idx][0] for idx in one_by_one]
+                one_by_one_cons = [con_blocks[idx][0] for idx in one_by_one]
+                if batch_calc_var:
+                    failed = _solve_one_by_one_blocks(
+                        one_by_one_vars, one_by_one_cons, **calc_var_kwds
+                    )
+                else:
+                    failed = range(len(one_by_one))
+                for i in failed:
+                    calculate_variable_from_constraint(
+                        one_by_one_vars[i], one_by_one_cons[i], **calc_var_kwds
+                    )
+            finally:
+                # Make sure no solves are still running before the inputs
+                # are unfixed
+                concurrent.futures.wait(futures)
+            for idx, future in zip(others, futures):
+                res_list[idx] = future.result()
+    return res_list
+
+
+_invalid_types = set(native_complex_types)
+_invalid_types.add(type(None))
+
+
+def _evaluate_residuals(exprs, indices):
+    residuals = np.empty(len(indices))
+    for k, i in enumerate(indices):
+        try:
+            val = value(exprs[i], exception=False)
+        except (ArithmeticError, ValueError):
+            val = None
+        residuals[k] = np.nan if val.__class__ in _invalid_types else val
+    return residuals
+
+
+def _solve_one_by_one_blocks(
+    variables,
+    constraints,
+    eps=1e-8,
+    iterlim=1000,
+    linesearch=True,
+    alpha_min=1e-8,
+    diff_mode=None,
+):
+    """Solve independent variable-constraint pairs simultaneously
+
+    Newton's method (with the same line search as
+    calculate_variable_from_constraint) is applied to all pairs at once:
+    residuals and derivatives are evaluated for every unconverged pair,
+    and the steps, line search, and convergence tests are vectorized.
+    Derivatives are computed with reverse-mode numeric differentiation.
+
+    Returns the indices of the pairs that could not be solved this way
+    (e.g., uninitialized variables, zero derivatives, evaluation errors,
+    or iteration limits). The values of these variables are restored.
+
+    """
+    n = len(variables)
+    failed = np.zeros(n, dtype=bool)
+    exprs = []
+    for i, (var, con) in enumerate(zip(variables, constraints)):
+        if var.value is None or con.lb is None or con.lb != con.ub:
+            failed[i] = True
+            exprs.append(None)
+        else:
+            exprs.append(con.body - con.ub)
+    x0 = np.array([np.nan if var.value is None else var.value for var in variables])
+    x = x0.copy()
+
+    idx = np.flatnonzero(~failed)
+    f = np.full(n, np.nan)
+    f[idx] = _evaluate_residuals(exprs, idx)
+    failed[idx[np.isnan(f[idx])]] = True
+
+    c1 = 0.999
+    iter_left = iterlim
+    while True:
+        idx = np.flatnonzero(~failed & (np.abs(f) > eps))
+        if not len(idx):
+            break
+        iter_left -= 1
+        if not iter_left:
+            failed[idx] = True
+            break
+        fp = np.empty(len(idx))
+        for k, i in enumerate(idx):
+            try:
+                fp[k] = differentiate(
+                    exprs[i], wrt=variables[i], mode=differentiate.Modes.reverse_numeric
+                )
+            except (ArithmeticError, ValueError):
+                fp[k] = np.nan
+        bad = ~(np.abs(fp) >= 1e-12)
+        failed[idx[bad]] = True
+        idx = idx[~bad]
+        step = -f[idx] / fp[~bad]
+        alpha = np.ones(len(idx))
+        # Line search over all pairs that have not yet found a step with
+        # sufficient reduction in the residual
+        while len(idx):
+            xk = x[idx] + alpha * step
+            for i, val in zip(idx, xk.tolist()):
+                variables[i].set_value(val, skip_validation=True)
+            fk = _evaluate_residuals(exprs, idx)
+            if linesearch:
+                with np.errstate(over="ignore", invalid="ignore"):
+                    accept = fk**2 < c1 * f[idx] ** 2
+            else:
+                accept = ~np.isnan(fk)
+                failed[idx[~accept]] = True
+            x[idx[accept]] = xk[accept]
+            f[idx[accept]] = fk[accept]
+            if not linesearch:
+                break
+            idx = idx[~accept]
+            step = step[~accept]
+            alpha = alpha[~accept] / 2.0
+            exhausted = alpha <= alpha_min
+            failed[idx[exhausted]] = True
+            idx = idx[~exhausted]
+            step = step[~exhausted]
+            alpha = alpha[~exhausted]
+
+    for i, var in enumerate(variables):
+        if failed[i]:
+            if not np.isnan(x0[i]):
+                var.set_value(x0[i], skip_validation=True)
+        else:
+            # Re-set the variable value to trigger any warnings WRT the
+            # final variable state
+            var.set_value(var.value)
+    return np.flatnonzero(failed).tolist()
@@ -17,6 +17,7 @@ from pyomo.common.dependencies import (
     scipy_available,
 )
 from pyomo.common.collections import ComponentSet, ComponentMap
+from pyomo.contrib.incidence_analysis.config import IncidenceGraphBackend
 from pyomo.contrib.incidence_analysis.interface import (
     asl_available,
     IncidenceGraphInterface,
@@ -1925,5 +1926,175 @@ class TestIndexedBlock(unittest.TestCase):
             igraph = IncidenceGraphInterface(m.block)
 
 
+@unittest.skipUnless(networkx_available, "networkx is not available.")
+@unittest.skipUnless(scipy_available, "scipy is not available.")
+class TestScipyBackend(unittest.TestCase):
+    def _make_igraphs(self, m, **kwds):
+        return (
+            IncidenceGraphInterface(m, **kwds),
+            IncidenceGraphInterface(m, backend=IncidenceGraphBackend.scipy, **kwds),
+        )
+
+    def test_incidence_matrix(self):
+        m = make_gas_expansion_model()
+        nx_igraph, sp_igraph = self._make_igraphs(m)
+        self.assertEqual(sp_igraph.variables, nx_igraph.variables)
+        self.assertEqual(sp_igraph.constraints, nx_igraph.constraints)
+        self.assertEqual(sp_igraph.n_edges, nx_igraph.n_edges)
+        self.assertEqual(
+            (sp_igraph.incidence_matrix != nx_igraph.incidence_matrix).nnz, 0
+        )
+        for comp in [m.rho[1], m.P[0], m.mbal[1], m.ideal_gas[2]]:
+            self.assertEqual(
+                sp_igraph.get_adjacent_to(comp), nx_igraph.get_adjacent_to(comp)
+            )
+
+    def test_block_triangularize(self):
+        m = make_gas_expansion_model()
+        m.rho[0].fix()
+        m.T[0].fix()
+        m.F[0].fix()
+        nx_igraph, sp_igraph = self._make_igraphs(m)
+        nx_vblocks, nx_cblocks = nx_igraph.block_triangularize()
+        sp_vblocks, sp_cblocks = sp_igraph.block_triangularize()
+        self.assertEqual(len(nx_vblocks), len(sp_vblocks))
+        for nx_vb, nx_cb, sp_vb, sp_cb in zip(
+            nx_vblocks, nx_cblocks, sp_vblocks, sp_cblocks
+        ):
+            self.assertEqual(ComponentSet(nx_vb), ComponentSet(sp_vb))
+            self.assertEqual(ComponentSet(nx_cb), ComponentSet(sp_cb))
+
+        var_block_map, con_block_map = sp_igraph.map_nodes_to_block_triangular_indices()
+        for idx, (vb, cb) in enumerate(zip(sp_vblocks, sp_cblocks)):
+            for var in vb:
+                self.assertEqual(var_block_map[var], idx)
+            for con in cb:
+                self.assertEqual(con_block_map[con], idx)
+
+    def test_dulmage_mendelsohn(self):
+        m = make_degenerate_solid_phase_model()
+        nx_igraph, sp_igraph = self._make_igraphs(m)
+        nx_vdmp, nx_cdmp = nx_igraph.dulmage_mendelsohn()
+        sp_vdmp, sp_cdmp = sp_igraph.dulmage_mendelsohn()
+        self.assertEqual(
+            ComponentSet(nx_vdmp.unmatched + nx_vdmp.underconstrained),
+            ComponentSet(sp_vdmp.unmatched + sp_vdmp.underconstrained),
+        )
+        self.assertEqual(
+            ComponentSet(nx_cdmp.unmatched + nx_cdmp.overconstrained),
+            ComponentSet(sp_cdmp.unmatched + sp_cdmp.overconstrained),
+        )
+        for field in ["square", "overconstrained"]:
+            self.assertEqual(
+                ComponentSet(getattr(nx_vdmp, field)),
+                ComponentSet(getattr(sp_vdmp, field)),
+            )
+        for field in ["square", "underconstrained"]:
+            self.assertEqual(
+                ComponentSet(getattr(nx_cdmp, field)),
+                ComponentSet(getattr(sp_cdmp, field)),
+            )
+        matching = sp_igraph.maximum_matching()
+        self.assertEqual(len(matching), len(nx_igraph.maximum_matching()))
+        for con, var in matching.items():
+            self.assertIn(var, ComponentSet(sp_igraph.get_adjacent_to(con)))
+
+    def test_connected_components_and_subgraph(self):
+        m = make_gas_expansion_model()
+        nx_igraph, sp_igraph = self._make_igraphs(m)
+        variables = [m.rho[1], m.T[1], m.P[1], m.F[1]]
+        constraints = [m.mbal[1], m.ebal[1], m.expansion[1], m.ideal_gas[1]]
+        nx_sub = nx_igraph.subgraph(variables, constraints)
+        sp_sub = sp_igraph.subgraph(variables, constraints)
+        self.assertEqual(sp_sub.n_edges, nx_sub.n_edges)
+        self.assertEqual(
+            nx_sub.get_connected_components(), sp_sub.get_connected_components()
+        )
+        sp_igraph.remove_nodes([m.rho[1]], [m.mbal[1]])
+        nx_igraph.remove_nodes([m.rho[1]], [m.mbal[1]])
+        self.assertEqual(sp_igraph.n_edges, nx_igraph.n_edges)
+        sp_igraph.add_edge(m.P[0], m.ebal[1])
+        nx_igraph.add_edge(m.P[0], m.ebal[1])
+        self.assertEqual(sp_igraph.n_edges, nx_igraph.n_edges)
+        self.assertIn(m.P[0], ComponentSet(sp_igraph.get_adjacent_to(m.ebal[1])))
+
+    def test_no_cache(self):
+        m = make_gas_expansion_model()
+        variables = list(m.component_data_objects(pyo.Var))
+        constraints = list(m.component_data_objects(pyo.Constraint))
+        igraph = IncidenceGraphInterface(backend="scipy")
+        vdmp, cdmp = igraph.dulmage_mendelsohn(variables, constraints)
+        self.assertEqual(len(vdmp.unmatched), len(variables) - len(constraints))
+
+
+@unittest.skipUnless(networkx_available, "networkx is not available.")
+class TestIncrementalUpdate(unittest.TestCase):
+    def _assert_same_graph(self, igraph, m, **kwds):
+        expected = IncidenceGraphInterface(m, **kwds)
+        self.assertEqual(igraph.constraints, expected.constraints)
+        self.assertEqual(igraph.variables, expected.variables)
+        self.assertEqual(igraph.n_edges, expected.n_edges)
+        for con in expected.constraints:
+            self.assertEqual(igraph.get_adjacent_to(con), expected.get_adjacent_to(con))
+
+    def _test_update(self, **kwds):
+        m = make_gas_expansion_model()
+        igraph = IncidenceGraphInterface(m, incremental=True, **kwds)
+        self._assert_same_graph(igraph, m)
+
+        m.P[0].fix(1.0)
+        m.F[0].fix(2.0)
+        m.mbal[1].deactivate()
+        igraph.update()
+        self._assert_same_graph(igraph, m)
+        self.assertNotIn(m.P[0], ComponentSet(igraph.variables))
+        self.assertNotIn(m.mbal[1], ComponentSet(igraph.constraints))
+
+        m.P[0].unfix()
+        m.mbal[1].activate()
+        m.ideal_gas[2].deactivate()
+        igraph.update()
+        self._assert_same_graph(igraph, m)
+
+        # Replacing a constraint expression is detected
+        m.ideal_gas[2].activate()
+        m.ideal_gas[2].set_value(m.P[2] == m.rho[2])
+        igraph.update()
+        self._assert_same_graph(igraph, m)
+        self.assertEqual(
+            ComponentSet(igraph.get_adjacent_to(m.ideal_gas[2])),
+            ComponentSet([m.P[2], m.rho[2]]),
+        )
+
+    def test_update_networkx(self):
+        self._test_update()
+
+    @unittest.skipUnless(scipy_available, "scipy is not available.")
+    def test_update_scipy(self):
+        self._test_update(backend=IncidenceGraphBackend.scipy)
+
+    def test_update_uses_cache(self):
+        m = make_gas_expansion_model()
+        igraph = IncidenceGraphInterface(m, incremental=True)
+        graph = igraph._incidence_graph
+        igraph.update()
+        # Nothing changed, so the graph is not rebuilt
+        self.assertIs(igraph._incidence_graph, graph)
+        cached = igraph._incident_cache[m.mbal[1]][3]
+        m.P[0].fix()
+        igraph.update()
+        self.assertIsNot(igraph._incidence_graph, graph)
+        # Constraints not containing P[0] are not inspected again
+        self.assertIs(igraph._incident_cache[m.mbal[1]][3], cached)
+
+    def test_update_errors(self):
+        m = make_gas_expansion_model()
+        igraph = IncidenceGraphInterface(m)
+        with self.assertRaisesRegex(RuntimeError, "incremental=True"):
+            igraph.update()
+        with self.assertRaisesRegex(ValueError, "only supported when"):
+            IncidenceGraphInterface(incremental=True)
+
+
 if __name__ == "__main__":
     unittest.main()
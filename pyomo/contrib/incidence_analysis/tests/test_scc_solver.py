@@ -9,11 +9,14 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pyomo.environ as pyo
 import pyomo.dae as dae
 from pyomo.common.dependencies import networkx_available
-from pyomo.common.dependencies import scipy_available
+from pyomo.common.dependencies import scipy_available, numpy as np
 from pyomo.common.collections import ComponentSet, ComponentMap
+from pyomo.repn import generate_standard_repn
 from pyomo.contrib.incidence_analysis.scc_solver import (
     TemporarySubsystemManager,
     generate_strongly_connected_components,
@@ -501,6 +504,134 @@ class TestSolveSCC(unittest.TestCase):
         self.assertEqual(m.x[3].value, 1.0)
 
 
+class _LinearSolver(object):
+    """A "solver" for square linear subsystems, used to test that solves of
+    higher-dimension blocks are dispatched correctly
+    """
+
+    def __init__(self):
+        self.solved = []
+
+    def solve(self, block):
+        variables = list(block.vars.values())
+        var_idx = ComponentMap((var, i) for i, var in enumerate(variables))
+        A = np.zeros((len(variables), len(variables)))
+        b = np.zeros(len(variables))
+        for i, con in enumerate(block.cons.values()):
+            repn = generate_standard_repn(con.body, compute_values=True)
+            for coef, var in zip(repn.linear_coefs, repn.linear_vars):
+                A[i, var_idx[var]] += coef
+            b[i] = pyo.value(con.upper) - repn.constant
+        for var, val in zip(variables, np.linalg.solve(A, b)):
+            var.set_value(val)
+        self.solved.append(ComponentSet(variables))
+        return len(variables)
+
+
+@unittest.skipUnless(scipy_available, "SciPy is not available")
+@unittest.skipUnless(networkx_available, "NetworkX is not available")
+class TestSolveSCCByLevel(unittest.TestCase):
+    def _make_model(self, n=4):
+        # n independent 2x2 linear blocks, each of which determines the
+        # input of a 1x1 nonlinear block
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(n)
+        m.p = pyo.Var(m.I, initialize=lambda m, i: float(i))
+        m.p.fix()
+        m.x = pyo.Var(m.I, initialize=1.0)
+        m.y = pyo.Var(m.I, initialize=1.0)
+        m.z = pyo.Var(m.I, initialize=1.0)
+        m.eq1 = pyo.Constraint(m.I, rule=lambda m, i: m.x[i] + 2 * m.y[i] == m.p[i])
+        m.eq2 = pyo.Constraint(m.I, rule=lambda m, i: m.x[i] - m.y[i] == 1)
+        m.eq3 = pyo.Constraint(
+            m.I, rule=lambda m, i: m.z[i] ** 3 + m.z[i] == 10 + m.x[i]
+        )
+        return m
+
+    def _assert_solved(self, m):
+        for con in m.component_data_objects(pyo.Constraint):
+            self.assertAlmostEqual(
+                pyo.value(con.body), pyo.value(con.upper), delta=1e-7
+            )
+
+    def test_dynamic_forward_batch(self):
+        m = make_dynamic_model(nfe=5, scheme="FORWARD")
+        t0 = m.time.first()
+        m.flow_in.fix()
+        m.height[t0].fix()
+
+        results = solve_strongly_connected_components(m, batch_calc_var=True)
+        self.assertEqual(results, [None] * len(results))
+        self._assert_solved(m)
+        for t in m.time:
+            self.assertIs(m.height[t].fixed, t == t0)
+            self.assertFalse(m.flow_out[t].fixed)
+            self.assertFalse(m.dhdt[t].fixed)
+            self.assertTrue(m.flow_in[t].fixed)
+
+    def test_batch_falls_back_to_calc_var(self):
+        # Same model as test_with_calc_var_kwds. The variables are not
+        # initialized, so these blocks are solved by
+        # calculate_variable_from_constraint.
+        m = pyo.ConcreteModel()
+        m.v0 = pyo.Var()
+        m.v1 = pyo.Var()
+        m.v2 = pyo.Var(initialize=79703634.05074187)
+        m.v2.fix()
+        m.p0 = pyo.Param(initialize=3e5)
+        m.p1 = pyo.Param(initialize=1.296e12)
+        m.con0 = pyo.Constraint(expr=m.v0 == m.p0)
+        m.con1 = pyo.Constraint(expr=0.0 == m.p1 * m.v1 / m.v0 + m.v2)
+        results = solve_strongly_connected_components(
+            m, calc_var_kwds={"eps": 1e-7}, batch_calc_var=True
+        )
+        self.assertEqual(len(results), 2)
+        self.assertAlmostEqual(m.v0.value, m.p0.value)
+        self.assertAlmostEqual(m.v1.value, -18.4499152895)
+
+    def test_executor(self):
+        n = 4
+        m = self._make_model(n)
+        solver = _LinearSolver()
+        with ThreadPoolExecutor(2) as executor:
+            results = solve_strongly_connected_components(
+                m, solver=solver, executor=executor, batch_calc_var=True
+            )
+        self._assert_solved(m)
+        self.assertEqual([r for r in results if r is not None], [2] * n)
+        self.assertEqual(results.count(None), n)
+        self.assertEqual(len(solver.solved), n)
+        for i in m.I:
+            self.assertIn(ComponentSet([m.x[i], m.y[i]]), solver.solved)
+            # Inputs are unfixed after the solve
+            self.assertFalse(m.x[i].fixed)
+            self.assertFalse(m.y[i].fixed)
+            self.assertTrue(m.p[i].fixed)
+
+    def test_executor_matches_sequential(self):
+        m1 = self._make_model()
+        m2 = self._make_model()
+        solve_strongly_connected_components(m1, solver=_LinearSolver())
+        with ThreadPoolExecutor(2) as executor:
+            solve_strongly_connected_components(
+                m2, solver=_LinearSolver(), executor=executor
+            )
+        for v1, v2 in zip(
+            m1.component_data_objects(pyo.Var), m2.component_data_objects(pyo.Var)
+        ):
+            self.assertAlmostEqual(v1.value, v2.value)
+
+    def test_executor_no_solver(self):
+        m = self._make_model()
+        with ThreadPoolExecutor(2) as executor:
+            with self.assertRaisesRegex(RuntimeError, "An external solver is required"):
+                solve_strongly_connected_components(m, executor=executor)
+        # Nothing was left fixed
+        for i in m.I:
+            self.assertFalse(m.x[i].fixed)
+            self.assertFalse(m.y[i].fixed)
+
+
 @unittest.skipUnless(scipy_available, "SciPy is not available")
 @unittest.skipUnless(networkx_available, "NetworkX is not available")
 class TestExceptions(unittest.TestCase):
@@ -38,8 +38,11 @@ else:
     import pyomo.contrib.parmest.utils.scenario_tree as scenario_tree
 
 import re
+import copy
 import importlib as im
 import logging
+import math
+import os
 import types
 import json
 from collections.abc import Callable
@@ -317,6 +320,9 @@ class Estimator(object):
         self._second_stage_cost_exp = "SecondStageCost"
         # boolean to indicate if model is initialized using a square solve
         self.model_initialized = False
+        # cache of parmest models (by experiment number) that is
+        # populated while solving multiple samples (see _solve_samples)
+        self._model_cache = None
 
     # The deprecated Estimator constructor
     # This works by checking the type of the first argument passed to
@@ -449,8 +455,75 @@ class Estimator(object):
         return parmest_model
 
     def _instance_creation_callback(self, experiment_number=None, cb_data=None):
-        model = self._create_parmest_model(experiment_number)
-        return model
+        if self._model_cache is None:
+            return self._create_parmest_model(experiment_number)
+        # Reuse the model built for this experiment by a previous
+        # sample.  Note that the instance is always a clone, as the same
+        # experiment may appear more than once in a (bootstrap) sample.
+        model = self._model_cache.get(experiment_number, None)
+        if model is None:
+            model = self._model_cache[experiment_number] = self._create_parmest_model(
+                experiment_number
+            )
+        return model.clone()
+
+    def _solve_samples(self, samples, executor=None, n_workers=None, batch_size=None):
+        """
+        Estimate theta for each sample (list of experiment numbers)
+
+        The parmest model for each experiment is only built once and
+        reused across samples.  If an executor is provided, the samples
+        are split into batches of (at most) `batch_size` samples that
+        are solved by the executor (by default, about 4 batches for
+        each of the `n_workers` workers).
+
+        Returns a list of the estimated theta values (pd.Series), in
+        the same order as `samples`.
+        """
+        if executor is not None:
+            return self._solve_samples_with_executor(
+                samples, executor, n_workers, batch_size
+            )
+        cache = self._model_cache
+        if cache is None:
+            self._model_cache = {}
+        try:
+            return [self._Q_opt(bootlist=list(sample))[1] for sample in samples]
+        finally:
+            if cache is None:
+                self._model_cache = None
+
+    def _solve_samples_with_executor(self, samples, executor, n_workers, batch_size):
+        if not samples:
+            return []
+        if batch_size is None:
+            if n_workers is None:
+                # The default number of workers for ProcessPoolExecutor
+                n_workers = os.cpu_count() or 1
+            if int(n_workers) != n_workers or n_workers < 1:
+                raise ValueError(
+                    f"n_workers must be a positive integer (got {n_workers})"
+                )
+            batch_size = math.ceil(len(samples) / (4 * n_workers))
+        if int(batch_size) != batch_size or batch_size < 1:
+            raise ValueError(
+                f"batch_size must be a positive integer (got {batch_size})"
+            )
+        batch_size = int(batch_size)
+        # Each task is sent a copy of this Estimator (without the
+        # extensive form from any previous solve).  Sending batches of
+        # samples (see batch_size) limits the number of times the
+        # Estimator is serialized and lets each task reuse the parmest
+        # models across the samples in its batch.
+        worker = copy.copy(self)
+        worker.__dict__.pop('ef_instance', None)
+        worker._model_cache = None
+
+        futures = [
+            executor.submit(_solve_sample_batch, worker, samples[i : i + batch_size])
+            for i in range(0, len(samples), batch_size)
+        ]
+        return [thetavals for f in futures for thetavals in f.result()]
 
     def _Q_opt(
         self,
@@ -928,6 +1001,9 @@ class Estimator(object):
         replacement=True,
         seed=None,
         return_samples=False,
+        executor=None,
+        n_workers=None,
+        batch_size=None,
     ):
         """
         Parameter estimation using bootstrap resampling of the data
@@ -946,6 +1022,25 @@ class Estimator(object):
         return_samples: bool, optional
             Return a list of sample numbers used in each bootstrap estimation.
             Default is False.
+        executor: concurrent.futures.Executor or None, optional
+            Executor used to solve the bootstrap samples in parallel
+            (e.g., a ProcessPoolExecutor).  The Estimator (including
+            the experiment list and objective function) must be
+            picklable for process-based executors.  If None (default),
+            the samples are solved serially (or distributed over MPI
+            ranks if running under MPI).
+        n_workers: int or None, optional
+            Number of workers in the executor, used to choose the
+            default `batch_size`.  Default is ``os.cpu_count()`` (the
+            default number of workers of a ProcessPoolExecutor).
+        batch_size: int or None, optional
+            Number of samples solved by each executor task.  The models
+            built for each experiment are only reused across the samples
+            in the same batch, and each batch sends a copy of the
+            Estimator to the executor.  If None (default), the samples
+            are split into about 4 batches per worker (i.e.,
+            ``ceil(bootstrap_samples / (4 * n_workers))`` samples per
+            batch).  Only used with an executor.
 
         Returns
         -------
@@ -956,6 +1051,11 @@ class Estimator(object):
 
         # check if we are using deprecated parmest
         if self.pest_deprecated is not None:
+            if executor is not None:
+                raise ValueError(
+                    "The executor option is not supported by the deprecated "
+                    "parmest interface"
+                )
             return self.pest_deprecated.theta_est_bootstrap(
                 bootstrap_samples,
                 samplesize=samplesize,
@@ -981,11 +1081,10 @@ class Estimator(object):
         task_mgr = utils.ParallelTaskManager(bootstrap_samples)
         local_list = task_mgr.global_to_local_data(global_list)
 
-        bootstrap_theta = list()
-        for idx, sample in local_list:
-            objval, thetavals = self._Q_opt(bootlist=list(sample))
+        samples = [sample for idx, sample in local_list]
+        bootstrap_theta = self._solve_samples(samples, executor, n_workers, batch_size)
+        for thetavals, sample in zip(bootstrap_theta, samples):
             thetavals['samples'] = sample
-            bootstrap_theta.append(thetavals)
 
         global_bootstrap_theta = task_mgr.allgather_global_data(bootstrap_theta)
         bootstrap_theta = pd.DataFrame(global_bootstrap_theta)
@@ -996,7 +1095,14 @@ class Estimator(object):
         return bootstrap_theta
 
     def theta_est_leaveNout(
-        self, lNo, lNo_samples=None, seed=None, return_samples=False
+        self,
+        lNo,
+        lNo_samples=None,
+        seed=None,
+        return_samples=False,
+        executor=None,
+        n_workers=None,
+        batch_size=None,
     ):
         """
         Parameter estimation where N data points are left out of each sample
@@ -1012,6 +1118,15 @@ class Estimator(object):
             Random seed
         return_samples: bool, optional
             Return a list of sample numbers that were left out. Default is False.
+        executor: concurrent.futures.Executor or None, optional
+            Executor used to solve the leave-N-out samples in parallel
+            (see :meth:`theta_est_bootstrap`).  Default is None.
+        n_workers: int or None, optional
+            Number of workers in the executor (see
+            :meth:`theta_est_bootstrap`).  Default is None.
+        batch_size: int or None, optional
+            Number of samples solved by each executor task (see
+            :meth:`theta_est_bootstrap`).  Default is None.
 
         Returns
         -------
@@ -1022,6 +1137,11 @@ class Estimator(object):
 
         # check if we are using deprecated parmest
         if self.pest_deprecated is not None:
+            if executor is not None:
+                raise ValueError(
+                    "The executor option is not supported by the deprecated "
+                    "parmest interface"
+                )
             return self.pest_deprecated.theta_est_leaveNout(
                 lNo, lNo_samples=lNo_samples, seed=seed, return_samples=return_samples
             )
@@ -1041,12 +1161,11 @@ class Estimator(object):
         task_mgr = utils.ParallelTaskManager(len(global_list))
         local_list = task_mgr.global_to_local_data(global_list)
 
-        lNo_theta = list()
-        for idx, sample in local_list:
-            objval, thetavals = self._Q_opt(bootlist=list(sample))
+        samples = [sample for idx, sample in local_list]
+        lNo_theta = self._solve_samples(samples, executor, n_workers, batch_size)
+        for thetavals, sample in zip(lNo_theta, samples):
             lNo_s = list(set(range(len(self.exp_list))) - set(sample))
             thetavals['lNo'] = np.sort(lNo_s)
-            lNo_theta.append(thetavals)
 
         global_bootstrap_theta = task_mgr.allgather_global_data(lNo_theta)
         lNo_theta = pd.DataFrame(global_bootstrap_theta)
@@ -1057,7 +1176,16 @@ class Estimator(object):
         return lNo_theta
 
     def leaveNout_bootstrap_test(
-        self, lNo, lNo_samples, bootstrap_samples, distribution, alphas, seed=None
+        self,
+        lNo,
+        lNo_samples,
+        bootstrap_samples,
+        distribution,
+        alphas,
+        seed=None,
+        executor=None,
+        n_workers=None,
+        batch_size=None,
     ):
         """
         Leave-N-out bootstrap test to compare theta values where N data points are
@@ -1083,6 +1211,15 @@ class Estimator(object):
             or outside the region.
         seed: int or None, optional
             Random seed
+        executor: concurrent.futures.Executor or None, optional
+            Executor used to solve the bootstrap samples in parallel
+            (see :meth:`theta_est_bootstrap`).  Default is None.
+        n_workers: int or None, optional
+            Number of workers in the executor (see
+            :meth:`theta_est_bootstrap`).  Default is None.
+        batch_size: int or None, optional
+            Number of samples solved by each executor task (see
+            :meth:`theta_est_bootstrap`).  Default is None.
 
         Returns
         -------
@@ -1102,6 +1239,11 @@ class Estimator(object):
 
         # check if we are using deprecated parmest
         if self.pest_deprecated is not None:
+            if executor is not None:
+                raise ValueError(
+                    "The executor option is not supported by the deprecated "
+                    "parmest interface"
+                )
             return self.pest_deprecated.leaveNout_bootstrap_test(
                 lNo, lNo_samples, bootstrap_samples, distribution, alphas, seed=seed
             )
@@ -1123,7 +1265,12 @@ class Estimator(object):
 
             obj, theta = self.theta_est()
 
-            bootstrap_theta = self.theta_est_bootstrap(bootstrap_samples)
+            bootstrap_theta = self.theta_est_bootstrap(
+                bootstrap_samples,
+                executor=executor,
+                n_workers=n_workers,
+                batch_size=batch_size,
+            )
 
             training, test = self.confidence_region_test(
                 bootstrap_theta,
@@ -1382,6 +1529,12 @@ class Estimator(object):
             return training_results
 
 
+def _solve_sample_batch(estimator, samples):
+    # Executor task used by Estimator._solve_samples_with_executor
+    # (defined at the module scope so that it can be pickled)
+    return estimator._solve_samples(samples)
+
+
 ################################
 # deprecated functions/classes #
 ################################
@@ -13,6 +13,7 @@ import platform
 import sys
 import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from itertools import product
 
 import pyomo.common.unittest as unittest
@@ -34,6 +35,15 @@ pynumero_ASL_available = AmplInterface.available()
 testdir = this_file_dir()
 
 
+def rooney_biegler_SSE(model):
+    # Sum of squared error function (defined at module scope so that it
+    # can be pickled for process-based executors)
+    return (
+        model.experiment_outputs[model.y]
+        - model.response_function[model.experiment_outputs[model.hour]]
+    ) ** 2
+
+
 @unittest.skipIf(
     not parmest.parmest_available,
     "Cannot test parmest: required dependencies are missing",
@@ -71,6 +81,7 @@ class TestRooneyBiegler(unittest.TestCase):
         solver_options = {"tol": 1e-8}
 
         self.data = data
+        self.exp_list = exp_list
         self.pest = parmest.Estimator(
             exp_list, obj_function=SSE, solver_options=solver_options, tee=True
         )
@@ -135,6 +146,32 @@ class TestRooneyBiegler(unittest.TestCase):
 
         graphics.pairwise_plot(LR, thetavals, 0.8)
 
+    def test_bootstrap_executor(self):
+        pest = parmest.Estimator(
+            self.exp_list, obj_function=rooney_biegler_SSE, solver_options={"tol": 1e-8}
+        )
+        serial = pest.theta_est_bootstrap(7, seed=524, return_samples=True)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parallel = pest.theta_est_bootstrap(
+                7, seed=524, return_samples=True, executor=executor, batch_size=3
+            )
+            lNo_parallel = pest.theta_est_leaveNout(
+                1, return_samples=True, executor=executor, n_workers=2
+            )
+        with self.assertRaisesRegex(ValueError, "batch_size must be a positive"):
+            pest.theta_est_bootstrap(2, executor=executor, batch_size=0)
+        with self.assertRaisesRegex(ValueError, "n_workers must be a positive"):
+            pest.theta_est_bootstrap(2, executor=executor, n_workers=0)
+        self.assertEqual(list(parallel.columns), list(serial.columns))
+        self.assertEqual(list(parallel['samples']), list(serial['samples']))
+        for name in ('asymptote', 'rate_constant'):
+            np.testing.assert_allclose(parallel[name], serial[name], rtol=1e-6)
+
+        lNo_serial = pest.theta_est_leaveNout(1, return_samples=True)
+        self.assertEqual(lNo_parallel.shape, (6, 3))
+        for name in ('asymptote', 'rate_constant'):
+            np.testing.assert_allclose(lNo_parallel[name], lNo_serial[name], rtol=1e-6)
+
     def test_leaveNout(self):
         lNo_theta = self.pest.theta_est_leaveNout(1)
         self.assertTrue(lNo_theta.shape == (6, 2))
@@ -27,10 +27,10 @@ import numpy as np
 from pyomo.common.deprecation import deprecated
 from pyomo.contrib.pynumero.interfaces.nlp import ExtendedNLP
 
+# constraints with bounds closer than this are treated as equalities
+_equality_tolerance = 1e-8
+
 
-# TODO: need to add support for modifying bounds.
-# support for changing variable bounds seems possible.
-# support for changing inequality bounds would require more work. (this is less frequent?)
 # TODO: check performance impacts of caching - memory and computational time.
 # TODO: only create and cache data for ExtendedNLP methods if they are ever asked for
 # TODO: There are todos in the code below
@@ -160,12 +160,9 @@ class AslNLP(ExtendedNLP):
         # to separate vectors of equality and inequality constraints.
         self._build_constraint_maps()
 
-        # get the values for the lower and upper bounds on the
-        # inequalities (extracted from con_full)
-        self._con_ineq_lb = np.compress(self._con_full_ineq_mask, self._con_full_lb)
-        self._con_ineq_ub = np.compress(self._con_full_ineq_mask, self._con_full_ub)
-        self._con_ineq_lb.flags.writeable = False
-        self._con_ineq_ub.flags.writeable = False
+        # split the constraint bounds into the inequality bounds and the
+        # rhs of the equality constraints
+        self._split_constraint_bounds()
 
         # get the initial values for the dual variables
         self._init_duals_eq = np.compress(self._con_full_eq_mask, self._init_duals_full)
@@ -175,17 +172,6 @@ class AslNLP(ExtendedNLP):
         self._init_duals_eq.flags.writeable = False
         self._init_duals_ineq.flags.writeable = False
 
-        # TODO: Should we be doing this or not?
-        # adjust the rhs to be 0 for equality constraints (in both full and eq)
-        self._con_full_rhs = self._con_full_ub.copy()
-        # set the rhs to zero for the inequality constraints (will use lb, ub)
-        self._con_full_rhs[~self._con_full_eq_mask] = 0.0
-        # change the upper and lower bounds to zero for equality constraints
-        self._con_full_lb[self._con_full_eq_mask] = 0.0
-        self._con_full_ub[self._con_full_eq_mask] = 0.0
-        self._con_full_lb.flags.writeable = False
-        self._con_full_ub.flags.writeable = False
-
         # set number of equatity and inequality constraints from maps
         self._n_con_eq = len(self._con_eq_full_map)
         self._n_con_ineq = len(self._con_ineq_full_map)
@@ -256,6 +242,85 @@ class AslNLP(ExtendedNLP):
         self._irows_hess.flags.writeable = False
         self._jcols_hess.flags.writeable = False
 
+    def _split_constraint_bounds(self):
+        # get the values for the lower and upper bounds on the
+        # inequalities (extracted from con_full)
+        self._con_ineq_lb = np.compress(self._con_full_ineq_mask, self._con_full_lb)
+        self._con_ineq_ub = np.compress(self._con_full_ineq_mask, self._con_full_ub)
+        self._con_ineq_lb.flags.writeable = False
+        self._con_ineq_ub.flags.writeable = False
+
+        # TODO: Should we be doing this or not?
+        # adjust the rhs to be 0 for equality constraints (in both full and eq)
+        self._con_full_rhs = self._con_full_ub.copy()
+        # set the rhs to zero for the inequality constraints (will use lb, ub)
+        self._con_full_rhs[~self._con_full_eq_mask] = 0.0
+        # change the upper and lower bounds to zero for equality constraints
+        self._con_full_lb[self._con_full_eq_mask] = 0.0
+        self._con_full_ub[self._con_full_eq_mask] = 0.0
+        self._con_full_lb.flags.writeable = False
+        self._con_full_ub.flags.writeable = False
+
+    def _set_primals_bounds(self, primals_lb, primals_ub):
+        """
+        Replace the bounds on the primal variables (e.g., after the
+        bounds were changed on the model the NL file was generated from)
+
+        Parameters
+        ----------
+        primals_lb : numpy.ndarray
+            New lower bounds on the primal variables
+        primals_ub : numpy.ndarray
+            New upper bounds on the primal variables
+        """
+        primals_lb = np.array(primals_lb, dtype=np.float64)
+        primals_ub = np.array(primals_ub, dtype=np.float64)
+        if np.any(primals_ub - primals_lb < 0):
+            raise RuntimeError(
+                "Some variables have lower bounds that are greater than the upper bounds."
+            )
+        primals_lb.flags.writeable = False
+        primals_ub.flags.writeable = False
+        self._primals_lb = primals_lb
+        self._primals_ub = primals_ub
+
+    def _set_constraint_bounds(self, con_full_lb, con_full_ub):
+        """
+        Replace the bounds on the constraints (e.g., after the data in
+        the model the NL file was generated from was changed). The bounds
+        are in the form used by the ASL, i.e., with the rhs of the
+        equality constraints as both the lower and upper bound.
+
+        Which constraints are equalities is part of the structure of the
+        NLP, and cannot be changed.
+
+        Parameters
+        ----------
+        con_full_lb : numpy.ndarray
+            New lower bounds on the (full) constraints
+        con_full_ub : numpy.ndarray
+            New upper bounds on the (full) constraints
+        """
+        con_full_lb = np.array(con_full_lb, dtype=np.float64)
+        con_full_ub = np.array(con_full_ub, dtype=np.float64)
+        bounds_difference = con_full_ub - con_full_lb
+        if np.any(bounds_difference < 0.0):
+            raise RuntimeError(
+                "Bounds on range constraints found with upper bounds set below the lower bounds."
+            )
+        eq_mask = np.absolute(bounds_difference) < _equality_tolerance
+        if not np.array_equal(eq_mask, self._con_full_eq_mask):
+            raise RuntimeError(
+                "The new constraint bounds change which constraints are "
+                "equality constraints. This changes the structure of the NLP "
+                "and is not supported."
+            )
+        self._con_full_lb = con_full_lb
+        self._con_full_ub = con_full_ub
+        self._split_constraint_bounds()
+        # the constraint residuals depend on the rhs
+        self._con_full_is_cached = False
+
     def _build_constraint_maps(self):
         """Creates internal maps and masks that convert from the full
         vector of constraints (the vector that includes all equality
@@ -272,10 +337,9 @@ class AslNLP(ExtendedNLP):
 
         # build maps from con_full to con_eq and con_ineq
         abs_bounds_difference = np.absolute(bounds_difference)
-        tolerance_equalities = 1e-8
-        self._con_full_eq_mask = abs_bounds_difference < tolerance_equalities
+        self._con_full_eq_mask = abs_bounds_difference < _equality_tolerance
         self._con_eq_full_map = self._con_full_eq_mask.nonzero()[0]
-        self._con_full_ineq_mask = abs_bounds_difference >= tolerance_equalities
+        self._con_full_ineq_mask = abs_bounds_difference >= _equality_tolerance
         self._con_ineq_full_map = self._con_full_ineq_mask.nonzero()[0]
         self._con_full_eq_mask.flags.writeable = False
         self._con_eq_full_map.flags.writeable = False
@@ -12,15 +12,19 @@ This module defines the classes that provide an NLP interface based on
 the Ampl Solver Library (ASL) implementation
 """
 
+import itertools
 import os
 import numpy as np
 
 from scipy.sparse import coo_matrix
 from pyomo.common.deprecation import deprecated
+from pyomo.common.numeric_types import native_numeric_types
 from pyomo.common.tempfiles import TempfileManager
 from pyomo.opt import WriterFactory
 import pyomo.core.base as pyo
-from pyomo.common.collections import ComponentMap
+from pyomo.common.collections import ComponentMap, ComponentSet
+from pyomo.core.expr.visitor import identify_mutable_parameters, identify_variables
+from pyomo.repn import generate_standard_repn
 from pyomo.common.env import CtypesEnviron
 from pyomo.solvers.amplfunc_merge import amplfunc_merge
 from ..sparse.block_matrix import BlockMatrix
@@ -102,6 +106,28 @@ class PyomoNLP(AslNLP):
             # keep pyomo model in cache
             self._pyomo_model = pyomo_model
 
+            # Record the data that was written to the NL file, so that
+            # update_params() can detect changes that it cannot apply
+            self._written_values = ComponentMap(
+                (param_data, param_data.value)
+                for param in pyomo_model.component_objects(pyo.Param, descend_into=True)
+                if param.mutable
+                for param_data in param.values()
+            )
+            self._written_values.update(
+                (v, v.value)
+                for v in pyomo_model.component_data_objects(pyo.Var, descend_into=True)
+                if v.fixed
+            )
+            # The objective constant is part of the objective in the NL
+            # file (unlike the constraint constants, which are moved to
+            # the bounds)
+            self._written_objective_constant = generate_standard_repn(
+                self._objective.expr, quadratic=False
+            ).constant
+            self._objective_offset = 0.0
+            self._param_updates = None
+
             # Create ComponentMap corresponding to equality constraint indices
             # This must be done after the call to super-init.
             full_to_equality = self._con_full_eq_map
@@ -296,6 +322,132 @@ class PyomoNLP(AslNLP):
                 indices.append(con_ineq_idx)
         return indices
 
+    def update_variables(self, variables=None):
+        """
+        Update the bounds on the primals from the current bounds and
+        fixed flags of the Pyomo variables, without regenerating the NL
+        file. Fixed variables remain primals (with the lower and upper
+        bounds equal to their current value).
+
+        Note that variables that were fixed when this PyomoNLP was
+        created are not primals, and cannot be unfixed.
+
+        Parameters
+        ----------
+        variables : list of Pyomo Var or VarData objects
+            The variables to update (if None, all of the primals are
+            updated)
+        """
+        if variables is None:
+            variables = self.get_pyomo_variables()
+        else:
+            variables = [
+                vd for v in variables for vd in (v.values() if v.is_indexed() else (v,))
+            ]
+        primals_lb = self._primals_lb.copy()
+        primals_ub = self._primals_ub.copy()
+        for v, i in zip(variables, self.get_primal_indices(variables)):
+            if v.fixed:
+                primals_lb[i] = primals_ub[i] = v.value
+            else:
+                lb, ub = v.bounds
+                primals_lb[i] = -np.inf if lb is None else lb
+                primals_ub[i] = np.inf if ub is None else ub
+        self._set_primals_bounds(primals_lb, primals_ub)
+
+    def update_params(self):
+        """
+        Update the constraint bounds and the objective with the current
+        values of the mutable Params and fixed Vars in the Pyomo model,
+        without regenerating the NL file. This reuses the ASL interface
+        (and all of the structure of the NLP).
+
+        Only data that appears in the constraint bounds or in constant
+        terms of the constraints and objective can be updated: data that
+        was written to the NL file as part of a coefficient or a
+        nonlinear term must not change (a RuntimeError is raised if it
+        has). In that case, create a new PyomoNLP.
+        """
+        if self._param_updates is None:
+            self._param_updates = self._collect_param_updates()
+        con_updates, objective_constant, frozen = self._param_updates
+        for obj in frozen:
+            if obj in self._written_values and obj.value != self._written_values[obj]:
+                raise RuntimeError(
+                    "The value of '%s' changed, but it appears in a "
+                    "coefficient or a nonlinear term of the NLP and cannot "
+                    "be updated. Create a new PyomoNLP instead." % (obj.name,)
+                )
+
+        # Reconstruct the bounds in the form used by the ASL
+        eq_mask = self._con_full_eq_mask
+        con_full_lb = np.where(eq_mask, self._con_full_rhs, self._con_full_lb)
+        con_full_ub = np.where(eq_mask, self._con_full_rhs, self._con_full_ub)
+        for i, lower, constant, upper in con_updates:
+            constant = pyo.value(constant)
+            if lower is not None:
+                con_full_lb[i] = pyo.value(lower) - constant
+            if upper is not None:
+                con_full_ub[i] = pyo.value(upper) - constant
+        self._set_constraint_bounds(con_full_lb, con_full_ub)
+        self._objective_offset = (
+            pyo.value(objective_constant) - self._written_objective_constant
+        )
+
+    def _collect_param_updates(self):
+        # Find the constraints whose bounds (as written to the NL file)
+        # depend on mutable data, the (symbolic) objective constant, and
+        # the mutable data that was written to the NL file as part of a
+        # coefficient or nonlinear term.  Primals that were fixed after
+        # this NLP was created are still variables in the NL file, so we
+        # temporarily unfix them to generate consistent repns.
+        refix = [v for v in self._vardata_to_idx if v.fixed]
+        for v in refix:
+            v.unfix()
+        try:
+            frozen = ComponentSet()
+            con_updates = []
+            for con, i in self._condata_to_idx.items():
+                constant = self._generate_parametric_repn(con.body, frozen).constant
+                lower, upper = con.lower, con.upper
+                if any(
+                    e.__class__ not in native_numeric_types
+                    for e in (lower, constant, upper)
+                    if e is not None
+                ):
+                    con_updates.append((i, lower, constant, upper))
+            objective_constant = self._generate_parametric_repn(
+                self._objective.expr, frozen
+            ).constant
+        finally:
+            for v in refix:
+                v.fix()
+        return con_updates, objective_constant, frozen
+
+    def _generate_parametric_repn(self, expr, frozen):
+        repn = generate_standard_repn(expr, compute_values=False, quadratic=False)
+        for v in itertools.chain(repn.linear_vars, repn.nonlinear_vars):
+            if v not in self._vardata_to_idx:
+                raise RuntimeError(
+                    "Variable '%s' was fixed when the PyomoNLP was created "
+                    "and cannot be unfixed. Create a new PyomoNLP instead." % (v.name,)
+                )
+        frozen_exprs = [
+            coef
+            for coef in repn.linear_coefs
+            if coef.__class__ not in native_numeric_types
+        ]
+        if repn.nonlinear_expr is not None:
+            frozen_exprs.append(repn.nonlinear_expr)
+        for e in frozen_exprs:
+            frozen.update(identify_mutable_parameters(e))
+            frozen.update(v for v in identify_variables(e) if v.fixed)
+        return repn
+
+    # overloaded from NLP
+    def evaluate_objective(self):
+        return super().evaluate_objective() + self._objective_offset
+
     # overloaded from NLP
     def get_obj_scaling(self):
         scaling_finder = SuffixFinder(
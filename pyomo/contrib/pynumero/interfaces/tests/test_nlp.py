@@ -735,6 +735,104 @@ class TestPyomoNLP(unittest.TestCase):
         scaling = nlp.get_primals_scaling()
         assert scaling is None
 
+    def _make_parametric_model(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3], bounds=(0, 10), initialize=1.0)
+        m.x0 = pyo.Var(initialize=2.0)
+        m.x0.fix()
+        m.p = pyo.Param(mutable=True, initialize=1.0)
+        m.q = pyo.Param(mutable=True, initialize=3.0)
+        m.c1 = pyo.Constraint(expr=m.x[1] ** 2 + m.p + m.x0 == 4)
+        m.c2 = pyo.Constraint(expr=m.q * m.x[2] <= 5)
+        m.c3 = pyo.Constraint(expr=pyo.inequality(m.p, m.x[3] + m.x[1], 8))
+        m.o = pyo.Objective(expr=m.x[1] ** 2 + 2 * m.p + m.x0 + m.x[2])
+        return m
+
+    def _assert_nlps_equal(self, nlp, expected):
+        for method in (
+            'primals_lb',
+            'primals_ub',
+            'constraints_lb',
+            'constraints_ub',
+            'ineq_lb',
+            'ineq_ub',
+            'evaluate_constraints',
+            'evaluate_eq_constraints',
+            'evaluate_ineq_constraints',
+            'evaluate_grad_objective',
+        ):
+            self.assertTrue(
+                np.array_equal(getattr(nlp, method)(), getattr(expected, method)()),
+                msg=method,
+            )
+        self.assertAlmostEqual(nlp.evaluate_objective(), expected.evaluate_objective())
+
+    def test_update_params(self):
+        m = self._make_parametric_model()
+        nlp = PyomoNLP(m)
+        primals = nlp.create_new_vector('primals')
+        primals[nlp.get_primal_indices([m.x[1], m.x[2], m.x[3]])] = [1.5, 0.5, 2.0]
+        nlp.set_primals(primals)
+        asl = nlp._asl
+
+        m.p = 2.0
+        m.x0.set_value(1.5)
+        nlp.update_params()
+        self.assertIs(nlp._asl, asl)
+
+        expected = PyomoNLP(m)
+        expected.set_primals(primals)
+        self._assert_nlps_equal(nlp, expected)
+        con_lb = nlp.constraints_lb()[nlp.get_constraint_indices([m.c1, m.c2, m.c3])]
+        self.assertEqual(list(con_lb), [0, -np.inf, 2])
+        self.assertAlmostEqual(nlp.evaluate_objective(), 1.5**2 + 4 + 1.5 + 0.5)
+
+    def test_update_params_frozen_data(self):
+        m = self._make_parametric_model()
+        nlp = PyomoNLP(m)
+        m.q = 4.0
+        with self.assertRaisesRegex(
+            RuntimeError, "The value of 'q' changed, but it appears in a coefficient"
+        ):
+            nlp.update_params()
+
+        m.q = 3.0
+        m.x[2].fix(1)
+        nlp = PyomoNLP(m)
+        m.x[2].unfix()
+        with self.assertRaisesRegex(
+            RuntimeError,
+            r"Variable 'x\[2\]' was fixed when the PyomoNLP was created "
+            "and cannot be unfixed",
+        ):
+            nlp.update_params()
+
+    def test_update_variables(self):
+        m = self._make_parametric_model()
+        nlp = PyomoNLP(m)
+        idx = nlp.get_primal_indices([m.x[1], m.x[2], m.x[3]])
+        asl = nlp._asl
+
+        m.x[1].setub(5)
+        m.x[2].fix(4)
+        nlp.update_variables()
+        self.assertIs(nlp._asl, asl)
+        self.assertEqual(list(nlp.primals_lb()[idx]), [0, 4, 0])
+        self.assertEqual(list(nlp.primals_ub()[idx]), [5, 4, 10])
+
+        m.x[2].unfix()
+        m.x[3].setlb(1)
+        nlp.update_variables([m.x[2]])
+        self.assertEqual(list(nlp.primals_lb()[idx]), [0, 0, 0])
+        self.assertEqual(list(nlp.primals_ub()[idx]), [5, 10, 10])
+
+        m.x[1].setlb(6)
+        with self.assertRaisesRegex(
+            RuntimeError,
+            "Some variables have lower bounds that are greater than the upper bounds",
+        ):
+            nlp.update_variables()
+
     def test_no_objective(self):
         m = pyo.ConcreteModel()
         m.x = pyo.Var()
@@ -54,6 +54,52 @@ logger = logging.getLogger(__name__)
 highspy, highspy_available = attempt_import('highspy')
 
 
+class _UpdateBatch:
+    """Accumulate changes to the HiGHS model so that they can be sent
+    to HiGHS with (at most) one call for each kind of change"""
+
+    def __init__(self):
+        self.col_ndx = []
+        self.col_lb = []
+        self.col_ub = []
+        self.row_ndx = []
+        self.row_lb = []
+        self.row_ub = []
+        self.cost_ndx = []
+        self.cost = []
+        self.coefs = []
+        self.offset = None
+
+    def apply(self, highs):
+        if self.col_ndx:
+            highs.changeColsBounds(
+                len(self.col_ndx),
+                np.array(self.col_ndx),
+                np.array(self.col_lb, dtype=np.double),
+                np.array(self.col_ub, dtype=np.double),
+            )
+        if self.row_ndx:
+            highs.changeRowsBounds(
+                len(self.row_ndx),
+                np.array(self.row_ndx),
+                np.array(self.row_lb, dtype=np.double),
+                np.array(self.row_ub, dtype=np.double),
+            )
+        if self.cost_ndx:
+            highs.changeColsCost(
+                len(self.cost_ndx),
+                np.array(self.cost_ndx),
+                np.array(self.cost, dtype=np.double),
+            )
+        # HiGHS does not provide a vectorized interface for changing
+        # matrix coefficients; the helpers only record coefficients
+        # whose value actually changed.
+        for row_ndx, col_ndx, coef in self.coefs:
+            highs.changeCoeff(row_ndx, col_ndx, coef)
+        if self.offset is not None:
+            highs.changeObjectiveOffset(self.offset)
+
+
 class _MutableVarBounds:
     def __init__(self, lower_expr, upper_expr, pyomo_var_id, var_map, highs):
         self.pyomo_var_id = pyomo_var_id
@@ -62,11 +108,10 @@ class _MutableVarBounds:
         self.var_map = var_map
         self.highs = highs
 
-    def update(self):
-        col_ndx = self.var_map[self.pyomo_var_id]
-        lb = value(self.lower_expr)
-        ub = value(self.upper_expr)
-        self.highs.changeColBounds(col_ndx, lb, ub)
+    def update(self, batch):
+        batch.col_ndx.append(self.var_map[self.pyomo_var_id])
+        batch.col_lb.append(value(self.lower_expr))
+        batch.col_ub.append(value(self.upper_expr))
 
 
 class _MutableLinearCoefficient:
@@ -77,11 +122,17 @@ class _MutableLinearCoefficient:
         self.pyomo_con = pyomo_con
         self.con_map = con_map
         self.var_map = var_map
-
-    def update(self):
-        row_ndx = self.con_map[self.pyomo_con]
-        col_ndx = self.var_map[self.pyomo_var_id]
-        self.highs.changeCoeff(row_ndx, col_ndx, value(self.expr))
+        # The coefficient value most recently sent to HiGHS
+        self.last_value = value(expr)
+
+    def update(self, batch):
+        coef = value(self.expr)
+        if coef == self.last_value:
+            return
+        self.last_value = coef
+        batch.coefs.append(
+            (self.con_map[self.pyomo_con], self.var_map[self.pyomo_var_id], coef)
+        )
 
 
 class _MutableObjectiveCoefficient:
@@ -91,9 +142,9 @@ class _MutableObjectiveCoefficient:
         self.pyomo_var_id = pyomo_var_id
         self.var_map = var_map
 
-    def update(self):
-        col_ndx = self.var_map[self.pyomo_var_id]
-        self.highs.changeColCost(col_ndx, value(self.expr))
+    def update(self, batch):
+        batch.cost_ndx.append(self.var_map[self.pyomo_var_id])
+        batch.cost.append(value(self.expr))
 
 
 class _MutableObjectiveOffset:
@@ -101,8 +152,8 @@ class _MutableObjectiveOffset:
         self.expr = expr
         self.highs = highs
 
-    def update(self):
-        self.highs.changeObjectiveOffset(value(self.expr))
+    def update(self, batch):
+        batch.offset = value(self.expr)
 
 
 class _MutableConstraintBounds:
@@ -113,11 +164,10 @@ class _MutableConstraintBounds:
         self.con_map = con_map
         self.highs = highs
 
-    def update(self):
-        row_ndx = self.con_map[self.con]
-        lb = value(self.lower_expr)
-        ub = value(self.upper_expr)
-        self.highs.changeRowBounds(row_ndx, lb, ub)
+    def update(self, batch):
+        batch.row_ndx.append(self.con_map[self.con])
+        batch.row_lb.append(value(self.lower_expr))
+        batch.row_ub.append(value(self.upper_expr))
 
 
 class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
@@ -472,13 +522,17 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         self._sol = None
         if self._last_results_object is not None:
             self._last_results_object.solution_loader.invalidate()
+        # Evaluate all the mutable data first, and then send the changes
+        # to HiGHS in bulk
+        batch = _UpdateBatch()
         for con, helpers in self._mutable_helpers.items():
             for helper in helpers:
-                helper.update()
+                helper.update(batch)
         for k, (v, helper) in self._mutable_bounds.items():
-            helper.update()
+            helper.update(batch)
         for helper in self._objective_helpers:
-            helper.update()
+            helper.update(batch)
+        batch.apply(self._solver_model)
 
     def _set_objective(self, obj):
         self._sol = None
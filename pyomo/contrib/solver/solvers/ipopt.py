@@ -333,13 +333,13 @@ class Ipopt(SolverBase):
             # be terminated with '\n' regardless of platform.  We will
             # disable universal newlines in the NL file to prevent
             # Python from mapping those '\n' to '\r\n' on Windows.
-            with open(
-                basename + '.nl', 'w', newline='\n', encoding='utf-8'
-            ) as nl_file, open(
+            if config.writer_config.nl_format == 'b':
+                nl_file = open(basename + '.nl', 'wb')
+            else:
+                nl_file = open(basename + '.nl', 'w', newline='\n', encoding='utf-8')
+            with nl_file, open(
                 basename + '.row', 'w', encoding='utf-8'
-            ) as row_file, open(
-                basename + '.col', 'w', encoding='utf-8'
-            ) as col_file:
+            ) as row_file, open(basename + '.col', 'w', encoding='utf-8') as col_file:
                 timer.start('write_nl_file')
                 self._writer.config.set_value(config.writer_config)
                 try:
@@ -420,7 +420,9 @@ class Ipopt(SolverBase):
                     results.timing_info.total_seconds = 0
             else:
                 if os.path.isfile(basename + '.sol'):
-                    with open(basename + '.sol', 'r', encoding='utf-8') as sol_file:
+                    # Note: the .sol file is binary if the NL file was
+                    # binary; parse_sol_file() will detect the format
+                    with open(basename + '.sol', 'rb') as sol_file:
                         timer.start('parse_sol')
                         results = self._parse_solution(sol_file, nl_info)
                         timer.stop('parse_sol')
@@ -538,7 +540,7 @@ class Ipopt(SolverBase):
 
         return iters, nofunc_time, func_time, total_time
 
-    def _parse_solution(self, instream: io.TextIOBase, nl_info: NLWriterInfo):
+    def _parse_solution(self, instream: io.IOBase, nl_info: NLWriterInfo):
         results = Results()
         res, sol_data = parse_sol_file(
             sol_file=instream, nl_info=nl_info, result=results
@@ -10,13 +10,28 @@
 #  ___________________________________________________________________________
 
 
-from typing import Tuple, Dict, Any, List, Sequence, Optional, Mapping, NoReturn
+from typing import (
+    Tuple,
+    Dict,
+    Any,
+    List,
+    Sequence,
+    Optional,
+    Mapping,
+    NoReturn,
+    Union,
+)
 import io
+import itertools
+import mmap
+import struct
+import warnings
 
 from pyomo.core.base.constraint import ConstraintData
 from pyomo.core.base.var import VarData
 from pyomo.core.expr import value
 from pyomo.common.collections import ComponentMap
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.core.staleflag import StaleFlagManager
 from pyomo.common.errors import DeveloperError, PyomoException
 from pyomo.repn.plugins.nl_writer import NLWriterInfo
@@ -32,11 +47,14 @@ from pyomo.contrib.solver.common.solution_loader import SolutionLoaderBase
 class SolFileData:
     """
     Defines the data types found within a .sol file
+
+    After parsing, :attr:`primals` and :attr:`duals` are NumPy arrays
+    (if NumPy is available).
     """
 
     def __init__(self) -> None:
-        self.primals: List[float] = []
-        self.duals: List[float] = []
+        self.primals: Union[List[float], 'np.ndarray'] = []
+        self.duals: Union[List[float], 'np.ndarray'] = []
         self.var_suffixes: Dict[str, Dict[int, Any]] = {}
         self.con_suffixes: Dict[str, Dict[Any]] = {}
         self.obj_suffixes: Dict[str, Dict[int, Any]] = {}
@@ -62,16 +80,8 @@ class SolSolutionLoader(SolutionLoaderBase):
         if self._sol_data is None:
             assert len(self._nl_info.variables) == 0
         else:
-            if self._nl_info.scaling:
-                for var, val, scale in zip(
-                    self._nl_info.variables,
-                    self._sol_data.primals,
-                    self._nl_info.scaling.variables,
-                ):
-                    var.set_value(val / scale, skip_validation=True)
-            else:
-                for var, val in zip(self._nl_info.variables, self._sol_data.primals):
-                    var.set_value(val, skip_validation=True)
+            for var, val in zip(self._nl_info.variables, self._primal_values()):
+                var.set_value(val, skip_validation=True)
 
         for var, v_expr in self._nl_info.eliminated_vars:
             var.value = value(v_expr)
@@ -90,14 +100,7 @@ class SolSolutionLoader(SolutionLoaderBase):
         if self._sol_data is None:
             assert len(self._nl_info.variables) == 0
         else:
-            if self._nl_info.scaling is None:
-                scale_list = [1] * len(self._nl_info.variables)
-            else:
-                scale_list = self._nl_info.scaling.variables
-            for var, val, scale in zip(
-                self._nl_info.variables, self._sol_data.primals, scale_list
-            ):
-                val_map[id(var)] = val / scale
+            val_map = dict(zip(map(id, self._nl_info.variables), self._primal_values()))
 
         for var, v_expr in self._nl_info.eliminated_vars:
             val = replace_expressions(v_expr, substitution_map=val_map)
@@ -132,33 +135,259 @@ class SolSolutionLoader(SolutionLoaderBase):
                 "Solution data is empty. This should not "
                 "have happened. Report this error to the Pyomo Developers."
             )
-        res = {}
-        if self._nl_info.scaling is None:
-            scale_list = [1] * len(self._nl_info.constraints)
-            obj_scale = 1
-        else:
-            scale_list = self._nl_info.scaling.constraints
+        duals = self._sol_data.duals
+        if self._nl_info.scaling is not None:
             obj_scale = self._nl_info.scaling.objectives[0]
+            duals = [
+                val * scale / obj_scale
+                for val, scale in zip(duals, self._nl_info.scaling.constraints)
+            ]
+        elif numpy_available and isinstance(duals, np.ndarray):
+            duals = duals.tolist()
         if cons_to_load is None:
-            cons_to_load = set(self._nl_info.constraints)
-        else:
-            cons_to_load = set(cons_to_load)
-        for con, val, scale in zip(
-            self._nl_info.constraints, self._sol_data.duals, scale_list
-        ):
-            if con in cons_to_load:
-                res[con] = val * scale / obj_scale
-        return res
+            return dict(zip(self._nl_info.constraints, duals))
+        cons_to_load = set(cons_to_load)
+        return {
+            con: val
+            for con, val in zip(self._nl_info.constraints, duals)
+            if con in cons_to_load
+        }
 
+    def _primal_values(self) -> List[float]:
+        """Return the (unscaled) primal values in the order of
+        ``nl_info.variables``"""
+        primals = self._sol_data.primals
+        scaling = self._nl_info.scaling
+        if numpy_available and isinstance(primals, np.ndarray):
+            if scaling:
+                primals = primals / np.asarray(scaling.variables, dtype=float)
+            return primals.tolist()
+        if scaling:
+            return [val / scale for val, scale in zip(primals, scaling.variables)]
+        return primals
+
+
+# Binary .sol files are a sequence of Fortran-style unformatted
+# records: each record is the payload bracketed by its length (in bytes)
+_sol_record_len = struct.Struct('=i')
+_binary_sol_marker = _sol_record_len.pack(6) + b'binary' + _sol_record_len.pack(6)
+
+
+class _BinarySolReader:
+    """Reader for the records in a binary .sol file
+
+    Binary .sol files are generated by ASL solvers when the model was
+    passed to the solver as a binary NL file.  Numbers are stored in the
+    native machine representation (the same byte order used to write
+    the binary NL file).
 
-def parse_sol_file(
-    sol_file: io.TextIOBase, nl_info: NLWriterInfo, result: Results
-) -> Tuple[Results, SolFileData]:
     """
-    Parse a .sol file and populate to Pyomo objects
+
+    def __init__(self, sol_file: io.BufferedIOBase) -> None:
+        self.sol_file = sol_file
+
+    def read_record(self) -> Optional[bytes]:
+        header = self.sol_file.read(_sol_record_len.size)
+        if not header:
+            return None
+        if len(header) != _sol_record_len.size:
+            raise PyomoException("ERROR READING `sol` FILE. Truncated binary record.")
+        (n,) = _sol_record_len.unpack(header)
+        data = self.sol_file.read(n)
+        if len(data) != n or self.sol_file.read(_sol_record_len.size) != header:
+            raise PyomoException("ERROR READING `sol` FILE. Corrupt binary record.")
+        return data
+
+    def read_ints(self) -> Tuple[int, ...]:
+        data = self.read_record()
+        return struct.unpack(f'={len(data) // 4}i', data)
+
+    def read_floats(self, n: int) -> Sequence[float]:
+        if not n:
+            return np.empty(0) if numpy_available else []
+        data = self.read_record()
+        if len(data) != 8 * n:
+            raise PyomoException(
+                f"ERROR READING `sol` FILE. Expected {n} values; "
+                f"received {len(data) // 8}."
+            )
+        if numpy_available:
+            return np.frombuffer(data, dtype='=f8')
+        return list(struct.unpack(f'={n}d', data))
+
+    def read_solution(self):
+        # The message lines are terminated by an empty record
+        message = []
+        line = self.read_record()
+        while line:
+            message.append(line.decode())
+            line = self.read_record()
+        if line is None:
+            raise PyomoException("ERROR READING `sol` FILE. No options record found.")
+        model_objects = self.read_ints()
+        number_of_options = model_objects[0]
+        # [nOpts, options..., n_con, n_duals, n_var, n_primals]
+        number_of_cons, number_of_duals, number_of_vars, number_of_primals = (
+            model_objects[number_of_options + 1 : number_of_options + 5]
+        )
+        duals = self.read_floats(number_of_duals)
+        variable_vals = self.read_floats(number_of_primals)
+        objno = self.read_ints()
+        if len(objno) != 2:
+            raise PyomoException(
+                "ERROR READING `sol` FILE. Expected two numbers in `objno` "
+                f"record; received {objno}."
+            )
+        return (
+            '\n'.join(message),
+            number_of_cons,
+            number_of_vars,
+            duals,
+            variable_vals,
+            list(objno),
+        )
+
+    def read_suffixes(self, sol_data: SolFileData) -> None:
+        header = self.read_record()
+        while header:
+            read_data_type, number_of_entries, name_len, table_len = struct.unpack(
+                '=4i', header
+            )
+            suffix_name = self.read_record().decode().rstrip('\0')
+            if table_len:
+                sol_data.other.append(self.read_record().decode())
+            data = self.read_record()
+            if read_data_type & 4:
+                values = struct.iter_unpack('=id', data)
+            else:
+                values = struct.iter_unpack('=ii', data)
+            data_type = read_data_type & 3  # 0-var, 1-con, 2-obj, 3-prob
+            if data_type == 0:
+                sol_data.var_suffixes[suffix_name] = dict(values)
+            elif data_type == 1:
+                sol_data.con_suffixes[suffix_name] = dict(values)
+            elif data_type == 2:
+                sol_data.obj_suffixes[suffix_name] = dict(values)
+            else:
+                sol_data.problem_suffixes[suffix_name] = [v for _, v in values]
+            header = self.read_record()
+
+
+def _get_binary_sol_reader(sol_file) -> Optional[_BinarySolReader]:
+    """Return a _BinarySolReader if sol_file is a binary .sol file
+
+    Returns None if ``sol_file`` is a text stream.  Binary streams that
+    do not contain a binary .sol file are left positioned at the
+    beginning of the file.
+
     """
-    sol_data = SolFileData()
+    if isinstance(sol_file, io.TextIOBase):
+        return None
+    head = sol_file.read(len(_binary_sol_marker))
+    if head == _binary_sol_marker:
+        return _BinarySolReader(sol_file)
+    sol_file.seek(0)
+    return None
+
+
+class _MappedSolFile:
+    """Text .sol file interface over a memory-mapped file
 
+    This provides the subset of the text stream API used by the .sol
+    parser (:meth:`readline` and iteration), plus :meth:`read_values`,
+    which parses the (potentially very large) block of duals / primals
+    directly from the mapped buffer without splitting it into lines.
+
+    """
+
+    def __init__(self, buf: mmap.mmap) -> None:
+        self._buf = buf
+
+    def readline(self) -> str:
+        return self._buf.readline().decode()
+
+    def __iter__(self):
+        return iter(self.readline, '')
+
+    def read_values(self, n: int) -> Sequence[float]:
+        buf = self._buf
+        start = buf.tell()
+        if not n:
+            end = start
+        elif numpy_available:
+            newlines = np.flatnonzero(
+                np.frombuffer(buf, dtype=np.uint8, offset=start) == ord('\n')
+            )
+            if len(newlines) >= n:
+                end = start + int(newlines[n - 1]) + 1
+            else:
+                end = len(buf)
+            # Release the view into the buffer (the mmap cannot be
+            # closed while any exported views exist)
+            del newlines
+        else:
+            for i in range(n):
+                buf.readline()
+            end = buf.tell()
+        buf.seek(end)
+        return _parse_values(buf[start:end], n)
+
+    def close(self) -> None:
+        self._buf.close()
+
+
+def _map_sol_file(sol_file: io.IOBase) -> Optional[_MappedSolFile]:
+    """Memory-map the remainder of a binary stream backed by a real file
+
+    Returns None if the stream cannot be mapped (text streams,
+    in-memory streams, empty files, etc.).
+
+    """
+    if isinstance(sol_file, io.TextIOBase):
+        return None
+    try:
+        fileno = sol_file.fileno()
+        pos = sol_file.tell()
+        buf = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # io.UnsupportedOperation is a subclass of both OSError and
+        # ValueError; mmap raises ValueError for empty files
+        return None
+    buf.seek(pos)
+    return _MappedSolFile(buf)
+
+
+def _parse_values(data, n: int) -> Sequence[float]:
+    """Parse a block of `n` whitespace-separated floats (str or bytes)"""
+    if numpy_available:
+        with warnings.catch_warnings():
+            # NumPy only warns (and stops parsing) on malformed data
+            warnings.simplefilter('error', DeprecationWarning)
+            try:
+                values = np.fromstring(data, sep=' ')
+            except DeprecationWarning:
+                values = None
+        if values is None:
+            # Fall back on float() for malformed data (so that the
+            # error is consistent with the pure-Python parser)
+            values = [float(val) for val in data.split()]
+    else:
+        values = [float(val) for val in data.split()]
+    if len(values) != n:
+        raise PyomoException(
+            f"ERROR READING `sol` FILE. Expected {n} values; received {len(values)}."
+        )
+    return values
+
+
+def _read_values(sol_file, n: int) -> Sequence[float]:
+    """Read the next `n` lines of `sol_file` as floats"""
+    if isinstance(sol_file, _MappedSolFile):
+        return sol_file.read_values(n)
+    return _parse_values(''.join(itertools.islice(sol_file, n)), n)
+
+
+def _read_text_solution(sol_file: io.TextIOBase):
     #
     # Some solvers (minto) do not write a message.  We will assume
     # all non-blank lines up to the 'Options' line is the message.
@@ -200,11 +429,11 @@ def parse_sol_file(
     # Identify the total number of variables and constraints
     number_of_cons = model_objects[number_of_options + 1]
     number_of_vars = model_objects[number_of_options + 3]
-    assert number_of_cons == len(nl_info.constraints)
-    assert number_of_vars == len(nl_info.variables)
 
-    duals = [float(sol_file.readline()) for i in range(number_of_cons)]
-    variable_vals = [float(sol_file.readline()) for i in range(number_of_vars)]
+    # The duals and primals are a contiguous block of one value per line
+    values = _read_values(sol_file, number_of_cons + number_of_vars)
+    duals = values[:number_of_cons]
+    variable_vals = values[number_of_cons:]
 
     # Parse the exit code line and capture it
     exit_code = [0, 0]
@@ -220,6 +449,47 @@ def parse_sol_file(
         raise PyomoException(
             f"ERROR READING `sol` FILE. Expected `objno`; received {line}."
         )
+    return message, number_of_cons, number_of_vars, duals, variable_vals, exit_code
+
+
+def parse_sol_file(
+    sol_file: io.IOBase, nl_info: NLWriterInfo, result: Results
+) -> Tuple[Results, SolFileData]:
+    """
+    Parse a .sol file and populate to Pyomo objects
+
+    ``sol_file`` may be a text stream or a binary stream.  Binary
+    streams may contain either a text or a binary .sol file.  Text .sol
+    files opened in binary mode are memory-mapped and the solution
+    values are parsed directly from the mapped file.
+    """
+    binary_reader = _get_binary_sol_reader(sol_file)
+    if binary_reader is not None:
+        return _parse_sol_data(sol_file, binary_reader, nl_info, result)
+    mapped = _map_sol_file(sol_file)
+    if mapped is None:
+        if not isinstance(sol_file, io.TextIOBase):
+            sol_file = io.TextIOWrapper(sol_file, encoding='utf-8')
+        return _parse_sol_data(sol_file, None, nl_info, result)
+    try:
+        return _parse_sol_data(mapped, None, nl_info, result)
+    finally:
+        mapped.close()
+
+
+def _parse_sol_data(
+    sol_file, binary_reader: Optional[_BinarySolReader], nl_info, result
+) -> Tuple[Results, SolFileData]:
+    sol_data = SolFileData()
+
+    if binary_reader is not None:
+        solution = binary_reader.read_solution()
+    else:
+        solution = _read_text_solution(sol_file)
+    message, number_of_cons, number_of_vars, duals, variable_vals, exit_code = solution
+    assert number_of_cons == len(nl_info.constraints)
+    assert number_of_vars == len(nl_info.variables)
+
     result.extra_info.solver_message = message.strip().replace('\n', '; ')
     exit_code_message = ''
     if (exit_code[1] >= 0) and (exit_code[1] <= 99):
@@ -265,6 +535,9 @@ def parse_sol_file(
         sol_data.primals = variable_vals
         sol_data.duals = duals
         ### Read suffixes ###
+        if binary_reader is not None:
+            binary_reader.read_suffixes(sol_data)
+            return result, sol_data
         line = sol_file.readline()
         while line:
             line = line.strip()
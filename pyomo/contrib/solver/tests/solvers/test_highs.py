@@ -0,0 +1,129 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+import pyomo.environ as pyo
+from pyomo.common.dependencies import numpy_available
+from pyomo.contrib.solver.solvers.highs import (
+    Highs,
+    _MutableLinearCoefficient,
+    _UpdateBatch,
+)
+
+
+class TestUpdateBatch(unittest.TestCase):
+    def test_unchanged_coefficient(self):
+        m = pyo.ConcreteModel()
+        m.p = pyo.Param(mutable=True, initialize=2)
+        m.x = pyo.Var()
+        m.c = pyo.Constraint(expr=m.p * m.x >= 1)
+        helper = _MutableLinearCoefficient(
+            pyomo_con=m.c,
+            pyomo_var_id=id(m.x),
+            con_map={m.c: 0},
+            var_map={id(m.x): 3},
+            expr=m.p,
+            highs=None,
+        )
+        self.assertEqual(helper.last_value, 2)
+
+        # Coefficients that did not change are not sent to HiGHS
+        batch = _UpdateBatch()
+        helper.update(batch)
+        self.assertEqual(batch.coefs, [])
+
+        m.p = 5
+        batch = _UpdateBatch()
+        helper.update(batch)
+        self.assertEqual(batch.coefs, [(0, 3, 5)])
+        self.assertEqual(helper.last_value, 5)
+
+        batch = _UpdateBatch()
+        helper.update(batch)
+        self.assertEqual(batch.coefs, [])
+
+
+@unittest.skipUnless(numpy_available, 'numpy is not available')
+@unittest.skipUnless(Highs().available(), 'highspy is not available')
+class TestHighsPersistentUpdates(unittest.TestCase):
+    def _model(self):
+        m = pyo.ConcreteModel()
+        m.x_lb = pyo.Param(mutable=True, initialize=0)
+        m.x_ub = pyo.Param(mutable=True, initialize=10)
+        m.c_x = pyo.Param(mutable=True, initialize=1)
+        m.c_y = pyo.Param(mutable=True, initialize=2)
+        m.a = pyo.Param(mutable=True, initialize=1)
+        m.b = pyo.Param(mutable=True, initialize=1)
+        m.r1 = pyo.Param(mutable=True, initialize=4)
+        m.r2_lb = pyo.Param(mutable=True, initialize=-2)
+        m.r2_ub = pyo.Param(mutable=True, initialize=2)
+        m.x = pyo.Var(bounds=(m.x_lb, m.x_ub))
+        m.y = pyo.Var(bounds=(0, None))
+        m.obj = pyo.Objective(expr=m.c_x * m.x + m.c_y * m.y)
+        m.con1 = pyo.Constraint(expr=m.a * m.x + m.y >= m.r1)
+        m.con2 = pyo.Constraint(expr=(m.r2_lb, m.x - m.b * m.y, m.r2_ub))
+        return m
+
+    def _check(self, m, opt):
+        res = opt.solve(m)
+        obj = res.incumbent_objective
+        x, y = m.x.value, m.y.value
+        fresh = Highs().solve(m)
+        self.assertAlmostEqual(obj, fresh.incumbent_objective)
+        self.assertAlmostEqual(x, m.x.value)
+        self.assertAlmostEqual(y, m.y.value)
+        return obj
+
+    def test_updates_between_solves(self):
+        m = self._model()
+        opt = Highs()
+        self.assertAlmostEqual(self._check(m, opt), 5)
+
+        # variable bounds
+        m.x_ub = 1
+        self.assertAlmostEqual(self._check(m, opt), 7)
+        m.x_lb = 1.5
+        m.x_ub = 3
+        self._check(m, opt)
+
+        # constraint bounds
+        m.r1 = 6
+        m.r2_ub = 1
+        self._check(m, opt)
+        m.r2_lb = -1
+        self._check(m, opt)
+
+        # objective coefficients
+        m.c_x = 3
+        m.c_y = 0.5
+        self._check(m, opt)
+
+        # mutable coefficients in the constraint matrix
+        m.a = 2
+        m.b = 0.5
+        self._check(m, opt)
+
+        # an update where no coefficient changes (only a bound does)
+        m.a = 2
+        m.x_ub = 4
+        self._check(m, opt)
+
+        # a coefficient that was initially zero
+        m2 = self._model()
+        m2.a = 0
+        opt2 = Highs()
+        opt2.solve(m2)
+        m2.a = 1.5
+        self._check(m2, opt2)
+
+
+if __name__ == '__main__':
+    unittest.main()
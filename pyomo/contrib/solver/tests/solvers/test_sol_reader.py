@@ -9,10 +9,21 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import io
+import struct
+
+import pyomo.environ as pyo
 from pyomo.common import unittest
 from pyomo.common.fileutils import this_file_dir
 from pyomo.common.tempfiles import TempfileManager
-from pyomo.contrib.solver.solvers.sol_reader import SolFileData
+from pyomo.contrib.solver.common.results import Results, SolutionStatus
+from pyomo.common.errors import PyomoException
+from pyomo.contrib.solver.solvers.sol_reader import (
+    SolFileData,
+    SolSolutionLoader,
+    parse_sol_file,
+)
+from pyomo.repn.plugins.nl_writer import NLWriter
 
 currdir = this_file_dir()
 
@@ -49,3 +60,111 @@ class TestSolParser(unittest.TestCase):
 
     def test_infeasible2(self):
         pass
+
+    def test_binary_sol(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2], bounds=(0, None))
+        m.o = pyo.Objective(expr=m.x[1] + m.x[2])
+        m.c = pyo.Constraint(expr=m.x[1] * m.x[2] >= 1)
+        nl_info = NLWriter().write(m, io.BytesIO(), nl_format='b')
+
+        text = (
+            "Ipopt 3.14: Optimal Solution Found\n\nOptions\n3\n1\n1\n0\n"
+            "1\n1\n2\n2\n-0.5\n1.0\n1.0\nobjno 0 0\n"
+            "suffix 4 2 13 0 0\nipopt_zU_out\n0 -1.5\n1 2.5\n"
+            "suffix 1 1 7 0 0\nstatus\n0 3\n"
+        )
+
+        def record(data):
+            return struct.pack('=i', len(data)) + data + struct.pack('=i', len(data))
+
+        binary = b''.join(
+            [
+                record(b'binary'),
+                record(b'Ipopt 3.14: Optimal Solution Found'),
+                record(b''),
+                record(struct.pack('=8i', 3, 1, 1, 0, 1, 1, 2, 2)),
+                record(struct.pack('=d', -0.5)),
+                record(struct.pack('=2d', 1.0, 1.0)),
+                record(struct.pack('=2i', 0, 0)),
+                record(struct.pack('=4i', 4, 2, 13, 0)),
+                record(b'ipopt_zU_out'),
+                record(struct.pack('=idid', 0, -1.5, 1, 2.5)),
+                record(struct.pack('=4i', 1, 1, 7, 0)),
+                record(b'status'),
+                record(struct.pack('=ii', 0, 3)),
+            ]
+        )
+
+        text_fname = TempfileManager.create_tempfile(suffix='.sol')
+        with open(text_fname, 'w') as FILE:
+            FILE.write(text)
+        binary_fname = TempfileManager.create_tempfile(suffix='.sol')
+        with open(binary_fname, 'wb') as FILE:
+            FILE.write(binary)
+
+        results = []
+        for stream in (
+            io.StringIO(text),
+            io.BytesIO(text.encode()),
+            io.BytesIO(binary),
+            # Text files opened in binary mode are memory-mapped
+            open(text_fname, 'rb'),
+            open(text_fname, 'r'),
+            open(binary_fname, 'rb'),
+        ):
+            with stream:
+                res, sol_data = parse_sol_file(stream, nl_info, Results())
+            self.assertEqual(res.solution_status, SolutionStatus.optimal)
+            self.assertEqual(
+                res.extra_info.solver_message, 'Ipopt 3.14: Optimal Solution Found'
+            )
+            self.assertEqual(list(sol_data.primals), [1.0, 1.0])
+            self.assertEqual(list(sol_data.duals), [-0.5])
+            results.append(sol_data)
+        for sol_data in results[1:]:
+            self.assertEqual(sol_data.var_suffixes, results[0].var_suffixes)
+            self.assertEqual(sol_data.con_suffixes, results[0].con_suffixes)
+        self.assertEqual(results[2].var_suffixes, {'ipopt_zU_out': {0: -1.5, 1: 2.5}})
+        self.assertEqual(results[2].con_suffixes, {'status': {0: 3}})
+
+    def test_load_solution(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(range(5))
+        m.o = pyo.Objective(expr=sum(m.x.values()))
+        m.c = pyo.Constraint(range(3), rule=lambda m, i: m.x[i] + m.x[i + 1] >= i)
+        nl_info = NLWriter().write(m, io.StringIO(), symbolic_solver_labels=True)
+        self.assertEqual(len(nl_info.variables), 5)
+        self.assertEqual(len(nl_info.constraints), 3)
+
+        header = "\nOptions\n3\n1\n1\n0\n3\n3\n5\n5\n"
+        duals = "".join(f"{-0.5 * i}\n" for i in range(3))
+        primals = [f"{1.5 * i!r}\n" for i in range(5)]
+        fname = TempfileManager.create_tempfile(suffix='.sol')
+        with open(fname, 'w') as FILE:
+            FILE.write(header + duals + "".join(primals) + "objno 0 0\n")
+        with open(fname, 'rb') as FILE:
+            res, sol_data = parse_sol_file(FILE, nl_info, Results())
+        self.assertEqual(res.solution_status, SolutionStatus.optimal)
+
+        loader = SolSolutionLoader(sol_data, nl_info)
+        loader.load_vars()
+        for i, v in enumerate(nl_info.variables):
+            self.assertEqual(v.value, 1.5 * i)
+            self.assertIs(type(v.value), float)
+            self.assertFalse(v.stale)
+        self.assertEqual(
+            loader.get_duals(), {c: -0.5 * i for i, c in enumerate(nl_info.constraints)}
+        )
+        self.assertEqual(
+            loader.get_duals([nl_info.constraints[1]]), {nl_info.constraints[1]: -0.5}
+        )
+
+        # Truncated files are detected
+        with open(fname, 'w') as FILE:
+            FILE.write(header + duals + "".join(primals[:-1]))
+        with open(fname, 'rb') as FILE:
+            with self.assertRaisesRegex(
+                PyomoException, "Expected 8 values; received 7"
+            ):
+                parse_sol_file(FILE, nl_info, Results())
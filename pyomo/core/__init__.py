@@ -64,7 +64,7 @@ from pyomo.core.expr.calculus.derivatives import differentiate
 from pyomo.core.expr.taylor_series import taylor_series_expansion
 
 from pyomo.common.collections import ComponentMap
-from pyomo.core.expr.symbol_map import SymbolMap
+from pyomo.core.expr.symbol_map import SymbolMap, CompactSymbolMap
 from pyomo.core.expr import (
     numvalue,
     numeric_expr,
@@ -200,6 +200,7 @@ from pyomo.core.base.instance2dat import instance2dat
 from pyomo.core.util import (
     prod,
     quicksum,
+    linear_sum,
     sum_product,
     dot_product,
     summation,
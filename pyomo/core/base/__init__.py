@@ -14,7 +14,7 @@
 from pyomo.common.collections import ComponentMap
 from pyomo.common.enums import minimize, maximize
 
-from pyomo.core.expr.symbol_map import SymbolMap
+from pyomo.core.expr.symbol_map import SymbolMap, CompactSymbolMap
 from pyomo.core.expr.numvalue import (
     nonpyomo_leaf_types,
     native_types,
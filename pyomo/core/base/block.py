@@ -36,6 +36,8 @@ from pyomo.core.base.component import (
     Component,
     ActiveComponentData,
     ModelComponentFactory,
+    ComponentNameCache,
+    ModelStructureVersion,
 )
 from pyomo.core.base.enums import SortComponents, TraversalStrategy
 from pyomo.core.base.global_set import UnindexedComponent_index
@@ -238,6 +240,101 @@ class _DeduplicateInfo(object):
                 return filterfalse(has_been_seen, items)
 
 
+class _ComponentDataCache(object):
+    """Cache of :py:meth:`BlockData.component_data_objects` results
+
+    This class stores the component data objects returned for each
+    distinct set of :py:meth:`BlockData.component_data_objects`
+    arguments.  Each entry is validated before it is returned:
+
+      - the :py:data:`ModelStructureVersion` must not have changed
+        (that is, no components were added, removed, or
+        (de)activated, and no component data objects were deleted), and
+
+      - none of the traversed components (including the Block
+        components that the traversal descended into) may have gained
+        component data objects.
+
+    The cost of returning a cached result is therefore proportional to
+    the number of traversed components and not the number of component
+    data objects in the model.
+
+    """
+
+    __slots__ = ('entries',)
+
+    def __init__(self):
+        self.entries = {}
+
+    @staticmethod
+    def _key(ctype, active, sort, descend_into, descent_order):
+        # Return a hashable key for the arguments (or None if the
+        # arguments should not be cached, e.g., because they contain
+        # objects like SubclassOf that are created on every call)
+        if ctype is not None and not isclass(ctype):
+            ctype = tuple(ctype)
+            if not all(map(isclass, ctype)):
+                return None
+        if descend_into.__class__ is not bool and not isclass(descend_into):
+            if descend_into is not None:
+                descend_into = tuple(descend_into)
+                if not all(map(isclass, descend_into)):
+                    return None
+        return (ctype, active, sort, descend_into, descent_order)
+
+    def get(self, block, ctype, active, sort, descend_into, descent_order):
+        key = self._key(ctype, active, sort, descend_into, descent_order)
+        if key is None:
+            return None
+        entry = self.entries.get(key, None)
+        if entry is not None:
+            version, signature, data = entry
+            if version == ModelStructureVersion.current and all(
+                len(comp._data) == n for comp, n in signature
+            ):
+                return data
+        version = ModelStructureVersion.current
+        signature, data = self._collect(
+            block, ctype, active, sort, descend_into, descent_order
+        )
+        if signature is None:
+            self.entries.pop(key, None)
+        else:
+            self.entries[key] = version, signature, data
+        return data
+
+    @staticmethod
+    def _collect(block, ctype, active, sort, descend_into, descent_order):
+        if descend_into is True:
+            descent_ctype = (Block,)
+        elif isclass(descend_into):
+            descent_ctype = (descend_into,)
+        else:
+            descent_ctype = descend_into
+        components = []
+        data = []
+        dedup = _DeduplicateInfo()
+        for _block in block.block_data_objects(
+            active, sort, descend_into, descent_order
+        ):
+            components.extend(PseudoMap(_block, ctype, active, sort).values())
+            if descent_ctype:
+                components.extend(
+                    PseudoMap(_block, descent_ctype, active, sort).values()
+                )
+            data.extend(_block._component_data_itervalues(ctype, active, sort, dedup))
+        signature = []
+        for comp in components:
+            if not comp._constructed:
+                # The contents of unconstructed components can change
+                # without notice: do not cache this result
+                return None, tuple(data)
+            _data = getattr(comp, '_data', None)
+            if _data is not None:
+                signature.append((comp, len(_data)))
+        return signature, tuple(data)
+
+
 def _isNotNone(val):
     return val is not None
 
@@ -497,6 +594,14 @@ class BlockData(ActiveComponentData):
     # If a writer cached a repn on this block, remove it when cloning
     #  TODO: remove repn caching from the model
     __autoslot_mappers = {'_repn': AutoSlots.encode_as_none}
+    # Do not copy cached component_data_objects() results (see
+    # enable_component_data_cache())
+    __autoslot_mappers__ = {
+        '_component_data_cache': AutoSlots.encode_as_none,
+        '_name_cache': AutoSlots.encode_as_none,
+    }
+    _component_data_cache = None
+    _name_cache = None
 
     def __init__(self, component):
         #
@@ -1038,6 +1143,7 @@ component, use the block del_component() and add_component() methods.
             idx_info[2] += 1
         else:
             self._ctypes[_type] = [_new_idx, _new_idx, 1]
+        ModelStructureVersion.increment()
         #
         # Error, for disabled support implicit rule names
         #
@@ -1150,6 +1256,7 @@ component, use the block del_component() and add_component() methods.
         ctype_info[2] -= 1
         if ctype_info[2] == 0:
             del self._ctypes[obj.ctype]
+        ModelStructureVersion.increment()
 
         # Clear the _parent attribute
         obj._parent = None
@@ -1216,6 +1323,7 @@ component, use the block del_component() and add_component() methods.
                 ctype_info[1] = prev
 
         obj._ctype = new_ctype
+        ModelStructureVersion.increment()
 
         # Insert into the new ctype list
         if new_ctype not in self._ctypes:
@@ -1320,6 +1428,10 @@ component, use the block del_component() and add_component() methods.
         >>> assert compare_expressions(i.c.expr, m.x >= i.y + sum(i.z[:]))
         >>> assert compare_expressions(i.d.expr, i.y + sum(i.b2.w[:]) == 5)
 
+        As expression nodes are immutable, any (sub)expressions that do
+        not reference components in scope are shared with the original
+        block and not duplicated.
+
         """
         # FYI: we used to remove all _parent() weakrefs before
         # deepcopying and then restore them on the original and cloned
@@ -1343,6 +1455,9 @@ component, use the block del_component() and add_component() methods.
         if memo is None:
             memo = {}
         memo['__block_scope__'] = {id(self): True, id(None): False}
+        # Expression nodes that do not reference any cloned components
+        # can be shared by the original and cloned blocks
+        memo['__share_expressions__'] = True
         memo[id(parent)] = parent
 
         with PauseGC():
@@ -1577,6 +1692,61 @@ component, use the block del_component() and add_component() methods.
         kwargs['active'] = True
         return self.component_data_objects(*args, **kwargs)
 
+    def enable_component_data_cache(self, enable=True):
+        """Enable (or disable) caching :py:meth:`component_data_objects` results
+
+        Writers, transformations, and solver interfaces frequently call
+        :py:meth:`component_data_objects` with the same arguments.  When
+        the cache is enabled, the component data objects returned by
+        each (distinct) call on this block are stored and returned by
+        subsequent calls, provided the model structure has not changed
+        in the meantime.  Cached results are invalidated by adding,
+        removing, or (de)activating components or component data
+        objects, and by adding component data objects to any of the
+        components that were traversed.
+
+        The cache is not copied when the block is cloned or pickled.
+
+        Parameters
+        ----------
+        enable: bool
+            If True, enable the cache; if False, disable it and discard
+            any cached results.
+
+        """
+        if enable:
+            if self._component_data_cache is None:
+                self._component_data_cache = _ComponentDataCache()
+        else:
+            self._component_data_cache = None
+
+    def enable_name_cache(self, enable=True):
+        """Enable (or disable) caching fully qualified component names
+
+        Writers, solver interfaces, and result processing frequently
+        generate the fully qualified names (:py:attr:`name`) and
+        :py:class:`ComponentUID` identifiers of the same components.
+        When the cache is enabled, the names and CUIDs (relative to the
+        model) of this block and all components within it are memoized.
+        Cached names are invalidated when components are added,
+        removed, renamed, or moved (and whenever the model structure
+        changes; see :py:data:`ModelStructureVersion`).
+
+        The cache is not copied when the block is cloned or pickled.
+
+        Parameters
+        ----------
+        enable: bool
+            If True, enable the cache; if False, disable it and discard
+            any cached names.
+
+        """
+        if enable:
+            if self._name_cache is None:
+                self._name_cache = ComponentNameCache()
+        else:
+            self._name_cache = None
+
     def component_objects(
         self, ctype=None, active=None, sort=False, descend_into=True, descent_order=None
     ):
@@ -1598,7 +1768,22 @@ component, use the block del_component() and add_component() methods.
         component data objects for all components in a
         block.  By default, this generator recursively
         descends into sub-blocks.
+
+        If the component data cache is enabled for this block (see
+        :py:meth:`enable_component_data_cache`), repeated calls with
+        the same arguments return an iterator over the cached result.
         """
+        if self._component_data_cache is not None:
+            data = self._component_data_cache.get(
+                self, ctype, active, sort, descend_into, descent_order
+            )
+            if data is not None:
+                return iter(data)
+        return self._component_data_objects(
+            ctype, active, sort, descend_into, descent_order
+        )
+
+    def _component_data_objects(self, ctype, active, sort, descend_into, descent_order):
         dedup = _DeduplicateInfo()
         for _block in self.block_data_objects(
             active, sort, descend_into, descent_order
@@ -42,6 +42,137 @@ relocated_module_attribute(
 _ref_types = {type(None), weakref_ref}
 
 
+class _ModelStructureVersion(object):
+    """Global counter tracking changes to the structure of Pyomo models
+
+    The counter is incremented whenever components are added to or
+    removed from a block, component data objects are deleted from
+    indexed components, components are renamed, or components are
+    (de)activated.  It is used to validate cached model traversals (see
+    :py:meth:`BlockData.enable_component_data_cache()
+    <pyomo.core.base.block.BlockData.enable_component_data_cache>`) and
+    cached component names (see :py:class:`ComponentNameCache`).
+
+    """
+
+    __slots__ = ('current',)
+
+    def __init__(self):
+        self.current = 0
+
+    def increment(self):
+        self.current += 1
+
+
+ModelStructureVersion = _ModelStructureVersion()
+
+
+class ComponentNameCache(object):
+    """Cache of fully qualified component names and ComponentUIDs
+
+    Instances of this class are created by
+    :py:meth:`BlockData.enable_name_cache()
+    <pyomo.core.base.block.BlockData.enable_name_cache>`.  While a
+    cache is enabled on a block, the fully qualified names (relative to
+    the model) and the :py:class:`ComponentUID` identifiers of the
+    components (and component data objects) within that block are
+    memoized.  Names of indexed component data objects are built from
+    the cached name of the parent component, so the parent block chain
+    is only traversed once per component.
+
+    All entries are discarded whenever the
+    :py:data:`ModelStructureVersion` changes (e.g., because components
+    were added, removed, renamed, or moved).
+
+    """
+
+    __slots__ = ('version', 'names', 'cuids')
+
+    # The number of caches that are currently enabled.  The (common)
+    # case where no caches are enabled does not need to search the
+    # block hierarchy for a cache.
+    enabled = 0
+
+    def __init__(self):
+        self.version = ModelStructureVersion.current
+        self.names = {}
+        self.cuids = {}
+        ComponentNameCache.enabled += 1
+
+    def __del__(self):
+        ComponentNameCache.enabled -= 1
+
+    @staticmethod
+    def find(obj):
+        """Return the name cache that applies to `obj` (or None)"""
+        while obj is not None:
+            cache = getattr(obj, '_name_cache', None)
+            if cache is not None:
+                return cache
+            obj = obj.parent_block()
+        return None
+
+    def _validate(self):
+        if self.version != ModelStructureVersion.current:
+            self.version = ModelStructureVersion.current
+            self.names = {}
+            self.cuids = {}
+
+    def getname(self, obj):
+        """Return the (cached) fully qualified name for `obj`"""
+        self._validate()
+        # Entries hold a reference to the object so that the id() is
+        # not reused while the entry is in the cache
+        entry = self.names.get(id(obj), None)
+        if entry is not None:
+            return entry[1]
+        c = obj.parent_component()
+        if c is None:
+            return obj.getname(fully_qualified=True)
+        if c is not obj:
+            ans = self.getname(c) + index_repr(obj.index())
+        else:
+            pb = obj.parent_block()
+            if pb is None or pb.parent_block() is None:
+                ans = name_repr(obj.local_name)
+            else:
+                ans = self.getname(pb) + '.' + name_repr(obj.local_name)
+        self.names[id(obj)] = (obj, ans)
+        return ans
+
+    def setnames(self, component, names):
+        """Record the names of the data objects in an indexed component
+
+        `names` maps each index of `component` to the fully qualified
+        name of the corresponding component data object.
+
+        """
+        self._validate()
+        data = component._data
+        self.names.update((id(data[idx]), (data[idx], n)) for idx, n in names.items())
+
+    def getcuid(self, obj):
+        """Return the (cached) ComponentUID `_cids` tuple for `obj`"""
+        self._validate()
+        entry = self.cuids.get(id(obj), None)
+        if entry is not None:
+            return entry[1]
+        pb = obj.parent_block()
+        if pb is None:
+            ans = ()
+        else:
+            c = obj.parent_component()
+            if c is obj:
+                ans = self.getcuid(pb) + ((c.local_name, ()),)
+            else:
+                idx = obj.index()
+                if idx.__class__ is not tuple or len(idx) == 1:
+                    idx = (idx,)
+                ans = self.getcuid(pb) + ((c.local_name, idx),)
+        self.cuids[id(obj)] = (obj, ans)
+        return ans
+
+
 class ModelComponentFactoryClass(Factory):
     def register(self, doc=None):
         def fn(cls):
@@ -572,6 +703,15 @@ class Component(ComponentBase):
         relative_to: Block
             Generate fully_qualified names relative to the specified block.
         """
+        if (
+            fully_qualified
+            and ComponentNameCache.enabled
+            and relative_to is None
+            and name_buffer is None
+        ):
+            cache = ComponentNameCache.find(self)
+            if cache is not None:
+                return cache.getname(self)
         local_name = self._name
         if local_name is None:
             local_name = type(self).__name__
@@ -621,6 +761,7 @@ class Component(ComponentBase):
     def name(self, val):
         if self.parent_block() is None:
             self._name = val
+            ModelStructureVersion.increment()
         else:
             raise ValueError(
                 "The .name attribute is not settable when the component "
@@ -721,10 +862,12 @@ class ActiveComponent(Component):
     def activate(self):
         """Set the active attribute to True"""
         self._active = True
+        ModelStructureVersion.increment()
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        ModelStructureVersion.increment()
 
 
 class ComponentData(ComponentBase):
@@ -872,6 +1015,10 @@ class ComponentData(ComponentBase):
             if id(self) in name_buffer:
                 # Return the name if it is in the buffer
                 return name_buffer[id(self)]
+        elif fully_qualified and ComponentNameCache.enabled and relative_to is None:
+            cache = ComponentNameCache.find(self)
+            if cache is not None:
+                return cache.getname(self)
 
         c = self.parent_component()
         if c is self:
@@ -1004,7 +1151,9 @@ class ActiveComponentData(ComponentData):
     def activate(self):
         """Set the active attribute to True"""
         self._active = self.parent_component()._active = True
+        ModelStructureVersion.increment()
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        ModelStructureVersion.increment()
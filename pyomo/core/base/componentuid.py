@@ -16,6 +16,7 @@ import ply.lex
 from pyomo.common.collections import ComponentMap
 from pyomo.common.dependencies import pickle
 from pyomo.common.deprecation import deprecated
+from pyomo.core.base.component import ComponentNameCache
 from pyomo.core.base.component_namer import (
     literals,
     special_chars,
@@ -98,9 +99,17 @@ class ComponentUID(object):
                 self._generate_cuid_from_slice(component, context=context)
             )
         else:
-            self._cids = tuple(
-                self._generate_cuid(component, cuid_buffer=cuid_buffer, context=context)
-            )
+            cache = None
+            if ComponentNameCache.enabled and context is None and cuid_buffer is None:
+                cache = ComponentNameCache.find(component)
+            if cache is not None:
+                self._cids = cache.getcuid(component)
+            else:
+                self._cids = tuple(
+                    self._generate_cuid(
+                        component, cuid_buffer=cuid_buffer, context=context
+                    )
+                )
 
     def __str__(self):
         "Return a 'nicely formatted' string representation of the CUID"
@@ -18,7 +18,14 @@ import pyomo.core.expr as EXPR
 import pyomo.core.base as BASE
 from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
 from pyomo.core.base.initializer import Initializer
-from pyomo.core.base.component import Component, ActiveComponent, ComponentData
+from pyomo.core.base.component import (
+    Component,
+    ActiveComponent,
+    ComponentData,
+    ComponentNameCache,
+    ModelStructureVersion,
+)
+from pyomo.core.base.component_namer import index_repr
 from pyomo.core.base.config import PyomoOptions
 from pyomo.core.base.enums import SortComponents
 from pyomo.core.base.global_set import UnindexedComponent_set
@@ -379,6 +386,7 @@ class IndexedComponent(Component):
         """Clear the data in this component"""
         if self.is_indexed():
             self._data = {}
+            ModelStructureVersion.increment()
         else:
             raise DeveloperError(
                 "Derived scalar component %s failed to define clear()."
@@ -393,6 +401,47 @@ class IndexedComponent(Component):
         """Return true if this component is indexed"""
         return self._index_set is not UnindexedComponent_set
 
+    def getnames(self, fully_qualified=False, relative_to=None):
+        """Return the names of all component data objects in this component
+
+        This generates the names for the entire component at once:
+        the (possibly fully qualified) name of the component is only
+        computed once and the index of each component data object is
+        appended to it.  If a name cache is enabled on the model (see
+        :py:meth:`BlockData.enable_name_cache()
+        <pyomo.core.base.block.BlockData.enable_name_cache>`), the
+        fully qualified names are also stored in the cache.
+
+        Parameters
+        ----------
+        fully_qualified: bool
+            Generate full names from nested block names
+
+        relative_to: Block
+            Generate fully_qualified names relative to the specified block.
+
+        Returns
+        -------
+        dict
+            Map of each index to the name of the corresponding
+            component data object
+
+        """
+        if not self.is_indexed() or self.is_reference():
+            # Scalar components are named by Component.getname(), and
+            # the data in References are named by their owning component
+            return {
+                idx: obj.getname(fully_qualified, relative_to=relative_to)
+                for idx, obj in self.items()
+            }
+        base = self.getname(fully_qualified, relative_to=relative_to)
+        ans = {idx: base + index_repr(idx) for idx in self.keys()}
+        if fully_qualified and ComponentNameCache.enabled and relative_to is None:
+            cache = ComponentNameCache.find(self)
+            if cache is not None:
+                cache.setnames(self, ans)
+        return ans
+
     def is_reference(self):
         """Return True if this component is a reference, where
         "reference" is interpreted as any component that does not
@@ -747,6 +796,7 @@ You can silence this warning by one of three ways:
                 # Remove reference to this object
                 self._data[index]._component = None
             del self._data[index]
+            ModelStructureVersion.increment()
 
     def _construct_from_rule_using_setitem(self):
         if self._rule is None:
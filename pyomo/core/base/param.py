@@ -18,6 +18,7 @@ from pyomo.common.pyomo_typing import overload
 from typing import Union, Type
 
 from pyomo.common.autoslots import AutoSlots
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import deprecation_warning, RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
@@ -34,12 +35,14 @@ from pyomo.core.base.indexed_component import (
 )
 from pyomo.core.base.initializer import Initializer
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
-from pyomo.core.base.set import Reals, _AnySet, SetInitializer
+from pyomo.core.base.set import Reals, _AnySet, SetInitializer, _global_domain_screen
 from pyomo.core.base.units_container import units
 from pyomo.core.expr import GetItemExpression
 
 logger = logging.getLogger('pyomo.core')
 
+_nan = float('nan')
+
 
 def _raise_modifying_immutable_error(obj, index):
     if obj.is_indexed():
@@ -997,6 +1000,74 @@ class IndexedParam(Param):
             component_list.append((self, _new))
         return _ans
 
+    def get_values_array(self):
+        """Return the parameter values as a NumPy ``float64`` array.
+
+        Values are returned in the order of :meth:`keys()` (including
+        any indices that take the default value).  Parameters whose
+        value is ``None`` are returned as ``nan``.
+
+        """
+        if self._mutable:
+            vals = (p._value for p in self.values())
+        else:
+            vals = self.values()
+        return np.fromiter(
+            (_nan if v is None else v for v in vals), dtype=float, count=len(self)
+        )
+
+    def set_values_array(self, values, check=True):
+        """Set the (mutable) parameter values from a one-dimensional array.
+
+        ``values`` is interpreted in the order of :meth:`keys()`.  For
+        numeric arrays the domain check is performed in bulk (for the
+        global numeric domains) and the values are assigned directly to
+        the underlying ParamData objects.  If ``check`` is True, then
+        any offending values (and all values for non-global domains or
+        Params with a ``validate`` rule) are checked element-by-element
+        (raising the usual ValueError).
+
+        """
+        if not self._mutable:
+            _raise_modifying_immutable_error(self, '*')
+        keys = list(self.keys())
+        values = np.asarray(values)
+        if values.shape != (len(keys),):
+            raise ValueError(
+                "set_values_array: expected a one-dimensional array of "
+                "length %s (got shape %s)" % (len(keys), values.shape)
+            )
+        if values.dtype.kind not in 'iuf':
+            if check:
+                for index, val in zip(keys, values.tolist()):
+                    self[index] = val
+                return
+        vals = values.tolist()
+        if check:
+            domain = self.domain
+            if self._validate:
+                to_check = range(len(keys))
+            elif isinstance(domain, _AnySet) and values.dtype.kind in 'iuf':
+                # (real) numeric values are always in Any
+                to_check = ()
+            else:
+                mask = _global_domain_screen(domain, values)
+                if mask is None:
+                    to_check = range(len(keys))
+                else:
+                    to_check = np.flatnonzero(mask).tolist()
+            # Validate before assigning anything so that a failed
+            # check leaves the Param unchanged
+            for i in to_check:
+                self._validate_value(keys[i], vals[i])
+        _data = self._data
+        for index, val in zip(keys, vals):
+            obj = _data.get(index, None)
+            if obj is None:
+                obj = _data[index] = ParamData(self)
+                obj._index = index
+            obj._value = val
+
     # Because CP supports indirection [the ability to index objects by
     # another (inter) Var] for certain types (including Var), we will
     # catch the normal RuntimeError and return a (variable)
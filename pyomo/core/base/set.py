@@ -23,6 +23,7 @@ from typing import Union, Type, Any as typingAny
 
 from pyomo.common.autoslots import AutoSlots
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import deprecated, deprecation_warning, RenamedClass
 from pyomo.common.errors import DeveloperError, PyomoException
 from pyomo.common.log import is_debug_set
@@ -3363,12 +3364,83 @@ class AbstractFiniteSimpleRangeSet(metaclass=RenamedClass):
 ############################################################################
 
 
+class _MaterializedSetOperatorData(object):
+    """The members of a materialized (ordered, finite) Set operator
+
+    `values` holds the members (in order) and `positions` maps each
+    member to its 0-based position.  The record is valid as long as
+    none of the (leaf) operand Sets changed since the members were
+    generated.  `leaves` holds `(set, attribute)` pairs naming the
+    attribute that each leaf Set replaces whenever its members change
+    (the `_ordered_values` list of ordered Sets and the `_ranges` of
+    RangeSets), and `markers` holds the attribute values when the
+    members were generated.
+
+    """
+
+    __slots__ = ('leaves', 'exact', 'markers', 'values', 'positions', 'array')
+
+    def __init__(self, leaves, exact):
+        self.leaves = leaves
+        # True if all members are stored in their normalized form (so
+        # that a value not found in `positions` is not in the Set)
+        self.exact = exact
+        self.markers = None
+        self.values = None
+        self.positions = None
+        self.array = None
+
+    def is_current(self):
+        if self.values is None:
+            return False
+        for (s, attr), marker in zip(self.leaves, self.markers):
+            if getattr(s, attr) is not marker:
+                return False
+        return True
+
+    def update(self, values):
+        for s, attr in self.leaves:
+            if attr == '_ordered_values' and s._ordered_values is None:
+                s._rebuild_ordered_values()
+        self.markers = tuple(getattr(s, attr) for s, attr in self.leaves)
+        self.values = values = tuple(values)
+        self.positions = {v: i for i, v in enumerate(values)}
+        self.array = None
+
+
+def _reset_materialized(encode, val):
+    # __autoslot_mappers__ mapper: do not copy (or pickle) the members
+    # of materialized Set operators
+    if encode and val is not None:
+        return _MaterializedSetOperatorData(val.leaves, val.exact)
+    return val
+
+
+def _set_members_to_array(values, dimen, dtype):
+    if dimen is None or dimen is UnknownSetDimen:
+        # Members with different dimensions are stored as tuples
+        ans = np.empty(len(values), dtype=object)
+        for i, v in enumerate(values):
+            ans[i] = v
+        return ans
+    if dtype is None:
+        _iter = itertools.chain.from_iterable(values) if dimen > 1 else values
+        if not all(v.__class__ in native_numeric_types for v in _iter):
+            dtype = object
+    if dimen == 1:
+        return np.array(values, dtype=dtype)
+    return np.array(values, dtype=dtype).reshape(len(values), dimen)
+
+
 class SetOperator(SetData, Set):
-    __slots__ = ('_sets',)
+    __slots__ = ('_sets', '_materialized')
+    # Do not copy the stored members of materialized Set operators
+    __autoslot_mappers__ = {'_materialized': _reset_materialized}
 
     def __init__(self, *args, **kwds):
         SetData.__init__(self, component=self)
         Set.__init__(self, **kwds)
+        self._materialized = None
         self._sets, _anonymous = zip(*(process_setarg(_set) for _set in args))
         _anonymous = tuple(filter(None, _anonymous))
         if _anonymous:
@@ -3463,6 +3535,21 @@ class SetOperator(SetData, Set):
         """Returns True if this set admits only discrete members"""
         return all(r.isdiscrete() for r in self.ranges())
 
+    def materialize(self, enable=True):
+        """Store the members of this Set operator
+
+        Only ordered (finite) Set operators can be materialized.
+        """
+        if enable:
+            raise TypeError(
+                "Cannot materialize Set operator %s: only ordered, finite "
+                "Set operators can be materialized" % (self,)
+            )
+
+    def is_materialized(self):
+        """Return True if the members of this Set operator are stored"""
+        return False
+
     def subsets(self, expand_all_set_operators=None):
         if not isinstance(self, SetProduct):
             if expand_all_set_operators is None:
@@ -3529,6 +3616,175 @@ class SetOperator(SetData, Set):
 ############################################################################
 
 
+class _MaterializedSetOperatorMixin(object):
+    """Mixin class for Set operators whose members can be materialized
+
+    When materialized, the members of the Set operator are stored in an
+    ordered tuple and a hashed position map.  Membership tests,
+    iteration, len(), ord(), and at() then no longer traverse the
+    operand Sets.
+
+    """
+
+    __slots__ = ()
+
+    def materialize(self, enable=True):
+        """Store (or stop storing) the members of this Set operator
+
+        Set operators (like ``m.A * m.B``) generate their members and
+        test membership by querying their operand Sets.  For large (or
+        nested) operations that are iterated over or queried
+        repeatedly, it is faster to generate the members once and store
+        them.  When enabled, the members are generated the next time
+        they are needed and stored as an ordered, hashed collection
+        that supports O(1) membership tests, :py:meth:`ord` and
+        :py:meth:`at`.  The stored members are automatically
+        regenerated when any of the operand Sets change.
+
+        Note that materializing a Set operator stores every member of
+        the Set (e.g., every tuple in a cross product).
+
+        Parameters
+        ----------
+        enable: bool
+            If True, materialize the members of this Set operator; if
+            False, discard the stored members and revert to
+            generating them from the operand Sets.
+
+        """
+        if not enable:
+            self._materialized = None
+            return
+        if self._materialized is not None:
+            return
+        leaves = []
+        exact = True
+        stack = list(reversed(self._sets))
+        while stack:
+            s = stack.pop()
+            if isinstance(s, SetOperator):
+                stack.extend(reversed(s._sets))
+            elif isinstance(s, OrderedSetData):
+                leaves.append((s, '_ordered_values'))
+            elif isinstance(s, InfiniteRangeSetData):
+                leaves.append((s, '_ranges'))
+                # RangeSets with non-integer values can contain members
+                # that do not hash to the values they generate
+                exact &= all(
+                    r.__class__ is NumericRange
+                    and r.start.__class__ is int
+                    and r.step.__class__ is int
+                    for r in s.ranges()
+                )
+            elif not isinstance(s, (_AnySet, _EmptySet)):
+                raise TypeError(
+                    "Cannot materialize Set operator %s: the members of "
+                    "the operand Set %s (%s) cannot be tracked for changes"
+                    % (self, s, type(s).__name__)
+                )
+        self._materialized = _MaterializedSetOperatorData(leaves, exact)
+
+    def is_materialized(self):
+        """Return True if the members of this Set operator are stored"""
+        return self._materialized is not None
+
+    def _get_materialized(self):
+        data = self._materialized
+        if data is not None and not data.is_current():
+            data.update(super()._iter_impl())
+        return data
+
+    def get(self, value, default=None):
+        data = self._get_materialized()
+        if data is None:
+            return super().get(value, default)
+        positions = data.positions
+        try:
+            if value in positions:
+                return value
+            if normalize_index.flatten:
+                value = normalize_index(value)
+                if value in positions:
+                    return value
+                if data.exact and FLATTEN_CROSS_PRODUCT:
+                    return default
+        except TypeError:
+            pass
+        return super().get(value, default)
+
+    def _iter_impl(self):
+        data = self._get_materialized()
+        if data is None:
+            return super()._iter_impl()
+        return iter(data.values)
+
+    def __reversed__(self):
+        data = self._get_materialized()
+        if data is None:
+            return super().__reversed__()
+        return reversed(data.values)
+
+    def __len__(self):
+        data = self._get_materialized()
+        if data is None:
+            return super().__len__()
+        return len(data.values)
+
+    def data(self):
+        data = self._get_materialized()
+        if data is None:
+            return super().data()
+        return data.values
+
+    # Note: the Set operator classes implement at() and ord() and call
+    # these methods if the Set operator is materialized
+
+    def _materialized_at(self, index):
+        data = self._get_materialized()
+        try:
+            return data.values[self._to_0_based_index(index)]
+        except IndexError:
+            raise IndexError(f"{self.name} index out of range") from None
+
+    def _materialized_ord(self, item):
+        # Return the position of item (or None if the item was not
+        # found in its normalized form)
+        positions = self._get_materialized().positions
+        try:
+            if item in positions:
+                return positions[item] + 1
+            if normalize_index.flatten:
+                item = normalize_index(item)
+                if item in positions:
+                    return positions[item] + 1
+        except TypeError:
+            pass
+        return None
+
+    def to_numpy(self, dtype=None):
+        """Return the members of this Set as a NumPy array
+
+        Sets with dimen 1 are returned as a 1-dimensional array, Sets
+        of tuples with dimen `d` as an `(n, d)` array.  Unless `dtype`
+        is specified, Sets whose members are not all numeric are
+        returned as arrays of Python objects.  If the Set operator is
+        materialized, the (read-only) array is stored with the members.
+
+        """
+        data = self._get_materialized()
+        if data is None:
+            return _set_members_to_array(self.data(), self.dimen, dtype)
+        if dtype is not None:
+            return _set_members_to_array(data.values, self.dimen, dtype)
+        if data.array is None:
+            data.array = _set_members_to_array(data.values, self.dimen, None)
+            data.array.flags.writeable = False
+        return data.array
+
+
+############################################################################
+
+
 class SetUnion(SetOperator):
     __slots__ = tuple()
 
@@ -3595,10 +3851,17 @@ class SetUnion_FiniteSet(_FiniteSetMixin, SetUnion_InfiniteSet):
         return len(set0) + sum(1 for s in set1 if s not in set0)
 
 
-class SetUnion_OrderedSet(_ScalarOrderedSetMixin, _OrderedSetMixin, SetUnion_FiniteSet):
+class SetUnion_OrderedSet(
+    _MaterializedSetOperatorMixin,
+    _ScalarOrderedSetMixin,
+    _OrderedSetMixin,
+    SetUnion_FiniteSet,
+):
     __slots__ = tuple()
 
     def at(self, index):
+        if self._materialized is not None:
+            return self._materialized_at(index)
         idx = self._to_0_based_index(index)
         set0_len = len(self._sets[0])
         if idx < set0_len:
@@ -3623,6 +3886,10 @@ class SetUnion_OrderedSet(_ScalarOrderedSetMixin, _OrderedSetMixin, SetUnion_Fin
 
         If the search item is not in the Set, then an IndexError is raised.
         """
+        if self._materialized is not None:
+            ans = self._materialized_ord(item)
+            if ans is not None:
+                return ans
         if item in self._sets[0]:
             return self._sets[0].ord(item)
         if item not in self._sets[1]:
@@ -3736,11 +4003,16 @@ class SetIntersection_FiniteSet(_FiniteSetMixin, SetIntersection_InfiniteSet):
 
 
 class SetIntersection_OrderedSet(
-    _ScalarOrderedSetMixin, _OrderedSetMixin, SetIntersection_FiniteSet
+    _MaterializedSetOperatorMixin,
+    _ScalarOrderedSetMixin,
+    _OrderedSetMixin,
+    SetIntersection_FiniteSet,
 ):
     __slots__ = tuple()
 
     def at(self, index):
+        if self._materialized is not None:
+            return self._materialized_at(index)
         idx = self._to_0_based_index(index)
         _iter = iter(self)
         try:
@@ -3759,6 +4031,10 @@ class SetIntersection_OrderedSet(
 
         If the search item is not in the Set, then an IndexError is raised.
         """
+        if self._materialized is not None:
+            ans = self._materialized_ord(item)
+            if ans is not None:
+                return ans
         if item not in self._sets[0] or item not in self._sets[1]:
             raise IndexError(
                 "Cannot identify position of %s in Set %s: item not in Set"
@@ -3830,11 +4106,16 @@ class SetDifference_FiniteSet(_FiniteSetMixin, SetDifference_InfiniteSet):
 
 
 class SetDifference_OrderedSet(
-    _ScalarOrderedSetMixin, _OrderedSetMixin, SetDifference_FiniteSet
+    _MaterializedSetOperatorMixin,
+    _ScalarOrderedSetMixin,
+    _OrderedSetMixin,
+    SetDifference_FiniteSet,
 ):
     __slots__ = tuple()
 
     def at(self, index):
+        if self._materialized is not None:
+            return self._materialized_at(index)
         idx = self._to_0_based_index(index)
         _iter = iter(self)
         try:
@@ -3853,6 +4134,10 @@ class SetDifference_OrderedSet(
 
         If the search item is not in the Set, then an IndexError is raised.
         """
+        if self._materialized is not None:
+            ans = self._materialized_ord(item)
+            if ans is not None:
+                return ans
         if item not in self:
             raise IndexError(
                 "Cannot identify position of %s in Set %s: item not in Set"
@@ -3940,11 +4225,16 @@ class SetSymmetricDifference_FiniteSet(
 
 
 class SetSymmetricDifference_OrderedSet(
-    _ScalarOrderedSetMixin, _OrderedSetMixin, SetSymmetricDifference_FiniteSet
+    _MaterializedSetOperatorMixin,
+    _ScalarOrderedSetMixin,
+    _OrderedSetMixin,
+    SetSymmetricDifference_FiniteSet,
 ):
     __slots__ = tuple()
 
     def at(self, index):
+        if self._materialized is not None:
+            return self._materialized_at(index)
         idx = self._to_0_based_index(index)
         _iter = iter(self)
         try:
@@ -3963,6 +4253,10 @@ class SetSymmetricDifference_OrderedSet(
 
         If the search item is not in the Set, then an IndexError is raised.
         """
+        if self._materialized is not None:
+            ans = self._materialized_ord(item)
+            if ans is not None:
+                return ans
         if item not in self:
             raise IndexError(
                 "Cannot identify position of %s in Set %s: item not in Set"
@@ -4223,11 +4517,16 @@ class SetProduct_FiniteSet(_FiniteSetMixin, SetProduct_InfiniteSet):
 
 
 class SetProduct_OrderedSet(
-    _ScalarOrderedSetMixin, _OrderedSetMixin, SetProduct_FiniteSet
+    _MaterializedSetOperatorMixin,
+    _ScalarOrderedSetMixin,
+    _OrderedSetMixin,
+    SetProduct_FiniteSet,
 ):
     __slots__ = tuple()
 
     def at(self, index):
+        if self._materialized is not None:
+            return self._materialized_at(index)
         _idx = self._to_0_based_index(index)
         _ord = list(len(_) for _ in self._sets)
         i = len(_ord)
@@ -4249,6 +4548,10 @@ class SetProduct_OrderedSet(
 
         If the search item is not in the Set, then an IndexError is raised.
         """
+        if self._materialized is not None:
+            ans = self._materialized_ord(item)
+            if ans is not None:
+                return ans
         found = self._find_val(item)
         if found is None:
             raise IndexError(
@@ -4663,6 +4966,35 @@ integer_global_set_ids = set(
     )
 )
 
+
+def _global_domain_screen(domain, values):
+    """Vectorized (conservative) membership test for the global numeric Sets
+
+    Returns a boolean mask (for the NumPy array `values`) flagging the
+    values that *may* not be in `domain`, or ``None`` if `domain` is
+    not one of the known global numeric Sets.  Flagged values should
+    be re-tested with the (exact) ``value in domain`` test.
+
+    """
+    _id = id(domain)
+    if _id in real_global_set_ids:
+        is_int = False
+    elif _id in integer_global_set_ids:
+        is_int = True
+    else:
+        return None
+    lb, ub = domain.bounds()
+    # Flag NaN
+    mask = values != values
+    if lb is not None:
+        mask |= values <= lb if lb not in domain else values < lb
+    if ub is not None:
+        mask |= values >= ub if ub not in domain else values > ub
+    if is_int:
+        mask |= values % 1 != 0
+    return mask
+
+
 RealSet = Reals.__class__
 IntegerSet = Integers.__class__
 BinarySet = Binary.__class__
@@ -12,10 +12,14 @@
 from __future__ import annotations
 import logging
 import sys
+from collections.abc import MutableMapping
+from itertools import islice
 from pyomo.common.pyomo_typing import overload
-from weakref import ref as weakref_ref
+from weakref import ref as weakref_ref, WeakValueDictionary
 from typing import Union, Type
 
+from pyomo.common.autoslots import fast_deepcopy
+from pyomo.common.dependencies import numpy as np
 from pyomo.common.deprecation import RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
@@ -32,6 +36,7 @@ from pyomo.core.expr.numvalue import (
     native_numeric_types,
 )
 from pyomo.core.base.component import ComponentData, ModelComponentFactory
+from pyomo.core.base.enums import SortComponents
 from pyomo.core.base.global_set import UnindexedComponent_index
 from pyomo.core.base.disable_methods import disable_methods
 from pyomo.core.base.indexed_component import (
@@ -49,8 +54,10 @@ from pyomo.core.base.set import (
     Binary,
     Set,
     SetInitializer,
+    InsertionOrderSetData,
     real_global_set_ids,
     integer_global_set_ids,
+    _global_domain_screen,
 )
 from pyomo.core.base.units_container import units
 
@@ -58,6 +65,7 @@ logger = logging.getLogger('pyomo.core')
 
 _inf = float('inf')
 _ninf = -_inf
+_nan = float('nan')
 _nonfinite_values = {_inf, _ninf}
 _known_global_real_domains = dict(
     [(_, True) for _ in real_global_set_ids]
@@ -601,6 +609,10 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
             :meth:`index_set` when constructing the Var (True) or just the
             variables returned by ``initialize``/``rule`` (False).  Defaults
             to ``True``.
+        storage (str, optional): Set to ``'array'`` to store the data for
+            an indexed Var in contiguous NumPy arrays (see
+            :class:`ArrayIndexedVar`).  Defaults to ``None`` (a separate
+            VarData object for every index).
         units (pyomo units expression, optional): Set the units corresponding
             to the entries in this variable.
         name (str, optional): Name for this component.
@@ -623,6 +635,8 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
             return super(Var, cls).__new__(cls)
         if not args or (args[0] is UnindexedComponent_set and len(args) == 1):
             return super(Var, cls).__new__(AbstractScalarVar)
+        elif kwargs.get('storage', None) == 'array':
+            return super(Var, cls).__new__(ArrayIndexedVar)
         else:
             return super(Var, cls).__new__(IndexedVar)
 
@@ -636,6 +650,7 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         initialize=None,
         rule=None,
         dense=True,
+        storage=None,
         units=None,
         name=None,
         doc=None,
@@ -653,6 +668,13 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
         )
         _bounds_arg = kwargs.pop('bounds', None)
         self._dense = kwargs.pop('dense', True)
+        storage = kwargs.pop('storage', None)
+        if storage not in (None, 'array'):
+            raise ValueError(
+                "Var: unknown storage '%s' (expected None or 'array')" % (storage,)
+            )
+        if storage is not None and not isinstance(self, ArrayIndexedVar):
+            raise ValueError("Var: storage='array' is only supported for indexed Vars")
         self._units = kwargs.pop('units', None)
         if self._units is not None:
             self._units = units.get_units(self._units)
@@ -953,6 +975,174 @@ class IndexedVar(Var):
         """Alias for :meth:`unfix`"""
         return self.unfix()
 
+    #
+    # Bulk (NumPy) accessors.  All arrays are one-dimensional and
+    # ordered consistently with :meth:`keys()` (the ordering of the
+    # underlying index set).  Only the VarData objects that currently
+    # exist are included (this only matters for sparse `dense=False`
+    # IndexedVars).
+    #
+
+    def _ordered_data(self):
+        return list(map(self._data.__getitem__, self.keys()))
+
+    @staticmethod
+    def _check_array(vals, n, name):
+        vals = np.asarray(vals)
+        if vals.shape != (n,):
+            raise ValueError(
+                "%s: expected a one-dimensional array of length %s (got shape %s)"
+                % (name, n, vals.shape)
+            )
+        return vals
+
+    def get_values_array(self):
+        """Return the variable values as a NumPy ``float64`` array.
+
+        Values are returned in the order of :meth:`keys()`.  Variables
+        whose value is ``None`` are returned as ``nan``.
+
+        """
+        data = self._ordered_data()
+        return np.fromiter(
+            (_nan if v._value is None else v._value for v in data),
+            dtype=float,
+            count=len(data),
+        )
+
+    def set_values_array(self, values, skip_validation=False):
+        """Set the variable values from a one-dimensional array.
+
+        ``values`` is interpreted in the order of :meth:`keys()`.
+        ``nan`` entries clear the corresponding variable (set the value
+        to ``None``).  Numeric arrays are assigned directly (bypassing
+        the per-element :meth:`VarData.set_value` machinery); domain and
+        bounds validation (unless ``skip_validation`` is True) is
+        performed in bulk, and only the offending elements are passed
+        through :meth:`VarData.set_value` to generate the usual
+        warnings.  Non-numeric arrays fall back on
+        :meth:`VarData.set_value` for every element.
+
+        """
+        data = self._ordered_data()
+        values = self._check_array(values, len(data), 'set_values_array')
+        if values.dtype.kind not in 'biuf':
+            for vardata, val in zip(data, values.tolist()):
+                vardata.set_value(val, skip_validation)
+            return
+        if values.dtype.kind == 'b':
+            values = values.astype(int)
+        vals = values.tolist()
+        if values.dtype.kind == 'f':
+            missing = np.isnan(values)
+            if missing.any():
+                for i in np.flatnonzero(missing).tolist():
+                    vals[i] = None
+        else:
+            missing = None
+
+        # Note: in "delayed" mode, the stale flag only advances if we
+        # are updating a currently non-stale variable
+        flag = StaleFlagManager.get_flag(0)
+        if any(vardata._stale == flag for vardata in data):
+            flag = StaleFlagManager.get_flag(flag)
+        for vardata, val in zip(data, vals):
+            vardata._value = val
+            vardata._stale = 0 if val is None else flag
+
+        if skip_validation:
+            return
+        invalid = self._invalid_values_mask(data, values)
+        if missing is not None:
+            invalid &= ~missing
+        for i in np.flatnonzero(invalid).tolist():
+            data[i].set_value(vals[i])
+
+    def _invalid_values_mask(self, data, values):
+        # Returns a (conservative) mask of the values that may be
+        # outside the variable domain or bounds.  Elements flagged here
+        # are re-checked by VarData.set_value().
+        lb, ub = self._bounds_arrays(data)
+        with np.errstate(invalid='ignore'):
+            invalid = (values < lb) | (values > ub)
+        # Group the variables by domain so that we only need to test
+        # domain membership once per (global) domain
+        by_domain = {}
+        for i, vardata in enumerate(data):
+            by_domain.setdefault(id(vardata._domain), []).append(i)
+        for idx in by_domain.values():
+            domain = data[idx[0]]._domain
+            mask = _global_domain_screen(domain, values[idx])
+            if mask is None:
+                # Not a global domain: we cannot vectorize the check
+                invalid[idx] = True
+            else:
+                invalid[idx] |= mask
+        return invalid
+
+    def _bounds_arrays(self, data):
+        n = len(data)
+        lb = np.empty(n, dtype=float)
+        ub = np.empty(n, dtype=float)
+        for i, vardata in enumerate(data):
+            l, u = vardata.bounds
+            lb[i] = _ninf if l is None else l
+            ub[i] = _inf if u is None else u
+        return lb, ub
+
+    def get_bounds_arrays(self):
+        """Return the variable bounds as a tuple of NumPy arrays.
+
+        Returns ``(lb, ub)`` in the order of :meth:`keys()`.  As with
+        :attr:`VarData.bounds`, the bounds are the tighter of the
+        variable bounds and the domain bounds; missing bounds are
+        returned as ``-inf`` / ``inf``.
+
+        """
+        return self._bounds_arrays(self._ordered_data())
+
+    def set_bounds_arrays(self, lb=None, ub=None):
+        """Set the variable bounds from NumPy arrays.
+
+        ``lb`` and ``ub`` are interpreted in the order of :meth:`keys()`.
+        Infinite (or ``nan``) entries remove the corresponding bound.
+        Passing ``None`` for either array leaves those bounds unchanged.
+
+        """
+        data = self._ordered_data()
+        for name, bound, attr in (('lb', lb, '_lb'), ('ub', ub, '_ub')):
+            if bound is None:
+                continue
+            bound = self._check_array(bound, len(data), 'set_bounds_arrays')
+            bound = bound.astype(float)
+            vals = bound.tolist()
+            for i in np.flatnonzero(~np.isfinite(bound)).tolist():
+                vals[i] = None
+            for vardata, val in zip(data, vals):
+                setattr(vardata, attr, val)
+
+    def get_fixed_mask(self):
+        """Return a boolean NumPy array of the variable fixed flags.
+
+        The mask is returned in the order of :meth:`keys()`.
+
+        """
+        data = self._ordered_data()
+        return np.fromiter((v._fixed for v in data), dtype=bool, count=len(data))
+
+    def set_fixed_mask(self, mask):
+        """Fix / unfix the variables from a boolean array.
+
+        ``mask`` is interpreted in the order of :meth:`keys()`.  Note
+        that (unlike :meth:`fix`) this does not change the variable
+        values.
+
+        """
+        data = self._ordered_data()
+        mask = self._check_array(mask, len(data), 'set_fixed_mask')
+        for vardata, fixed in zip(data, mask.astype(bool).tolist()):
+            vardata._fixed = fixed
+
     @property
     def domain(self):
         raise AttributeError(
@@ -1010,6 +1200,596 @@ class IndexedVar(Var):
             raise
 
 
+class _ArrayVarData(VarData):
+    """A VarData "view" into the arrays of an :class:`ArrayIndexedVar`
+
+    Instances do not store any variable state: the VarData private
+    attributes (``_value``, ``_lb``, ``_ub``, ``_domain``, ``_fixed``,
+    and ``_stale``) are redirected to the arrays held by the owning
+    :class:`_ArrayVarDataStore`, so all the VarData methods work
+    unchanged.
+
+    """
+
+    __slots__ = ('_store', '_pos')
+
+    def __init__(self, store, pos, index):
+        self._component = store._component
+        self._index = index
+        self._store = store
+        self._pos = pos
+
+    def __getstate__(self):
+        return {'_store': self._store, '_pos': self._pos, '_index': self._index}
+
+    def __setstate__(self, state):
+        self._store = store = state['_store']
+        self._pos = state['_pos']
+        self._index = state['_index']
+        store._register(self)
+
+    def _create_objects_for_deepcopy(self, memo, component_list):
+        ans = memo.get(id(self), None)
+        if ans is None:
+            # Copying the owning container will create (and register in
+            # the memo) copies of all the current views
+            self.parent_component()._create_objects_for_deepcopy(memo, component_list)
+            ans = memo[id(self)]
+        return ans
+
+    @property
+    def _value(self):
+        store = self._store
+        val = store.values.item(self._pos)
+        if val != val:
+            return None
+        if store.integer.item(self._pos):
+            return int(val)
+        return val
+
+    @_value.setter
+    def _value(self, val):
+        store = self._store
+        if val is None:
+            store.values[self._pos] = _nan
+            store.integer[self._pos] = False
+        else:
+            store.values[self._pos] = val
+            # Integer values that are exactly representable as floats
+            # are returned as ints
+            store.integer[self._pos] = (
+                val.__class__ is int and store.values.item(self._pos) == val
+            )
+
+    @property
+    def _lb(self):
+        store = self._store
+        val = store.lb.item(self._pos)
+        if val != val:
+            return store.bound_exprs.get((self._pos, 0), None)
+        if store.integer_lb.item(self._pos):
+            return int(val)
+        return val
+
+    @_lb.setter
+    def _lb(self, val):
+        self._store._set_bound(self._pos, 0, val)
+
+    @property
+    def _ub(self):
+        store = self._store
+        val = store.ub.item(self._pos)
+        if val != val:
+            return store.bound_exprs.get((self._pos, 1), None)
+        if store.integer_ub.item(self._pos):
+            return int(val)
+        return val
+
+    @_ub.setter
+    def _ub(self, val):
+        self._store._set_bound(self._pos, 1, val)
+
+    @property
+    def _domain(self):
+        store = self._store
+        if store.domains:
+            return store.domains.get(self._pos, store.domain)
+        return store.domain
+
+    @_domain.setter
+    def _domain(self, val):
+        store = self._store
+        if val is store.domain:
+            store.domains.pop(self._pos, None)
+        else:
+            store.domains[self._pos] = val
+
+    @property
+    def _fixed(self):
+        return self._store.fixed.item(self._pos)
+
+    @_fixed.setter
+    def _fixed(self, val):
+        self._store.fixed[self._pos] = val
+
+    @property
+    def _stale(self):
+        return self._store.stale.item(self._pos)
+
+    @_stale.setter
+    def _stale(self, val):
+        self._store.stale[self._pos] = val
+
+
+class _ArrayVarDataStore(MutableMapping):
+    """The ``_data`` mapping for :class:`ArrayIndexedVar`
+
+    The variable state is held in contiguous NumPy arrays (ordered by
+    the position of the index in the component index set).  The map
+    from index to array position is fixed when the index is first
+    stored: indices added to the index set are appended to the arrays,
+    and removing (or reordering) indices that are already stored is an
+    error.  ``None`` values and bounds are stored as ``nan``.  Non-constant bounds
+    (e.g., mutable Params) and per-index domains are held in (sparse)
+    dicts.  VarData objects are lightweight views that are created on
+    demand and cached (weakly) so that the same index always maps to
+    the same (live) VarData object.
+
+    """
+
+    def __init__(self, component):
+        self._component = weakref_ref(component)
+        self._index_set = component.index_set()
+        self._n = 0
+        self._indices = []
+        self._positions = {}
+        self.values = np.empty(0, dtype=float)
+        self.integer = np.empty(0, dtype=bool)
+        self.lb = np.empty(0, dtype=float)
+        self.ub = np.empty(0, dtype=float)
+        self.integer_lb = np.empty(0, dtype=bool)
+        self.integer_ub = np.empty(0, dtype=bool)
+        self.fixed = np.empty(0, dtype=bool)
+        self.stale = np.empty(0, dtype=np.int64)
+        self.domain = None
+        self.domains = {}
+        self.bound_exprs = {}
+        self._views = WeakValueDictionary()
+        self._resize()
+
+    def _modified_error(self):
+        return RuntimeError(
+            "Elements were removed from (or reordered in) the index set of "
+            "the array-backed Var '%s'.  Elements may only be added to the "
+            "end of the index set after construction." % (self._component().name,)
+        )
+
+    def _resize(self):
+        """Append the indices added to the index set since the last call"""
+        index_set = self._index_set
+        n = len(index_set)
+        if n < self._n:
+            raise self._modified_error()
+        if n == self._n:
+            return
+        if isinstance(index_set, InsertionOrderSetData):
+            # New elements are always added to the end of the set
+            new = [index_set.at(i) for i in range(self._n + 1, n + 1)]
+        else:
+            # e.g., sorted Sets (or products of mutable Sets) may insert
+            # new elements before the ones we already store
+            it = iter(index_set)
+            if self._indices != list(islice(it, self._n)):
+                raise self._modified_error()
+            new = list(it)
+        positions = self._positions
+        for pos, index in enumerate(new, self._n):
+            positions[index] = pos
+        self._indices.extend(new)
+        k = n - self._n
+        self.values = np.concatenate((self.values, np.full(k, _nan)))
+        self.integer = np.concatenate((self.integer, np.zeros(k, dtype=bool)))
+        self.lb = np.concatenate((self.lb, np.full(k, _nan)))
+        self.ub = np.concatenate((self.ub, np.full(k, _nan)))
+        self.integer_lb = np.concatenate((self.integer_lb, np.zeros(k, dtype=bool)))
+        self.integer_ub = np.concatenate((self.integer_ub, np.zeros(k, dtype=bool)))
+        self.fixed = np.concatenate((self.fixed, np.zeros(k, dtype=bool)))
+        self.stale = np.concatenate((self.stale, np.zeros(k, dtype=np.int64)))
+        self._n = n
+
+    def _update(self):
+        """Bring the store up to date with the index set
+
+        Indices added to the index set are appended (and initialized
+        by the owning component); removing indices is an error.
+
+        """
+        n = self._n
+        self._resize()
+        if self._n != n:
+            self._component()._init_new_elements(n)
+
+    def _set_bound(self, pos, which, val):
+        if val is None:
+            val = _nan
+        elif val.__class__ not in native_numeric_types:
+            # Non-constant (e.g., mutable Param) bound
+            self.bound_exprs[pos, which] = val
+            val = _nan
+        elif self.bound_exprs:
+            self.bound_exprs.pop((pos, which), None)
+        bounds = self.ub if which else self.lb
+        bounds[pos] = val
+        # As with values, integer bounds are returned as ints
+        (self.integer_ub if which else self.integer_lb)[pos] = (
+            val.__class__ is int and bounds.item(pos) == val
+        )
+
+    def _view(self, pos, index):
+        ans = self._views.get(pos, None)
+        if ans is None:
+            ans = self._views[pos] = _ArrayVarData(self, pos, index)
+        return ans
+
+    def _register(self, view):
+        if '_views' in self.__dict__:
+            self._views[view._pos] = view
+        else:
+            # This store has not been unpickled yet: defer the
+            # registration until __setstate__
+            self.__dict__.setdefault('_pending', []).append(view)
+
+    def _pos(self, index):
+        if len(self._index_set) < self._n:
+            raise self._modified_error()
+        try:
+            return self._positions[index]
+        except TypeError:
+            # unhashable index
+            raise KeyError(index)
+
+    def __getitem__(self, index):
+        pos = self._pos(index)
+        ans = self._views.get(pos, None)
+        if ans is None:
+            ans = self._views[pos] = _ArrayVarData(self, pos, index)
+        return ans
+
+    def __setitem__(self, index, val):
+        raise TypeError(
+            "Cannot assign VarData objects to the array-backed Var '%s'"
+            % (self._component().name,)
+        )
+
+    def __delitem__(self, index):
+        raise TypeError(
+            "Cannot remove elements from the array-backed Var '%s'"
+            % (self._component().name,)
+        )
+
+    def __contains__(self, index):
+        try:
+            self._pos(index)
+            return True
+        except (KeyError, TypeError):
+            return False
+
+    def __iter__(self):
+        self._update()
+        return iter(self._indices)
+
+    def __len__(self):
+        self._update()
+        return self._n
+
+    def items(self):
+        return map(lambda i: (i[1], self._view(*i)), enumerate(self))
+
+    def values(self):
+        return map(lambda i: self._view(*i), enumerate(self))
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state['_views']
+        state['_component'] = self._component()
+        # Stale flags are only meaningful within a single process
+        state['stale'] = self.stale != StaleFlagManager.get_flag(0)
+        return state
+
+    def __setstate__(self, state):
+        pending = self.__dict__.pop('_pending', ())
+        self.__dict__.update(state)
+        self._component = weakref_ref(self._component)
+        self.stale = np.where(self.stale, 0, StaleFlagManager.get_flag(0))
+        self._views = WeakValueDictionary()
+        for view in pending:
+            self._views[view._pos] = view
+
+    def _copy(self, component, memo):
+        ans = self.__class__.__new__(self.__class__)
+        ans._component = weakref_ref(component)
+        ans._index_set = fast_deepcopy(self._index_set, memo)
+        ans._n = self._n
+        ans._indices = list(self._indices)
+        ans._positions = dict(self._positions)
+        for name in (
+            'values',
+            'integer',
+            'lb',
+            'ub',
+            'integer_lb',
+            'integer_ub',
+            'fixed',
+            'stale',
+        ):
+            setattr(ans, name, getattr(self, name).copy())
+        ans.domain = fast_deepcopy(self.domain, memo)
+        ans.domains = fast_deepcopy(self.domains, memo)
+        ans.bound_exprs = fast_deepcopy(self.bound_exprs, memo)
+        ans._views = WeakValueDictionary()
+        for pos, view in list(self._views.items()):
+            memo[id(view)] = ans._view(pos, fast_deepcopy(view._index, memo))
+        return ans
+
+
+class ArrayIndexedVar(IndexedVar):
+    """An array of variables whose data is stored in NumPy arrays.
+
+    This is the class returned by ``Var(*indexes, storage='array')``.
+    The values, bounds, fixed flags (and stale flags) for all the
+    variables are held in contiguous NumPy arrays, and the VarData
+    objects are lightweight views created on demand (and released when
+    they are no longer referenced).  This significantly reduces the
+    memory footprint of very large, dense variables.
+
+    Array-backed variables must be dense and indexed by a finite,
+    ordered Set.  Elements may be added to the end of the index set
+    after construction, but not removed or inserted before existing
+    elements (e.g., into a sorted Set).  Variable values are stored as
+    floating point numbers (``nan`` is interpreted as ``None``); integer
+    values and bounds that are exactly representable are returned as
+    ``int``.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        if not kwargs.get('dense', True):
+            raise ValueError("Array-backed Vars (storage='array') must be dense")
+        super().__init__(*args, **kwargs)
+
+    def is_reference(self):
+        return False
+
+    def keys(self, sort=SortComponents.UNSORTED, ordered=NOTSET):
+        if self._constructed:
+            # Raise an exception if indices were removed from the index set
+            self._data._update()
+        return super().keys(sort, ordered)
+
+    def _create_objects_for_deepcopy(self, memo, component_list):
+        _new = self.__class__.__new__(self.__class__)
+        _ans = memo.setdefault(id(self), _new)
+        if _ans is _new:
+            component_list.append((self, _new))
+            _src = self._data
+            if _src.__class__ is _ArrayVarDataStore:
+                memo[id(_src)] = _new._data = _src._copy(_new, memo)
+        return _ans
+
+    def construct(self, data=None):
+        """Construct the array storage for this variable"""
+        if self._constructed:
+            return
+        self._constructed = True
+
+        timer = ConstructionTimer(self)
+        if is_debug_set(logger):
+            logger.debug("Constructing Variable %s" % (self.name,))
+
+        if self._anonymous_sets is not None:
+            for _set in self._anonymous_sets:
+                _set.construct()
+
+        index = None
+        try:
+            assert data is None
+            index_set = self.index_set()
+            if not index_set.isfinite() or not index_set.isordered():
+                raise ValueError(
+                    "Array-backed Vars (storage='array') must be indexed "
+                    "by a finite, ordered Set"
+                )
+            if self._rule_init is not None and self._rule_init.contains_indices():
+                # Support sparse initialization maps (see Var.construct)
+                self._rule_init = DefaultInitializer(self._rule_init, None, KeyError)
+            store = self._data = _ArrayVarDataStore(self)
+            if not store._n:
+                return
+            block = self.parent_block()
+            if self._rule_domain.constant():
+                store.domain = self._rule_domain(block, None, self)
+            else:
+                # Only store the domains that differ from the first one
+                store.domain = self._rule_domain(block, next(iter(index_set)), self)
+                for pos, index in enumerate(index_set):
+                    store._view(pos, index)._domain = self._rule_domain(
+                        block, index, self
+                    )
+            constant_bounds = self._rule_bounds is None or self._rule_bounds.constant()
+            constant_init = self._rule_init is None or (
+                self._rule_init.constant()
+                and constant_bounds
+                and self._rule_domain.constant()
+            )
+            # Initialize (and validate) the first element, then
+            # broadcast anything that is constant.
+            index = next(iter(index_set))
+            self._init_element(block, store._view(0, index), index)
+            index = None
+            if constant_bounds:
+                store.lb[:] = store.lb[0]
+                store.ub[:] = store.ub[0]
+                store.integer_lb[:] = store.integer_lb[0]
+                store.integer_ub[:] = store.integer_ub[0]
+                for which in (0, 1):
+                    expr = store.bound_exprs.get((0, which), None)
+                    if expr is not None:
+                        store.bound_exprs.update(
+                            ((pos, which), expr) for pos in range(1, store._n)
+                        )
+            if constant_init:
+                store.values[:] = store.values[0]
+                store.integer[:] = store.integer[0]
+                store.stale[:] = store.stale[0]
+            if not (constant_bounds and constant_init):
+                for pos, index in enumerate(index_set):
+                    if not pos:
+                        continue
+                    obj = store._view(pos, index)
+                    if not constant_bounds:
+                        obj.lower, obj.upper = self._rule_bounds(block, index)
+                    if not constant_init:
+                        obj.set_value(self._rule_init(block, index))
+                index = None
+        except Exception:
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed when initializing variable for "
+                "Var %s with index %s:\n%s: %s"
+                % (self.name, str(index), type(err).__name__, err)
+            )
+            raise
+        finally:
+            timer.report()
+
+    def _init_element(self, block, obj, index):
+        if self._rule_bounds is not None:
+            obj.lower, obj.upper = self._rule_bounds(block, index)
+        if self._rule_init is not None:
+            obj.set_value(self._rule_init(block, index))
+
+    def _init_new_elements(self, start):
+        # Initialize the elements added to the index set since
+        # construction (called by _ArrayVarDataStore._update)
+        store = self._data
+        block = self.parent_block()
+        for pos in range(start, store._n):
+            index = store._indices[pos]
+            obj = store._view(pos, index)
+            obj._domain = self._rule_domain(block, index, self)
+            self._init_element(block, obj, index)
+
+    def _getitem_when_not_present(self, index):
+        # The index set has grown since construction
+        store = self._data
+        store._update()
+        if index not in store._positions:
+            # The index set did not grow: an existing element was removed
+            raise store._modified_error()
+        return store[index]
+
+    def _setitem_when_not_present(self, index, value=NOTSET):
+        if value is self.Skip:
+            return None
+        obj = self._getitem_when_not_present(index)
+        if value is not NOTSET:
+            obj.set_value(value)
+        return obj
+
+    def _updated_data(self):
+        # The store, brought up to date with the index set
+        store = self._data
+        store._update()
+        return store
+
+    def flag_as_stale(self):
+        self._updated_data().stale[:] = 0
+
+    def fix(self, value=NOTSET, skip_validation=False):
+        if value is NOTSET:
+            self._updated_data().fixed[:] = True
+        else:
+            super().fix(value, skip_validation)
+
+    def unfix(self):
+        self._updated_data().fixed[:] = False
+
+    #
+    # Bulk (NumPy) accessors operating directly on the underlying arrays
+    #
+
+    def get_values_array(self):
+        return self._updated_data().values.copy()
+
+    def set_values_array(self, values, skip_validation=False):
+        store = self._updated_data()
+        values = self._check_array(values, store._n, 'set_values_array')
+        if values.dtype.kind not in 'biuf':
+            return super().set_values_array(values, skip_validation)
+        integer = values.dtype.kind in 'iu'
+        values = values.astype(float)
+        missing = np.isnan(values)
+        flag = StaleFlagManager.get_flag(0)
+        if (store.stale == flag).any():
+            flag = StaleFlagManager.get_flag(flag)
+        store.values[:] = values
+        store.integer[:] = integer
+        store.stale[:] = np.where(missing, 0, flag)
+        if skip_validation:
+            return
+        if store.domains or store.bound_exprs:
+            invalid = self._invalid_values_mask(self._ordered_data(), values)
+        else:
+            lb, ub = self.get_bounds_arrays()
+            with np.errstate(invalid='ignore'):
+                invalid = (values < lb) | (values > ub)
+            mask = _global_domain_screen(store.domain, values)
+            if mask is None:
+                invalid[:] = True
+            else:
+                invalid |= mask
+        invalid &= ~missing
+        for i in np.flatnonzero(invalid).tolist():
+            store._view(i, store._indices[i]).set_value(values.item(i))
+
+    def get_bounds_arrays(self):
+        store = self._updated_data()
+        if store.domains or store.bound_exprs:
+            return super().get_bounds_arrays()
+        dlb, dub = store.domain.bounds()
+        lb = np.where(np.isnan(store.lb), _ninf, store.lb)
+        ub = np.where(np.isnan(store.ub), _inf, store.ub)
+        if dlb is not None:
+            lb = np.maximum(lb, dlb)
+        if dub is not None:
+            ub = np.minimum(ub, dub)
+        return lb, ub
+
+    def set_bounds_arrays(self, lb=None, ub=None):
+        store = self._updated_data()
+        for which, bound in enumerate((lb, ub)):
+            if bound is None:
+                continue
+            bound = self._check_array(bound, store._n, 'set_bounds_arrays')
+            integer = bound.dtype.kind in 'iu'
+            bound = bound.astype(float)
+            (store.ub if which else store.lb)[:] = np.where(
+                np.isfinite(bound), bound, _nan
+            )
+            (store.integer_ub if which else store.integer_lb)[:] = integer
+            if store.bound_exprs:
+                for key in [k for k in store.bound_exprs if k[1] == which]:
+                    del store.bound_exprs[key]
+
+    def get_fixed_mask(self):
+        return self._updated_data().fixed.copy()
+
+    def set_fixed_mask(self, mask):
+        store = self._updated_data()
+        mask = self._check_array(mask, store._n, 'set_fixed_mask')
+        store.fixed[:] = mask.astype(bool)
+
+
 @ModelComponentFactory.register("List of decision variables.")
 class VarList(IndexedVar):
     """
@@ -196,6 +196,7 @@ from .visitor import (
 )
 
 from .calculus.derivatives import differentiate
+from .tape import compile_expression, ExpressionTape
 from .taylor_series import taylor_series_expansion
 
 #
@@ -9,6 +9,8 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from operator import is_
+
 from pyomo.common.dependencies import attempt_import
 from pyomo.common.numeric_types import native_types
 from pyomo.common.modeling import NOTSET
@@ -41,6 +43,29 @@ class ExpressionBase(PyomoObject):
     """
     ASSOCIATIVITY = OperatorAssociativity.LEFT_TO_RIGHT
 
+    def __deepcopy__(self, memo):
+        ans = super().__deepcopy__(memo)
+        if '__share_expressions__' not in memo:
+            return ans
+        # Expression nodes are immutable: when cloning a block, nodes
+        # that do not reference any cloned components (e.g., subtrees
+        # that only contain constants or components outside the block
+        # scope) can be shared between the original and the new block.
+        # (Note that Block.clone() sets '__share_expressions__', but
+        # ExpressionBase.clone() does not.)
+        for slot in self.__auto_slots__.slots:
+            old = getattr(self, slot)
+            new = getattr(ans, slot)
+            if new is old:
+                continue
+            if (
+                new.__class__ is not list
+                or len(new) != len(old)
+                or not all(map(is_, new, old))
+            ):
+                return ans
+        return self
+
     def nargs(self):
         """Returns the number of child nodes.
 
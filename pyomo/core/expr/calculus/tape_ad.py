@@ -0,0 +1,681 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Reverse-mode automatic differentiation on expression tapes
+
+:func:`reverse_ad` differentiates a single expression by walking the
+expression tree (twice) for every call.  The classes in this module
+record a list of expressions once into an
+:class:`~pyomo.core.expr.tape.ExpressionTape` and then differentiate
+the tape: first derivatives are computed with a single reverse sweep
+over the (level-grouped) instructions of the tape, and the Hessian of a
+weighted sum of the expressions is computed with forward-over-reverse
+sweeps.  Because every expression has its own slots in the tape, one
+reverse sweep computes the gradients of all expressions at once, and
+the forward-over-reverse sweeps for every expression are performed
+together.  The columns of the Hessian of each expression are colored so
+that columns that do not share a nonzero row are computed with a single
+direction, so the number of directions is usually small (and does not
+grow with the number of variables in the model).
+
+The tape, the sparsity structure of the Jacobian, and the sparsity
+structure of the Hessian are computed once; evaluating the derivatives
+at new points (or after changing the value of mutable parameters or
+fixed variables) does not rebuild anything.
+
+"""
+
+from pyomo.common.dependencies import numpy as np, scipy
+from pyomo.core.base.constraint import Constraint
+from pyomo.core.base.objective import Objective
+from pyomo.core.expr.calculus.diff_with_pyomo import DifferentiationException
+from pyomo.core.expr.tape import compile_expression, _nary_ops
+
+#
+# First derivatives of each operation with respect to each of its
+# arguments.  Each function returns a list with one entry per argument
+# (or a single entry for n-ary operations, covering all arguments);
+# None means that the derivative is (structurally) zero.
+#
+
+
+def _d_sum(R, out, args, data, aux):
+    return [1.0]
+
+
+def _d_max_min(R, out, args, data, aux):
+    # Split the derivative equally among the arguments that attain the
+    # maximum (minimum)
+    flat, offsets = args
+    out_flat = aux[0]
+    active = (R[flat] == R[out_flat]).astype(float)
+    count = np.add.reduceat(active, offsets, axis=0)
+    return [active / count[aux[1]]]
+
+
+def _d_mul(R, out, args, data, aux):
+    return [R[args[1]], R[args[0]]]
+
+
+def _d_div(R, out, args, data, aux):
+    inv = 1 / R[args[1]]
+    return [inv, -R[out] * inv]
+
+
+def _d_pow_const(R, out, args, data, aux):
+    a = R[args[0]]
+    b = R[args[1]]
+    return [b * a ** (b - 1), None]
+
+
+def _d_pow(R, out, args, data, aux):
+    a = R[args[0]]
+    b = R[args[1]]
+    return [b * a ** (b - 1), R[out] * np.log(a)]
+
+
+def _d_neg(R, out, args, data, aux):
+    return [-1.0]
+
+
+def _d_unary(R, out, args, data, aux):
+    return [_unary_d1[data](R[args[0]], R[out])]
+
+
+def _d_if(R, out, args, data, aux):
+    cond = (R[args[0]] != 0).astype(float)
+    return [None, cond, 1 - cond]
+
+
+#
+# Directional derivatives (along the tangents T) of the first
+# derivatives above.  Linear (and piecewise linear) operations return
+# None.
+#
+
+
+def _dd_mul(R, out, args, data, T):
+    return [T[args[1]], T[args[0]]]
+
+
+def _dd_div(R, out, args, data, T):
+    a = R[args[0]]
+    inv = 1 / R[args[1]]
+    inv2 = inv * inv
+    Tb = T[args[1]]
+    return [-Tb * inv2, -T[args[0]] * inv2 + 2 * a * inv2 * inv * Tb]
+
+
+def _dd_pow_const(R, out, args, data, T):
+    a = R[args[0]]
+    b = R[args[1]]
+    return [b * (b - 1) * a ** (b - 2) * T[args[0]], None]
+
+
+def _dd_pow(R, out, args, data, T):
+    a = R[args[0]]
+    b = R[args[1]]
+    f = R[out]
+    log_a = np.log(a)
+    d_ab = a ** (b - 1) * (1 + b * log_a)
+    Ta = T[args[0]]
+    Tb = T[args[1]]
+    return [
+        b * (b - 1) * a ** (b - 2) * Ta + d_ab * Tb,
+        d_ab * Ta + f * log_a * log_a * Tb,
+    ]
+
+
+def _dd_unary(R, out, args, data, T):
+    return [_unary_d2[data](R[args[0]], R[out]) * T[args[0]]]
+
+
+_first_derivative = {
+    'sum': _d_sum,
+    'max': _d_max_min,
+    'min': _d_max_min,
+    'mul': _d_mul,
+    'div': _d_div,
+    'pow_const': _d_pow_const,
+    'pow': _d_pow,
+    'neg': _d_neg,
+    'unary': _d_unary,
+    'if': _d_if,
+}
+
+_second_derivative = {
+    'mul': _dd_mul,
+    'div': _dd_div,
+    'pow_const': _dd_pow_const,
+    'pow': _dd_pow,
+    'unary': _dd_unary,
+}
+
+# First and second derivatives of the unary functions, as functions of
+# the argument (x) and the value of the function (f)
+_unary_d1 = {
+    'log': lambda x, f: 1 / x,
+    'log10': lambda x, f: 1 / (x * np.log(10)),
+    'sin': lambda x, f: np.cos(x),
+    'cos': lambda x, f: -np.sin(x),
+    'tan': lambda x, f: 1 + f * f,
+    'sinh': lambda x, f: np.cosh(x),
+    'cosh': lambda x, f: np.sinh(x),
+    'tanh': lambda x, f: 1 - f * f,
+    'asin': lambda x, f: 1 / np.sqrt(1 - x * x),
+    'acos': lambda x, f: -1 / np.sqrt(1 - x * x),
+    'atan': lambda x, f: 1 / (1 + x * x),
+    'exp': lambda x, f: f,
+    'sqrt': lambda x, f: 0.5 / f,
+    'asinh': lambda x, f: 1 / np.sqrt(x * x + 1),
+    'acosh': lambda x, f: 1 / np.sqrt(x * x - 1),
+    'atanh': lambda x, f: 1 / (1 - x * x),
+    'abs': lambda x, f: np.sign(x),
+}
+
+_unary_d2 = {
+    'log': lambda x, f: -1 / (x * x),
+    'log10': lambda x, f: -1 / (x * x * np.log(10)),
+    'sin': lambda x, f: -f,
+    'cos': lambda x, f: -f,
+    'tan': lambda x, f: 2 * f * (1 + f * f),
+    'sinh': lambda x, f: f,
+    'cosh': lambda x, f: f,
+    'tanh': lambda x, f: -2 * f * (1 - f * f),
+    'asin': lambda x, f: x / (1 - x * x) ** 1.5,
+    'acos': lambda x, f: -x / (1 - x * x) ** 1.5,
+    'atan': lambda x, f: -2 * x / (1 + x * x) ** 2,
+    'exp': lambda x, f: f,
+    'sqrt': lambda x, f: -0.25 / (f * x),
+    'asinh': lambda x, f: -x / (x * x + 1) ** 1.5,
+    'acosh': lambda x, f: -x / (x * x - 1) ** 1.5,
+    'atanh': lambda x, f: 2 * x / (1 - x * x) ** 2,
+    'abs': lambda x, f: np.zeros_like(x),
+}
+
+# Unary functions whose derivative is zero (almost) everywhere
+_piecewise_constant = {'ceil', 'floor'}
+
+
+def _scatter_add(A, idx, unique, vals):
+    if unique:
+        A[idx] += vals
+    else:
+        np.add.at(A, idx, vals)
+
+
+class DerivativeTape(object):
+    """Evaluate the derivatives of a list of expressions from a tape
+
+    Parameters
+    ----------
+    exprs: list
+        The expressions to differentiate
+
+    variables: list
+        The variables (VarData) to differentiate with respect to (the
+        columns of the Jacobian).  If None, the unfixed variables are
+        collected from the expressions.  See :func:`compile_expression`.
+
+    Attributes
+    ----------
+    variables: list
+        The variables (VarData) that are the columns of the Jacobian
+        (and the rows and columns of the Hessian)
+
+    """
+
+    # Upper bound on the number of tape slots times the number of
+    # directions propagated together when computing Hessians
+    hessian_chunk_size = 2**21
+
+    def __init__(self, exprs, variables=None):
+        self._tape = compile_expression(list(exprs), variables)
+        self.variables = self._tape.variables
+        self._n_outputs = len(self._tape._outputs)
+        self._build()
+        self._hessian_structure = None
+
+    def _build(self):
+        tape = self._tape
+        varying = np.zeros(tape._n_slots, dtype=bool)
+        varying[tape._input_slots] = True
+        self._groups = groups = []
+        for opcode, data, out, args in tape._groups:
+            if opcode in _nary_ops:
+                varying[out] = np.logical_or.reduceat(varying[args[0]], args[1])
+            else:
+                varying[out] = np.logical_or.reduce([varying[a] for a in args])
+            if not varying[out].any():
+                continue
+            if opcode == 'generic':
+                node = data
+                raise DifferentiationException(
+                    "Cannot differentiate expressions of type %s on an "
+                    "expression tape" % (type(node).__name__,)
+                )
+            if opcode in ('compare', 'ranged') or (
+                opcode == 'unary' and data in _piecewise_constant
+            ):
+                # The derivative of these operations is zero
+                continue
+            if opcode == 'pow':
+                # Split the power operations whose exponent does not
+                # depend on the variables (so that we do not need to
+                # take the log of the base)
+                const = ~varying[args[1]]
+                for op, mask in (('pow_const', const), ('pow', ~const)):
+                    if mask.any():
+                        self._add_group(
+                            op, data, out[mask], tuple(a[mask] for a in args)
+                        )
+                continue
+            self._add_group(opcode, data, out, args)
+
+        # Each expression has its own slots in the tape, so the
+        # derivatives of each expression with respect to its inputs are
+        # the adjoints of the input slots
+        self._input_output = (
+            np.searchsorted(tape._output_start, tape._input_slots, side='right') - 1
+        )
+
+    def _add_group(self, opcode, data, out, args):
+        if opcode in _nary_ops:
+            flat, offsets = args
+            lengths = np.diff(np.append(offsets, len(flat)))
+            owner = np.repeat(np.arange(len(out)), lengths)
+            aux = (out[owner], owner)
+            unique = (len(np.unique(flat)) == len(flat),)
+        else:
+            aux = None
+            unique = tuple(len(np.unique(a)) == len(a) for a in args)
+        self._groups.append((opcode, data, out, args, aux, unique))
+
+    def _point(self, x):
+        X = self._tape._points(x)
+        if X.shape[0] != 1:
+            raise ValueError(
+                "Derivatives can only be evaluated at a single point, but "
+                "got an array with shape %s" % (np.shape(x),)
+            )
+        return X.T
+
+    def _partials(self, R):
+        return [
+            _first_derivative[opcode](R, out, args, data, aux)
+            for opcode, data, out, args, aux, unique in self._groups
+        ]
+
+    def _adjoints(self, partials, seed):
+        # Reverse sweep: propagate the adjoints in the output slots back
+        # to all slots of the tape
+        tape = self._tape
+        A = np.zeros((tape._n_slots, seed.shape[1]))
+        A[tape._output_slots] = seed
+        for (opcode, data, out, args, aux, unique), d in zip(
+            reversed(self._groups), reversed(partials)
+        ):
+            if aux is not None:
+                _scatter_add(A, args[0], unique[0], d[0] * A[aux[0]])
+                continue
+            A_out = A[out]
+            for arg, u, d_arg in zip(args, unique, d):
+                if d_arg is not None:
+                    _scatter_add(A, arg, u, d_arg * A_out)
+        return A
+
+    def _tangents(self, partials, T):
+        # Forward sweep: propagate the tangents in the input slots to
+        # all slots of the tape
+        for (opcode, data, out, args, aux, unique), d in zip(self._groups, partials):
+            if aux is not None:
+                T[out] = np.add.reduceat(d[0] * T[args[0]], args[1], axis=0)
+                continue
+            T_out = 0
+            for arg, d_arg in zip(args, d):
+                if d_arg is not None:
+                    T_out = T_out + d_arg * T[arg]
+            T[out] = T_out
+        return T
+
+    def _adjoint_tangents(self, R, partials, A, T):
+        # Reverse sweep of the tangents of the adjoints (the second
+        # order adjoints)
+        Adot = np.zeros_like(T)
+        for (opcode, data, out, args, aux, unique), d in zip(
+            reversed(self._groups), reversed(partials)
+        ):
+            if aux is not None:
+                _scatter_add(Adot, args[0], unique[0], d[0] * Adot[aux[0]])
+                continue
+            Adot_out = Adot[out]
+            dd = None
+            if opcode in _second_derivative:
+                dd = _second_derivative[opcode](R, out, args, data, T)
+                A_out = A[out]
+            for i, (arg, u, d_arg) in enumerate(zip(args, unique, d)):
+                if d_arg is None:
+                    continue
+                vals = d_arg * Adot_out
+                if dd is not None:
+                    vals = vals + dd[i] * A_out
+                _scatter_add(Adot, arg, u, vals)
+        return Adot
+
+    def evaluate(self, x=None):
+        """Evaluate the expressions at a point
+
+        Parameters
+        ----------
+        x: array_like
+            The values of the variables.  If None, the current values of
+            the variables are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            The value of each expression
+
+        """
+        return self._tape.evaluate(np.asarray(self._point(x))[:, 0])
+
+    def jacobian(self, x=None):
+        """Evaluate the Jacobian of the expressions at a point
+
+        Parameters
+        ----------
+        x: array_like
+            The values of the variables.  If None, the current values of
+            the variables are used.
+
+        Returns
+        -------
+        scipy.sparse.coo_matrix
+            The Jacobian, with one row per expression and one column
+            per variable.  The sparsity structure does not depend on
+            the point.
+
+        """
+        tape = self._tape
+        with np.errstate(all='ignore'):
+            R = tape._forward(self._point(x))
+            A = self._adjoints(self._partials(R), np.ones((self._n_outputs, 1)))
+        return scipy.sparse.coo_matrix(
+            (A[tape._input_slots, 0], (self._input_output, tape._input_index)),
+            shape=(self._n_outputs, len(self.variables)),
+        )
+
+    def _get_hessian_structure(self):
+        if self._hessian_structure is not None:
+            return self._hessian_structure
+        tape = self._tape
+        # Collect the input slots each slot depends on and, for every
+        # nonlinear operation, the pairs of inputs that interact through
+        # it (the nonzeros of the Hessian of each expression)
+        empty = frozenset()
+        dep = {s: frozenset((s,)) for s in tape._input_slots.tolist()}
+        products = []
+        for opcode, out, args, data in tape._instructions:
+            deps = [dep.get(a, empty) for a in args]
+            if opcode in ('compare', 'ranged', 'generic') or (
+                opcode == 'unary' and data in _piecewise_constant
+            ):
+                continue
+            if opcode == 'if':
+                deps = deps[1:]
+            if len(deps) == 1:
+                dep[out] = deps[0]
+            else:
+                dep[out] = frozenset().union(*deps)
+            if not dep[out]:
+                continue
+            if opcode == 'mul':
+                if deps[0] and deps[1]:
+                    products.append((deps[0], deps[1]))
+            elif opcode == 'div':
+                if deps[1]:
+                    products.append((dep[out], deps[1]))
+            elif opcode == 'pow' or (opcode == 'unary' and data != 'abs'):
+                products.append((dep[out], dep[out]))
+        pattern = {}
+        for A, B in products:
+            for i in A:
+                pattern.setdefault(i, set()).update(B)
+            for j in B:
+                pattern.setdefault(j, set()).update(A)
+
+        # Greedy coloring of the columns of the Hessian of each
+        # expression: columns that do not share a nonzero row can be
+        # computed with a single direction
+        color = {}
+        for j in sorted(pattern):
+            forbidden = set()
+            for i in pattern[j]:
+                for k in pattern[i]:
+                    if k in color:
+                        forbidden.add(color[k])
+            c = 0
+            while c in forbidden:
+                c += 1
+            color[j] = c
+
+        var_index = dict(zip(tape._input_slots.tolist(), tape._input_index.tolist()))
+        seed_slots = np.fromiter(color, dtype=int, count=len(color))
+        seed_colors = np.fromiter(color.values(), dtype=int, count=len(color))
+        pair_slot = []
+        pair_color = []
+        pair_key = []
+        n = len(self.variables)
+        for i, cols in pattern.items():
+            row = var_index[i] * n
+            for j in cols:
+                pair_slot.append(i)
+                pair_color.append(color[j])
+                pair_key.append(row + var_index[j])
+        key, index = np.unique(np.array(pair_key, dtype=int), return_inverse=True)
+        self._hessian_structure = (
+            seed_slots,
+            seed_colors,
+            np.array(pair_slot, dtype=int),
+            np.array(pair_color, dtype=int),
+            index.reshape(-1),
+            key // n,
+            key % n,
+            max(color.values()) + 1 if color else 0,
+        )
+        return self._hessian_structure
+
+    def hessian(self, x=None, weights=None):
+        """Evaluate the Hessian of a weighted sum of the expressions
+
+        Parameters
+        ----------
+        x: array_like
+            The values of the variables.  If None, the current values of
+            the variables are used.
+
+        weights: array_like
+            The weight of each expression (e.g., the Lagrange
+            multipliers).  If None, all weights are 1.
+
+        Returns
+        -------
+        scipy.sparse.coo_matrix
+            The (symmetric) Hessian, with one row and one column per
+            variable.  Both triangles are returned, and the sparsity
+            structure does not depend on the point or the weights.
+
+        """
+        tape = self._tape
+        (
+            seed_slots,
+            seed_colors,
+            pair_slot,
+            pair_color,
+            pair_index,
+            rows,
+            cols,
+            n_dir,
+        ) = self._get_hessian_structure()
+        if weights is None:
+            seed = np.ones((self._n_outputs, 1))
+        else:
+            seed = np.asarray(weights, dtype=float).reshape(-1, 1)
+            if seed.shape[0] != self._n_outputs:
+                raise ValueError(
+                    "Expected %s weights (one for each expression), but got %s"
+                    % (self._n_outputs, seed.shape[0])
+                )
+        values = np.zeros(len(pair_slot))
+        chunk = max(1, min(n_dir, self.hessian_chunk_size // max(tape._n_slots, 1)))
+        with np.errstate(all='ignore'):
+            R = tape._forward(self._point(x))
+            partials = self._partials(R)
+            A = self._adjoints(partials, seed)
+            for first in range(0, n_dir, chunk):
+                T = np.zeros((tape._n_slots, min(chunk, n_dir - first)))
+                seeded = (seed_colors >= first) & (seed_colors < first + chunk)
+                T[seed_slots[seeded], seed_colors[seeded] - first] = 1
+                self._tangents(partials, T)
+                Adot = self._adjoint_tangents(R, partials, A, T)
+                in_chunk = (pair_color >= first) & (pair_color < first + chunk)
+                values[in_chunk] = Adot[
+                    pair_slot[in_chunk], pair_color[in_chunk] - first
+                ]
+        data = np.bincount(pair_index, weights=values, minlength=len(rows))
+        n = len(self.variables)
+        return scipy.sparse.coo_matrix((data, (rows, cols)), shape=(n, n))
+
+
+class BlockDerivativeTape(DerivativeTape):
+    """Evaluate the constraints and objective of a block (and their
+    derivatives) from a tape
+
+    All active constraints and the active objective (if any) on the
+    block (and its active sub-blocks) are recorded once.  The methods
+    mirror the evaluation methods of the PyNumero NLP interfaces, so
+    that derivative information can be computed without writing an NL
+    file.
+
+    Parameters
+    ----------
+    block: BlockData
+        The block (model) to record
+
+    variables: list
+        The variables (VarData) to differentiate with respect to.  If
+        None, all unfixed variables that appear in the active
+        constraints and objective are used.
+
+    Attributes
+    ----------
+    constraints: list
+        The active constraints (ConstraintData), in the order of the
+        rows of the Jacobian
+
+    objective: ObjectiveData
+        The active objective (or None)
+
+    """
+
+    def __init__(self, block, variables=None):
+        self.constraints = list(
+            block.component_data_objects(Constraint, active=True, descend_into=True)
+        )
+        objectives = list(
+            block.component_data_objects(Objective, active=True, descend_into=True)
+        )
+        if len(objectives) > 1:
+            raise ValueError(
+                "Block '%s' has %s active objectives; expected at most one"
+                % (block.name, len(objectives))
+            )
+        self.objective = objectives[0] if objectives else None
+        exprs = [con.body for con in self.constraints]
+        if self.objective is not None:
+            exprs.append(self.objective.expr)
+        super().__init__(exprs, variables)
+        self._n_con = len(self.constraints)
+        self._con_entries = self._input_output < self._n_con
+
+    def evaluate_objective(self, x=None):
+        """Evaluate the objective at a point (see :meth:`evaluate`)"""
+        if self.objective is None:
+            raise ValueError("The block does not have an active objective")
+        return float(self.evaluate(x)[self._n_con])
+
+    def evaluate_constraints(self, x=None):
+        """Evaluate the body of each constraint at a point"""
+        return self.evaluate(x)[: self._n_con]
+
+    def evaluate_grad_objective(self, x=None):
+        """Evaluate the (dense) gradient of the objective at a point"""
+        if self.objective is None:
+            raise ValueError("The block does not have an active objective")
+        jac = self.jacobian(x)
+        obj = ~self._con_entries
+        return np.bincount(
+            jac.col[obj], weights=jac.data[obj], minlength=len(self.variables)
+        )
+
+    def evaluate_jacobian(self, x=None):
+        """Evaluate the Jacobian of the constraints at a point
+
+        Returns
+        -------
+        scipy.sparse.coo_matrix
+            One row per constraint and one column per variable
+
+        """
+        jac = self.jacobian(x)
+        con = self._con_entries
+        return scipy.sparse.coo_matrix(
+            (jac.data[con], (jac.row[con], jac.col[con])),
+            shape=(self._n_con, len(self.variables)),
+        )
+
+    def evaluate_hessian_lag(self, x=None, duals=None, obj_factor=1.0):
+        """Evaluate the Hessian of the Lagrangian at a point
+
+        The Lagrangian is ``obj_factor * f(x) + sum(duals[i] * c_i(x))``,
+        where ``c_i`` is the body of the i-th constraint.
+
+        Parameters
+        ----------
+        x: array_like
+            The values of the variables.  If None, the current values of
+            the variables are used.
+
+        duals: array_like
+            The multiplier for each constraint.  If None, all
+            multipliers are 1.
+
+        obj_factor: float
+            The multiplier for the objective
+
+        Returns
+        -------
+        scipy.sparse.coo_matrix
+            The (symmetric) Hessian of the Lagrangian
+
+        """
+        if duals is None:
+            weights = np.ones(self._n_con)
+        else:
+            weights = np.asarray(duals, dtype=float).reshape(-1)
+            if weights.shape[0] != self._n_con:
+                raise ValueError(
+                    "Expected %s duals (one for each constraint), but got %s"
+                    % (self._n_con, weights.shape[0])
+                )
+        if self.objective is not None:
+            weights = np.append(weights, obj_factor)
+        return self.hessian(x, weights)
@@ -10,6 +10,12 @@
 #  ___________________________________________________________________________
 
 
+import re
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+
+
 class SymbolMap(object):
     """
     A class for tracking assigned labels for modeling components.
@@ -202,3 +208,382 @@ class SymbolMap(object):
     def removeSymbol(self, obj):
         symb = self.byObject.pop(id(obj))
         self.bySymbol.pop(symb)
+
+
+# Split a symbol into a prefix, a trailing (canonical) integer, and a
+# suffix that does not contain any digits.  The integer is limited to 18
+# digits so that it fits in a signed 64-bit array.
+_numbered_symbol = re.compile(r'(.*?)(0|[1-9][0-9]{0,17})(\D*)\Z', re.S)
+
+# Markers stored in CompactSymbolMap._source for entries that are not
+# numbered
+_EXPLICIT = -1
+_REMOVED = -2
+
+
+class CompactSymbolMap(SymbolMap):
+    """A memory-efficient :class:`SymbolMap` for very large models
+
+    The standard :class:`SymbolMap` stores every symbol as a string
+    (and every object / symbol pair in two dictionaries).  For models
+    with millions of components, this can consume more memory than the
+    model itself.  This class stores the objects in a list (the
+    position in the list is the object's "code") and decomposes each
+    symbol into a prefix, an integer, and a suffix (e.g., ``'x'``,
+    ``12``, and ``''`` for ``'x12'``, or ``'c_e_x('``, ``3``, and
+    ``')_'`` for ``'c_e_x(3)_'``).  The (shared) prefix / suffix pairs
+    are stored once, and the integers are stored in compact arrays.
+    Symbols are regenerated on demand.  Symbols that do not contain a
+    digit are stored as strings.
+
+    The ``id(obj) -> code`` index is only built when it is needed (i.e.,
+    for symbol lookups by object), so symbol maps that are only used to
+    map symbols back to objects (e.g., when loading solutions) do not
+    store any per-object dictionary entries.
+
+    This class supports the same API as :class:`SymbolMap`;
+    :attr:`byObject` and :attr:`bySymbol` are read-only mapping views.
+
+    """
+
+    def __init__(self, labeler=None):
+        self.aliases = {}
+        self.default_labeler = labeler
+        self._objects = []
+        self._source = array('l')
+        self._number = array('q')
+        self._n_removed = 0
+        # (prefix, suffix) pairs, and the reverse map
+        self._sources = []
+        self._source_id = {}
+        # For each source, either a tuple of (sorted) arrays of
+        # (numbers, codes), or (if symbols were not added in increasing
+        # order) a dict mapping number -> code
+        self._reverse = []
+        self._explicit = {}
+        self._explicit_code = {}
+        self._index = None
+
+    @classmethod
+    def from_symbol_map(cls, symbol_map):
+        """Create a CompactSymbolMap with the contents of a SymbolMap"""
+        ans = cls(symbol_map.default_labeler)
+        # The objects in a SymbolMap are unique, so we do not need to
+        # build the object index
+        for symb, obj in symbol_map.bySymbol.items():
+            ans._add(obj, symb, 'addSymbols')
+        ans.aliases.update(symbol_map.aliases)
+        return ans
+
+    @property
+    def byObject(self):
+        return _SymbolsByObject(self)
+
+    @property
+    def bySymbol(self):
+        return _ObjectsBySymbol(self)
+
+    def __getstate__(self):
+        # Note: the id() keys need to be regenerated when the symbol map
+        # is deepcopied / unpickled, so we only store enough information
+        # to rebuild the map.
+        return (
+            self._objects,
+            self._source,
+            self._number,
+            self._sources,
+            self._explicit,
+            self.aliases,
+            self.default_labeler,
+        )
+
+    def __setstate__(self, state):
+        objects, source, number, sources, explicit, aliases, labeler = state
+        self.__init__(labeler)
+        self.aliases = aliases
+        for code, obj in enumerate(objects):
+            src = source[code]
+            if src == _REMOVED:
+                self._append(None, _REMOVED, 0)
+                self._n_removed += 1
+            elif src == _EXPLICIT:
+                self._add_explicit(obj, explicit[code])
+            else:
+                prefix, suffix = sources[src]
+                self._add_numbered(obj, prefix, suffix, number[code])
+
+    def _append(self, obj, src, num):
+        code = len(self._objects)
+        self._objects.append(obj)
+        self._source.append(src)
+        self._number.append(num)
+        if self._index is not None and obj is not None:
+            self._index[id(obj)] = code
+        return code
+
+    def _add_explicit(self, obj, symb, caller='addSymbol'):
+        if symb in self._explicit_code:
+            raise RuntimeError(
+                "SymbolMap.%s(): duplicate symbol.  "
+                "SymbolMap likely in an inconsistent state" % (caller,)
+            )
+        code = self._append(obj, _EXPLICIT, 0)
+        self._explicit[code] = symb
+        self._explicit_code[symb] = code
+
+    def _add_numbered(self, obj, prefix, suffix, num, caller='addSymbol'):
+        key = prefix, suffix
+        src = self._source_id.get(key, None)
+        if src is None:
+            src = self._source_id[key] = len(self._sources)
+            self._sources.append(key)
+            self._reverse.append((array('q'), array('q')))
+        code = len(self._objects)
+        rev = self._reverse[src]
+        if rev.__class__ is tuple:
+            numbers, codes = rev
+            if not numbers or num > numbers[-1]:
+                numbers.append(num)
+                codes.append(code)
+                self._append(obj, src, num)
+                return
+            # Symbols were not added in increasing order: switch to a
+            # dict for this source
+            source = self._source
+            rev = self._reverse[src] = {
+                n: c for n, c in zip(numbers, codes) if source[c] == src
+            }
+        if num in rev:
+            raise RuntimeError(
+                "SymbolMap.%s(): duplicate symbol.  "
+                "SymbolMap likely in an inconsistent state" % (caller,)
+            )
+        rev[num] = code
+        self._append(obj, src, num)
+
+    def _add(self, obj, symb, caller='addSymbol'):
+        match = _numbered_symbol.match(symb) if symb.__class__ is str else None
+        if match is None:
+            self._add_explicit(obj, symb, caller)
+            return
+        prefix, num, suffix = match.groups()
+        num = int(num)
+        if self._lookup_numbered(prefix, suffix, num) is not None:
+            raise RuntimeError(
+                "SymbolMap.%s(): duplicate symbol.  "
+                "SymbolMap likely in an inconsistent state" % (caller,)
+            )
+        self._add_numbered(obj, prefix, suffix, num, caller)
+
+    def _get_index(self):
+        if self._index is None:
+            index = {id(obj): code for code, obj in enumerate(self._objects)}
+            if self._n_removed:
+                index.pop(id(None), None)
+            if len(index) != len(self._objects) - self._n_removed:
+                raise RuntimeError(
+                    "SymbolMap.addSymbols(): duplicate object.  "
+                    "SymbolMap likely in an inconsistent state"
+                )
+            self._index = index
+        return self._index
+
+    def _symbol(self, code):
+        src = self._source[code]
+        if src >= 0:
+            prefix, suffix = self._sources[src]
+            return f'{prefix}{self._number[code]}{suffix}'
+        return self._explicit[code]
+
+    def _lookup_numbered(self, prefix, suffix, num):
+        src = self._source_id.get((prefix, suffix), None)
+        if src is None:
+            return None
+        rev = self._reverse[src]
+        if rev.__class__ is dict:
+            code = rev.get(num, None)
+            if code is None:
+                return None
+        else:
+            numbers, codes = rev
+            i = bisect_left(numbers, num)
+            if i == len(numbers) or numbers[i] != num:
+                return None
+            code = codes[i]
+        if self._source[code] != src:
+            # removed
+            return None
+        return code
+
+    def _lookup(self, symb):
+        code = self._explicit_code.get(symb, None)
+        if code is not None or symb.__class__ is not str:
+            return code
+        match = _numbered_symbol.match(symb)
+        if match is None:
+            return None
+        prefix, num, suffix = match.groups()
+        return self._lookup_numbered(prefix, suffix, int(num))
+
+    def addSymbol(self, obj, symb):
+        """
+        Add a symbol for a given object
+        """
+        if id(obj) in self._get_index():
+            raise RuntimeError(
+                "SymbolMap.addSymbol(): duplicate object.  "
+                "SymbolMap likely in an inconsistent state"
+            )
+        self._add(obj, symb)
+
+    def addSymbols(self, obj_symbol_tuples):
+        """
+        Add (object, symbol) tuples from an iterable object.
+        """
+        index = self._get_index()
+        for obj, symb in obj_symbol_tuples:
+            if id(obj) in index:
+                raise RuntimeError(
+                    "SymbolMap.addSymbols(): duplicate object.  "
+                    "SymbolMap likely in an inconsistent state"
+                )
+            self._add(obj, symb, 'addSymbols')
+
+    def addNumberedSymbols(self, objs, prefix, start=0, suffix=''):
+        """
+        Add the symbols ``prefix + str(start + i) + suffix`` for the
+        objects in ``objs`` without generating the symbol strings.
+
+        This method assumes that the objects are not already in the
+        symbol map (duplicate objects are only detected once the map is
+        queried by object).
+        """
+        if (prefix and prefix[-1].isdigit()) or any(c.isdigit() for c in suffix):
+            # Fall back on parsing the symbols so that the prefix /
+            # suffix decomposition is canonical
+            for i, obj in enumerate(objs, start):
+                self._add(obj, f'{prefix}{i}{suffix}', 'addNumberedSymbols')
+            return
+        for i, obj in enumerate(objs, start):
+            self._add_numbered(obj, prefix, suffix, i, 'addNumberedSymbols')
+
+    def createSymbol(self, obj, labeler=None, *args):
+        """
+        Create a symbol for an object with a given labeler.
+        """
+        symbol = (labeler or self.default_labeler or str)(obj, *args)
+        self.addSymbol(obj, symbol)
+        return symbol
+
+    def createSymbols(self, objs, labeler=None, *args):
+        """
+        Create a symbol for iterable objects with a given labeler.
+        """
+        labeler = labeler or self.default_labeler or str
+        self.addSymbols((obj, labeler(obj, *args)) for obj in objs)
+
+    def getSymbol(self, obj, labeler=None, *args):
+        """
+        Return the symbol for an object.  If it has not already been
+        added to the symbol map, then create it.
+        """
+        index = self._get_index()
+        code = index.get(id(obj), None)
+        if code is not None:
+            return self._symbol(code)
+        symbol = (labeler or self.default_labeler or str)(obj, *args)
+        code = self._lookup(symbol)
+        if code is not None:
+            # The labeler can have side-effects, including registering
+            # this symbol in the symbol map
+            if obj is self._objects[code]:
+                return symbol
+            raise RuntimeError(
+                "Duplicate symbol '%s' already associated with "
+                "component '%s' (conflicting component: '%s')"
+                % (symbol, self._objects[code].name, obj.name)
+            )
+        self._add(obj, symbol)
+        return symbol
+
+    def getObject(self, symbol):
+        """
+        Return the object corresponding to a symbol
+        """
+        code = self._lookup(symbol)
+        if code is not None:
+            return self._objects[code]
+        return self.aliases.get(symbol, SymbolMap.UnknownSymbol)
+
+    def removeSymbol(self, obj):
+        code = self._get_index().pop(id(obj))
+        src = self._source[code]
+        if src == _EXPLICIT:
+            del self._explicit_code[self._explicit.pop(code)]
+        else:
+            rev = self._reverse[src]
+            if rev.__class__ is dict:
+                del rev[self._number[code]]
+        self._objects[code] = None
+        self._source[code] = _REMOVED
+        self._n_removed += 1
+
+
+class _SymbolsByObject(Mapping):
+    """Read-only view of a CompactSymbolMap as a dict id(obj) -> symbol"""
+
+    __slots__ = ('_smap',)
+
+    def __init__(self, smap):
+        self._smap = smap
+
+    def __getitem__(self, obj_id):
+        return self._smap._symbol(self._smap._get_index()[obj_id])
+
+    def get(self, obj_id, default=None):
+        code = self._smap._get_index().get(obj_id, None)
+        if code is None:
+            return default
+        return self._smap._symbol(code)
+
+    def __contains__(self, obj_id):
+        return obj_id in self._smap._get_index()
+
+    def __iter__(self):
+        return iter(self._smap._get_index())
+
+    def __len__(self):
+        return len(self._smap._objects) - self._smap._n_removed
+
+
+class _ObjectsBySymbol(Mapping):
+    """Read-only view of a CompactSymbolMap as a dict symbol -> obj"""
+
+    __slots__ = ('_smap',)
+
+    def __init__(self, smap):
+        self._smap = smap
+
+    def __getitem__(self, symbol):
+        code = self._smap._lookup(symbol)
+        if code is None:
+            raise KeyError(symbol)
+        return self._smap._objects[code]
+
+    def get(self, symbol, default=None):
+        code = self._smap._lookup(symbol)
+        if code is None:
+            return default
+        return self._smap._objects[code]
+
+    def __contains__(self, symbol):
+        return self._smap._lookup(symbol) is not None
+
+    def __iter__(self):
+        smap = self._smap
+        for code, src in enumerate(smap._source):
+            if src != _REMOVED:
+                yield smap._symbol(code)
+
+    def __len__(self):
+        return len(self._smap._objects) - self._smap._n_removed
@@ -0,0 +1,446 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Compile Pyomo expressions into a flat "tape" of vectorized operations
+
+Evaluating an expression with :func:`value` walks the expression tree
+in Python every time it is called.  :func:`compile_expression` walks
+the tree once and records a tape: every node is assigned a row (a
+"slot") in a 2-D NumPy array and becomes an instruction that computes
+its slot from the slots of its arguments.  Instructions with the same
+operation and the same depth in the expression graph are independent of
+each other and are executed together as a single NumPy operation, so
+the cost of evaluating a tape is (mostly) proportional to the depth of
+the expressions and not to the number of nodes.  The columns of the
+array are the points being evaluated, so one call can evaluate the
+expressions at any number of points.
+
+"""
+
+import operator
+
+from pyomo.common.dependencies import numpy as np
+from pyomo.common.numeric_types import native_types, value
+from pyomo.core.expr import numeric_expr, relational_expr
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor
+
+
+def _fwd_sum(R, out, args, data):
+    flat, offsets = args
+    R[out] = np.add.reduceat(R[flat], offsets, axis=0)
+
+
+def _fwd_max(R, out, args, data):
+    flat, offsets = args
+    R[out] = np.maximum.reduceat(R[flat], offsets, axis=0)
+
+
+def _fwd_min(R, out, args, data):
+    flat, offsets = args
+    R[out] = np.minimum.reduceat(R[flat], offsets, axis=0)
+
+
+def _fwd_mul(R, out, args, data):
+    R[out] = R[args[0]] * R[args[1]]
+
+
+def _fwd_div(R, out, args, data):
+    R[out] = R[args[0]] / R[args[1]]
+
+
+def _fwd_pow(R, out, args, data):
+    R[out] = R[args[0]] ** R[args[1]]
+
+
+def _fwd_neg(R, out, args, data):
+    R[out] = -R[args[0]]
+
+
+def _fwd_unary(R, out, args, data):
+    R[out] = getattr(np, _unary_functions[data])(R[args[0]])
+
+
+def _fwd_if(R, out, args, data):
+    R[out] = np.where(R[args[0]] != 0, R[args[1]], R[args[2]])
+
+
+def _fwd_compare(R, out, args, data):
+    R[out] = data(R[args[0]], R[args[1]])
+
+
+def _fwd_ranged(R, out, args, data):
+    lower, upper = data
+    R[out] = lower(R[args[0]], R[args[1]]) & upper(R[args[1]], R[args[2]])
+
+
+def _fwd_generic(R, out, args, data):
+    # Fall back on the node's own (scalar) implementation, one point at a
+    # time (e.g., for external functions)
+    for j in range(R.shape[1]):
+        try:
+            R[out[0], j] = data._apply_operation([R[a[0], j] for a in args])
+        except (ValueError, ArithmeticError):
+            R[out[0], j] = np.nan
+
+
+# Map the unary function names to the name of the NumPy ufunc (resolved
+# when the tape is evaluated so that importing this module does not
+# import NumPy)
+_unary_functions = {
+    'log': 'log',
+    'log10': 'log10',
+    'sin': 'sin',
+    'cos': 'cos',
+    'tan': 'tan',
+    'sinh': 'sinh',
+    'cosh': 'cosh',
+    'tanh': 'tanh',
+    'asin': 'arcsin',
+    'acos': 'arccos',
+    'atan': 'arctan',
+    'exp': 'exp',
+    'sqrt': 'sqrt',
+    'asinh': 'arcsinh',
+    'acosh': 'arccosh',
+    'atanh': 'arctanh',
+    'ceil': 'ceil',
+    'floor': 'floor',
+    'abs': 'abs',
+}
+
+_forward = {
+    'sum': _fwd_sum,
+    'max': _fwd_max,
+    'min': _fwd_min,
+    'mul': _fwd_mul,
+    'div': _fwd_div,
+    'pow': _fwd_pow,
+    'neg': _fwd_neg,
+    'unary': _fwd_unary,
+    'if': _fwd_if,
+    'compare': _fwd_compare,
+    'ranged': _fwd_ranged,
+    'generic': _fwd_generic,
+}
+
+# Operations that take a variable number of arguments (these are stored
+# as a flat array of arguments and the offset of each instruction)
+_nary_ops = {'sum', 'max', 'min'}
+
+
+def _unary_handler(node):
+    name = node.getname()
+    if name in _unary_functions:
+        return 'unary', name
+    return 'generic', node
+
+
+def _inequality_handler(node):
+    return 'compare', operator.lt if node.strict else operator.le
+
+
+def _ranged_handler(node):
+    return 'ranged', tuple(operator.lt if s else operator.le for s in node.strict)
+
+
+_node_handlers = {
+    numeric_expr.SumExpression: lambda node: ('sum', None),
+    numeric_expr.MaxExpression: lambda node: ('max', None),
+    numeric_expr.MinExpression: lambda node: ('min', None),
+    numeric_expr.ProductExpression: lambda node: ('mul', None),
+    numeric_expr.DivisionExpression: lambda node: ('div', None),
+    numeric_expr.PowExpression: lambda node: ('pow', None),
+    numeric_expr.NegationExpression: lambda node: ('neg', None),
+    numeric_expr.UnaryFunctionExpression: _unary_handler,
+    numeric_expr.Expr_ifExpression: lambda node: ('if', None),
+    relational_expr.EqualityExpression: lambda node: ('compare', operator.eq),
+    relational_expr.InequalityExpression: _inequality_handler,
+    relational_expr.RangedExpression: _ranged_handler,
+}
+
+
+def _get_node_handler(cls):
+    for base in cls.__mro__:
+        if base in _node_handlers:
+            _node_handlers[cls] = _node_handlers[base]
+            return _node_handlers[cls]
+    # Anything we do not recognize is evaluated by the node itself
+    _node_handlers[cls] = lambda node: ('generic', node)
+    return _node_handlers[cls]
+
+
+class _TapeRecorder(StreamBasedExpressionVisitor):
+    def __init__(self, tape):
+        super().__init__()
+        self.tape = tape
+        # Leaves and named expressions are only shared within a single
+        # output, so that the instructions for each output are
+        # independent of all other outputs
+        self.leaf_slots = {}
+        self.named_slots = {}
+
+    def initializeWalker(self, expr):
+        self.leaf_slots.clear()
+        self.named_slots.clear()
+        walk, result = self.beforeChild(None, expr, 0)
+        if not walk:
+            return False, result
+        return True, None
+
+    def beforeChild(self, node, child, child_idx):
+        if child.__class__ in native_types:
+            return False, self.tape._add_constant(child)
+        if id(child) in self.leaf_slots:
+            return False, self.leaf_slots[id(child)]
+        if id(child) in self.named_slots:
+            return False, self.named_slots[id(child)]
+        if not child.is_expression_type():
+            if child.is_potentially_variable():
+                slot = self.tape._add_variable(child)
+            else:
+                slot = self.tape._add_parameter(child)
+            self.leaf_slots[id(child)] = slot
+            return False, slot
+        if not child.is_potentially_variable():
+            # There are no variables under this node: evaluate it as
+            # a single parameter (it will be re-evaluated each time the
+            # tape is evaluated)
+            slot = self.leaf_slots[id(child)] = self.tape._add_parameter(child)
+            return False, slot
+        return True, None
+
+    def exitNode(self, node, data):
+        if node.is_named_expression_type():
+            slot = self.named_slots[id(node)] = data[0]
+            return slot
+        handler = _node_handlers.get(node.__class__, None)
+        if handler is None:
+            handler = _get_node_handler(node.__class__)
+        opcode, op_data = handler(node)
+        return self.tape._add_instruction(opcode, data, op_data)
+
+
+class ExpressionTape(object):
+    """A compiled, vectorized representation of one or more expressions
+
+    Create instances with :func:`compile_expression`.  Calling the tape
+    (or :meth:`evaluate`) evaluates the expressions at one or more
+    points.
+
+    Attributes
+    ----------
+    variables: list
+        The variables (VarData) that are the inputs to the tape, in the
+        order of the columns of the points passed to :meth:`evaluate`
+
+    """
+
+    def __init__(self, variables=None):
+        self.variables = []
+        self._var_index = {}
+        self._fixed_inputs = variables is not None
+        if variables is not None:
+            for v in variables:
+                self._add_input(v)
+        self._n_slots = 0
+        self._constants = ([], [])
+        self._parameters = ([], [])
+        self._params = []
+        self._param_index = {}
+        self._inputs = ([], [])
+        self._instructions = []
+        self._level = []
+        self._outputs = []
+        # The first slot recorded for each output: the slots created while
+        # recording output i are [_output_start[i], _output_start[i+1])
+        self._output_start = []
+        self._groups = None
+
+    def _add_input(self, var):
+        if id(var) in self._var_index:
+            raise ValueError("Variable '%s' appears more than once" % (var.name,))
+        self._var_index[id(var)] = len(self.variables)
+        self.variables.append(var)
+
+    def _new_slot(self, level):
+        self._level.append(level)
+        self._n_slots += 1
+        return self._n_slots - 1
+
+    def _add_constant(self, val):
+        slot = self._new_slot(0)
+        self._constants[0].append(slot)
+        self._constants[1].append(val)
+        return slot
+
+    def _add_parameter(self, obj):
+        slot = self._new_slot(0)
+        if id(obj) not in self._param_index:
+            self._param_index[id(obj)] = len(self._params)
+            self._params.append(obj)
+        self._parameters[0].append(slot)
+        self._parameters[1].append(self._param_index[id(obj)])
+        return slot
+
+    def _add_variable(self, var):
+        if id(var) not in self._var_index:
+            if var.fixed:
+                return self._add_parameter(var)
+            if self._fixed_inputs:
+                raise ValueError(
+                    "Variable '%s' is not fixed and is not one of the "
+                    "variables the expression is compiled for" % (var.name,)
+                )
+            self._add_input(var)
+        slot = self._new_slot(0)
+        self._inputs[0].append(slot)
+        self._inputs[1].append(self._var_index[id(var)])
+        return slot
+
+    def _add_instruction(self, opcode, args, data):
+        slot = self._new_slot(1 + max(self._level[a] for a in args))
+        self._instructions.append((opcode, slot, tuple(args), data))
+        return slot
+
+    def _finalize(self):
+        # Group the instructions with the same operation at the same
+        # level of the graph, so that they can be executed together
+        groups = {}
+        for opcode, out, args, data in self._instructions:
+            if opcode == 'generic':
+                key = (self._level[out], opcode, id(data))
+            else:
+                key = (self._level[out], opcode, data)
+            if key not in groups:
+                groups[key] = (opcode, data, [], [])
+            groups[key][2].append(out)
+            groups[key][3].append(args)
+        self._groups = []
+        for key in sorted(groups, key=lambda k: k[0]):
+            opcode, data, out, args = groups[key]
+            if opcode in _nary_ops:
+                offsets = np.cumsum([0] + [len(a) for a in args[:-1]])
+                args = (np.fromiter((i for a in args for i in a), dtype=int), offsets)
+            else:
+                args = tuple(np.array(a, dtype=int) for a in zip(*args))
+            self._groups.append((opcode, data, np.array(out, dtype=int), args))
+        self._const_slots = np.array(self._constants[0], dtype=int)
+        self._const_values = np.array(self._constants[1], dtype=float)
+        self._param_slots = np.array(self._parameters[0], dtype=int)
+        self._param_values = np.array(self._parameters[1], dtype=int)
+        self._input_slots = np.array(self._inputs[0], dtype=int)
+        self._input_index = np.array(self._inputs[1], dtype=int)
+        self._output_slots = np.array(self._outputs, dtype=int)
+
+    def _forward(self, XT):
+        # Evaluate all slots of the tape for the points in the columns
+        # of XT (one row per variable)
+        R = np.empty((self._n_slots, XT.shape[1]))
+        R[self._const_slots] = self._const_values[:, None]
+        params = np.array([value(p) for p in self._params], dtype=float)
+        R[self._param_slots] = params[self._param_values, None]
+        R[self._input_slots] = XT[self._input_index]
+        with np.errstate(all='ignore'):
+            for opcode, data, out, args in self._groups:
+                _forward[opcode](R, out, args, data)
+        return R
+
+    def _points(self, x):
+        if x is None:
+            x = [v.value for v in self.variables]
+        X = np.asarray(x, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.ndim != 2 or X.shape[1] != len(self.variables):
+            raise ValueError(
+                "Expected points with %s values (one for each variable), "
+                "but got an array with shape %s" % (len(self.variables), np.shape(x))
+            )
+        return X
+
+    def evaluate(self, x=None):
+        """Evaluate the expressions
+
+        Parameters
+        ----------
+        x: array_like
+            The values of the variables: either a single point (a 1-D
+            array with one value per variable) or a 2-D array with one
+            point per row.  If None, the current values of the
+            variables are used.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            For a single expression, the value of the expression (or an
+            array with one value per point).  For a list of
+            expressions, an array with one value per expression (or a
+            2-D array with one row per point).
+
+        Invalid operations (e.g., taking the log of a negative number)
+        result in ``nan`` (or ``inf``) values rather than exceptions.
+
+        """
+        X = self._points(x)
+        values = self._forward(X.T)[self._output_slots].T
+        if np.ndim(x) == 1 or x is None:
+            values = values[0]
+            if self._scalar:
+                return float(values[0])
+            return values
+        if self._scalar:
+            return values[:, 0]
+        return values
+
+    __call__ = evaluate
+
+
+def compile_expression(expr, variables=None):
+    """Compile one or more expressions into an :class:`ExpressionTape`
+
+    Parameters
+    ----------
+    expr: NumericValue or list
+        The expression (or list of expressions) to compile
+
+    variables: list
+        The variables (VarData) that are the inputs to the tape (and
+        the order of the values in each point).  If None, the unfixed
+        variables are collected from the expressions (in the order in
+        which they are encountered).  Fixed variables that are not in
+        this list are treated like mutable parameters.
+
+    Returns
+    -------
+    ExpressionTape
+
+    Notes
+    -----
+    The current values of mutable parameters and fixed variables are
+    read every time the tape is evaluated, so the tape remains valid
+    when they change.  Expressions that are not supported by the tape
+    (e.g., external functions) are evaluated point by point by the
+    expression itself.
+
+    """
+    tape = ExpressionTape(variables)
+    if isinstance(expr, (list, tuple)):
+        exprs = expr
+        tape._scalar = False
+    else:
+        exprs = [expr]
+        tape._scalar = True
+    recorder = _TapeRecorder(tape)
+    for e in exprs:
+        tape._output_start.append(tape._n_slots)
+        tape._outputs.append(recorder.walk_expression(e))
+    tape._finalize()
+    return tape
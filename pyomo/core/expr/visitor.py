@@ -15,6 +15,7 @@ import logging
 import sys
 from copy import deepcopy
 from collections import deque
+from types import FunctionType
 
 logger = logging.getLogger('pyomo.core')
 
@@ -37,6 +38,23 @@ except AttributeError:
     currentframe = inspect.currentframe
 
 
+def _positional_argspec(fcn):
+    """Return the number of positional arguments and whether fcn accepts *args
+
+    This is equivalent to inspecting the result of
+    :py:func:`inspect.getfullargspec`, but avoids building the full
+    signature for plain Python functions and methods (walkers are
+    frequently constructed, and inspect is surprisingly expensive).
+
+    """
+    func = getattr(fcn, '__func__', fcn)
+    if type(func) is FunctionType and getattr(func, '__signature__', None) is None:
+        code = func.__code__
+        return code.co_argcount, bool(code.co_flags & inspect.CO_VARARGS)
+    _args = inspect.getfullargspec(fcn)
+    return len(_args.args), _args.varargs is not None
+
+
 def get_stack_depth():
     n = -1  # skip *this* frame in the count
     f = currentframe()
@@ -221,9 +239,9 @@ class StreamBasedExpressionVisitor(object):
             fcn = getattr(self, name)
             if fcn is None:
                 continue
-            _args = inspect.getfullargspec(fcn)
+            n_args, varargs = _positional_argspec(fcn)
             _self_arg = 1 if inspect.ismethod(fcn) else 0
-            if len(_args.args) == nargs + _self_arg and _args.varargs is None:
+            if n_args == nargs + _self_arg and not varargs:
                 deprecation_warning(
                     "Note that the API for the StreamBasedExpressionVisitor "
                     "has changed to include the child index for the %s() "
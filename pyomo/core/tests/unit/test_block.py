@@ -2455,6 +2455,40 @@ class TestBlock(unittest.TestCase):
             sorted(id(x) for x in (m.x, m.y[1], nb.x, nb.y[1])),
         )
 
+    def test_clone_shares_unchanged_expressions(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var([1])
+        m.b = Block()
+        m.b.x = Var()
+        m.b.p = Param(initialize=2, mutable=True)
+        m.b.c = Constraint(expr=m.x**2 + m.y[1] <= 5)
+        m.b.d = Constraint(expr=m.x**2 + m.b.p * m.b.x <= 10)
+
+        nb = m.b.clone()
+
+        # Expressions that only reference out-of-scope components are
+        # shared...
+        self.assertIs(nb.c.expr, m.b.c.expr)
+        # ...as are the unchanged subtrees of expressions that reference
+        # cloned components
+        self.assertIsNot(nb.d.expr, m.b.d.expr)
+        self.assertIs(nb.d.body.arg(0), m.b.d.body.arg(0))
+        self.assertIsNot(nb.d.body.arg(1), m.b.d.body.arg(1))
+        self.assertEqual(
+            sorted(id(x) for x in EXPR.identify_mutable_parameters(nb.d.body)),
+            [id(nb.p)],
+        )
+        self.assertEqual(
+            sorted(id(x) for x in EXPR.identify_variables(nb.d.body)),
+            sorted(id(x) for x in (m.x, nb.x)),
+        )
+
+        # Expression.clone() always duplicates the expression nodes
+        e = m.b.c.expr.clone()
+        self.assertIsNot(e, m.b.c.expr)
+        self.assertIsNot(e.arg(0), m.b.c.expr.arg(0))
+
     def test_clone_indexed_subblock(self):
         m = ConcreteModel()
 
@@ -3255,6 +3289,139 @@ class TestBlock(unittest.TestCase):
         self.assertIs(b1.find_component(cuid1), b1.b2.v1)
         self.assertIs(b1.find_component(cuid2), b1.b2.v2[2])
 
+    def test_component_data_cache(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.c = Constraint(Any)
+        m.c[1] = m.x[1] >= 0
+        m.c[2] = m.x[2] >= 0
+        m.b = Block(Any)
+        m.b[1].d = Constraint(expr=m.x[1] <= 5)
+
+        def cons(blk, **kwds):
+            return list(blk.component_data_objects(Constraint, **kwds))
+
+        m.enable_component_data_cache()
+        self.assertEqual(cons(m), [m.c[1], m.c[2], m.b[1].d])
+        self.assertEqual(cons(m, active=True), [m.c[1], m.c[2], m.b[1].d])
+        self.assertEqual(cons(m, descend_into=False), [m.c[1], m.c[2]])
+        # Repeated calls return the cached result
+        cache = m._component_data_cache
+        key = cache._key(Constraint, True, False, True, None)
+        data = cache.entries[key][2]
+        cons(m, active=True)
+        self.assertIs(cache.entries[key][2], data)
+
+        # Deactivating component data
+        m.c[2].deactivate()
+        self.assertEqual(cons(m, active=True), [m.c[1], m.b[1].d])
+        self.assertEqual(cons(m), [m.c[1], m.c[2], m.b[1].d])
+        m.c[2].activate()
+        self.assertEqual(cons(m, active=True), [m.c[1], m.c[2], m.b[1].d])
+        # Deactivating blocks
+        m.b[1].deactivate()
+        self.assertEqual(cons(m, active=True), [m.c[1], m.c[2]])
+        m.b[1].activate()
+
+        # Adding component data
+        m.c[3] = m.x[2] <= 1
+        self.assertEqual(cons(m), [m.c[1], m.c[2], m.c[3], m.b[1].d])
+        # ... including to scalar components
+        m.b[2].d = Constraint(expr=Constraint.Skip)
+        self.assertEqual(cons(m), [m.c[1], m.c[2], m.c[3], m.b[1].d])
+        m.b[2].d = m.x[2] <= 5
+        self.assertEqual(cons(m), [m.c[1], m.c[2], m.c[3], m.b[1].d, m.b[2].d])
+        # Removing component data
+        del m.c[1]
+        self.assertEqual(cons(m), [m.c[2], m.c[3], m.b[1].d, m.b[2].d])
+        # Adding blocks
+        m.b[3].d = Constraint(expr=m.x[1] <= 2)
+        self.assertEqual(cons(m), [m.c[2], m.c[3], m.b[1].d, m.b[2].d, m.b[3].d])
+        # Adding / removing components
+        m.e = Constraint(expr=m.x[1] <= 3)
+        self.assertEqual(cons(m), [m.c[2], m.c[3], m.e, m.b[1].d, m.b[2].d, m.b[3].d])
+        m.del_component(m.c)
+        self.assertEqual(cons(m), [m.e, m.b[1].d, m.b[2].d, m.b[3].d])
+        m.b[2].reclassify_component_type('d', Expression)
+        self.assertEqual(cons(m), [m.e, m.b[1].d, m.b[3].d])
+
+        # Arguments that cannot be cached
+        self.assertEqual(
+            list(m.component_data_objects(Constraint, descend_into=SubclassOf(Block))),
+            [m.e, m.b[1].d, m.b[3].d],
+        )
+
+        # The cache is not cloned
+        i = m.clone()
+        self.assertIsNone(i._component_data_cache)
+        self.assertEqual(cons(i), [i.e, i.b[1].d, i.b[3].d])
+
+        m.enable_component_data_cache(False)
+        self.assertIsNone(m._component_data_cache)
+        self.assertEqual(cons(m), [m.e, m.b[1].d, m.b[3].d])
+
+    def test_name_cache(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.b = Block([1, 'a b'])
+        m.b['a b'].y = Var([(1, 'c')])
+        m.b['a b'].z = Var()
+
+        m.enable_name_cache()
+        cache = m._name_cache
+        self.assertEqual(m.x[1].name, 'x[1]')
+        self.assertEqual(m.b['a b'].y[1, 'c'].name, 'b[a b].y[1,c]')
+        self.assertEqual(m.b['a b'].z.name, 'b[a b].z')
+        # The names of the parent components and blocks are also cached
+        self.assertIn(id(m.b['a b']), cache.names)
+        self.assertEqual(len(cache.names), 7)
+        self.assertEqual(
+            ComponentUID(m.b['a b'].y[1, 'c']), ComponentUID('b[a b].y[1,c]')
+        )
+        self.assertEqual(len(cache.cuids), 3)
+        # Names relative to other blocks are not cached
+        self.assertEqual(m.b['a b'].z.getname(True, relative_to=m.b['a b']), 'z')
+        self.assertEqual(str(ComponentUID(m.b['a b'].z, context=m.b['a b'])), 'z')
+        self.assertEqual(len(cache.names), 7)
+
+        # Moving a component invalidates the cache
+        b = m.b['a b']
+        z = b.z
+        b.del_component(z)
+        m.b[1].z = z
+        self.assertEqual(z.name, 'b[1].z')
+        self.assertEqual(str(ComponentUID(z)), 'b[1].z')
+        self.assertEqual(len(cache.names), 3)
+        # ... as do renaming and deleting components
+        m.name = 'model'
+        self.assertEqual(m.name, 'model')
+        x1 = m.x[1]
+        del m.x[1]
+        self.assertEqual(x1.name, '[Unattached VarData]')
+
+        # Bulk name generation
+        self.assertEqual(
+            m.b['a b'].y.getnames(fully_qualified=True), {(1, 'c'): 'b[a b].y[1,c]'}
+        )
+        self.assertIn(id(m.b['a b'].y[1, 'c']), cache.names)
+        self.assertEqual(m.x.getnames(), {2: 'x[2]'})
+        self.assertEqual(m.b[1].z.getnames(True), {None: 'b[1].z'})
+
+        # Caches on sub-blocks
+        m.enable_name_cache(False)
+        self.assertIsNone(m._name_cache)
+        m.b[1].enable_name_cache()
+        self.assertEqual(m.b[1].z.name, 'b[1].z')
+        self.assertEqual(m.x[2].name, 'x[2]')
+        self.assertEqual(
+            set(m.b[1]._name_cache.names), {id(m.b[1].z), id(m.b[1]), id(m.b)}
+        )
+
+        # The cache is not cloned
+        i = m.clone()
+        self.assertIsNone(i.b[1]._name_cache)
+        self.assertEqual(i.b[1].z.name, 'b[1].z')
+
     def test_deduplicate_component_data_objects(self):
         m = ConcreteModel()
         m.b = Block()
@@ -25,6 +25,7 @@ currdir = dirname(abspath(__file__)) + os.sep
 from filecmp import cmp
 import pyomo.common.unittest as unittest
 from pyomo.common.log import LoggingIntercept
+from pyomo.common.dependencies import numpy as np, numpy_available
 from io import StringIO
 
 from pyomo.environ import (
@@ -61,6 +62,7 @@ from pyomo.environ import (
     sqrt,
     value,
     quicksum,
+    linear_sum,
     sum_product,
     is_fixed,
     is_constant,
@@ -3736,6 +3738,74 @@ class TestSummationExpression(unittest.TestCase):
             ),
         )
 
+    def test_linear_sum(self):
+        m = self.m
+        x = list(m.a.values())
+        e = linear_sum([1, 2, 0, -1, 2.5], x)
+        self.assertExpressionsEqual(
+            e,
+            LinearExpression(
+                [
+                    m.a[1],
+                    MonomialTermExpression((2, m.a[2])),
+                    MonomialTermExpression((0, m.a[3])),
+                    MonomialTermExpression((-1, m.a[4])),
+                    MonomialTermExpression((2.5, m.a[5])),
+                ]
+            ),
+        )
+        # Mutable / immutable Params, and a constant
+        coefs = [m.p[1], m.q[2], m.p[3] + 1, 1, 5]
+        e = linear_sum(coefs, x, constant=10)
+        self.assertExpressionsEqual(
+            e, quicksum((c * v for c, v in zip(coefs, x)), start=10)
+        )
+        self.assertExpressionsEqual(
+            e,
+            LinearExpression(
+                [
+                    10,
+                    MonomialTermExpression((m.p[1], m.a[1])),
+                    MonomialTermExpression((3, m.a[2])),
+                    MonomialTermExpression((m.p[3] + 1, m.a[3])),
+                    m.a[4],
+                    MonomialTermExpression((5, m.a[5])),
+                ]
+            ),
+        )
+        e = linear_sum(coefs[:1], x[:1], constant=m.p[1])
+        self.assertExpressionsEqual(
+            e, LinearExpression([m.p[1], MonomialTermExpression((m.p[1], m.a[1]))])
+        )
+        # Degenerate sums
+        self.assertEqual(linear_sum([], []), 0)
+        self.assertEqual(linear_sum([], [], 5), 5)
+        self.assertIs(linear_sum([1], [m.a[1]]), m.a[1])
+        # Nonlinear terms fall back on quicksum
+        coefs = [2, m.b[2], 3]
+        e = linear_sum(coefs, x[:3])
+        self.assertExpressionsEqual(e, quicksum(c * v for c, v in zip(coefs, x)))
+        e = linear_sum([2, 3], [m.a[1], m.a[2] ** 2], 1)
+        self.assertExpressionsEqual(e, quicksum([2 * m.a[1], 3 * m.a[2] ** 2], start=1))
+
+        with self.assertRaisesRegex(
+            ValueError,
+            r"linear_sum\(\): coefs \(length 2\) and variables "
+            r"\(length 5\) must be the same length",
+        ):
+            linear_sum([1, 2], x)
+
+    @unittest.skipUnless(numpy_available, "NumPy is not available")
+    def test_linear_sum_numpy(self):
+        m = self.m
+        x = np.array(list(m.a.values()), dtype=object)
+        e = linear_sum(np.array([1.0, 2.0, 3.0, 4.0, 5.0]), x)
+        self.assertExpressionsEqual(
+            e, LinearExpression([m.a[1]] + [float(i) * m.a[i] for i in range(2, 6)])
+        )
+        for arg in e.args[1:]:
+            self.assertIs(arg.arg(0).__class__, float)
+
 
 class TestSumExpression(unittest.TestCase):
     def setUp(self):
@@ -24,6 +24,7 @@ import os
 import sys
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 
 from pyomo.environ import (
     Set,
@@ -2284,6 +2285,36 @@ class MiscIndexedParamBehaviorTests(unittest.TestCase):
         self.assertEqual(len(m.p), 2)
         self.assertEqual(len(m.p._data), 0)
 
+    @unittest.skipUnless(numpy_available, "Numpy is not installed")
+    def test_values_array(self):
+        m = ConcreteModel()
+        m.p = Param([3, 1, 2], mutable=True, initialize={3: 5, 1: 6}, default=1)
+        m.q = Param([3, 1, 2], initialize={3: 5, 1: 6}, default=1)
+        self.assertEqual(m.p.get_values_array().tolist(), [5, 6, 1])
+        self.assertEqual(m.q.get_values_array().tolist(), [5, 6, 1])
+
+        m.p.set_values_array(np.array([1.5, 2.5, 3.5]))
+        self.assertEqual([m.p[i].value for i in m.p], [1.5, 2.5, 3.5])
+        self.assertEqual(len(m.p._data), 3)
+        self.assertEqual(m.p[2].index(), 2)
+
+        with self.assertRaisesRegex(TypeError, "immutable parameter q"):
+            m.q.set_values_array([1, 2, 3])
+        with self.assertRaisesRegex(
+            ValueError, "expected a one-dimensional array of length 3"
+        ):
+            m.p.set_values_array([[1, 2, 3]])
+
+        m.r = Param([1, 2, 3], mutable=True, domain=NonNegativeIntegers, default=0)
+        with self.assertRaisesRegex(
+            ValueError, r"Invalid parameter value: r\[2\] = '1.5'"
+        ):
+            m.r.set_values_array([1, 1.5, 2])
+        # Failed validation leaves the Param unchanged
+        self.assertEqual(m.r.get_values_array().tolist(), [0, 0, 0])
+        m.r.set_values_array([1, 1.5, 2], check=False)
+        self.assertEqual(m.r.get_values_array().tolist(), [1, 1.5, 2])
+
 
 # Add test methods for all intrinsic functions
 assignTestsIndexedParamTests(MiscIndexedParamBehaviorTests, intrinsic_test_list)
@@ -1861,6 +1861,126 @@ class Test_SetOperator(unittest.TestCase):
         self.assertEqual(i.x[1].domain, i.A * i.B)
         self.assertEqual(i.x[1], [])
 
+    def test_materialize(self):
+        m = ConcreteModel()
+        m.A = Set(initialize=[3, 1, 2])
+        m.B = Set(initialize=['a', 'b'])
+        m.C = RangeSet(2)
+        m.D = Set(initialize=[(1, 2), (3, 4)])
+        m.P = m.A * m.B * m.D
+        m.U = m.A | m.C
+        ref = list(m.P)
+
+        self.assertFalse(m.P.is_materialized())
+        m.P.materialize()
+        m.U.materialize()
+        self.assertTrue(m.P.is_materialized())
+        self.assertEqual(list(m.P), ref)
+        self.assertEqual(len(m.P), 12)
+        self.assertEqual(m.P.at(3), (3, 'b', 1, 2))
+        self.assertEqual(m.P.at(-1), (2, 'b', 3, 4))
+        self.assertEqual(m.P.ord((1, 'a', 3, 4)), 6)
+        self.assertEqual(m.P.ord((1, 'a', (3, 4))), 6)
+        self.assertIn((1, 'a', 3, 4), m.P)
+        self.assertIn((1, 'a', (3, 4)), m.P)
+        self.assertNotIn((1, 'c', 3, 4), m.P)
+        self.assertNotIn((1, 'a', 3), m.P)
+        self.assertEqual(list(reversed(m.P)), ref[::-1])
+        self.assertEqual(m.P.next((3, 'b', 3, 4)), (1, 'a', 1, 2))
+        with self.assertRaisesRegex(IndexError, "P index out of range"):
+            m.P.at(13)
+        with self.assertRaisesRegex(IndexError, "item not in Set"):
+            m.P.ord((1, 'c', 3, 4))
+        self.assertEqual(list(m.U), [3, 1, 2])
+        self.assertEqual(m.U.ord(2), 3)
+
+        # Changes to the operand Sets are reflected in the stored members
+        m.B.add('c')
+        self.assertEqual(len(m.P), 18)
+        self.assertIn((1, 'c', 3, 4), m.P)
+        m.B.remove('a')
+        self.assertNotIn((1, 'a', 3, 4), m.P)
+        self.assertEqual(m.P.at(1), (3, 'b', 1, 2))
+        m.B.clear()
+        self.assertEqual(list(m.P), [])
+        m.B.update(['a', 'b'])
+        self.assertEqual(list(m.P), ref)
+        m.C.construct()
+        m.A.add(5)
+        self.assertEqual(list(m.U), [3, 1, 2, 5])
+
+        # The stored members are not copied
+        i = m.clone()
+        self.assertTrue(i.P.is_materialized())
+        self.assertIsNone(i.P._materialized.values)
+        self.assertEqual(list(i.P), list(m.P))
+        self.assertIn((5, 'b', 3, 4), i.P)
+        i = pickle.loads(pickle.dumps(m))
+        self.assertEqual(list(i.P), list(m.P))
+
+        m.P.materialize(False)
+        self.assertFalse(m.P.is_materialized())
+        self.assertEqual(len(m.P), 16)
+
+    def test_materialize_errors(self):
+        m = ConcreteModel()
+        m.A = Set(initialize=[1, 2])
+        m.B = Set(initialize=[2, 3], ordered=False)
+        with self.assertRaisesRegex(
+            TypeError,
+            r"Cannot materialize Set operator A\*B: only ordered, finite "
+            "Set operators can be materialized",
+        ):
+            (m.A * m.B).materialize()
+        with self.assertRaisesRegex(
+            TypeError,
+            r"Cannot materialize Set operator A \| \[2, 3\]: the members of the "
+            r"operand Set \[2, 3\] \(OrderedSetOf\) cannot be tracked for changes",
+        ):
+            (m.A | SetOf([2, 3])).materialize()
+
+    def test_materialize_non_integer_ranges(self):
+        m = ConcreteModel()
+        m.A = Set(initialize=[0.3, 5])
+        m.R = RangeSet(0, 1, 0.1)
+        m.U = m.R | m.A
+        ref = list(m.U)
+        m.U.materialize()
+        self.assertEqual(list(m.U), ref)
+        # Values that do not exactly match a generated member are
+        # checked against the operand Sets
+        self.assertIn(0.1 * 3, m.U)
+        self.assertIn(0.3, m.U)
+        self.assertNotIn(0.35, m.U)
+
+    @unittest.skipUnless(numpy_available, "to_numpy() requires NumPy")
+    def test_to_numpy(self):
+        m = ConcreteModel()
+        m.A = Set(initialize=[3, 1, 2])
+        m.B = Set(initialize=['a', 'b'])
+        m.C = RangeSet(2)
+
+        a = (m.A * m.C).to_numpy()
+        self.assertEqual(a.shape, (6, 2))
+        self.assertEqual(a.dtype.kind, 'i')
+        self.assertEqual(a.tolist(), [list(x) for x in m.A * m.C])
+
+        a = (m.A * m.B).to_numpy()
+        self.assertEqual(a.dtype, object)
+        self.assertEqual(a[1].tolist(), [3, 'b'])
+
+        a = (m.A | m.C).to_numpy(dtype=float)
+        self.assertEqual(a.tolist(), [3.0, 1.0, 2.0])
+
+        m.P = m.A * m.C
+        m.P.materialize()
+        a = m.P.to_numpy()
+        self.assertIs(m.P.to_numpy(), a)
+        self.assertFalse(a.flags.writeable)
+        m.C.construct()
+        m.A.add(4)
+        self.assertEqual(m.P.to_numpy().shape, (8, 2))
+
     @unittest.skipIf(not pandas_available, "pandas is not available")
     def test_pandas_multiindex_set_init(self):
         # Test that TuplizeValuesInitializer does not assume truthiness
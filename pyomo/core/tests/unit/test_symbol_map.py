@@ -9,24 +9,28 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from copy import deepcopy
+
 import pyomo.common.unittest as unittest
-from pyomo.core.expr.symbol_map import SymbolMap
+from pyomo.core.expr.symbol_map import SymbolMap, CompactSymbolMap
 from pyomo.core.kernel.variable import variable
 from pyomo.environ import ConcreteModel, Var
 
 
 class TestSymbolMap(unittest.TestCase):
+    SymbolMap = SymbolMap
+
     def test_no_labeler(self):
-        s = SymbolMap()
+        s = self.SymbolMap()
         v = variable()
         self.assertEqual(str(v), s.getSymbol(v))
 
-        s = SymbolMap()
+        s = self.SymbolMap()
         m = ConcreteModel()
         m.x = Var()
         self.assertEqual('x', s.createSymbol(m.x))
 
-        s = SymbolMap()
+        s = self.SymbolMap()
         m.y = Var([1, 2, 3])
         s.createSymbols(m.y.values())
         self.assertEqual(s.bySymbol, {'y[1]': m.y[1], 'y[2]': m.y[2], 'y[3]': m.y[3]})
@@ -35,16 +39,16 @@ class TestSymbolMap(unittest.TestCase):
         )
 
     def test_default_labeler(self):
-        s = SymbolMap(lambda x: "_" + str(x))
+        s = self.SymbolMap(lambda x: "_" + str(x))
         v = variable()
         self.assertEqual("_" + str(v), s.getSymbol(v))
 
-        s = SymbolMap(lambda x: "_" + str(x))
+        s = self.SymbolMap(lambda x: "_" + str(x))
         m = ConcreteModel()
         m.x = Var()
         self.assertEqual('_x', s.createSymbol(m.x))
 
-        s = SymbolMap(lambda x: "_" + str(x))
+        s = self.SymbolMap(lambda x: "_" + str(x))
         m.y = Var([1, 2, 3])
         s.createSymbols(m.y.values())
         self.assertEqual(
@@ -57,16 +61,16 @@ class TestSymbolMap(unittest.TestCase):
     def test_custom_labeler(self):
         labeler = lambda x, y: "^" + str(x) + y
 
-        s = SymbolMap(lambda x: "_" + str(x))
+        s = self.SymbolMap(lambda x: "_" + str(x))
         v = variable()
         self.assertEqual("^" + str(v) + "~", s.getSymbol(v, labeler, "~"))
 
-        s = SymbolMap(lambda x: "_" + str(x))
+        s = self.SymbolMap(lambda x: "_" + str(x))
         m = ConcreteModel()
         m.x = Var()
         self.assertEqual('^x~', s.createSymbol(m.x, labeler, "~"))
 
-        s = SymbolMap(lambda x: "_" + str(x))
+        s = self.SymbolMap(lambda x: "_" + str(x))
         m.y = Var([1, 2, 3])
         s.createSymbols(m.y.values(), labeler, "~")
         self.assertEqual(
@@ -78,7 +82,7 @@ class TestSymbolMap(unittest.TestCase):
         )
 
     def test_existing_alias(self):
-        s = SymbolMap()
+        s = self.SymbolMap()
         v1 = variable()
         s.alias(v1, "v")
         self.assertIs(s.aliases["v"], v1)
@@ -93,7 +97,7 @@ class TestSymbolMap(unittest.TestCase):
         self.assertIs(s.aliases["A"], v1)
 
     def test_add_symbol(self):
-        s = SymbolMap()
+        s = self.SymbolMap()
         m = ConcreteModel()
         m.x = Var()
         m.y = Var([1, 2, 3])
@@ -104,7 +108,7 @@ class TestSymbolMap(unittest.TestCase):
             RuntimeError, r'SymbolMap.addSymbol\(\): duplicate symbol.'
         ):
             s.addSymbol(m.y, 'x')
-        s = SymbolMap()
+        s = self.SymbolMap()
         s.addSymbol(m.x, 'x')
         with self.assertRaisesRegex(
             RuntimeError, r'SymbolMap.addSymbol\(\): duplicate object.'
@@ -116,7 +120,7 @@ class TestSymbolMap(unittest.TestCase):
         m.x = Var()
         m.y = Var([1, 2, 3])
 
-        s = SymbolMap()
+        s = self.SymbolMap()
         s.addSymbols((m.y[i], str(i)) for i in (1, 2, 3))
         self.assertEqual(s.bySymbol, {'1': m.y[1], '2': m.y[2], '3': m.y[3]})
         self.assertEqual(
@@ -127,7 +131,7 @@ class TestSymbolMap(unittest.TestCase):
         ):
             s.addSymbols([(m.y, '1')])
 
-        s = SymbolMap()
+        s = self.SymbolMap()
         s.addSymbols((m.y[i], str(i)) for i in (1, 2, 3))
         with self.assertRaisesRegex(
             RuntimeError, r'SymbolMap.addSymbols\(\): duplicate object.'
@@ -135,5 +139,110 @@ class TestSymbolMap(unittest.TestCase):
             s.addSymbols([(m.y[2], 'x')])
 
 
+class TestCompactSymbolMap(TestSymbolMap):
+    SymbolMap = CompactSymbolMap
+
+    def test_numbered_symbols(self):
+        m = ConcreteModel()
+        m.x = Var(range(5))
+        s = CompactSymbolMap()
+        s.addNumberedSymbols(m.x.values(), 'v')
+        # Symbols are not stored as strings
+        self.assertEqual(s._sources, [('v', '')])
+        self.assertEqual(s._explicit, {})
+        # ... and looking up objects by symbol does not build the index
+        self.assertIs(s.getObject('v3'), m.x[3])
+        self.assertIs(s.bySymbol['v0'], m.x[0])
+        self.assertIs(s.getObject('v5'), SymbolMap.UnknownSymbol)
+        self.assertIs(s.getObject('v03'), SymbolMap.UnknownSymbol)
+        self.assertIsNone(s._index)
+
+        s.addSymbols([(m, 'model')])
+        self.assertEqual(s._explicit, {5: 'model'})
+        self.assertIs(s.getObject('model'), m)
+        self.assertEqual(list(s.bySymbol), ['v0', 'v1', 'v2', 'v3', 'v4', 'model'])
+        self.assertEqual(len(s.bySymbol), 6)
+
+        self.assertEqual(s.getSymbol(m.x[4]), 'v4')
+        self.assertEqual(s.byObject[id(m.x[2])], 'v2')
+        self.assertIsNotNone(s._index)
+
+    def test_decomposition(self):
+        m = ConcreteModel()
+        m.x = Var(range(6))
+        symbols = ['c_e_x(3)_', 'x012', 'y(1_2)', 'x12', '0', 'a' + '9' * 25]
+        s = CompactSymbolMap()
+        s.addSymbols(zip(m.x.values(), symbols))
+        self.assertEqual(
+            s._sources,
+            [
+                ('c_e_x(', ')_'),
+                ('x0', ''),
+                ('y(1_', ')'),
+                ('x', ''),
+                ('', ''),
+                ('a9999999', ''),
+            ],
+        )
+        for v, symb in zip(m.x.values(), symbols):
+            self.assertEqual(s.getSymbol(v), symb)
+            self.assertIs(s.getObject(symb), v)
+        with self.assertRaisesRegex(
+            RuntimeError, r'SymbolMap.addSymbol\(\): duplicate symbol.'
+        ):
+            s.addSymbol(m, 'x12')
+
+    def test_unordered_symbols(self):
+        m = ConcreteModel()
+        m.x = Var(range(4))
+        s = CompactSymbolMap()
+        s.addSymbols(zip(m.x.values(), ['x3', 'x1', 'x10', 'x2']))
+        self.assertIs(s.getObject('x1'), m.x[1])
+        self.assertIs(s.getObject('x3'), m.x[0])
+        self.assertEqual(
+            s.byObject, {id(m.x[i]): 'x%s' % j for i, j in enumerate((3, 1, 10, 2))}
+        )
+        with self.assertRaisesRegex(
+            RuntimeError, r'SymbolMap.addSymbols\(\): duplicate symbol.'
+        ):
+            s.addSymbols([(m, 'x10')])
+
+    def test_remove_symbol(self):
+        m = ConcreteModel()
+        m.x = Var(range(3))
+        s = CompactSymbolMap()
+        s.addSymbols(zip(m.x.values(), ['x1', 'x2', 'y']))
+        s.removeSymbol(m.x[0])
+        s.removeSymbol(m.x[2])
+        self.assertEqual(s.bySymbol, {'x2': m.x[1]})
+        self.assertEqual(s.byObject, {id(m.x[1]): 'x2'})
+        self.assertIs(s.getObject('x1'), SymbolMap.UnknownSymbol)
+        s.addSymbol(m.x[2], 'x1')
+        s.addSymbol(m.x[0], 'y')
+        self.assertEqual(s.bySymbol, {'x2': m.x[1], 'x1': m.x[2], 'y': m.x[0]})
+
+    def test_from_symbol_map_and_deepcopy(self):
+        m = ConcreteModel()
+        m.x = Var(range(3))
+        ref = SymbolMap()
+        ref.addSymbols(zip(m.x.values(), ['x1', 'x[2]', 'c_u_x3_']))
+        ref.alias(m.x[0], '__default__')
+        s = CompactSymbolMap.from_symbol_map(ref)
+        self.assertEqual(s.bySymbol, ref.bySymbol)
+        self.assertIsNone(s._index)
+        self.assertEqual(s.byObject, ref.byObject)
+        self.assertEqual(s.aliases, ref.aliases)
+
+        m.smap = s
+        m2 = deepcopy(m)
+        s2 = m2.smap
+        self.assertIsInstance(s2, CompactSymbolMap)
+        self.assertEqual(
+            s2.bySymbol, {'x1': m2.x[0], 'x[2]': m2.x[1], 'c_u_x3_': m2.x[2]}
+        )
+        self.assertEqual(s2.getSymbol(m2.x[2]), 'c_u_x3_')
+        self.assertIs(s2.getObject('__default__'), m2.x[0])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,155 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+import pyomo.environ as pyo
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.core.expr.numeric_expr import MaxExpression, MinExpression
+from pyomo.core.expr.tape import compile_expression, ExpressionTape
+
+
+def _make_model():
+    m = pyo.ConcreteModel()
+    m.x = pyo.Var([1, 2, 3], initialize={1: 1.5, 2: -0.5, 3: 2.0})
+    m.y = pyo.Var(initialize=3.0)
+    m.y.fix()
+    m.p = pyo.Param(mutable=True, initialize=2.0)
+    m.e = pyo.Expression(expr=m.x[1] * m.x[2] + m.p)
+    return m
+
+
+def _make_exprs(m):
+    return [
+        m.e**2 + pyo.sin(m.x[3]) - m.y / m.x[1],
+        pyo.exp(m.e) * m.e - pyo.log(m.x[1]) / pyo.sqrt(m.x[3]),
+        abs(m.x[2]) + 3 * m.x[1] + m.p * m.x[2] - m.x[3] ** m.x[1],
+        pyo.Expr_if(pyo.inequality(0, m.x[2], 1), m.x[2], -m.x[3]),
+        pyo.cos(m.x[1]) + pyo.tan(m.x[2]) + pyo.atan(m.x[3]) - pyo.tanh(m.e),
+        4.0,
+        m.x[1],
+        2 * m.p,
+    ]
+
+
+@unittest.skipUnless(numpy_available, "Tape evaluation requires NumPy")
+class TestExpressionTape(unittest.TestCase):
+    def test_single_point(self):
+        m = _make_model()
+        exprs = _make_exprs(m)
+        tape = compile_expression(exprs)
+        self.assertIsInstance(tape, ExpressionTape)
+        self.assertEqual(tape.variables, [m.x[1], m.x[2], m.x[3]])
+        expected = [pyo.value(e) for e in exprs]
+        self.assertStructuredAlmostEqual(list(tape()), expected)
+        self.assertStructuredAlmostEqual(list(tape([1.5, -0.5, 2.0])), expected)
+
+    def test_multiple_points(self):
+        m = _make_model()
+        exprs = _make_exprs(m)
+        tape = compile_expression(exprs)
+        points = np.array([[1.5, -0.5, 2.0], [0.25, 0.5, 1.0], [2.0, 3.0, 0.5]])
+        values = tape(points)
+        self.assertEqual(values.shape, (3, len(exprs)))
+        for point, row in zip(points, values):
+            for v, val in zip(tape.variables, point):
+                v.set_value(val)
+            self.assertStructuredAlmostEqual(list(row), [pyo.value(e) for e in exprs])
+
+    def test_scalar_expression(self):
+        m = _make_model()
+        tape = compile_expression(m.e)
+        self.assertEqual(tape.variables, [m.x[1], m.x[2]])
+        self.assertAlmostEqual(tape(), 1.25)
+        self.assertIsInstance(tape(), float)
+        self.assertStructuredAlmostEqual(
+            list(tape([[1, 2], [3, 4], [0, 0]])), [4, 14, 2]
+        )
+
+        tape = compile_expression(m.x[1] + 2)
+        self.assertEqual(tape([1]), 3)
+
+    def test_parameters_are_updated(self):
+        m = _make_model()
+        exprs = _make_exprs(m)
+        tape = compile_expression(exprs)
+        m.p = 5
+        m.y.set_value(-1)
+        self.assertStructuredAlmostEqual(list(tape()), [pyo.value(e) for e in exprs])
+
+    def test_specified_variables(self):
+        m = _make_model()
+        tape = compile_expression(
+            m.x[1] * m.y + m.x[2], variables=[m.y, m.x[2], m.x[1]]
+        )
+        self.assertEqual(tape.variables, [m.y, m.x[2], m.x[1]])
+        self.assertEqual(tape([2, 3, 4]), 11)
+
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Variable 'x\[3\]' is not fixed and is not one of the variables",
+        ):
+            compile_expression(m.x[1] * m.x[3], variables=[m.x[1]])
+
+        with self.assertRaisesRegex(
+            ValueError, r"Variable 'x\[1\]' appears more than once"
+        ):
+            compile_expression(m.x[1], variables=[m.x[1], m.x[1]])
+
+    def test_invalid_points(self):
+        m = _make_model()
+        tape = compile_expression(pyo.log(m.x[1]) + pyo.sqrt(m.x[2]))
+        values = tape([[1, 4], [-1, 4], [1, -4]])
+        self.assertEqual(values[0], 2)
+        self.assertTrue(np.isnan(values[1]))
+        self.assertTrue(np.isnan(values[2]))
+
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Expected points with 2 values \(one for each variable\), but "
+            r"got an array with shape \(3,\)",
+        ):
+            tape([1, 2, 3])
+
+    def test_relational_expressions(self):
+        m = _make_model()
+        tape = compile_expression(
+            [
+                m.x[1] <= 1,
+                m.x[1] == 1,
+                pyo.inequality(1, m.x[1], 2, strict=True),
+                pyo.Expr_if(m.x[1] >= 1, m.x[1], 0),
+            ]
+        )
+        self.assertStructuredAlmostEqual(
+            tape([[0], [1], [1.5], [2]]).tolist(),
+            [[1, 0, 0, 0], [1, 1, 0, 1], [0, 0, 1, 1.5], [0, 0, 0, 2]],
+        )
+
+    def test_level_scheduling(self):
+        # Instructions with the same operation at the same depth are
+        # executed together, regardless of the number of expressions
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(range(100), initialize=lambda m, i: i / 10)
+        exprs = [m.x[i] ** 2 + pyo.exp(m.x[i - 1]) * m.x[i] for i in range(1, 100)]
+        tape = compile_expression(exprs)
+        self.assertEqual(len(tape._groups), 4)
+        self.assertStructuredAlmostEqual(list(tape()), [pyo.value(e) for e in exprs])
+
+    def test_max_min(self):
+        m = _make_model()
+        tape = compile_expression(
+            [MaxExpression((m.x[1], m.x[2], m.x[3])), MinExpression((m.x[1], m.x[2]))]
+        )
+        self.assertStructuredAlmostEqual(list(tape([1, 5, 3])), [5, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,270 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyomo.common.unittest as unittest
+import pyomo.environ as pyo
+from pyomo.common.dependencies import numpy as np, numpy_available, scipy_available
+from pyomo.core.expr.calculus.derivatives import differentiate, Modes
+from pyomo.core.expr.calculus.diff_with_pyomo import DifferentiationException
+
+if numpy_available and scipy_available:
+    from pyomo.core.expr.calculus.tape_ad import DerivativeTape, BlockDerivativeTape
+
+
+def _make_model():
+    m = pyo.ConcreteModel()
+    m.x = pyo.Var([1, 2, 3], initialize={1: 1.5, 2: 0.7, 3: 2.0})
+    m.y = pyo.Var(initialize=0.3)
+    m.y.fix()
+    m.p = pyo.Param(mutable=True, initialize=2.0)
+    m.e = pyo.Expression(expr=m.x[1] * m.x[2] + m.p)
+    return m
+
+
+def _make_exprs(m):
+    return [
+        m.e**2 + pyo.sin(m.x[3]) - m.y / m.x[1],
+        pyo.exp(m.e) * m.e - pyo.log(m.x[1]) / pyo.sqrt(m.x[3]),
+        3 * m.x[1] + m.p * m.x[2] - m.x[3] ** m.x[1] + m.x[2] ** m.p,
+        pyo.cos(m.x[1]) + pyo.tan(m.x[2]) + pyo.atan(m.x[3]) - pyo.log10(m.e),
+        pyo.asin(m.x[2] / 2) * pyo.acos(m.x[2] / 3) + 2 ** m.x[1],
+        m.x[1] + m.x[2],
+        m.x[3],
+        4.0,
+        m.x[1] * m.x[1] * m.x[1],
+    ]
+
+
+@unittest.skipUnless(
+    numpy_available and scipy_available, "Tape derivatives require NumPy and SciPy"
+)
+class TestDerivativeTape(unittest.TestCase):
+    def _reference_jacobian(self, exprs, variables):
+        return [
+            [
+                pyo.value(differentiate(e, wrt=v, mode=Modes.reverse_numeric))
+                for v in variables
+            ]
+            for e in exprs
+        ]
+
+    def _reference_hessian(self, exprs, variables, weights):
+        H = np.zeros((len(variables), len(variables)))
+        for w, e in zip(weights, exprs):
+            for i, v in enumerate(variables):
+                d = differentiate(e, wrt=v, mode=Modes.reverse_symbolic)
+                for j, u in enumerate(variables):
+                    H[i, j] += w * pyo.value(
+                        differentiate(d, wrt=u, mode=Modes.reverse_numeric)
+                    )
+        return H
+
+    def test_jacobian(self):
+        m = _make_model()
+        exprs = _make_exprs(m)
+        tape = DerivativeTape(exprs)
+        self.assertEqual(tape.variables, [m.x[1], m.x[2], m.x[3]])
+        J = tape.jacobian()
+        self.assertEqual(J.shape, (len(exprs), 3))
+        self.assertStructuredAlmostEqual(
+            J.toarray().tolist(),
+            self._reference_jacobian(exprs, tape.variables),
+            abstol=1e-10,
+        )
+        # Only the variables that appear in each expression are in the
+        # sparsity structure
+        self.assertEqual(J.nnz, 3 + 3 + 3 + 3 + 2 + 2 + 1 + 0 + 1)
+
+    def test_jacobian_new_point(self):
+        m = _make_model()
+        exprs = _make_exprs(m)
+        tape = DerivativeTape(exprs)
+        J = tape.jacobian([1.2, 0.4, 3.0]).toarray()
+        m.x[1] = 1.2
+        m.x[2] = 0.4
+        m.x[3] = 3.0
+        self.assertStructuredAlmostEqual(
+            J.tolist(), self._reference_jacobian(exprs, tape.variables), abstol=1e-10
+        )
+        # Parameters are read at every evaluation
+        m.p = 1.5
+        m.y.set_value(-2)
+        self.assertStructuredAlmostEqual(
+            tape.jacobian().toarray().tolist(),
+            self._reference_jacobian(exprs, tape.variables),
+            abstol=1e-10,
+        )
+
+    def test_hessian(self):
+        m = _make_model()
+        exprs = _make_exprs(m)
+        tape = DerivativeTape(exprs)
+        weights = np.arange(1, len(exprs) + 1)
+        H = tape.hessian(weights=weights)
+        self.assertEqual(H.shape, (3, 3))
+        self.assertStructuredAlmostEqual(
+            H.toarray().tolist(),
+            self._reference_hessian(exprs, tape.variables, weights).tolist(),
+            abstol=1e-8,
+        )
+        self.assertStructuredAlmostEqual(
+            tape.hessian().toarray().tolist(),
+            self._reference_hessian(exprs, tape.variables, [1] * len(exprs)).tolist(),
+            abstol=1e-8,
+        )
+
+        with self.assertRaisesRegex(
+            ValueError, r"Expected 9 weights \(one for each expression\), but got 2"
+        ):
+            tape.hessian(weights=[1, 2])
+
+    def test_hessian_sparsity(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(range(50), initialize=lambda m, i: 1 + i / 10)
+        exprs = [
+            sum((m.x[i] - 1) ** 2 for i in range(50)),
+            sum(m.x[i] * m.x[i + 1] for i in range(49)),
+            sum(m.x[i] for i in range(50)),
+        ]
+        tape = DerivativeTape(exprs)
+        H = tape.hessian()
+        # The diagonal (from the first expression) and the first
+        # off-diagonals (from the second expression)
+        self.assertEqual(H.nnz, 50 + 2 * 49)
+        ref = np.diag(np.full(50, 2.0)) + np.diag(np.ones(49), 1)
+        ref += np.diag(np.ones(49), -1)
+        self.assertStructuredAlmostEqual(H.toarray().tolist(), ref.tolist())
+        # Non-overlapping columns are computed together
+        self.assertEqual(tape._get_hessian_structure()[-1], 2)
+
+        # Processing one direction at a time gives the same result
+        tape.hessian_chunk_size = 1
+        self.assertStructuredAlmostEqual(
+            tape.hessian().toarray().tolist(), ref.tolist()
+        )
+
+    def test_piecewise(self):
+        m = _make_model()
+        exprs = [
+            pyo.Expr_if(pyo.inequality(0, m.x[2], 1), m.x[2] ** 3, -m.x[3]),
+            abs(m.x[1] - 3) * m.x[2],
+            pyo.floor(m.x[1]) + m.x[3],
+            m.x[1] <= m.x[2],
+        ]
+        tape = DerivativeTape(exprs, variables=[m.x[1], m.x[2], m.x[3]])
+        self.assertStructuredAlmostEqual(
+            tape.jacobian().toarray().tolist(),
+            [[0, 3 * 0.7**2, 0], [-0.7, 1.5, 0], [0, 0, 1], [0, 0, 0]],
+        )
+        self.assertStructuredAlmostEqual(
+            tape.hessian().toarray().tolist(), [[0, -1, 0], [-1, 6 * 0.7, 0], [0, 0, 0]]
+        )
+        self.assertStructuredAlmostEqual(
+            tape.jacobian([1, 2, 3]).toarray().tolist(),
+            [[0, 0, -1], [-2, 2, 0], [0, 0, 1], [0, 0, 0]],
+        )
+
+    def test_unsupported(self):
+        m = _make_model()
+        m.f = pyo.ExternalFunction(lambda a: a**2)
+        with self.assertRaisesRegex(
+            DifferentiationException, "Cannot differentiate expressions of type"
+        ):
+            DerivativeTape([m.f(m.x[1]) + m.x[2]])
+        # ... unless they do not depend on the variables
+        tape = DerivativeTape([m.f(m.y) * m.x[2]])
+        self.assertAlmostEqual(tape.jacobian().toarray()[0, 0], 0.09)
+
+
+@unittest.skipUnless(
+    numpy_available and scipy_available, "Tape derivatives require NumPy and SciPy"
+)
+class TestBlockDerivativeTape(unittest.TestCase):
+    def _make_block(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3], initialize={1: 1.5, 2: 0.7, 3: 2.0})
+        m.p = pyo.Param(mutable=True, initialize=2.0)
+        m.c1 = pyo.Constraint(expr=m.x[1] ** 2 + m.x[2] * m.x[3] == m.p)
+        m.c2 = pyo.Constraint(expr=pyo.exp(m.x[1]) - m.x[3] <= 4)
+        m.c3 = pyo.Constraint(expr=m.x[1] + m.x[2] >= 0)
+        m.c3.deactivate()
+        m.b = pyo.Block()
+        m.b.c = pyo.Constraint(expr=pyo.log(m.x[2]) + m.x[3] >= 0)
+        m.o = pyo.Objective(expr=m.x[1] * m.x[2] + m.p * m.x[3] ** 2)
+        return m
+
+    def test_evaluate(self):
+        m = self._make_block()
+        tape = BlockDerivativeTape(m)
+        self.assertEqual(tape.constraints, [m.c1, m.c2, m.b.c])
+        self.assertIs(tape.objective, m.o)
+        self.assertEqual(tape.variables, [m.x[1], m.x[2], m.x[3]])
+        self.assertStructuredAlmostEqual(
+            list(tape.evaluate_constraints()),
+            [pyo.value(c.body) for c in tape.constraints],
+        )
+        self.assertAlmostEqual(tape.evaluate_objective(), pyo.value(m.o))
+        self.assertStructuredAlmostEqual(
+            list(tape.evaluate_grad_objective()), [0.7, 1.5, 8.0]
+        )
+        m.p = 3
+        self.assertAlmostEqual(tape.evaluate_objective([1, 1, 1]), 4)
+
+    def test_derivatives(self):
+        m = self._make_block()
+        tape = BlockDerivativeTape(m)
+        J = tape.evaluate_jacobian()
+        self.assertEqual(J.shape, (3, 3))
+        self.assertEqual(J.nnz, 7)
+        e = np.exp(1.5)
+        self.assertStructuredAlmostEqual(
+            J.toarray().tolist(), [[3, 2, 0.7], [e, 0, -1], [0, 1 / 0.7, 1]]
+        )
+        H = tape.evaluate_hessian_lag(duals=[1, 2, 3], obj_factor=0.5)
+        self.assertStructuredAlmostEqual(
+            H.toarray().tolist(), [[2 + 2 * e, 0.5, 0], [0.5, -3 / 0.49, 1], [0, 1, 2]]
+        )
+        H = tape.evaluate_hessian_lag([1, 1, 1])
+        self.assertStructuredAlmostEqual(
+            H.toarray().tolist(), [[2 + np.exp(1), 1, 0], [1, -1, 1], [0, 1, 4]]
+        )
+
+        with self.assertRaisesRegex(
+            ValueError, r"Expected 3 duals \(one for each constraint\), but got 1"
+        ):
+            tape.evaluate_hessian_lag(duals=[1])
+        with self.assertRaisesRegex(
+            ValueError, "Derivatives can only be evaluated at a single point"
+        ):
+            tape.evaluate_jacobian([[1, 1, 1], [2, 2, 2]])
+
+    def test_objectives(self):
+        m = self._make_block()
+        m.o2 = pyo.Objective(expr=m.x[1])
+        with self.assertRaisesRegex(
+            ValueError, "Block 'unknown' has 2 active objectives; expected at most one"
+        ):
+            BlockDerivativeTape(m)
+
+        m.o.deactivate()
+        m.o2.deactivate()
+        tape = BlockDerivativeTape(m)
+        self.assertIsNone(tape.objective)
+        self.assertEqual(tape.evaluate_jacobian().shape, (3, 3))
+        self.assertEqual(tape.evaluate_hessian_lag().shape, (3, 3))
+        with self.assertRaisesRegex(
+            ValueError, "The block does not have an active objective"
+        ):
+            tape.evaluate_objective()
+
+
+if __name__ == "__main__":
+    unittest.main()
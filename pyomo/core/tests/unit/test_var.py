@@ -16,6 +16,7 @@
 #
 
 import os
+import pickle
 from os.path import abspath, dirname
 
 currdir = dirname(abspath(__file__)) + os.sep
@@ -23,6 +24,7 @@ currdir = dirname(abspath(__file__)) + os.sep
 from io import StringIO
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.log import LoggingIntercept
 
 from pyomo.core.base import IntegerSet
@@ -49,9 +51,12 @@ from pyomo.environ import (
     NonNegativeReals,
     Integers,
     Binary,
+    Constraint,
+    Objective,
     value,
 )
 from pyomo.core.base.units_container import units, pint_available, UnitsError
+from pyomo.core.base.var import ArrayIndexedVar
 
 
 class TestVarData(unittest.TestCase):
@@ -1824,6 +1829,260 @@ class MiscVarTests(unittest.TestCase):
         self.assertEqual(x.is_continuous(), False)
         self.assertEqual(x.bounds, (0, 1))
 
+    @unittest.skipUnless(numpy_available, "Numpy is not installed")
+    def test_values_array(self):
+        m = ConcreteModel()
+        m.x = Var([3, 1, 2], bounds=(0, 5), initialize={3: 1, 1: 2})
+        vals = m.x.get_values_array()
+        self.assertEqual(vals[:2].tolist(), [1, 2])
+        self.assertTrue(np.isnan(vals[2]))
+
+        StaleFlagManager.mark_all_as_stale()
+        with LoggingIntercept() as LOG:
+            m.x.set_values_array(np.array([4, float('nan'), 6.0]))
+        self.assertEqual(
+            LOG.getvalue().replace('\n', ' ').strip(),
+            "Setting Var 'x[2]' to a numeric value `6.0` outside the bounds (0, 5).",
+        )
+        self.assertEqual(m.x[3].value, 4)
+        self.assertIsNone(m.x[1].value)
+        self.assertEqual(m.x[2].value, 6)
+        self.assertFalse(m.x[3].stale)
+        self.assertTrue(m.x[1].stale)
+        self.assertFalse(m.x[2].stale)
+
+        with LoggingIntercept() as LOG:
+            m.x.set_values_array([-1, 0, 1], skip_validation=True)
+        self.assertEqual(LOG.getvalue(), "")
+        self.assertEqual([m.x[i].value for i in m.x], [-1, 0, 1])
+
+        with self.assertRaisesRegex(
+            ValueError, "expected a one-dimensional array of length 3"
+        ):
+            m.x.set_values_array([1, 2])
+
+        m.y = Var([1, 2, 3], domain=PositiveReals)
+        with LoggingIntercept() as LOG:
+            m.y.set_values_array([1, 0, 2])
+        self.assertIn("Setting Var 'y[2]' to a value `0`", LOG.getvalue())
+
+        m.z = Var([1, 2, 3], domain=Integers)
+        with LoggingIntercept() as LOG:
+            m.z.set_values_array([1, 1.5, 2])
+        self.assertIn("Setting Var 'z[2]' to a value `1.5`", LOG.getvalue())
+        self.assertEqual([m.z[i].value for i in m.z], [1, 1.5, 2])
+
+    @unittest.skipUnless(numpy_available, "Numpy is not installed")
+    def test_bounds_and_fixed_arrays(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], bounds=(0, 5))
+        m.x[2].domain = NonPositiveReals
+        lb, ub = m.x.get_bounds_arrays()
+        self.assertEqual(lb.tolist(), [0, 0, 0])
+        self.assertEqual(ub.tolist(), [5, 0, 5])
+
+        m.x.set_bounds_arrays(ub=[10, float('inf'), 1])
+        self.assertEqual(m.x[1].bounds, (0, 10))
+        self.assertEqual(m.x[2].bounds, (0, 0))
+        self.assertIsNone(m.x[2]._ub)
+        self.assertEqual(m.x[3].bounds, (0, 1))
+        m.x.set_bounds_arrays(np.array([-np.inf, -1, 1]), np.array([1, 2, np.inf]))
+        lb, ub = m.x.get_bounds_arrays()
+        self.assertEqual(lb.tolist(), [-float('inf'), -1, 1])
+        self.assertEqual(ub.tolist(), [1, 0, float('inf')])
+
+        self.assertEqual(m.x.get_fixed_mask().tolist(), [False, False, False])
+        m.x[3].fix(1)
+        self.assertEqual(m.x.get_fixed_mask().tolist(), [False, False, True])
+        m.x.set_fixed_mask([True, False, False])
+        self.assertTrue(m.x[1].fixed)
+        self.assertFalse(m.x[3].fixed)
+        self.assertEqual(m.x[3].value, 1)
+
+
+@unittest.skipUnless(numpy_available, "Numpy is not installed")
+class TestArrayStorageVar(unittest.TestCase):
+    def _model(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 2, 3, 4])
+        m.p = Param(mutable=True, initialize=3)
+        m.x = Var(m.I, storage='array', bounds=(0, 10), initialize={1: 1, 3: 3})
+        m.y = Var(m.I, storage='array', bounds=(0, m.p), domain=Binary)
+        m.c = Constraint(expr=m.x[1] + m.y[2] >= 1)
+        return m
+
+    def test_construct(self):
+        m = self._model()
+        self.assertIs(type(m.x), ArrayIndexedVar)
+        self.assertFalse(m.x.is_reference())
+        self.assertEqual(len(m.x), 4)
+        self.assertEqual(list(m.x.keys()), [1, 2, 3, 4])
+        self.assertIs(m.x[1], m.x[1])
+        self.assertEqual(m.x[1].index(), 1)
+        self.assertIs(m.x[1].parent_component(), m.x)
+        self.assertEqual([m.x[i].value for i in m.I], [1, None, 3, None])
+        self.assertEqual(m.x[2].bounds, (0, 10))
+        self.assertIs(m.y[2].domain, Binary)
+        self.assertIs(m.y[2]._ub, m.p)
+        self.assertEqual(m.y[2].bounds, (0, 1))
+        m.p = 0.5
+        self.assertEqual(m.y[2].bounds, (0, 0.5))
+
+        with self.assertRaisesRegex(ValueError, "only supported for indexed Vars"):
+            m.z = Var(storage='array')
+        with self.assertRaisesRegex(ValueError, "must be dense"):
+            m.z = Var(m.I, storage='array', dense=False)
+        with self.assertRaisesRegex(ValueError, "unknown storage 'list'"):
+            m.z = Var(m.I, storage='list')
+        m.J = Set(initialize=[1, 2], ordered=False)
+        with self.assertRaisesRegex(ValueError, "finite, ordered Set"):
+            m.z = Var(m.J, storage='array')
+
+    def test_vardata_api(self):
+        m = self._model()
+        m.x[2] = 5
+        self.assertEqual(m.x[2].value, 5)
+        self.assertFalse(m.x[2].stale)
+        m.x[2].fix()
+        self.assertTrue(m.x[2].fixed)
+        self.assertEqual(m.x.get_fixed_mask().tolist(), [False, True, False, False])
+        m.x.unfix()
+        self.assertFalse(m.x[2].fixed)
+        m.x[4].setlb(2)
+        m.x[4].domain = NonNegativeReals
+        self.assertEqual(m.x[4].bounds, (2, 10))
+        self.assertIs(m.x[3].domain, Reals)
+        self.assertIs(m.x[4].domain, NonNegativeReals)
+        with LoggingIntercept() as LOG:
+            m.x[4].value = 20
+        self.assertIn("outside the bounds (2, 10)", LOG.getvalue())
+
+        # New elements in the index set are created on demand
+        m.I.add(5)
+        self.assertEqual(m.x[5].bounds, (0, 10))
+        self.assertIsNone(m.x[5].value)
+        self.assertEqual(len(m.x), 5)
+
+        with self.assertRaisesRegex(TypeError, "Cannot remove elements"):
+            del m.x[1]
+
+    def test_index_set_changes(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1, 3], ordered=Set.SortedOrder)
+        m.x = Var(m.I, storage='array')
+        m.x[1] = 10
+        m.x[3] = 30
+        self.assertIs(type(m.x[1].value), int)
+        m.x[3] = 2.5
+        self.assertIs(type(m.x[3].value), float)
+        m.x[3] = 30
+        # Inserting into a sorted Set would reorder the stored elements
+        m.I.add(2)
+        with self.assertRaisesRegex(RuntimeError, "removed from \\(or reordered"):
+            m.x[2]
+        self.assertEqual(m.x[1].value, 10)
+        self.assertEqual(m.x[3].value, 30)
+        m.I.add(4)
+        with self.assertRaisesRegex(RuntimeError, "removed from \\(or reordered"):
+            m.x[4]
+
+        # Removing elements (even if others are then added) is an error
+        m.J = Set(initialize=[1, 2, 3])
+        m.y = Var(m.J, storage='array', initialize=lambda m, i: 10 * i)
+        m.J.add(4)
+        m.y[4] = 40
+        self.assertEqual(m.y.get_values_array().tolist(), [10, 20, 30, 40])
+        m.J.remove(2)
+        with self.assertRaisesRegex(RuntimeError, "removed from \\(or reordered"):
+            m.y[3]
+        with self.assertRaisesRegex(RuntimeError, "removed from \\(or reordered"):
+            list(m.y.values())
+        m.J.add(5)
+        with self.assertRaisesRegex(RuntimeError, "removed from \\(or reordered"):
+            m.y[5]
+
+    def test_bulk_arrays_track_index_set(self):
+        m = self._model()
+        m.I.add(5)
+        self.assertEqual(list(m.x.keys()), [1, 2, 3, 4, 5])
+        self.assertEqual(len(m.x), 5)
+        self.assertEqual(m.x.get_values_array().shape, (5,))
+        m.x.set_values_array([1, 2, 3, 4, 5])
+        self.assertEqual(m.x[5].value, 5)
+        self.assertEqual(m.x[5].bounds, (0, 10))
+        self.assertEqual(m.y.get_fixed_mask().tolist(), [False] * 5)
+        lb, ub = m.y.get_bounds_arrays()
+        self.assertEqual(ub.tolist(), [1] * 5)
+
+        m.I.remove(1)
+        for op in (
+            lambda: list(m.x.keys()),
+            lambda: len(m.x),
+            m.x.get_values_array,
+            lambda: m.x.set_values_array([1, 2, 3, 4]),
+            m.x.get_bounds_arrays,
+            m.x.get_fixed_mask,
+            m.x.fix,
+        ):
+            with self.assertRaisesRegex(RuntimeError, "removed from \\(or reordered"):
+                op()
+
+    def test_writers_match_default_storage(self):
+        from pyomo.repn.plugins.nl_writer import NLWriter
+        from pyomo.repn.plugins.lp_writer import LPWriter
+
+        def build(storage):
+            m = ConcreteModel()
+            m.I = Set(initialize=[1, 2, 3])
+            m.p = Param(mutable=True, initialize=4)
+            m.x = Var(m.I, bounds=(0, 10), initialize={1: 1, 2: 2.5}, **storage)
+            m.y = Var(m.I, bounds=(-1, m.p), domain=Integers, **storage)
+            m.o = Objective(expr=sum(m.x[i] + 2 * m.y[i] for i in m.I))
+            m.c = Constraint(m.I, rule=lambda m, i: m.x[i] * m.y[i] >= 1)
+            m.d = Constraint(expr=sum(m.x.values()) <= 20)
+            return m
+
+        for writer in (NLWriter, LPWriter):
+            ref = StringIO()
+            writer().write(build({}), ref)
+            out = StringIO()
+            writer().write(build({'storage': 'array'}), out)
+            self.assertEqual(ref.getvalue(), out.getvalue())
+
+    def test_bulk_arrays(self):
+        m = self._model()
+        m.x.set_values_array(np.array([1, 2, 3, np.nan]))
+        self.assertEqual([m.x[i].value for i in m.I], [1, 2, 3, None])
+        self.assertTrue(m.x[4].stale)
+        with LoggingIntercept() as LOG:
+            m.y.set_values_array([0, 0.5, 1, 1])
+        self.assertIn("Setting Var 'y[2]' to a value `0.5`", LOG.getvalue())
+
+        m.x.set_bounds_arrays(ub=[1, 2, np.inf, 4])
+        lb, ub = m.x.get_bounds_arrays()
+        self.assertEqual(lb.tolist(), [0, 0, 0, 0])
+        self.assertEqual(ub.tolist(), [1, 2, float('inf'), 4])
+        self.assertIsNone(m.x[3].upper)
+
+        lb, ub = m.y.get_bounds_arrays()
+        self.assertEqual(ub.tolist(), [1, 1, 1, 1])
+        m.x.set_fixed_mask([True, False, True, False])
+        self.assertTrue(m.x[3].fixed)
+
+    def test_clone_and_pickle(self):
+        m = self._model()
+        m.x[1].fix(2)
+        for i, m2 in enumerate((m.clone(), pickle.loads(pickle.dumps(m)))):
+            self.assertIs(type(m2.x), ArrayIndexedVar)
+            self.assertIs(m2.c.body.args[0], m2.x[1])
+            self.assertIsNot(m2.x[1], m.x[1])
+            self.assertTrue(m2.x[1].fixed)
+            self.assertEqual(m2.x[1].value, 2)
+            self.assertFalse(m2.x[1].stale)
+            self.assertIs(m2.y[2]._ub, m2.p)
+            m2.x[1].value = 5
+            self.assertEqual(m.x[1].value, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
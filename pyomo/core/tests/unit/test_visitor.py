@@ -12,6 +12,8 @@
 # Unit Tests for expression generation
 #
 
+import functools
+import inspect
 import os
 import platform
 import sys
@@ -72,6 +74,7 @@ from pyomo.core.expr.visitor import (
     identify_mutable_parameters,
     RECURSION_LIMIT,
     get_stack_depth,
+    _positional_argspec,
 )
 from pyomo.core.base.param import ParamData, ScalarParam
 from pyomo.core.expr.template_expr import IndexTemplate
@@ -1217,6 +1220,43 @@ class BaseStreamBasedVisitorTests(object):
         ref = ['2', 6]
         self.assertEqual(str(ans), str(ref))
 
+    def test_positional_argspec(self):
+        class Callbacks:
+            def method(self, node, child):
+                pass
+
+            def varargs(self, *args):
+                pass
+
+            @staticmethod
+            def static(node, child, child_idx):
+                pass
+
+            def __call__(self, node, child):
+                pass
+
+        def posonly(node, child, /, child_idx, *, flag=None):
+            pass
+
+        @functools.wraps(posonly)
+        def wrapped(*args, **kwds):
+            pass
+
+        for fcn in (
+            Callbacks().method,
+            Callbacks().varargs,
+            Callbacks.static,
+            Callbacks(),
+            posonly,
+            wrapped,
+            lambda node, child: None,
+            functools.partial(posonly, 1),
+        ):
+            ref = inspect.getfullargspec(fcn)
+            self.assertEqual(
+                _positional_argspec(fcn), (len(ref.args), ref.varargs is not None)
+            )
+
     def test_old_beforeChild(self):
         def before(node, child):
             if type(child) in nonpyomo_leaf_types or not child.is_expression_type():
@@ -14,15 +14,27 @@
 #
 
 from pyomo.common.deprecation import deprecation_warning
+from pyomo.common.gc_manager import PauseGC
 from pyomo.core.expr.numvalue import native_numeric_types
-from pyomo.core.expr.numeric_expr import mutable_expression, NPV_SumExpression
+from pyomo.core.expr.numeric_expr import (
+    mutable_expression,
+    NPV_SumExpression,
+    LinearExpression,
+    MonomialTermExpression,
+    ARG_TYPE,
+    _categorize_arg_type,
+    _zero_one_optimizations,
+)
 from pyomo.core.base.var import Var
 from pyomo.core.base.expression import Expression
 from pyomo.core.base.component import ComponentBase
 import logging
+import operator
 
 logger = logging.getLogger(__name__)
 
+_constant_arg_types = {ARG_TYPE.NATIVE, ARG_TYPE.NPV, ARG_TYPE.PARAM}
+
 
 def prod(terms):
     """
@@ -113,6 +125,121 @@ def quicksum(args, start=0, linear=None):
     return e
 
 
+def linear_sum(coefs, variables, constant=0):
+    """Efficiently build the linear expression ``constant + sum(c*v)``
+
+    This is a bulk alternative to ``quicksum(c[i]*x[i] for i in I)``
+    for the (very common) case where the terms are known to be products
+    of coefficients and variables.  The resulting
+    :class:`~pyomo.core.expr.numeric_expr.LinearExpression` is
+    assembled directly from the two sequences, bypassing the
+    per-term operator dispatch used by :func:`quicksum`.  For numeric
+    `constant` values, the resulting expression is identical to the one
+    generated by :func:`quicksum`.
+
+    If any term is not a simple product of a constant (native value,
+    Param, or NPV expression) and a variable, this falls back on
+    :func:`quicksum`.
+
+    Parameters
+    ----------
+    coefs: Sequence
+        The term coefficients.  This may be a list / tuple or a NumPy
+        array.
+
+    variables: Sequence
+        The term variables (aligned with `coefs`).  This may be a list
+        / tuple or a NumPy array.
+
+    constant: Any
+        The constant term in the sum.  Defaults to 0.
+
+    Returns
+    -------
+    The value of the sum, which may be a Pyomo expression object.
+
+    """
+    # NumPy arrays: convert to lists (this also converts numpy scalars
+    # to the equivalent native Python types)
+    if hasattr(coefs, 'tolist'):
+        coefs = coefs.tolist()
+    elif coefs.__class__ not in (list, tuple):
+        coefs = list(coefs)
+    if hasattr(variables, 'tolist'):
+        variables = variables.tolist()
+    elif variables.__class__ not in (list, tuple):
+        variables = list(variables)
+    if len(coefs) != len(variables):
+        raise ValueError(
+            "linear_sum(): coefs (length %s) and variables (length %s) "
+            "must be the same length" % (len(coefs), len(variables))
+        )
+
+    args = []
+    if constant.__class__ in native_numeric_types:
+        if constant:
+            args.append(constant)
+    elif _categorize_arg_type(constant) in _constant_arg_types:
+        args.append(constant)
+    else:
+        return quicksum(map(operator.mul, coefs, variables), constant)
+
+    # The terms are all new (acyclic) objects: there is no reason to
+    # let the garbage collector repeatedly scan them
+    with PauseGC():
+        if _linear_terms(args, coefs, variables):
+            if len(args) > 1:
+                return LinearExpression(args)
+            elif not args:
+                return 0
+            return args[0]
+    return quicksum(map(operator.mul, coefs, variables), constant)
+
+
+def _linear_terms(args, coefs, variables):
+    """Append the terms ``coefs[i]*variables[i]`` to `args`
+
+    This mirrors the logic in the ``_mul_*_var`` expression generation
+    dispatchers.  Returns False (and leaves `args` in an indeterminate
+    state) if any term is not a constant times a variable.
+
+    """
+    zero_one = _zero_one_optimizations
+    if all(
+        _categorize_arg_type(var) is ARG_TYPE.VAR
+        for var in dict(zip(map(type, variables), variables)).values()
+    ):
+        if native_numeric_types.issuperset(map(type, coefs)):
+            if zero_one.isdisjoint(coefs):
+                # Fast path: native coefficients (none of which are
+                # optimized away) and variables
+                args.extend(map(MonomialTermExpression, zip(coefs, variables)))
+                return True
+        check_var = False
+    else:
+        check_var = True
+
+    append = args.append
+    for coef, var in zip(coefs, variables):
+        if check_var and _categorize_arg_type(var) is not ARG_TYPE.VAR:
+            return False
+        if coef.__class__ not in native_numeric_types:
+            coef_type = _categorize_arg_type(coef)
+            if coef_type is ARG_TYPE.PARAM and coef.is_constant():
+                coef = coef.value
+            elif coef_type is ARG_TYPE.PARAM or coef_type is ARG_TYPE.NPV:
+                append(MonomialTermExpression((coef, var)))
+                continue
+            else:
+                return False
+        if coef in zero_one:
+            if coef:
+                append(var)
+        else:
+            append(MonomialTermExpression((coef, var)))
+    return True
+
+
 def sum_product(*args, **kwds):
     """
     A utility function to compute a generalized dot product.
@@ -164,20 +164,21 @@ class ContinuousSet(SortedScalarSet):
         -------
         float
         """
-        if point in self._fe:
+        fe = self._fe
+        # The list _fe is always sorted, so we can locate the point by
+        # bisection rather than scanning the finite element boundaries
+        i = bisect.bisect_left(fe, point)
+        if i < len(fe) and fe[i] == point:
             return point
-        elif point > max(self._fe):
+        elif i == len(fe):
             logger.warning(
                 "The point '%s' exceeds the upper bound "
                 "of the ContinuousSet '%s'. Returning the upper bound"
                 % (str(point), self.name)
             )
-            return max(self._fe)
+            return fe[-1]
         else:
-            for i in self._fe:
-                # This works because the list _fe is always sorted
-                if i > point:
-                    return i
+            return fe[i]
 
     def get_lower_element_boundary(self, point):
         """Returns the first finite element point that is less than or
@@ -191,29 +192,26 @@ class ContinuousSet(SortedScalarSet):
         -------
         float
         """
-        if point in self._fe:
+        fe = self._fe
+        i = bisect.bisect_left(fe, point)
+        if i < len(fe) and fe[i] == point:
             if 'scheme' in self._discretization_info:
                 if self._discretization_info['scheme'] == 'LAGRANGE-RADAU':
                     # Because Radau Collocation has a collocation point on the
                     # upper finite element bound this if statement ensures that
                     # the desired finite element bound is returned
-                    tmp = self._fe.index(point)
-                    if tmp != 0:
-                        return self._fe[tmp - 1]
+                    if i != 0:
+                        return fe[i - 1]
             return point
-        elif point < min(self._fe):
+        elif i == 0:
             logger.warning(
                 "The point '%s' is less than the lower bound "
                 "of the ContinuousSet '%s'. Returning the lower bound "
                 % (str(point), self.name)
             )
-            return min(self._fe)
+            return fe[0]
         else:
-            rev_fe = list(self._fe)
-            rev_fe.reverse()
-            for i in rev_fe:
-                if i < point:
-                    return i
+            return fe[i - 1]
 
     def construct(self, values=None):
         """Constructs a :py:class:`ContinuousSet` component"""
@@ -9,6 +9,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import heapq
 import logging
 
 from pyomo.common.collections import ComponentMap
@@ -42,9 +43,13 @@ def generate_finite_elements(ds, nfe):
         # If only bounds have been specified on the differentialset we
         # generate the desired number of finite elements by
         # spreading them evenly over the interval
-        step = (max(ds) - min(ds)) / float(nfe)
-        tmp = min(ds) + step
-        while round(tmp, 6) <= round((max(ds) - step), 6):
+        lb = min(ds)
+        ub = max(ds)
+        step = (ub - lb) / float(nfe)
+        tmp = lb + step
+        # Note: the bounds do not change as points are added, so we
+        # avoid recomputing max(ds) (which re-sorts the set) every pass
+        while round(tmp, 6) <= round((ub - step), 6):
             ds.add(round(tmp, 6))
             tmp += step
         ds.set_changed(True)
@@ -62,24 +67,31 @@ def generate_finite_elements(ds, nfe):
         # largest step
 
         addpts = nfe - (len(ds) - 1)
-        while addpts > 0:
-            _add_point(ds)
-            addpts -= 1
+        _add_points(ds, addpts)
         ds.set_changed(True)
         ds._fe = list(ds)
         return
 
 
-def _add_point(ds):
+def _add_points(ds, npts):
+    # Repeatedly bisect the largest step (the first one if there are
+    # ties). The steps are kept in a heap keyed on (-step, left point) so
+    # that we do not rescan (and re-sort) the whole set for every point.
     sortds = list(ds)
-    maxstep = sortds[1] - sortds[0]
-    maxloc = 0
-    for i in range(2, len(sortds)):
-        if (sortds[i] - sortds[i - 1]) > maxstep:
-            maxstep = sortds[i] - sortds[i - 1]
-            maxloc = i - 1
-
-    ds.add(round((sortds[maxloc] + maxstep / 2.0), 6))
+    steps = [
+        (-(sortds[i] - sortds[i - 1]), sortds[i - 1], sortds[i])
+        for i in range(1, len(sortds))
+    ]
+    heapq.heapify(steps)
+    for _ in range(npts):
+        negstep, left, right = steps[0]
+        pt = round(left - negstep / 2.0, 6)
+        if pt == left or pt == right:
+            # The step cannot be split any further (at this precision)
+            continue
+        ds.add(pt)
+        heapq.heapreplace(steps, (-(pt - left), left, pt))
+        heapq.heappush(steps, (-(right - pt), pt, right))
 
 
 def generate_colloc_points(ds, tau):
@@ -354,6 +366,16 @@ def create_access_function(var):
     return _fun
 
 
+def _element_points(ds, start, n):
+    """
+    Return the n+1 consecutive points of the ContinuousSet ds beginning
+    at the (0-based) position start. Discretization schemes are applied
+    one index at a time, so we look up the handful of points each
+    equation needs rather than copying the entire set.
+    """
+    return [ds.at(start + j + 1) for j in range(n + 1)]
+
+
 def create_partial_expression(scheme, expr, ind, loc):
     """
     This method returns a function which applies a discretization scheme
@@ -402,14 +424,14 @@ def add_continuity_equations(block, d, i, loc):
         afinal = s.get_discretization_info()['afinal']
 
         def _fun(i):
-            tmp = list(s)
             idx = s.ord(i) - 1
             low = s.get_lower_element_boundary(i)
             if i != low or idx == 0:
                 raise IndexError("list index out of range")
-            low = s.get_lower_element_boundary(tmp[idx - 1])
+            low = s.get_lower_element_boundary(s.at(idx))
             lowidx = s.ord(low) - 1
-            return sum(v(tmp[lowidx + j]) * afinal[j] for j in range(ncp + 1))
+            tmp = _element_points(s, lowidx, ncp)
+            return sum(v(tmp[j]) * afinal[j] for j in range(ncp + 1))
 
         return _fun
 
@@ -32,6 +32,7 @@ from pyomo.dae.misc import add_discretization_equations
 from pyomo.dae.misc import add_continuity_equations
 from pyomo.dae.misc import block_fully_discretized
 from pyomo.dae.misc import get_index_information
+from pyomo.dae.misc import _element_points
 from pyomo.dae.diffvar import DAE_Error
 
 from pyomo.common.config import ConfigBlock, ConfigValue, PositiveInt, In
@@ -44,16 +45,14 @@ def _lagrange_radau_transform(v, s):
     adot = s.get_discretization_info()['adot']
 
     def _fun(i):
-        tmp = list(s)
         idx = s.ord(i) - 1
         if idx == 0:  # Don't apply this equation at initial point
             raise IndexError("list index out of range")
         low = s.get_lower_element_boundary(i)
         lowidx = s.ord(low) - 1
+        tmp = _element_points(s, lowidx, ncp)
         return sum(
-            v(tmp[lowidx + j])
-            * adot[j][idx - lowidx]
-            * (1.0 / (tmp[lowidx + ncp] - tmp[lowidx]))
+            v(tmp[j]) * adot[j][idx - lowidx] * (1.0 / (tmp[ncp] - tmp[0]))
             for j in range(ncp + 1)
         )
 
@@ -65,17 +64,15 @@ def _lagrange_radau_transform_order2(v, s):
     adotdot = s.get_discretization_info()['adotdot']
 
     def _fun(i):
-        tmp = list(s)
         idx = s.ord(i) - 1
         if idx == 0:
             # Don't apply this equation at initial point
             raise IndexError("list index out of range")
         low = s.get_lower_element_boundary(i)
         lowidx = s.ord(low) - 1
+        tmp = _element_points(s, lowidx, ncp)
         return sum(
-            v(tmp[lowidx + j])
-            * adotdot[j][idx - lowidx]
-            * (1.0 / (tmp[lowidx + ncp] - tmp[lowidx]) ** 2)
+            v(tmp[j]) * adotdot[j][idx - lowidx] * (1.0 / (tmp[ncp] - tmp[0]) ** 2)
             for j in range(ncp + 1)
         )
 
@@ -87,7 +84,6 @@ def _lagrange_legendre_transform(v, s):
     adot = s.get_discretization_info()['adot']
 
     def _fun(i):
-        tmp = list(s)
         idx = s.ord(i) - 1
         if idx == 0:
             # Don't apply this equation at initial point
@@ -98,10 +94,9 @@ def _lagrange_legendre_transform(v, s):
             raise IndexError("list index out of range")
         low = s.get_lower_element_boundary(i)
         lowidx = s.ord(low) - 1
+        tmp = _element_points(s, lowidx, ncp + 1)
         return sum(
-            v(tmp[lowidx + j])
-            * adot[j][idx - lowidx]
-            * (1.0 / (tmp[lowidx + ncp + 1] - tmp[lowidx]))
+            v(tmp[j]) * adot[j][idx - lowidx] * (1.0 / (tmp[ncp + 1] - tmp[0]))
             for j in range(ncp + 1)
         )
 
@@ -113,7 +108,6 @@ def _lagrange_legendre_transform_order2(v, s):
     adotdot = s.get_discretization_info()['adotdot']
 
     def _fun(i):
-        tmp = list(s)
         idx = s.ord(i) - 1
         if idx == 0:
             # Don't apply this equation at initial point
@@ -124,10 +118,9 @@ def _lagrange_legendre_transform_order2(v, s):
             raise IndexError("list index out of range")
         low = s.get_lower_element_boundary(i)
         lowidx = s.ord(low) - 1
+        tmp = _element_points(s, lowidx, ncp + 1)
         return sum(
-            v(tmp[lowidx + j])
-            * adotdot[j][idx - lowidx]
-            * (1.0 / (tmp[lowidx + ncp + 1] - tmp[lowidx]) ** 2)
+            v(tmp[j]) * adotdot[j][idx - lowidx] * (1.0 / (tmp[ncp + 1] - tmp[0]) ** 2)
             for j in range(ncp + 1)
         )
 
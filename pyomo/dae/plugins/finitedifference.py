@@ -21,6 +21,7 @@ from pyomo.dae.misc import expand_components
 from pyomo.dae.misc import create_partial_expression
 from pyomo.dae.misc import add_discretization_equations
 from pyomo.dae.misc import block_fully_discretized
+from pyomo.dae.misc import _element_points
 from pyomo.dae.diffvar import DAE_Error
 
 from pyomo.common.config import ConfigBlock, ConfigValue, PositiveInt, In
@@ -35,11 +36,11 @@ def _central_transform(v, s):
     """
 
     def _ctr_fun(i):
-        tmp = list(s)
         idx = s.ord(i) - 1
         if idx == 0:  # Needed since '-1' is considered a valid index in Python
             raise IndexError("list index out of range")
-        return 1 / (tmp[idx + 1] - tmp[idx - 1]) * (v(tmp[idx + 1]) - v(tmp[idx - 1]))
+        tmp = _element_points(s, idx - 1, 2)
+        return 1 / (tmp[2] - tmp[0]) * (v(tmp[2]) - v(tmp[0]))
 
     return _ctr_fun
 
@@ -51,14 +52,14 @@ def _central_transform_order2(v, s):
     """
 
     def _ctr_fun2(i):
-        tmp = list(s)
         idx = s.ord(i) - 1
         if idx == 0:  # Needed since '-1' is considered a valid index in Python
             raise IndexError("list index out of range")
+        tmp = _element_points(s, idx - 1, 2)
         return (
             1
-            / ((tmp[idx + 1] - tmp[idx]) * (tmp[idx] - tmp[idx - 1]))
-            * (v(tmp[idx + 1]) - 2 * v(tmp[idx]) + v(tmp[idx - 1]))
+            / ((tmp[2] - tmp[1]) * (tmp[1] - tmp[0]))
+            * (v(tmp[2]) - 2 * v(tmp[1]) + v(tmp[0]))
         )
 
     return _ctr_fun2
@@ -70,9 +71,9 @@ def _forward_transform(v, s):
     """
 
     def _fwd_fun(i):
-        tmp = list(s)
         idx = s.ord(i) - 1
-        return 1 / (tmp[idx + 1] - tmp[idx]) * (v(tmp[idx + 1]) - v(tmp[idx]))
+        tmp = _element_points(s, idx, 1)
+        return 1 / (tmp[1] - tmp[0]) * (v(tmp[1]) - v(tmp[0]))
 
     return _fwd_fun
 
@@ -83,12 +84,12 @@ def _forward_transform_order2(v, s):
     """
 
     def _fwd_fun(i):
-        tmp = list(s)
         idx = s.ord(i) - 1
+        tmp = _element_points(s, idx, 2)
         return (
             1
-            / ((tmp[idx + 2] - tmp[idx + 1]) * (tmp[idx + 1] - tmp[idx]))
-            * (v(tmp[idx + 2]) - 2 * v(tmp[idx + 1]) + v(tmp[idx]))
+            / ((tmp[2] - tmp[1]) * (tmp[1] - tmp[0]))
+            * (v(tmp[2]) - 2 * v(tmp[1]) + v(tmp[0]))
         )
 
     return _fwd_fun
@@ -100,11 +101,11 @@ def _backward_transform(v, s):
     """
 
     def _bwd_fun(i):
-        tmp = list(s)
         idx = s.ord(i) - 1
         if idx == 0:  # Needed since '-1' is considered a valid index in Python
             raise IndexError("list index out of range")
-        return 1 / (tmp[idx] - tmp[idx - 1]) * (v(tmp[idx]) - v(tmp[idx - 1]))
+        tmp = _element_points(s, idx - 1, 1)
+        return 1 / (tmp[1] - tmp[0]) * (v(tmp[1]) - v(tmp[0]))
 
     return _bwd_fun
 
@@ -116,16 +117,16 @@ def _backward_transform_order2(v, s):
     """
 
     def _bwd_fun(i):
-        tmp = list(s)
         idx = s.ord(i) - 1
 
         # This check is needed since '-1' is considered a valid index in Python
         if idx == 0 or idx == 1:
             raise IndexError("list index out of range")
+        tmp = _element_points(s, idx - 2, 2)
         return (
             1
-            / ((tmp[idx - 1] - tmp[idx - 2]) * (tmp[idx] - tmp[idx - 1]))
-            * (v(tmp[idx]) - 2 * v(tmp[idx - 1]) + v(tmp[idx - 2]))
+            / ((tmp[1] - tmp[0]) * (tmp[2] - tmp[1]))
+            * (v(tmp[2]) - 2 * v(tmp[1]) + v(tmp[0]))
         )
 
     return _bwd_fun
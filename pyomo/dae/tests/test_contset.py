@@ -166,6 +166,8 @@ class TestContinuousSet(unittest.TestCase):
         self.assertEqual(m.t.get_upper_element_boundary(1.5), 2)
         self.assertEqual(m.t.get_upper_element_boundary(2.5), 3)
         self.assertEqual(m.t.get_upper_element_boundary(2), 2)
+        self.assertEqual(m.t.get_upper_element_boundary(1), 1)
+        self.assertEqual(m.t.get_upper_element_boundary(3), 3)
 
         log_out = StringIO()
         with LoggingIntercept(log_out, 'pyomo.dae'):
@@ -179,6 +181,15 @@ class TestContinuousSet(unittest.TestCase):
         self.assertEqual(m.t.get_lower_element_boundary(1.5), 1)
         self.assertEqual(m.t.get_lower_element_boundary(2.5), 2)
         self.assertEqual(m.t.get_lower_element_boundary(2), 2)
+        self.assertEqual(m.t.get_lower_element_boundary(1), 1)
+        self.assertEqual(m.t.get_lower_element_boundary(3), 3)
+
+        # Radau collocation places a point on the upper element boundary
+        m.t._discretization_info['scheme'] = 'LAGRANGE-RADAU'
+        self.assertEqual(m.t.get_lower_element_boundary(1), 1)
+        self.assertEqual(m.t.get_lower_element_boundary(2), 1)
+        self.assertEqual(m.t.get_lower_element_boundary(3), 2)
+        self.assertEqual(m.t.get_lower_element_boundary(2.5), 2)
 
         log_out = StringIO()
         with LoggingIntercept(log_out, 'pyomo.dae'):
@@ -250,6 +250,7 @@ from pyomo.core import (
     BooleanSet,
     prod,
     quicksum,
+    linear_sum,
     sum_product,
     dot_product,
     summation,
@@ -302,6 +302,7 @@ class BigM_Transformation(GDP_to_MIP_Transformation, _BigM_MixIn):
             c = obj[i]
             if not c.active:
                 continue
+            c_lower, c_upper = c.lower, c.upper
 
             lower = (None, None, None)
             upper = (None, None, None)
@@ -318,8 +319,8 @@ class BigM_Transformation(GDP_to_MIP_Transformation, _BigM_MixIn):
                 )
 
             # if we didn't get something we need from args, try suffixes:
-            if (M[0] is None and c.lower is not None) or (
-                M[1] is None and c.upper is not None
+            if (M[0] is None and c_lower is not None) or (
+                M[1] is None and c_upper is not None
             ):
                 # first get anything parent to c but below disjunct
                 suffix_list = _get_bigM_suffix_list(
@@ -338,12 +339,17 @@ class BigM_Transformation(GDP_to_MIP_Transformation, _BigM_MixIn):
                     "after checking suffixes is %s." % (c.name, str(M))
                 )
 
-            if c.lower is not None and M[0] is None:
-                M = (self._estimate_M(c.body, c)[0] - c.lower, M[1])
-                lower = (M[0], None, None)
-            if c.upper is not None and M[1] is None:
-                M = (M[0], self._estimate_M(c.body, c)[1] - c.upper)
-                upper = (M[1], None, None)
+            need_lower = c_lower is not None and M[0] is None
+            need_upper = c_upper is not None and M[1] is None
+            if need_lower or need_upper:
+                # (only walk the body once, even for equality constraints)
+                body_bounds = self._estimate_M(c.body, c)
+                if need_lower:
+                    M = (body_bounds[0] - c_lower, M[1])
+                    lower = (M[0], None, None)
+                if need_upper:
+                    M = (M[0], body_bounds[1] - c_upper)
+                    upper = (M[1], None, None)
 
             if self._generate_debug_messages:
                 logger.debug(
@@ -253,27 +253,30 @@ class _BigM_MixIn(object):
         name = c.local_name + "_%s" % unique
         if indicator_expression is None:
             indicator_expression = 1 - indicator_var
+        # (each of these standardizes the constraint expression, so we
+        # only query them once)
+        lower, body, upper = c.lower, c.body, c.upper
 
-        if c.lower is not None:
+        if lower is not None:
             if M[0] is None:
                 raise GDP_Error(
                     "Cannot relax disjunctive constraint '%s' "
                     "because M is not defined." % name
                 )
             M_expr = M[0] * indicator_expression
-            newConstraint.add((name, i, 'lb'), c.lower <= c.body - M_expr)
+            newConstraint.add((name, i, 'lb'), lower <= body - M_expr)
             constraint_map.transformed_constraints[c].append(
                 newConstraint[name, i, 'lb']
             )
             constraint_map.src_constraint[newConstraint[name, i, 'lb']] = c
-        if c.upper is not None:
+        if upper is not None:
             if M[1] is None:
                 raise GDP_Error(
                     "Cannot relax disjunctive constraint '%s' "
                     "because M is not defined." % name
                 )
             M_expr = M[1] * indicator_expression
-            newConstraint.add((name, i, 'ub'), c.body - M_expr <= c.upper)
+            newConstraint.add((name, i, 'ub'), body - M_expr <= upper)
             constraint_map.transformed_constraints[c].append(
                 newConstraint[name, i, 'ub']
             )
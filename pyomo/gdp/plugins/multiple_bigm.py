@@ -9,11 +9,15 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import hashlib
 import itertools
+import json
 import logging
+import os
+import pickle
 
 from pyomo.common.collections import ComponentMap, ComponentSet
-from pyomo.common.config import ConfigDict, ConfigValue
+from pyomo.common.config import ConfigDict, ConfigValue, Path
 from pyomo.common.gc_manager import PauseGC
 from pyomo.common.modeling import unique_component_name
 
@@ -38,7 +42,7 @@ from pyomo.core import (
     value,
     Var,
 )
-from pyomo.core.base import Reference, TransformationFactory
+from pyomo.core.base import ComponentUID, Reference, TransformationFactory
 import pyomo.core.expr as EXPR
 from pyomo.core.util import target_list
 
@@ -80,6 +84,52 @@ def Solver(val):
     return val
 
 
+def _solve_M_subproblem(solver, disjunct, scratch, constraint, sense):
+    # Optimize the constraint body over the Disjunct, returning the
+    # termination condition and the optimal objective value (None if the
+    # solve was not successful).
+    scratch.obj.expr = constraint.body - (
+        constraint.lower if sense == minimize else constraint.upper
+    )
+    scratch.obj.sense = sense
+    results = solver.solve(disjunct, load_solutions=False)
+    termination_condition = results.solver.termination_condition
+    if termination_condition is not TerminationCondition.optimal:
+        return termination_condition, None
+    disjunct.solutions.load_from(results)
+    return termination_condition, value(scratch.obj.expr)
+
+
+def _solve_M_subproblems(model_data, disjunct_cuid, scratch_cuid, objectives):
+    # Executor task: solve a sequence of M value subproblems for a single
+    # Disjunct on a private copy of the model.
+    model, solver = pickle.loads(model_data)
+    disjunct = disjunct_cuid.find_component_on(model)
+    scratch = scratch_cuid.find_component_on(model)
+    return [
+        _solve_M_subproblem(
+            solver, disjunct, scratch, cuid.find_component_on(model), sense
+        )
+        for cuid, sense in objectives
+    ]
+
+
+def _subproblem_expr_data(expr):
+    # Hashable description of an expression (including the current
+    # parameter values and the bounds and domains of the variables in it)
+    # for the M value cache.
+    repn = generate_standard_repn(expr, compute_values=True, quadratic=False)
+    return (
+        repn.constant,
+        tuple(zip((v.name for v in repn.linear_vars), repn.linear_coefs)),
+        None if repn.nonlinear_expr is None else str(repn.nonlinear_expr),
+        tuple(
+            (v.name, v.lb, v.ub, v.is_integer())
+            for v in itertools.chain(repn.linear_vars, repn.nonlinear_vars)
+        ),
+    )
+
+
 @TransformationFactory.register(
     'gdp.mbigm',
     doc="Relax disjunctive model using big-M terms specific to each disjunct",
@@ -141,6 +191,46 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
             "calculating the M values",
         ),
     )
+    CONFIG.declare(
+        'executor',
+        ConfigValue(
+            default=None,
+            description="Executor used to solve the M value subproblems in parallel",
+            doc="""
+        A concurrent.futures.Executor (e.g., a ProcessPoolExecutor) used to
+        solve the subproblems for calculating the M values in parallel. The
+        subproblems for each Disjunct are solved in a single task, which
+        works on its own (unpickled) copy of the model and solver, so both
+        the model and the solver must be picklable. If None (default), the
+        subproblems are solved serially.
+        """,
+        ),
+    )
+    CONFIG.declare(
+        'M_value_cache',
+        ConfigValue(
+            default=None,
+            domain=Path(),
+            description="File in which to cache calculated M values",
+            doc="""
+        Path to a JSON file used to cache the M values calculated by solving
+        subproblems. Each entry is keyed by a hash of the subproblem data: the
+        constraint being relaxed, the constraints on the Disjunct being
+        selected, the bounds, domains, and (fixed) values of the variables
+        involved, and the solver name. Cached values are therefore only reused
+        for subproblems that are unchanged, which makes re-transforming a
+        re-parameterized model cheap when most of the subproblems are not
+        affected by the changes. The file is created if it does not exist and
+        is updated with any newly calculated values.
+
+        Note that the key does not include the solver options or
+        tolerances: a cache populated with one set of solver settings will
+        return the (possibly stale) M values computed with those settings
+        when it is reused with different settings. Use a separate cache file
+        (or delete the file) when changing the solver options.
+        """,
+        ),
+    )
     CONFIG.declare(
         'bigM',
         ConfigValue(
@@ -222,6 +312,8 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
     def __init__(self):
         super().__init__(logger)
         self._arg_list = {}
+        self._M_cache = None
+        self._M_cache_keys = {}
         self._set_up_expr_bound_visitor()
         self.handlers[Suffix] = self._warn_for_active_suffix
 
@@ -234,6 +326,8 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
                 self._restore_state()
                 self.used_args.clear()
                 self._arg_list.clear()
+                self._M_cache = None
+                self._M_cache_keys.clear()
                 self._expr_bound_visitor.leaf_bounds.clear()
                 self._expr_bound_visitor.use_fixed_var_values_as_bounds = False
 
@@ -255,6 +349,8 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
                 "multiple bigm."
             )
 
+        self._load_M_cache()
+
         # filter out inactive targets and handle case where targets aren't
         # specified.
         targets = self._filter_targets(instance)
@@ -280,6 +376,8 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
                     root_disjunct=gdp_tree.root_disjunct(t),
                 )
 
+        self._save_M_cache()
+
         # issue warnings about anything that was in the bigM args dict that we
         # didn't use
         _warn_for_unused_bigM_args(self._config.bigM, self.used_args, logger)
@@ -592,6 +690,9 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
     ):
         scratch_blocks = {}
         all_vars = list(self._get_all_var_objects(active_disjuncts))
+        # First collect all of the subproblems (in the order we will process
+        # them) so that we can solve them in parallel if requested.
+        subproblems = []
         for disjunct, other_disjunct in itertools.product(
             active_disjuncts, active_disjuncts
         ):
@@ -631,36 +732,54 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
                     self.used_args[constraint, other_disjunct] = (lower_M, upper_M)
                 else:
                     (lower_M, upper_M) = (None, None)
-                unsuccessful_solve_msg = (
-                    "Unsuccessful solve to calculate M value to "
-                    "relax constraint '%s' on Disjunct '%s' when "
-                    "Disjunct '%s' is selected."
-                    % (constraint.name, disjunct.name, other_disjunct.name)
+                subproblems.append(
+                    (disjunct, constraint, other_disjunct, scratch, lower_M, upper_M)
                 )
-                if constraint.lower is not None and lower_M is None:
-                    # last resort: calculate
-                    if lower_M is None:
-                        scratch.obj.expr = constraint.body - constraint.lower
-                        scratch.obj.sense = minimize
-                        lower_M = self._solve_disjunct_for_M(
-                            other_disjunct,
-                            scratch,
-                            unsuccessful_solve_msg,
-                            active_disjuncts,
-                        )
-                if constraint.upper is not None and upper_M is None:
-                    # last resort: calculate
-                    if upper_M is None:
-                        scratch.obj.expr = constraint.body - constraint.upper
-                        scratch.obj.sense = maximize
-                        upper_M = self._solve_disjunct_for_M(
-                            other_disjunct,
-                            scratch,
-                            unsuccessful_solve_msg,
-                            active_disjuncts,
-                        )
-                arg_Ms[constraint, other_disjunct] = (lower_M, upper_M)
-                transBlock._mbm_values[constraint, other_disjunct] = (lower_M, upper_M)
+
+        # Solve (or look up) everything we are going to need up front if
+        # we are solving in parallel
+        solved = {}
+        if self._config.executor is not None:
+            solved = self._solve_M_subproblems_in_parallel(subproblems)
+
+        for (
+            disjunct,
+            constraint,
+            other_disjunct,
+            scratch,
+            lower_M,
+            upper_M,
+        ) in subproblems:
+            unsuccessful_solve_msg = (
+                "Unsuccessful solve to calculate M value to "
+                "relax constraint '%s' on Disjunct '%s' when "
+                "Disjunct '%s' is selected."
+                % (constraint.name, disjunct.name, other_disjunct.name)
+            )
+            if constraint.lower is not None and lower_M is None:
+                # last resort: calculate
+                lower_M = self._solve_disjunct_for_M(
+                    other_disjunct,
+                    scratch,
+                    unsuccessful_solve_msg,
+                    active_disjuncts,
+                    constraint,
+                    minimize,
+                    solved,
+                )
+            if constraint.upper is not None and upper_M is None:
+                # last resort: calculate
+                upper_M = self._solve_disjunct_for_M(
+                    other_disjunct,
+                    scratch,
+                    unsuccessful_solve_msg,
+                    active_disjuncts,
+                    constraint,
+                    maximize,
+                    solved,
+                )
+            arg_Ms[constraint, other_disjunct] = (lower_M, upper_M)
+            transBlock._mbm_values[constraint, other_disjunct] = (lower_M, upper_M)
 
         # clean up the scratch blocks
         for blk in scratch_blocks.values():
@@ -668,8 +787,61 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
 
         return arg_Ms
 
+    def _solve_M_subproblems_in_parallel(self, subproblems):
+        # Group the subproblems that we actually need to solve by the
+        # Disjunct being selected: each group is a single task that
+        # solves the subproblems in sequence on its own copy of the
+        # model.
+        tasks = {}
+        for _, constraint, other_disjunct, scratch, lower_M, upper_M in subproblems:
+            for bound, M, sense in (
+                (constraint.lower, lower_M, minimize),
+                (constraint.upper, upper_M, maximize),
+            ):
+                if bound is None or M is not None:
+                    continue
+                if self._get_cached_M(constraint, other_disjunct, sense) is not None:
+                    continue
+                if id(other_disjunct) not in tasks:
+                    tasks[id(other_disjunct)] = (other_disjunct, scratch, [])
+                tasks[id(other_disjunct)][2].append((constraint, sense))
+        if not tasks:
+            return {}
+
+        model = next(iter(tasks.values()))[0].model()
+        try:
+            model_data = pickle.dumps((model, self._config.solver))
+        except Exception as e:
+            raise GDP_Error(
+                "Solving the M value subproblems in parallel requires that "
+                "the model and the solver are picklable, but pickling failed "
+                "with:\n\t%s: %s" % (type(e).__name__, e)
+            ) from e
+        futures = {
+            key: self._config.executor.submit(
+                _solve_M_subproblems,
+                model_data,
+                ComponentUID(other_disjunct),
+                ComponentUID(scratch),
+                [(ComponentUID(c), sense) for c, sense in objectives],
+            )
+            for key, (other_disjunct, scratch, objectives) in tasks.items()
+        }
+        solved = {}
+        for key, (other_disjunct, scratch, objectives) in tasks.items():
+            for (constraint, sense), result in zip(objectives, futures[key].result()):
+                solved[id(constraint), id(other_disjunct), sense] = result
+        return solved
+
     def _solve_disjunct_for_M(
-        self, other_disjunct, scratch_block, unsuccessful_solve_msg, active_disjuncts
+        self,
+        other_disjunct,
+        scratch_block,
+        unsuccessful_solve_msg,
+        active_disjuncts,
+        constraint,
+        sense,
+        solved,
     ):
         if not other_disjunct.active:
             # If a Disjunct is infeasible, we will discover that and deactivate
@@ -681,8 +853,17 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
 
         solver = self._config.solver
 
-        results = solver.solve(other_disjunct, load_solutions=False)
-        if results.solver.termination_condition is TerminationCondition.infeasible:
+        result = solved.get((id(constraint), id(other_disjunct), sense), None)
+        if result is None:
+            result = self._get_cached_M(constraint, other_disjunct, sense)
+        if result is None:
+            result = _solve_M_subproblem(
+                solver, other_disjunct, scratch_block, constraint, sense
+            )
+        termination_condition, M = result
+        self._cache_M(constraint, other_disjunct, sense, result)
+
+        if termination_condition is TerminationCondition.infeasible:
             # [2/18/24]: TODO: After the solver rewrite is complete, we will not
             # need this check since we can actually determine from the
             # termination condition whether or not the solver proved
@@ -707,13 +888,88 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
                 # this so that we check for 'proven_infeasible'
                 # and then we can abandon this hack
                 raise GDP_Error(unsuccessful_solve_msg)
-        elif results.solver.termination_condition is not TerminationCondition.optimal:
+        elif termination_condition is not TerminationCondition.optimal:
             raise GDP_Error(unsuccessful_solve_msg)
-        else:
-            other_disjunct.solutions.load_from(results)
-            M = value(scratch_block.obj.expr)
         return M
 
+    def _load_M_cache(self):
+        self._M_cache = None
+        self._M_cache_keys.clear()
+        fname = self._config.M_value_cache
+        if fname is None:
+            return
+        self._M_cache = {}
+        if os.path.exists(fname):
+            with open(fname) as FILE:
+                data = json.load(FILE)
+            for key, (termination_condition, M) in data['M_values'].items():
+                self._M_cache[key] = (TerminationCondition(termination_condition), M)
+
+    def _save_M_cache(self):
+        if self._M_cache is None:
+            return
+        fname = self._config.M_value_cache
+        data = {
+            'version': 1,
+            'M_values': {
+                key: (str(termination_condition), M)
+                for key, (termination_condition, M) in self._M_cache.items()
+            },
+        }
+        # Write to a temporary file and then move it into place so that
+        # an interrupted write never leaves a corrupt cache behind
+        tmp = fname + '.tmp'
+        with open(tmp, 'w') as FILE:
+            json.dump(data, FILE)
+        os.replace(tmp, fname)
+
+    def _get_cached_M(self, constraint, other_disjunct, sense):
+        if self._M_cache is None:
+            return None
+        return self._M_cache.get(
+            self._M_cache_key(constraint, other_disjunct, sense), None
+        )
+
+    def _cache_M(self, constraint, other_disjunct, sense, result):
+        # We only cache definitive answers
+        if self._M_cache is None or result[0] not in (
+            TerminationCondition.optimal,
+            TerminationCondition.infeasible,
+        ):
+            return
+        self._M_cache[self._M_cache_key(constraint, other_disjunct, sense)] = result
+
+    def _M_cache_key(self, constraint, other_disjunct, sense):
+        key = (id(constraint), id(other_disjunct), sense)
+        if key in self._M_cache_keys:
+            return self._M_cache_keys[key]
+        if id(other_disjunct) not in self._M_cache_keys:
+            # The data for the Disjunct being selected is the same for
+            # every constraint, so we only generate it once
+            data = []
+            for c in other_disjunct.component_data_objects(
+                Constraint,
+                active=True,
+                descend_into=Block,
+                sort=SortComponents.deterministic,
+            ):
+                data.append(
+                    (value(c.lower), value(c.upper), _subproblem_expr_data(c.body))
+                )
+            self._M_cache_keys[id(other_disjunct)] = data
+        if sense == minimize:
+            obj = constraint.body - constraint.lower
+        else:
+            obj = constraint.body - constraint.upper
+        data = (
+            self._config.solver.name,
+            sense,
+            _subproblem_expr_data(obj),
+            self._M_cache_keys[id(other_disjunct)],
+        )
+        ans = self._M_cache_keys[key] = hashlib.sha256(repr(data).encode()).hexdigest()
+        return ans
+
     def _warn_for_active_suffix(self, suffix, disjunct, active_disjuncts, Ms):
         if suffix.local_name == 'BigM':
             logger.debug(
@@ -9,13 +9,17 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from io import StringIO
 import logging
+import os
 from os.path import join, normpath
 import pickle
 
+from pyomo.common.dependencies import numpy as np, scipy, scipy_available
 from pyomo.common.fileutils import import_file, PYOMO_ROOT_DIR
 from pyomo.common.log import LoggingIntercept
+from pyomo.common.tempfiles import TempfileManager
 import pyomo.common.unittest as unittest
 from pyomo.core.expr.compare import (
     assertExpressionsEqual,
@@ -27,13 +31,16 @@ from pyomo.environ import (
     ConcreteModel,
     Constraint,
     LogicalConstraint,
+    maximize,
     NonNegativeIntegers,
+    Objective,
     SolverFactory,
     Suffix,
     TransformationFactory,
     value,
     Var,
 )
+from pyomo.core.base.PyomoModel import ModelSolutions
 from pyomo.gdp import Disjunct, Disjunction, GDP_Error
 from pyomo.gdp.tests.common_tests import (
     check_linear_coef,
@@ -42,6 +49,7 @@ from pyomo.gdp.tests.common_tests import (
     check_pprint_equal,
 )
 from pyomo.gdp.tests.models import make_indexed_equality_model
+from pyomo.opt import SolverResults, SolverStatus, TerminationCondition
 from pyomo.repn import generate_standard_repn
 
 gurobi_available = (
@@ -51,6 +59,69 @@ gurobi_available = (
 exdir = normpath(join(PYOMO_ROOT_DIR, 'examples', 'gdp'))
 
 
+class LinprogSolver(object):
+    """A minimal (picklable) LP solver built on scipy.optimize.linprog for
+    testing the M value calculations without a licensed solver"""
+
+    name = 'scipy_highs'
+
+    def __init__(self):
+        self.num_solves = 0
+
+    def solve(self, blk, load_solutions=True):
+        self.num_solves += 1
+        if not hasattr(blk, 'solutions'):
+            # (the writers attach this when solving a Block)
+            blk.solutions = ModelSolutions(blk)
+        obj = next(blk.component_data_objects(Objective, active=True))
+        repns = [(generate_standard_repn(obj.expr), None, None)] + [
+            (generate_standard_repn(c.body), value(c.lower), value(c.upper))
+            for c in blk.component_data_objects(Constraint, active=True)
+        ]
+        idx = {}
+        for repn, _, _ in repns:
+            for v in repn.linear_vars:
+                idx.setdefault(id(v), (len(idx), v))
+        rows = []
+        for repn, _, _ in repns:
+            row = np.zeros(len(idx))
+            for v, coef in zip(repn.linear_vars, repn.linear_coefs):
+                row[idx[id(v)][0]] += coef
+            rows.append(row)
+        A_ub, b_ub, A_eq, b_eq = [], [], [], []
+        for row, (repn, lb, ub) in zip(rows[1:], repns[1:]):
+            if lb is not None and lb == ub:
+                A_eq.append(row)
+                b_eq.append(lb - repn.constant)
+                continue
+            if lb is not None:
+                A_ub.append(-row)
+                b_ub.append(repn.constant - lb)
+            if ub is not None:
+                A_ub.append(row)
+                b_ub.append(ub - repn.constant)
+        sign = -1 if obj.sense == maximize else 1
+        res = scipy.optimize.linprog(
+            sign * rows[0],
+            A_ub=np.array(A_ub) if A_ub else None,
+            b_ub=b_ub or None,
+            A_eq=np.array(A_eq) if A_eq else None,
+            b_eq=b_eq or None,
+            bounds=[(v.lb, v.ub) for _, v in idx.values()],
+        )
+        results = SolverResults()
+        results.solver.status = SolverStatus.ok
+        if res.status == 0:
+            results.solver.termination_condition = TerminationCondition.optimal
+            for (i, v), val in zip(idx.values(), res.x):
+                v.set_value(val, skip_validation=True)
+        elif res.status == 2:
+            results.solver.termination_condition = TerminationCondition.infeasible
+        else:
+            results.solver.termination_condition = TerminationCondition.error
+        return results
+
+
 class CommonTests(unittest.TestCase):
     def check_pretty_bound_constraints(self, cons, var, bounds, lb):
         self.assertEqual(value(cons.upper), 0)
@@ -344,6 +415,67 @@ class LinearModelDecisionTreeExample(CommonTests):
 
         self.assertStructuredAlmostEqual(mbm.get_all_M_values(m), self.get_Ms(m))
 
+    @unittest.skipUnless(scipy_available, "SciPy is not available")
+    def test_calculated_Ms_serial_and_parallel(self):
+        for executor in (None, ThreadPoolExecutor(2), ProcessPoolExecutor(2)):
+            m = self.make_model()
+            mbm = TransformationFactory('gdp.mbigm')
+            mbm.apply_to(
+                m,
+                reduce_bound_constraints=False,
+                solver=LinprogSolver(),
+                executor=executor,
+            )
+            if executor is not None:
+                executor.shutdown()
+
+            self.check_all_untightened_bounds_constraints(m, mbm)
+            self.check_linear_func_constraints(m, mbm)
+            self.assertStructuredAlmostEqual(mbm.get_all_M_values(m), self.get_Ms(m))
+
+    @unittest.skipUnless(scipy_available, "SciPy is not available")
+    def test_calculated_Ms_cached(self):
+        with TempfileManager.new_context() as tempfile:
+            fname = os.path.join(tempfile.mkdtemp(), 'M_values.json')
+
+            m = self.make_model()
+            solver = LinprogSolver()
+            mbm = TransformationFactory('gdp.mbigm')
+            mbm.apply_to(
+                m, reduce_bound_constraints=False, solver=solver, M_value_cache=fname
+            )
+            self.assertTrue(os.path.exists(fname))
+            # 9 constraints, 2 bounds each, 2 other Disjuncts
+            self.assertEqual(solver.num_solves, 36)
+            self.assertStructuredAlmostEqual(mbm.get_all_M_values(m), self.get_Ms(m))
+
+            # Nothing changed, so everything comes from the cache
+            m = self.make_model()
+            solver = LinprogSolver()
+            mbm.apply_to(
+                m, reduce_bound_constraints=False, solver=solver, M_value_cache=fname
+            )
+            self.assertEqual(solver.num_solves, 0)
+            self.check_all_untightened_bounds_constraints(m, mbm)
+            self.check_linear_func_constraints(m, mbm)
+            self.assertStructuredAlmostEqual(mbm.get_all_M_values(m), self.get_Ms(m))
+
+            # Changing a constraint on d3 only invalidates the subproblems
+            # where d3 is selected and the ones relaxing that constraint
+            m = self.make_model()
+            m.d3.x2_bounds.set_value((0.55, m.x2, 1.5))
+            solver = LinprogSolver()
+            mbm.apply_to(
+                m, reduce_bound_constraints=False, solver=solver, M_value_cache=fname
+            )
+            # (6 constraints relaxed when d3 is selected, plus the upper
+            # bound of d3.x2_bounds relaxed when d1 or d2 is selected)
+            self.assertEqual(solver.num_solves, 14)
+            Ms = mbm.get_all_M_values(m)
+            self.assertAlmostEqual(Ms[m.d1.x2_bounds, m.d3][1], -1.5)
+            self.assertAlmostEqual(Ms[m.d3.x2_bounds, m.d1][1], 1.5)
+            self.assertAlmostEqual(Ms[m.d1.x1_bounds, m.d2][1], 1)
+
     def test_transformed_constraints_correct_Ms_specified(self):
         m = self.make_model()
         mbm = TransformationFactory('gdp.mbigm')
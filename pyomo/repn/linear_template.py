@@ -86,6 +86,7 @@ class LinearTemplateRepn(LinearRepn):
         repetitions,
         remove_fixed_vars,
         check_duplicates,
+        var_order,
     ):
         ans = []
         multiplier *= self.multiplier
@@ -126,6 +127,9 @@ class LinearTemplateRepn(LinearRepn):
                         #
                         # Remove the 'v = ' from the beginning of the last line:
                         k = ans.pop()[4:]
+            elif var_order is not None:
+                # This is a (non-templated) VarData: map it to its column
+                k = var_order[k]
             if check_duplicates:
                 ans.append(indent + f'if {k} in linear:')
                 ans.append(indent + f'    linear[{k}] += {coef}')
@@ -159,6 +163,7 @@ class LinearTemplateRepn(LinearRepn):
                 repetitions * subrep,
                 remove_fixed_vars,
                 check_duplicates,
+                var_order,
             )
             indent = '    ' * (len(subsets))
             ans.extend(indent + line for line in subans)
@@ -173,9 +178,10 @@ class LinearTemplateRepn(LinearRepn):
         args,
         remove_fixed_vars=False,
         check_duplicates=False,
+        var_order=None,
     ):
         ans, constant = self._build_evaluator(
-            smap, expr_cache, 1, 1, remove_fixed_vars, check_duplicates
+            smap, expr_cache, 1, 1, remove_fixed_vars, check_duplicates, var_order
         )
         if not ans:
             return constant
@@ -303,45 +309,56 @@ class LinearTemplateRepnVisitor(linear.LinearRepnVisitor):
         else:
             return node.args, []
 
-    def expand_expression(self, obj, template_info):
-        env = self.env
+    def _compile_template(self, obj, template_info):
         try:
-            body, lb, ub = self.expanded_templates[id(template_info)]
+            return self.expanded_templates[id(template_info)]
         except KeyError:
-            smap = self.symbolmap
-            expr, indices = template_info
-            args = [smap.getSymbol(i) for i in indices]
-            if expr.is_expression_type(ExpressionType.RELATIONAL):
-                lb, body, ub = obj.to_bounded_expression()
-                if body is not None:
-                    body = self.walk_expression(body).compile(
-                        env, smap, self.expr_cache, args, False
-                    )
-                if lb is not None:
-                    lb = self.walk_expression(lb).compile(
-                        env, smap, self.expr_cache, args, True
-                    )
-                if ub is not None:
-                    ub = self.walk_expression(ub).compile(
-                        env, smap, self.expr_cache, args, True
-                    )
-            elif expr is not None:
-                lb = ub = None
-                body = self.walk_expression(expr).compile(
-                    env, smap, self.expr_cache, args, False
+            pass
+        env = self.env
+        smap = self.symbolmap
+        var_order = self.var_recorder.var_order
+        expr, indices = template_info
+        args = [smap.getSymbol(i) for i in indices]
+        if expr.is_expression_type(ExpressionType.RELATIONAL):
+            lb, body, ub = obj.to_bounded_expression()
+            if body is not None:
+                body = self.walk_expression(body).compile(
+                    env, smap, self.expr_cache, args, False, var_order=var_order
                 )
-            else:
-                body = lb = ub = None
-            self.expanded_templates[id(template_info)] = body, lb, ub
+            if lb is not None:
+                lb = self.walk_expression(lb).compile(
+                    env, smap, self.expr_cache, args, True, var_order=var_order
+                )
+            if ub is not None:
+                ub = self.walk_expression(ub).compile(
+                    env, smap, self.expr_cache, args, True, var_order=var_order
+                )
+        elif expr is not None:
+            lb = ub = None
+            body = self.walk_expression(expr).compile(
+                env, smap, self.expr_cache, args, False, var_order=var_order
+            )
+        else:
+            body = lb = ub = None
+        ans = self.expanded_templates[id(template_info)] = body, lb, ub
+        return ans
 
-        linear_indices = []
-        linear_data = []
+    @staticmethod
+    def _template_index(obj):
         index = obj.index()
         if index.__class__ is not tuple:
             if index is None and not obj.parent_component().is_indexed():
                 index = ()
             else:
                 index = (index,)
+        return index
+
+    def expand_expression(self, obj, template_info):
+        body, lb, ub = self._compile_template(obj, template_info)
+
+        linear_indices = []
+        linear_data = []
+        index = self._template_index(obj)
         if lb.__class__ is code_type:
             lb = lb(linear_indices, linear_data, *index)
             if linear_indices:
@@ -357,3 +374,67 @@ class LinearTemplateRepnVisitor(linear.LinearRepnVisitor):
             lb,
             ub,
         )
+
+    def expand_expressions(self, objs, template_info):
+        """Expand a list of objects that all share the same template
+
+        This is the bulk equivalent of :meth:`expand_expression`: the
+        template is compiled once and then evaluated for the index of
+        every object in `objs`, with all the linear terms accumulated
+        into a single pair of (index, data) lists in CSR order.
+
+        Returns
+        -------
+        const: List[float]
+            The constant offset for each object
+
+        indptr: List[int]
+            The CSR row pointer: the linear terms for ``objs[i]`` are
+            ``[indptr[i]:indptr[i+1]]``
+
+        linear_indices: List[int]
+            The column (variable position) for each linear term
+
+        linear_data: List[float]
+            The coefficient for each linear term
+
+        lb: List[float] or None
+            The lower bound for each object (None if the template has
+            no lower bound)
+
+        ub: List[float] or None
+            The upper bound for each object (None if the template has
+            no upper bound)
+
+        """
+        body, lb, ub = self._compile_template(objs[0], template_info)
+
+        indices = list(map(self._template_index, objs))
+        bounds = []
+        for bound in (lb, ub):
+            if bound is None:
+                bounds.append(None)
+            elif bound.__class__ is code_type:
+                bound_indices = []
+                bound_data = []
+                bounds.append(
+                    [bound(bound_indices, bound_data, *idx) for idx in indices]
+                )
+                if bound_indices:
+                    raise RuntimeError(
+                        f"Constraint {objs[0].parent_component()} has non-fixed bounds"
+                    )
+            else:
+                bounds.append([bound] * len(objs))
+
+        linear_indices = []
+        linear_data = []
+        if body.__class__ is not code_type:
+            # The body is constant (no linear terms)
+            return [body] * len(objs), [0] * (len(objs) + 1), [], [], *bounds
+        indptr = [0]
+        const = []
+        for idx in indices:
+            const.append(body(linear_indices, linear_data, *idx))
+            indptr.append(len(linear_indices))
+        return const, indptr, linear_indices, linear_data, bounds[0], bounds[1]
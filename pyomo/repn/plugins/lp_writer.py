@@ -19,7 +19,9 @@ from pyomo.common.config import (
     InEnum,
     document_kwargs_from_configdict,
 )
+from pyomo.common.deprecation import deprecation_warning
 from pyomo.common.gc_manager import PauseGC
+from pyomo.common.numeric_types import native_types
 from pyomo.common.timing import TicTocTimer
 
 from pyomo.core.base import (
@@ -33,10 +35,12 @@ from pyomo.core.base import (
     SortComponents,
     Suffix,
     SymbolMap,
+    CompactSymbolMap,
     minimize,
 )
 from pyomo.core.base.component import ActiveComponent
 from pyomo.core.base.label import LPFileLabeler, NumericLabeler
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor
 from pyomo.opt import WriterFactory
 from pyomo.repn.linear import LinearRepnVisitor
 from pyomo.repn.quadratic import QuadraticRepnVisitor
@@ -66,10 +70,10 @@ class LPWriterInfo(object):
 
     Attributes
     ----------
-    symbol_map: SymbolMap
+    symbol_map: CompactSymbolMap
 
-        The :py:class:`SymbolMap` bimap between row/column labels and
-        Pyomo components.
+        The :py:class:`CompactSymbolMap` bimap between row/column labels
+        and Pyomo components.
 
     """
 
@@ -242,6 +246,68 @@ class LPWriter(object):
             return _LPWriter_impl(ostream, config).write(model)
 
 
+class PersistentLPWriter(object):
+    """An LP writer that caches the compiled model between writes
+
+    This writer is intended for workflows (e.g., scenario sweeps) that
+    repeatedly write the same model after making small changes to it.
+    The first call to :py:meth:`write` compiles and writes the model
+    exactly like :py:class:`LPWriter`.  Subsequent calls with the same
+    model only recompile the rows (and objective) that could have
+    changed:
+
+      - constraints that were added or whose expression was replaced,
+      - constraints whose named expressions were replaced,
+      - constraints referencing mutable Params whose value changed, and
+      - constraints referencing Vars that were fixed, unfixed, or whose
+        fixed value changed.
+
+    Constraints that were removed or deactivated are dropped, and the
+    variable bounds, domains and SOS sections are regenerated on every
+    write.  Row and column labels are stable across writes.  Writing a
+    different model resets the cache.
+
+    """
+
+    CONFIG = LPWriter.CONFIG()
+
+    @document_kwargs_from_configdict(CONFIG)
+    def __init__(self, **options):
+        self.config = self.CONFIG(options)
+        if self.config.output_fixed_variable_bounds:
+            deprecation_warning(
+                "The 'output_fixed_variable_bounds' option to the LP "
+                "writer is deprecated and is ignored by the lp_v2 writer."
+            )
+        self._impl = None
+
+    def reset(self):
+        """Discard all cached information about the previous model"""
+        self._impl = None
+
+    def write(self, model, ostream):
+        """Write a model in LP format, reusing cached rows where possible.
+
+        Returns
+        -------
+        LPWriterInfo
+
+        Parameters
+        ----------
+        model: ConcreteModel
+            The concrete Pyomo model to write out.
+
+        ostream: io.TextIOBase
+            The text output stream where the LP "file" will be written.
+            Could be an opened file or a io.StringIO.
+
+        """
+        if self._impl is None or self._impl.model is not model:
+            self._impl = _PersistentLPWriter_impl(model, self.config)
+        with PauseGC():
+            return self._impl.write(ostream)
+
+
 class _LPWriter_impl(object):
     def __init__(self, ostream, config):
         self.ostream = ostream
@@ -257,24 +323,92 @@ class _LPWriter_impl(object):
 
         ostream = self.ostream
 
+        self.labeler = labeler = self._create_labeler()
+        self.symbol_map = SymbolMap(labeler)
+        addSymbol = self.symbol_map.addSymbol
+        aliasSymbol = self.symbol_map.alias
+
+        self.sorter = FileDeterminism_to_SortComponents(self.config.file_determinism)
+        component_map = self._categorize_components(model)
+
+        self._initialize_columns(model)
+        ONE_VAR_CONSTANT = self.ONE_VAR_CONSTANT
+
+        timer.toc('Initialized column order', level=logging.DEBUG)
+
+        # We don't export any suffix information to the LP file
+        #
+        self._warn_export_suffixes(component_map)
+
+        ostream.write(f"\\* Source Pyomo model name={model.name} *\\\n\n")
+
+        #
+        # Process objective
+        #
+        obj = self._get_objective(model, component_map)
+        self._write_objective(ostream, obj, self._compile_objective(obj))
+        if with_debug_timing:
+            timer.toc('Objective %s', obj, level=logging.DEBUG)
+
+        ostream.write("\ns.t.\n")
+
+        #
+        # Tabulate constraints
+        #
+        have_nontrivial = False
+        last_parent = None
+        for con in ordered_active_constraints(model, self.config):
+            if with_debug_timing and con.parent_component() is not last_parent:
+                timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+                last_parent = con.parent_component()
+            compiled = self._compile_constraint(con)
+            if compiled is None:
+                continue
+            lb, ub, offset, repn, nontrivial = compiled
+            if nontrivial:
+                have_nontrivial = True
+            labels = self._write_constraint(ostream, labeler(con), repn, lb, ub, offset)
+            addSymbol(con, labels[0])
+            for label in labels[1:]:
+                aliasSymbol(con, label)
+
+        if with_debug_timing:
+            # report the last constraint
+            timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
+        if not have_nontrivial:
+            self._write_dummy_constraint(ostream)
+
+        self._write_bounds(ostream)
+        timer.toc("Wrote variable bounds and domains", level=logging.DEBUG)
+
+        #
+        # Tabulate SOS constraints
+        #
+        self._write_sos(ostream, component_map)
+
+        ostream.write("\nend\n")
+
+        # The label strings are only needed while writing the file:
+        # keep a compact copy of the symbol map for loading results
+        self.symbol_map = CompactSymbolMap.from_symbol_map(self.symbol_map)
+        info = LPWriterInfo(self.symbol_map)
+        timer.toc("Generated LP representation", delta=False)
+        return info
+
+    def _create_labeler(self):
         labeler = self.config.labeler
         if labeler is None:
             if self.config.symbolic_solver_labels:
                 labeler = LPFileLabeler()
             else:
                 labeler = NumericLabeler('x')
-        self.symbol_map = SymbolMap(labeler)
-        addSymbol = self.symbol_map.addSymbol
-        aliasSymbol = self.symbol_map.alias
-        getSymbol = self.symbol_map.getSymbol
+        return labeler
 
-        self.sorter = sorter = FileDeterminism_to_SortComponents(
-            self.config.file_determinism
-        )
+    def _categorize_components(self, model):
         component_map, unknown = categorize_valid_components(
             model,
             active=True,
-            sort=sorter,
+            sort=self.sorter,
             valid={
                 Block,
                 Constraint,
@@ -302,56 +436,54 @@ class _LPWriter_impl(object):
                     ),
                 )
             )
+        return component_map
 
-        ONE_VAR_CONSTANT = Var(name='ONE_VAR_CONSTANT', bounds=(1, 1))
-        ONE_VAR_CONSTANT.construct()
+    def _initialize_columns(self, model):
+        self.ONE_VAR_CONSTANT = Var(name='ONE_VAR_CONSTANT', bounds=(1, 1))
+        self.ONE_VAR_CONSTANT.construct()
 
-        self.var_map = {id(ONE_VAR_CONSTANT): ONE_VAR_CONSTANT}
+        self.var_map = {id(self.ONE_VAR_CONSTANT): self.ONE_VAR_CONSTANT}
         initialize_var_map_from_column_order(model, self.config, self.var_map)
         self.var_order = {_id: i for i, _id in enumerate(self.var_map)}
-        self.var_recorder = OrderedVarRecorder(self.var_map, self.var_order, sorter)
+        self.var_recorder = OrderedVarRecorder(
+            self.var_map, self.var_order, self.sorter
+        )
 
         _qp = self.config.allow_quadratic_objective
         _qc = self.config.allow_quadratic_constraint
-        objective_visitor = (QuadraticRepnVisitor if _qp else LinearRepnVisitor)(
+        self.objective_visitor = (QuadraticRepnVisitor if _qp else LinearRepnVisitor)(
             {}, var_recorder=self.var_recorder
         )
-        constraint_visitor = (QuadraticRepnVisitor if _qc else LinearRepnVisitor)(
-            objective_visitor.subexpression_cache if _qp == _qc else {},
+        self.constraint_visitor = (QuadraticRepnVisitor if _qc else LinearRepnVisitor)(
+            self.objective_visitor.subexpression_cache if _qp == _qc else {},
             var_recorder=self.var_recorder,
         )
 
-        timer.toc('Initialized column order', level=logging.DEBUG)
-
-        # We don't export any suffix information to the LP file
-        #
-        if component_map[Suffix]:
-            suffixesByName = {}
-            for block in component_map[Suffix]:
-                for suffix in block.component_objects(
-                    Suffix, active=True, descend_into=False, sort=sorter
-                ):
-                    if not suffix.export_enabled() or not suffix:
-                        continue
-                    name = suffix.local_name
-                    if name in suffixesByName:
-                        suffixesByName[name].append(suffix)
-                    else:
-                        suffixesByName[name] = [suffix]
-            for name, suffixes in suffixesByName.items():
-                n = len(suffixes)
-                plural = 's' if n > 1 else ''
-                logger.warning(
-                    f"EXPORT Suffix '{name}' found on {n} block{plural}:\n    "
-                    + "\n    ".join(s.name for s in suffixes)
-                    + "\nLP writer cannot export suffixes to LP files.  Skipping."
-                )
-
-        ostream.write(f"\\* Source Pyomo model name={model.name} *\\\n\n")
+    def _warn_export_suffixes(self, component_map):
+        if not component_map[Suffix]:
+            return
+        suffixesByName = {}
+        for block in component_map[Suffix]:
+            for suffix in block.component_objects(
+                Suffix, active=True, descend_into=False, sort=self.sorter
+            ):
+                if not suffix.export_enabled() or not suffix:
+                    continue
+                name = suffix.local_name
+                if name in suffixesByName:
+                    suffixesByName[name].append(suffix)
+                else:
+                    suffixesByName[name] = [suffix]
+        for name, suffixes in suffixesByName.items():
+            n = len(suffixes)
+            plural = 's' if n > 1 else ''
+            logger.warning(
+                f"EXPORT Suffix '{name}' found on {n} block{plural}:\n    "
+                + "\n    ".join(s.name for s in suffixes)
+                + "\nLP writer cannot export suffixes to LP files.  Skipping."
+            )
 
-        #
-        # Process objective
-        #
+    def _get_objective(self, model, component_map):
         if not component_map[Objective]:
             objectives = [Objective(expr=1)]
             objectives[0].construct()
@@ -360,7 +492,7 @@ class _LPWriter_impl(object):
             for blk in component_map[Objective]:
                 objectives.extend(
                     blk.component_data_objects(
-                        Objective, active=True, descend_into=False, sort=sorter
+                        Objective, active=True, descend_into=False, sort=self.sorter
                     )
                 )
         if len(objectives) > 1:
@@ -369,13 +501,10 @@ class _LPWriter_impl(object):
                 "Cannot write legal LP file\nObjectives: %s"
                 % (model.name, ' '.join(obj.name for obj in objectives))
             )
+        return objectives[0]
 
-        obj = objectives[0]
-        ostream.write(
-            ("min \n%s:\n" if obj.sense == minimize else "max \n%s:\n")
-            % (getSymbol(obj, labeler),)
-        )
-        repn = objective_visitor.walk_expression(obj.expr)
+    def _compile_objective(self, obj):
+        repn = self.objective_visitor.walk_expression(obj.expr)
         if repn.nonlinear is not None:
             raise ValueError(
                 f"Model objective ({obj.name}) contains nonlinear terms that "
@@ -391,121 +520,122 @@ class _LPWriter_impl(object):
             # In addition, most solvers do no tolerate an empty
             # objective, this will ensure we at least write out
             # 0*ONE_VAR_CONSTANT.
-            repn.linear[id(ONE_VAR_CONSTANT)] = repn.constant
+            repn.linear[id(self.ONE_VAR_CONSTANT)] = repn.constant
             repn.constant = 0
+        return repn
+
+    def _write_objective(self, ostream, obj, repn):
+        ostream.write(
+            ("min \n%s:\n" if obj.sense == minimize else "max \n%s:\n")
+            % (self.symbol_map.getSymbol(obj, self.labeler),)
+        )
         self.write_expression(ostream, repn, True)
-        aliasSymbol(obj, '__default_objective__')
-        if with_debug_timing:
-            timer.toc('Objective %s', obj, level=logging.DEBUG)
+        self.symbol_map.alias(obj, '__default_objective__')
 
-        ostream.write("\ns.t.\n")
+    def _compile_constraint(self, con):
+        """Compile a single constraint for output to the LP file
 
+        Returns ``None`` if the constraint should not be written,
+        otherwise a tuple ``(lb, ub, offset, repn, nontrivial)``.
+
+        """
+        # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+        # guarantee a return value that is either a (finite)
+        # native_numeric_type, or None
+        lb, body, ub = con.to_bounded_expression(True)
+
+        if lb is None and ub is None:
+            # Note: you *cannot* output trivial (unbounded)
+            # constraints in LP format.  I suppose we could add a
+            # slack variable if skip_trivial_constraints is False,
+            # but that seems rather silly.
+            return None
+        repn = self.constraint_visitor.walk_expression(body)
+        if repn.nonlinear is not None:
+            raise ValueError(
+                f"Model constraint ({con.name}) contains nonlinear terms that "
+                "cannot be written to LP format"
+            )
+
+        # Pull out the constant: we will move it to the bounds
+        offset = repn.constant
+        repn.constant = 0
+
+        if repn.linear or getattr(repn, 'quadratic', None):
+            return lb, ub, offset, repn, True
+        if (
+            self.config.skip_trivial_constraints
+            and (lb is None or lb <= offset)
+            and (ub is None or ub >= offset)
+        ):
+            return None
+        # This is a trivially infeasible model.  We could raise
+        # an exception, or we could allow the solver to return
+        # infeasible.  There are fewer logic paths (in
+        # particular related to mapping solver result status) if
+        # we just defer to the solver.
         #
-        # Tabulate constraints
-        #
-        skip_trivial_constraints = self.config.skip_trivial_constraints
-        have_nontrivial = False
-        last_parent = None
-        for con in ordered_active_constraints(model, self.config):
-            if with_debug_timing and con.parent_component() is not last_parent:
-                timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
-                last_parent = con.parent_component()
-            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
-            # guarantee a return value that is either a (finite)
-            # native_numeric_type, or None
-            lb, body, ub = con.to_bounded_expression(True)
-
-            if lb is None and ub is None:
-                # Note: you *cannot* output trivial (unbounded)
-                # constraints in LP format.  I suppose we could add a
-                # slack variable if skip_trivial_constraints is False,
-                # but that seems rather silly.
-                continue
-            repn = constraint_visitor.walk_expression(body)
-            if repn.nonlinear is not None:
-                raise ValueError(
-                    f"Model constraint ({con.name}) contains nonlinear terms that "
-                    "cannot be written to LP format"
-                )
+        # Add a dummy (fixed) variable to the constraint,
+        # because some solvers (including versions of GLPK)
+        # cannot parse an LP file without a variable on the left
+        # hand side.
+        repn.linear[id(self.ONE_VAR_CONSTANT)] = 0
+        return lb, ub, offset, repn, False
 
-            # Pull out the constant: we will move it to the bounds
-            offset = repn.constant
-            repn.constant = 0
+    def _write_constraint(self, ostream, symbol, repn, lb, ub, offset):
+        """Write the row(s) for a compiled constraint
 
-            if repn.linear or getattr(repn, 'quadratic', None):
-                have_nontrivial = True
+        Returns the tuple of row labels that were written (the first is
+        the constraint's primary symbol, any others are aliases).
+
+        """
+        if lb is not None:
+            if ub is None:
+                label = f'c_l_{symbol}_'
+                ostream.write(f'\n{label}:\n')
+                self.write_expression(ostream, repn, False)
+                ostream.write(f'>= {(lb - offset)!s}\n')
+            elif lb == ub:
+                label = f'c_e_{symbol}_'
+                ostream.write(f'\n{label}:\n')
+                self.write_expression(ostream, repn, False)
+                ostream.write(f'= {(lb - offset)!s}\n')
             else:
-                if (
-                    skip_trivial_constraints
-                    and (lb is None or lb <= offset)
-                    and (ub is None or ub >= offset)
-                ):
-                    continue
-                # This is a trivially infeasible model.  We could raise
-                # an exception, or we could allow the solver to return
-                # infeasible.  There are fewer logic paths (in
-                # particular related to mapping solver result status) if
-                # we just defer to the solver.
+                # We will need the constraint body twice.  Generate
+                # in a buffer so we only have to do that once.
+                buf = StringIO()
+                self.write_expression(buf, repn, False)
+                buf = buf.getvalue()
                 #
-                # Add a dummy (fixed) variable to the constraint,
-                # because some solvers (including versions of GLPK)
-                # cannot parse an LP file without a variable on the left
-                # hand side.
-                repn.linear[id(ONE_VAR_CONSTANT)] = 0
-
-            symbol = labeler(con)
-            if lb is not None:
-                if ub is None:
-                    label = f'c_l_{symbol}_'
-                    addSymbol(con, label)
-                    ostream.write(f'\n{label}:\n')
-                    self.write_expression(ostream, repn, False)
-                    ostream.write(f'>= {(lb - offset)!s}\n')
-                elif lb == ub:
-                    label = f'c_e_{symbol}_'
-                    addSymbol(con, label)
-                    ostream.write(f'\n{label}:\n')
-                    self.write_expression(ostream, repn, False)
-                    ostream.write(f'= {(lb - offset)!s}\n')
-                else:
-                    # We will need the constraint body twice.  Generate
-                    # in a buffer so we only have to do that once.
-                    buf = StringIO()
-                    self.write_expression(buf, repn, False)
-                    buf = buf.getvalue()
-                    #
-                    label = f'r_l_{symbol}_'
-                    addSymbol(con, label)
-                    ostream.write(f'\n{label}:\n')
-                    ostream.write(buf)
-                    ostream.write(f'>= {(lb - offset)!s}\n')
-                    label = f'r_u_{symbol}_'
-                    aliasSymbol(con, label)
-                    ostream.write(f'\n{label}:\n')
-                    ostream.write(buf)
-                    ostream.write(f'<= {(ub - offset)!s}\n')
-            elif ub is not None:
-                label = f'c_u_{symbol}_'
-                addSymbol(con, label)
+                label = f'r_l_{symbol}_'
                 ostream.write(f'\n{label}:\n')
-                self.write_expression(ostream, repn, False)
+                ostream.write(buf)
+                ostream.write(f'>= {(lb - offset)!s}\n')
+                alias = f'r_u_{symbol}_'
+                ostream.write(f'\n{alias}:\n')
+                ostream.write(buf)
                 ostream.write(f'<= {(ub - offset)!s}\n')
-
-        if with_debug_timing:
-            # report the last constraint
-            timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
-        if not have_nontrivial:
-            # Some solvers (notably CBC through at least 2.10.4) will
-            # return a nonzero return code when the model has no
-            # constraints.  To work around the original Pyomo solver
-            # hierarchy (where the return code was processed in the base
-            # class), we will add a dummy constraint here.
-            repn = constraint_visitor.Result()  # walk_expression(ONE_VAR_CONSTANT)
-            repn.linear[id(ONE_VAR_CONSTANT)] = 1
-            ostream.write(f'\nc_e_ONE_VAR_CONSTANT:\n')
+                return label, alias
+        elif ub is not None:
+            label = f'c_u_{symbol}_'
+            ostream.write(f'\n{label}:\n')
             self.write_expression(ostream, repn, False)
-            ostream.write(f'= 1\n')
-
+            ostream.write(f'<= {(ub - offset)!s}\n')
+        return (label,)
+
+    def _write_dummy_constraint(self, ostream):
+        # Some solvers (notably CBC through at least 2.10.4) will
+        # return a nonzero return code when the model has no
+        # constraints.  To work around the original Pyomo solver
+        # hierarchy (where the return code was processed in the base
+        # class), we will add a dummy constraint here.
+        repn = self.constraint_visitor.Result()  # walk_expression(ONE_VAR_CONSTANT)
+        repn.linear[id(self.ONE_VAR_CONSTANT)] = 1
+        ostream.write(f'\nc_e_ONE_VAR_CONSTANT:\n')
+        self.write_expression(ostream, repn, False)
+        ostream.write(f'= 1\n')
+
+    def _write_bounds(self, ostream):
         ostream.write("\nbounds")
 
         # Track the number of integer and binary variables, so you can
@@ -541,39 +671,31 @@ class _LPWriter_impl(object):
             ostream.write("\nbinary\n  ")
             ostream.write("\n  ".join(binary_vars))
 
-        timer.toc("Wrote variable bounds and domains", level=logging.DEBUG)
-
-        #
-        # Tabulate SOS constraints
-        #
-        if component_map[SOSConstraint]:
-            sos = []
-            for blk in component_map[SOSConstraint]:
-                sos.extend(
-                    blk.component_data_objects(
-                        SOSConstraint, active=True, descend_into=False, sort=sorter
-                    )
+    def _write_sos(self, ostream, component_map):
+        if not component_map[SOSConstraint]:
+            return
+        getSymbol = self.symbol_map.getSymbol
+        sos = []
+        for blk in component_map[SOSConstraint]:
+            sos.extend(
+                blk.component_data_objects(
+                    SOSConstraint, active=True, descend_into=False, sort=self.sorter
                 )
-            if self.config.row_order:
-                # sort() is stable (per Python docs), so we can let
-                # all unspecified rows have a row number one bigger than
-                # the number of rows specified by the user ordering.
-                _n = len(row_order)
-                sos.sort(key=lambda x: _row_getter(x, _n))
-
-            ostream.write("\nSOS\n")
-            for soscon in sos:
-                ostream.write(f'\n{getSymbol(soscon)}: S{soscon.level}::\n')
-                for v, w in getattr(soscon, 'get_items', soscon.items)():
-                    if w.__class__ not in int_float:
-                        w = float(f)
-                    ostream.write(f"  {getSymbol(v)}:{w!s}\n")
-
-        ostream.write("\nend\n")
-
-        info = LPWriterInfo(self.symbol_map)
-        timer.toc("Generated LP representation", delta=False)
-        return info
+            )
+        if self.config.row_order:
+            # sort() is stable (per Python docs), so we can let
+            # all unspecified rows have a row number one bigger than
+            # the number of rows specified by the user ordering.
+            _n = len(row_order)
+            sos.sort(key=lambda x: _row_getter(x, _n))
+
+        ostream.write("\nSOS\n")
+        for soscon in sos:
+            ostream.write(f'\n{getSymbol(soscon)}: S{soscon.level}::\n')
+            for v, w in getattr(soscon, 'get_items', soscon.items)():
+                if w.__class__ not in int_float:
+                    w = float(f)
+                ostream.write(f"  {getSymbol(v)}:{w!s}\n")
 
     def write_expression(self, ostream, expr, is_objective):
         assert not expr.constant
@@ -633,3 +755,283 @@ class _LPWriter_impl(object):
                 ostream.write("] / 2\n")
             else:
                 ostream.write("]\n")
+
+
+class _PersistentLabeler(object):
+    """Labeler wrapper that returns the same label for an object on every call"""
+
+    def __init__(self, labeler):
+        self.labeler = labeler
+        self.labels = {}
+
+    def __call__(self, obj):
+        _id = id(obj)
+        if _id in self.labels:
+            return self.labels[_id][1]
+        ans = self.labeler(obj)
+        # Hold a reference to obj so that its id() cannot be reused
+        self.labels[_id] = (obj, ans)
+        return ans
+
+    def retain(self, ids):
+        """Discard the labels of all objects whose id() is not in `ids`"""
+        labels = self.labels
+        for _id in [_id for _id in labels if _id not in ids]:
+            del labels[_id]
+
+
+class _LPDependencyVisitor(StreamBasedExpressionVisitor):
+    """Collect the Vars, mutable Params and named Expressions in an expression"""
+
+    def initializeWalker(self, expr):
+        self.variables = {}
+        self.params = {}
+        self.named_expressions = {}
+        if not self.beforeChild(None, expr, 0)[0]:
+            return False, self.finalizeResult(None)
+        return True, expr
+
+    def beforeChild(self, parent, child, index):
+        if child.__class__ in native_types:
+            return False, None
+        elif child.is_expression_type():
+            if child.is_named_expression_type():
+                self.named_expressions[id(child)] = (child, child.expr)
+            return True, None
+        elif child.is_variable_type():
+            self.variables[id(child)] = child
+        elif child.is_fixed() and not child.is_constant():
+            self.params[id(child)] = child
+        return False, None
+
+    def finalizeResult(self, result):
+        return self
+
+
+class _PersistentLPRow(object):
+    __slots__ = (
+        'obj',
+        'expr',
+        'sense',
+        'text',
+        'labels',
+        'nontrivial',
+        'written_vars',
+        'variables',
+        'params',
+        'named_expressions',
+    )
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.text = ''
+        self.labels = ()
+        self.nontrivial = False
+        self.written_vars = ()
+        self.variables = ()
+        self.params = ()
+        self.named_expressions = ()
+
+
+class _PersistentLPWriter_impl(_LPWriter_impl):
+    def __init__(self, model, config):
+        super().__init__(None, config)
+        self.model = model
+        self.labeler = _PersistentLabeler(self._create_labeler())
+        self.sorter = FileDeterminism_to_SortComponents(self.config.file_determinism)
+        self._initialize_columns(model)
+        self.dependency_visitor = _LPDependencyVisitor()
+        # id(obj) -> _PersistentLPRow for the objective and all constraints
+        self.rows = {}
+        # id(var) -> [var, fixed, value, set(row ids)]
+        self.var_deps = {}
+        # id(param) -> [param, value, set(row ids)]
+        self.param_deps = {}
+        # id(var) -> number of rows that write the var
+        self.var_refcount = {}
+
+    def write(self, ostream):
+        timing_logger = logging.getLogger('pyomo.common.timing.writer')
+        timer = TicTocTimer(logger=timing_logger)
+        model = self.model
+        rows = self.rows
+
+        self.symbol_map = SymbolMap(self.labeler)
+        component_map = self._categorize_components(model)
+        self._warn_export_suffixes(component_map)
+
+        dirty = self._find_modified_dependencies()
+        # Compiled named expressions may depend on values that changed
+        # since the last write; only reuse them within a single write.
+        self.objective_visitor.subexpression_cache.clear()
+        self.constraint_visitor.subexpression_cache.clear()
+        timer.toc('Checked dependencies', level=logging.DEBUG)
+
+        n_compiled = 0
+        obj = self._get_objective(model, component_map)
+        obj_row = self._get_row(obj, dirty)
+        if obj_row is None:
+            obj_row = self._compile_row(obj, True)
+            n_compiled += 1
+
+        current = {id(obj): obj_row}
+        constraint_rows = []
+        for con in ordered_active_constraints(model, self.config):
+            row = self._get_row(con, dirty)
+            if row is None:
+                row = self._compile_row(con, False)
+                n_compiled += 1
+            current[id(con)] = row
+            constraint_rows.append(row)
+
+        # Drop any rows for components that are no longer active in the model
+        for _id in [_id for _id in rows if _id not in current]:
+            self._release_row(rows.pop(_id))
+        timer.toc(
+            'Compiled %s of %s rows', n_compiled, len(current), level=logging.DEBUG
+        )
+
+        ostream.write(f"\\* Source Pyomo model name={model.name} *\\\n\n")
+        ostream.write(obj_row.text)
+        self.symbol_map.getSymbol(obj)
+        self.symbol_map.alias(obj, '__default_objective__')
+        ostream.write("\ns.t.\n")
+        addSymbol = self.symbol_map.addSymbol
+        aliasSymbol = self.symbol_map.alias
+        have_nontrivial = False
+        for row in constraint_rows:
+            if not row.labels:
+                continue
+            if row.nontrivial:
+                have_nontrivial = True
+            ostream.write(row.text)
+            addSymbol(row.obj, row.labels[0])
+            for label in row.labels[1:]:
+                aliasSymbol(row.obj, label)
+        if not have_nontrivial:
+            self._write_dummy_constraint(ostream)
+
+        # Register every variable that appears in the (cached) rows so
+        # that the bounds section includes it
+        getSymbol = self.symbol_map.getSymbol
+        var_map = self.var_map
+        for vid, count in self.var_refcount.items():
+            if count:
+                getSymbol(var_map[vid])
+
+        self._write_bounds(ostream)
+        self._write_sos(ostream, component_map)
+        ostream.write("\nend\n")
+
+        # Forget the labels of components that were not written (e.g.,
+        # because they were removed from the model) so that the labeler
+        # does not grow without bound
+        self.labeler.retain(self.symbol_map.byObject)
+
+        # The label strings are only needed while writing the file:
+        # keep a compact copy of the symbol map for loading results
+        self.symbol_map = CompactSymbolMap.from_symbol_map(self.symbol_map)
+        info = LPWriterInfo(self.symbol_map)
+        timer.toc("Generated LP representation", delta=False)
+        return info
+
+    def _find_modified_dependencies(self):
+        """Return the set of row ids whose dependencies changed since the last write"""
+        dirty = set()
+        for vid, info in self.var_deps.items():
+            v, fixed, value, row_ids = info
+            if v.fixed:
+                if fixed and v.value == value:
+                    continue
+                # A (newly) fixed var is no longer a column in the model
+                self.var_map.pop(vid, None)
+            elif not fixed:
+                continue
+            info[1] = v.fixed
+            info[2] = v.value
+            dirty.update(row_ids)
+        for info in self.param_deps.values():
+            p, value, row_ids = info
+            if p.value != value:
+                info[1] = p.value
+                dirty.update(row_ids)
+        return dirty
+
+    def _get_row(self, obj, dirty):
+        """Return the cached row for obj, or None if it must be recompiled"""
+        row = self.rows.get(id(obj), None)
+        if row is None or id(obj) in dirty:
+            return None
+        if row.obj is not obj or row.expr is not obj.expr:
+            return None
+        if row.sense is not None and row.sense != obj.sense:
+            return None
+        for e, expr in row.named_expressions:
+            if e.expr is not expr:
+                return None
+        return row
+
+    def _compile_row(self, obj, is_objective):
+        _id = id(obj)
+        if _id in self.rows:
+            self._release_row(self.rows[_id])
+        row = self.rows[_id] = _PersistentLPRow(obj)
+        row.expr = obj.expr
+        row.sense = obj.sense if is_objective else None
+        buf = StringIO()
+        if is_objective:
+            repn = self._compile_objective(obj)
+            self._write_objective(buf, obj, repn)
+            row.labels = (self.labeler(obj),)
+        else:
+            compiled = self._compile_constraint(obj)
+            if compiled is not None:
+                lb, ub, offset, repn, row.nontrivial = compiled
+                row.labels = self._write_constraint(
+                    buf, self.labeler(obj), repn, lb, ub, offset
+                )
+        row.text = buf.getvalue()
+
+        if row.labels:
+            written = set(repn.linear)
+            quadratic = getattr(repn, 'quadratic', None)
+            if quadratic:
+                for vids in quadratic:
+                    written.update(vids)
+            row.written_vars = tuple(written)
+            var_refcount = self.var_refcount
+            for vid in written:
+                var_refcount[vid] = var_refcount.get(vid, 0) + 1
+
+        # Record the components whose changes would invalidate this row
+        deps = self.dependency_visitor.walk_expression(row.expr)
+        row.named_expressions = tuple(deps.named_expressions.values())
+        row.variables = tuple(deps.variables)
+        row.params = tuple(deps.params)
+        var_deps = self.var_deps
+        for vid, v in deps.variables.items():
+            if vid not in var_deps:
+                var_deps[vid] = [v, v.fixed, v.value, set()]
+            var_deps[vid][3].add(_id)
+        param_deps = self.param_deps
+        for pid, p in deps.params.items():
+            if pid not in param_deps:
+                param_deps[pid] = [p, p.value, set()]
+            param_deps[pid][2].add(_id)
+        return row
+
+    def _release_row(self, row):
+        _id = id(row.obj)
+        var_refcount = self.var_refcount
+        for vid in row.written_vars:
+            var_refcount[vid] -= 1
+            if not var_refcount[vid]:
+                del var_refcount[vid]
+        for deps, vid, idx in (
+            *((self.var_deps, vid, 3) for vid in row.variables),
+            *((self.param_deps, pid, 2) for pid in row.params),
+        ):
+            row_ids = deps[vid][idx]
+            row_ids.discard(_id)
+            if not row_ids:
+                del deps[vid]
@@ -9,11 +9,19 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import bz2
+import gzip
+import io
 import logging
+import lzma
+import multiprocessing
 import os
+import struct
+import sys
 from collections import defaultdict, namedtuple
+from collections.abc import Sequence
 from contextlib import nullcontext
-from itertools import filterfalse, product
+from itertools import accumulate, filterfalse, islice, product, starmap
 from math import log10 as _log10
 from operator import itemgetter, attrgetter
 
@@ -21,7 +29,10 @@ from pyomo.common.collections import ComponentMap, ComponentSet
 from pyomo.common.config import (
     ConfigDict,
     ConfigValue,
+    In,
     InEnum,
+    NonNegativeInt,
+    PositiveInt,
     document_kwargs_from_configdict,
 )
 from pyomo.common.deprecation import relocated_module_attribute
@@ -39,7 +50,7 @@ from pyomo.core.base import (
     ExternalFunction,
     Suffix,
     SOSConstraint,
-    SymbolMap,
+    CompactSymbolMap,
     NameLabeler,
     SortComponents,
     minimize,
@@ -84,6 +95,9 @@ ScalingFactors = namedtuple(
     'ScalingFactors', ['variables', 'constraints', 'objectives']
 )
 
+# Openers for the supported NL file compression formats
+_compressed_open = {'gzip': gzip.open, 'bz2': bz2.open, 'lzma': lzma.open}
+
 
 # TODO: make a proper base class
 class NLWriterInfo(object):
@@ -281,6 +295,69 @@ class NLWriter(object):
         variable elimination (without fill-in).""",
         ),
     )
+    CONFIG.declare(
+        'parallel_workers',
+        ConfigValue(
+            default=0,
+            domain=NonNegativeInt,
+            description='Number of worker processes used to compile constraints',
+            doc="""
+        If greater than 1, the active constraints are split into
+        contiguous shards that are compiled into their AMPL
+        representation by a pool of (forked) worker processes.  The
+        partial results are merged back in the original constraint
+        order, so the generated NL file is identical to the file
+        generated by the serial writer.  Shards that reference named
+        Expression components or ExternalFunctions are compiled
+        serially in the main process.  This option is ignored on
+        platforms that do not support the 'fork' start method.""",
+        ),
+    )
+    CONFIG.declare(
+        'parallel_shard_size',
+        ConfigValue(
+            default=None,
+            domain=PositiveInt,
+            description='Number of constraints in each parallel shard',
+            doc="""
+        The number of constraints sent to a worker process in a single
+        shard when `parallel_workers` is greater than 1.  If None, the
+        constraints are split into 4 shards per worker (with at least
+        1000 constraints per shard).""",
+        ),
+    )
+    CONFIG.declare(
+        'nl_format',
+        ConfigValue(
+            default='g',
+            domain=In(['g', 'b']),
+            description="NL file format ('g' for text, 'b' for binary)",
+            doc="""
+        The NL file format to generate.  'g' generates the standard
+        text format.  'b' generates the AMPL binary format, which stores
+        all integers and floating point values in the native machine
+        representation.  This avoids converting every coefficient to a
+        string and generates notably smaller files.  The binary format
+        must be written to a stream opened in binary mode.  Symbolic
+        labels are still written to the row / col files, but comments
+        are not written to the binary NL file.""",
+        ),
+    )
+    CONFIG.declare(
+        'compression',
+        ConfigValue(
+            default=None,
+            domain=In([None, 'gzip', 'bz2', 'lzma']),
+            description='Compress NL files written through the file interface',
+            doc="""
+        Stream the NL file through the specified compressor when the
+        writer is called with a file name (e.g., through
+        :py:meth:`Block.write`).  The ASL cannot read compressed NL
+        files, so this is intended for archiving models.  Streams passed
+        to :py:meth:`write` can be compressed by opening them with the
+        corresponding module (e.g., :py:func:`gzip.open`).""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
@@ -309,9 +386,12 @@ class NLWriter(object):
             _open = lambda fname: open(fname, 'w')
         else:
             _open = nullcontext
-        with open(filename, 'w', newline='') as FILE, _open(
-            row_fname
-        ) as ROWFILE, _open(col_fname) as COLFILE:
+        _open_nl = _compressed_open.get(config.compression, open)
+        if config.nl_format == 'b':
+            nl_file = _open_nl(filename, 'wb')
+        else:
+            nl_file = _open_nl(filename, 'wt', newline='')
+        with nl_file as FILE, _open(row_fname) as ROWFILE, _open(col_fname) as COLFILE:
             info = self.write(model, FILE, ROWFILE, COLFILE, config=config)
         if not info.variables:
             # This exception is included for compatibility with the
@@ -352,7 +432,9 @@ class NLWriter(object):
 
         ostream: io.TextIOBase
             The text output stream where the NL "file" will be written.
-            Could be an opened file or a io.StringIO.
+            Could be an opened file or a io.StringIO.  When writing the
+            binary NL format (``nl_format='b'``), this must be a binary
+            stream (e.g., a file opened in 'wb' mode or an io.BytesIO).
 
         rowstream: io.TextIOBase
             A text output stream to write the ASL "row file" (list of
@@ -365,6 +447,11 @@ class NLWriter(object):
 
         """
         config = options.pop('config', self.config)(options)
+        if config.nl_format == 'b' and isinstance(ostream, io.TextIOBase):
+            raise ValueError(
+                "The binary NL format ('b') must be written to a binary "
+                "output stream, but the NL writer received a text stream"
+            )
 
         # Pause the GC, as the walker that generates the compiled NL
         # representation generates (and disposes of) a large number of
@@ -373,20 +460,39 @@ class NLWriter(object):
             return impl.write(model)
 
     def _generate_symbol_map(self, info):
-        # Now that the row/column ordering is resolved, create the labels
-        symbol_map = SymbolMap()
-        symbol_map.addSymbols(
-            (info, f"v{idx}") for idx, info in enumerate(info.variables)
-        )
-        symbol_map.addSymbols(
-            (info, f"c{idx}") for idx, info in enumerate(info.constraints)
-        )
-        symbol_map.addSymbols(
-            (info, f"o{idx}") for idx, info in enumerate(info.objectives)
-        )
+        # Now that the row/column ordering is resolved, create the
+        # labels.  The NL labels are just the row / column numbers, so
+        # there is no need to store them as strings.
+        symbol_map = CompactSymbolMap()
+        symbol_map.addNumberedSymbols(info.variables, 'v')
+        symbol_map.addNumberedSymbols(info.constraints, 'c')
+        symbol_map.addNumberedSymbols(info.objectives, 'o')
         return symbol_map
 
 
+class _ComponentLabels(Sequence):
+    """A (lazy) list of the labels for a list of components"""
+
+    __slots__ = ('_components', '_labeler')
+
+    def __init__(self, components, labeler):
+        self._components = components
+        self._labeler = labeler
+
+    def __len__(self):
+        return len(self._components)
+
+    def __getitem__(self, idx):
+        if idx.__class__ is slice:
+            return list(map(self._labeler, self._components[idx]))
+        return self._labeler(self._components[idx])
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+
 class _SuffixData(object):
     def __init__(self, name):
         self.name = name
@@ -497,8 +603,236 @@ class _NoScalingFactor(object):
         return 1
 
 
+# State shared (through fork()) with the worker processes that compile
+# constraint shards in parallel (see the 'parallel_workers' option)
+_parallel_shard_state = None
+
+
+def _compile_constraint_shard(shard):
+    """Compile the AMPLRepn for a contiguous shard of constraints
+
+    This runs in a forked worker process.  Returns a 2-tuple containing
+    the list of ``(lb, ub, const, linear, nonlinear)`` for each
+    constraint in the shard and the list of ids of the Var components
+    encountered for the first time by this worker (in the order that
+    they were encountered).  Returns None if the shard cannot be
+    transferred back to the parent process by value (because it
+    references named Expressions, ExternalFunctions, or non-AML
+    variables, or because compiling it raised an exception): the
+    parent process will then compile the shard serially.
+
+    """
+    constraints, var_map, scaling_factor, config, sorter = _parallel_shard_state
+    visitor = AMPLRepnVisitor(
+        {},
+        {},
+        var_map,
+        set(),
+        config.symbolic_solver_labels,
+        config.export_defined_variables,
+        sorter,
+    )
+    n_vars = len(var_map)
+    repns = []
+    try:
+        for con in islice(constraints, *shard):
+            lb, body, ub = con.to_bounded_expression(True)
+            info = visitor.walk_expression((body, con, 0, scaling_factor(con)))
+            if info.const.__class__ not in int_float:
+                return None
+            repns.append((lb, ub, info.const, info.linear, info.nonlinear))
+        if (
+            visitor.subexpression_cache
+            or visitor.external_functions
+            or visitor.encountered_string_arguments
+        ):
+            return None
+        var_components = {}
+        for v in islice(var_map.values(), n_vars, None):
+            var_components[id(v.parent_component())] = None
+    except Exception:
+        return None
+    return repns, list(var_components)
+
+
+# Structures for the binary ('b') NL format.  Binary NL files are
+# written in the native byte order, which is declared to the ASL through
+# the "arith" field in the header.
+_b_int = struct.Struct('=i')
+_b_float = struct.Struct('=d')
+_b_pair = struct.Struct('=id')
+_b_int_pair = struct.Struct('=ii')
+_b_linear_con = struct.Struct('=cicd')
+_b_bounds = {
+    0: struct.Struct('=cdd'),
+    1: struct.Struct('=cd'),
+    2: struct.Struct('=cd'),
+    3: struct.Struct('=c'),
+    4: struct.Struct('=cd'),
+    5: struct.Struct('=cii'),
+}
+_b_arith = 1 if sys.byteorder == 'little' else 2
+# Number of integer arguments following each segment key
+_b_segment_ints = {
+    'C': 1,
+    'L': 1,
+    'O': 2,
+    'V': 3,
+    'J': 2,
+    'G': 2,
+    'd': 1,
+    'x': 1,
+    'k': 1,
+    'r': 0,
+    'b': 0,
+    'F': 3,
+    'S': 2,
+}
+
+
+def _var_bound_record(bounds):
+    """Return the (type, *values) record for a variable's "b" line"""
+    lb, ub = bounds
+    if lb == ub:
+        if lb is None:  # unbounded
+            return (3,)
+        return (4, lb)
+    elif lb is None:  # var <= ub
+        return (1, ub)
+    elif ub is None:  # lb <= var
+        return (2, lb)
+    return (0, lb, ub)
+
+
+class _BinaryNLStream(object):
+    """Wrapper that encodes the text NL format into the binary format
+
+    The :py:class:`_NLWriter_impl` generates NL expressions (and segment
+    headers) as text.  This stream converts the text lines written to it
+    into the equivalent binary records (segment keys and operators are
+    single bytes, followed by the integer / float arguments in the
+    native machine representation).  The bulk data segments (bounds,
+    Jacobian and gradient coefficients, initial values, etc.) bypass
+    the text translation entirely through the ``write_*`` methods.
+
+    """
+
+    def __init__(self, ostream):
+        self.ostream = ostream
+        # The first 10 lines (the header) are always text
+        self.header_lines = 10
+        self.segment = None
+        self.int_suffix = False
+        self.buffer = ''
+
+    def write(self, text):
+        if self.buffer:
+            text = self.buffer + text
+        out = []
+        pos = 0
+        while True:
+            eol = text.find('\n', pos)
+            if eol < 0:
+                break
+            if self.header_lines:
+                self.header_lines -= 1
+                out.append(text[pos : eol + 1].encode())
+                pos = eol + 1
+                continue
+            if text[pos] == 'h':
+                # String arguments may contain any character (including
+                # newlines), so we must rely on the string length
+                sep = text.find(':', pos)
+                end = sep + 1 + int(text[pos + 1 : sep])
+                if end >= len(text):
+                    break
+                val = text[sep + 1 : end].encode()
+                out.append(b'h' + _b_int.pack(len(val)) + val)
+                pos = end + 1
+                continue
+            line = text[pos:eol]
+            pos = eol + 1
+            comment = line.find('#')
+            if comment >= 0:
+                line = line[:comment]
+            out.append(self._encode_line(line.split()))
+        self.buffer = text[pos:]
+        self.ostream.write(b''.join(out))
+
+    def _encode_line(self, tokens):
+        key = tokens[0][0]
+        if key == 'o' or key == 'v':
+            return key.encode() + _b_int.pack(int(tokens[0][1:]))
+        elif key == 'n':
+            return b'n' + _b_float.pack(float(tokens[0][1:]))
+        elif key == 'f':
+            return b'f' + _b_int_pair.pack(int(tokens[0][1:]), int(tokens[1]))
+        elif key in _b_segment_ints:
+            self.segment = key
+            n = _b_segment_ints[key]
+            ans = [key.encode()]
+            if n:
+                ans.extend(map(_b_int.pack, map(int, (tokens[0][1:], *tokens[1:n]))))
+            if n and len(tokens) > n:
+                # F (function name) and S (suffix name) lines
+                name = tokens[n].encode()
+                ans.append(_b_int.pack(len(name)) + name)
+            if key == 'S':
+                self.int_suffix = not (int(tokens[0][1:]) & 4)
+            return b''.join(ans)
+        # Numeric data lines
+        segment = self.segment
+        if segment == 'r' or segment == 'b':
+            return self._encode_bound((int(key), *map(float, tokens[1:])))
+        elif len(tokens) == 2:
+            if segment == 'S' and self.int_suffix:
+                return _b_int_pair.pack(int(tokens[0]), int(tokens[1]))
+            return _b_pair.pack(int(tokens[0]), float(tokens[1]))
+        else:
+            # 'k' column counts and the number of n-ary operator arguments
+            return _b_int.pack(int(tokens[0]))
+
+    def _encode_bound(self, bound):
+        _type = bound[0]
+        if _type == 5:
+            return _b_bounds[5].pack(b'5', *map(int, bound[1:]))
+        return _b_bounds[_type].pack(str(_type).encode(), *bound[1:])
+
+    def write_segment(self, key, *args):
+        """Write a segment key followed by its integer arguments"""
+        assert not self.buffer
+        self.segment = key
+        self.ostream.write(key.encode() + struct.pack(f'={len(args)}i', *args))
+
+    def write_pairs(self, pairs, int_values=False):
+        """Write (index, value) pairs (the body of S, V, d, x, J, G segments)"""
+        assert not self.buffer
+        pack = _b_int_pair.pack if int_values else _b_pair.pack
+        self.ostream.write(b''.join(starmap(pack, pairs)))
+
+    def write_bounds(self, bounds):
+        """Write the body of the r / b segments from (type, *values) tuples"""
+        assert not self.buffer
+        self.ostream.write(b''.join(map(self._encode_bound, bounds)))
+
+    def write_ints(self, values):
+        """Write a list of integers (the body of the k segment)"""
+        assert not self.buffer
+        values = list(values)
+        self.ostream.write(struct.pack(f'={len(values)}i', *values))
+
+    def write_linear_constraints(self, start, stop):
+        """Write C segments (with the constant 0 body) for linear rows"""
+        assert not self.buffer
+        pack = _b_linear_con.pack
+        self.ostream.write(b''.join(pack(b'C', i, b'n', 0) for i in range(start, stop)))
+
+
 class _NLWriter_impl(object):
     def __init__(self, ostream, rowstream, colstream, config):
+        self.binary = config.nl_format == 'b'
+        if self.binary:
+            ostream = _BinaryNLStream(ostream)
         self.ostream = ostream
         self.rowstream = rowstream
         self.colstream = colstream
@@ -672,7 +1006,15 @@ class _NLWriter_impl(object):
         n_complementarity_nz_var_lb = 0
         #
         last_parent = None
-        for con in ordered_active_constraints(model, self.config):
+        model_constraints = ordered_active_constraints(model, self.config)
+        if self.config.parallel_workers > 1:
+            model_constraints = list(model_constraints)
+            compiled_constraints = self._compile_constraints_in_parallel(
+                model, model_constraints, scaling_factor
+            )
+        else:
+            compiled_constraints = None
+        for con in model_constraints:
             if with_debug_timing and con.parent_component() is not last_parent:
                 if last_parent is None:
                     timer.toc(None)
@@ -680,11 +1022,14 @@ class _NLWriter_impl(object):
                     timer.toc('Constraint %s', last_parent, level=logging.DEBUG)
                 last_parent = con.parent_component()
             scale = scaling_factor(con)
-            # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
-            # guarantee a return value that is either a (finite)
-            # native_numeric_type, or None
-            lb, body, ub = con.to_bounded_expression(True)
-            expr_info = visitor.walk_expression((body, con, 0, scale))
+            if compiled_constraints is not None:
+                lb, ub, expr_info = next(compiled_constraints)
+            else:
+                # Note: Constraint.to_bounded_expression(evaluate_bounds=True)
+                # guarantee a return value that is either a (finite)
+                # native_numeric_type, or None
+                lb, body, ub = con.to_bounded_expression(True)
+                expr_info = visitor.walk_expression((body, con, 0, scale))
             if expr_info.named_exprs:
                 self._record_named_expression_usage(expr_info.named_exprs, con, 0)
 
@@ -1099,25 +1444,28 @@ class _NLWriter_impl(object):
                     )
             nl_map[_id] = nl % tuple(nl_map[_i] for _i in args)
 
+        # The r lines are stored as (type, *values) tuples so that the
+        # binary format can write the values without converting them
+        # to strings
         r_lines = [None] * n_cons
         for idx, (con, expr_info, lb, ub) in enumerate(constraints):
             if lb == ub:  # TBD: should this be within tolerance?
                 if lb is None:
                     # type = 3  # -inf <= c <= inf
-                    r_lines[idx] = "3"
+                    r_lines[idx] = (3,)
                 else:
                     # _type = 4  # L == c == U
-                    r_lines[idx] = f"4 {lb - expr_info.const!s}"
+                    r_lines[idx] = (4, lb - expr_info.const)
                     n_equality += 1
             elif lb is None:
                 # _type = 1  # c <= U
-                r_lines[idx] = f"1 {ub - expr_info.const!s}"
+                r_lines[idx] = (1, ub - expr_info.const)
             elif ub is None:
                 # _type = 2  # L <= c
-                r_lines[idx] = f"2 {lb - expr_info.const!s}"
+                r_lines[idx] = (2, lb - expr_info.const)
             else:
                 # _type = 0  # L <= c <= U
-                r_lines[idx] = f"0 {lb - expr_info.const!s} {ub - expr_info.const!s}"
+                r_lines[idx] = (0, lb - expr_info.const, ub - expr_info.const)
                 n_ranges += 1
             expr_info.const = 0
             # FIXME: this is a HACK to be compatible with the NLv1
@@ -1126,14 +1474,11 @@ class _NLWriter_impl(object):
             # that they are in an acceptable form).
             if hasattr(con, '_complementarity'):
                 # _type = 5
-                r_lines[idx] = f"5 {con._complementarity} {1+column_order[con._vid]}"
+                r_lines[idx] = (5, con._complementarity, 1 + column_order[con._vid])
                 if expr_info.nonlinear:
                     n_complementarity_nonlin += 1
                 else:
                     n_complementarity_lin += 1
-        if symbolic_solver_labels:
-            for idx in range(len(constraints)):
-                r_lines[idx] += row_comments[idx]
 
         timer.toc("Generated row/col labels & comments", level=logging.DEBUG)
 
@@ -1142,16 +1487,19 @@ class _NLWriter_impl(object):
         #
         # LINE 1
         #
-        if visitor.encountered_string_arguments and 'b' not in getattr(
-            ostream, 'mode', ''
-        ):
+        check_string_newlines = (
+            visitor.encountered_string_arguments
+            and not self.binary
+            and 'b' not in getattr(ostream, 'mode', '')
+        )
+        if check_string_newlines:
             # Not all streams support tell()
             try:
                 _written_bytes = ostream.tell()
             except IOError:
                 _written_bytes = None
 
-        line_1_txt = f"g3 1 1 0\t# problem {model.name}\n"
+        line_1_txt = f"{self.config.nl_format}3 1 1 0\t# problem {model.name}\n"
         ostream.write(line_1_txt)
 
         # If there were any string arguments, then we need to ensure
@@ -1159,9 +1507,7 @@ class _NLWriter_impl(object):
         # than '\n'.  Binary files do not perform newline mapping (of
         # course, we will also need to map all the str to bytes for
         # binary-mode I/O).
-        if visitor.encountered_string_arguments and 'b' not in getattr(
-            ostream, 'mode', ''
-        ):
+        if check_string_newlines:
             if _written_bytes is None:
                 _written_bytes = 0
             else:
@@ -1249,9 +1595,9 @@ class _NLWriter_impl(object):
         # LINE 6
         #
         ostream.write(
-            " 0 %d 0 1\t"
+            " 0 %d %d 1\t"
             "# linear network variables; functions; arith, flags\n"
-            % (len(self.external_functions),)
+            % (len(self.external_functions), _b_arith if self.binary else 0)
         )
         #
         # LINE 7
@@ -1331,9 +1677,15 @@ class _NLWriter_impl(object):
                     continue
                 ostream.write(f"S{_field|_float} {len(_vals)} {name}\n")
                 # Note: _SuffixData.compile() guarantees the value is int/float
-                ostream.write(
-                    ''.join(f"{_id} {_vals[_id]!s}\n" for _id in sorted(_vals))
-                )
+                if self.binary:
+                    ostream.write_pairs(
+                        ((_id, _vals[_id]) for _id in sorted(_vals)),
+                        int_values=not _float,
+                    )
+                else:
+                    ostream.write(
+                        ''.join(f"{_id} {_vals[_id]!s}\n" for _id in sorted(_vals))
+                    )
 
         #
         # "V" lines (common subexpressions)
@@ -1374,6 +1726,9 @@ class _NLWriter_impl(object):
                 # beginning, we can very quickly write all the linear
                 # constraints at the end (as their nonlinear expressions
                 # are the constant 0).
+                if self.binary:
+                    ostream.write_linear_constraints(row_idx, len(constraints))
+                    break
                 _expr = self.template.const % 0
                 if symbolic_solver_labels:
                     ostream.write(
@@ -1441,9 +1796,16 @@ class _NLWriter_impl(object):
             if data.con:
                 ostream.write(f"d{len(data.con)}\n")
                 # Note: _SuffixData.compile() guarantees the value is int/float
-                ostream.write(
-                    ''.join(f"{_id} {data.con[_id]!s}\n" for _id in sorted(data.con))
-                )
+                if self.binary:
+                    ostream.write_pairs(
+                        (_id, data.con[_id]) for _id in sorted(data.con)
+                    )
+                else:
+                    ostream.write(
+                        ''.join(
+                            f"{_id} {data.con[_id]!s}\n" for _id in sorted(data.con)
+                        )
+                    )
 
         #
         # "x" lines (variable initialization)
@@ -1462,12 +1824,15 @@ class _NLWriter_impl(object):
             'x%d%s\n'
             % (len(_init_lines), "\t# initial guess" if symbolic_solver_labels else '')
         )
-        ostream.write(
-            ''.join(
-                f'{var_idx} {val!s}{col_comments[var_idx]}\n'
-                for var_idx, val in _init_lines
+        if self.binary:
+            ostream.write_pairs(_init_lines)
+        else:
+            ostream.write(
+                ''.join(
+                    f'{var_idx} {val!s}{col_comments[var_idx]}\n'
+                    for var_idx, val in _init_lines
+                )
             )
-        )
 
         #
         # "r" lines (constraint bounds)
@@ -1482,9 +1847,15 @@ class _NLWriter_impl(object):
                 ),
             )
         )
-        ostream.write("\n".join(r_lines))
-        if r_lines:
-            ostream.write("\n")
+        if self.binary:
+            ostream.write_bounds(r_lines)
+        else:
+            ostream.write(
+                ''.join(
+                    f"{' '.join(map(str, r))}{row_comments[idx]}\n"
+                    for idx, r in enumerate(r_lines)
+                )
+            )
 
         #
         # "b" lines (variable bounds)
@@ -1499,19 +1870,24 @@ class _NLWriter_impl(object):
                 ),
             )
         )
-        for var_idx, _id in enumerate(variables):
-            lb, ub = var_bounds[_id]
-            if lb == ub:
-                if lb is None:  # unbounded
-                    ostream.write(f"3{col_comments[var_idx]}\n")
-                else:  # ==
-                    ostream.write(f"4 {lb!s}{col_comments[var_idx]}\n")
-            elif lb is None:  # var <= ub
-                ostream.write(f"1 {ub!s}{col_comments[var_idx]}\n")
-            elif ub is None:  # lb <= body
-                ostream.write(f"2 {lb!s}{col_comments[var_idx]}\n")
-            else:  # lb <= body <= ub
-                ostream.write(f"0 {lb!s} {ub!s}{col_comments[var_idx]}\n")
+        if self.binary:
+            ostream.write_bounds(
+                map(_var_bound_record, map(var_bounds.__getitem__, variables))
+            )
+        else:
+            for var_idx, _id in enumerate(variables):
+                lb, ub = var_bounds[_id]
+                if lb == ub:
+                    if lb is None:  # unbounded
+                        ostream.write(f"3{col_comments[var_idx]}\n")
+                    else:  # ==
+                        ostream.write(f"4 {lb!s}{col_comments[var_idx]}\n")
+                elif lb is None:  # var <= ub
+                    ostream.write(f"1 {ub!s}{col_comments[var_idx]}\n")
+                elif ub is None:  # lb <= body
+                    ostream.write(f"2 {lb!s}{col_comments[var_idx]}\n")
+                else:  # lb <= body <= ub
+                    ostream.write(f"0 {lb!s} {ub!s}{col_comments[var_idx]}\n")
 
         #
         # "k" lines (column offsets in Jacobian NNZ)
@@ -1527,10 +1903,15 @@ class _NLWriter_impl(object):
                 ),
             )
         )
-        ktot = 0
-        for var_idx, _id in enumerate(variables[:-1]):
-            ktot += con_nnz_by_var.get(_id, 0)
-            ostream.write(f"{ktot}\n")
+        if self.binary:
+            ostream.write_ints(
+                accumulate(con_nnz_by_var.get(_id, 0) for _id in variables[:-1])
+            )
+        else:
+            ktot = 0
+            for var_idx, _id in enumerate(variables[:-1]):
+                ktot += con_nnz_by_var.get(_id, 0)
+                ostream.write(f"{ktot}\n")
 
         #
         # "J" lines (non-empty terms in the Jacobian)
@@ -1544,9 +1925,11 @@ class _NLWriter_impl(object):
             if scale_model:
                 for _id, val in linear.items():
                     linear[_id] /= scaling_cache[_id]
-            ostream.write(f'J{row_idx} {len(linear)}{row_comments[row_idx]}\n')
-            for _id in sorted(linear, key=column_order.__getitem__):
-                ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
+            if self.binary:
+                ostream.write_segment('J', row_idx, len(linear))
+            else:
+                ostream.write(f'J{row_idx} {len(linear)}{row_comments[row_idx]}\n')
+            self._write_linear_pairs(linear)
 
         #
         # "G" lines (non-empty terms in the Objective)
@@ -1560,9 +1943,13 @@ class _NLWriter_impl(object):
             if scale_model:
                 for _id, val in linear.items():
                     linear[_id] /= scaling_cache[_id]
-            ostream.write(f'G{obj_idx} {len(linear)}{row_comments[obj_idx + n_cons]}\n')
-            for _id in sorted(linear, key=column_order.__getitem__):
-                ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
+            if self.binary:
+                ostream.write_segment('G', obj_idx, len(linear))
+            else:
+                ostream.write(
+                    f'G{obj_idx} {len(linear)}{row_comments[obj_idx + n_cons]}\n'
+                )
+            self._write_linear_pairs(linear)
 
         # Generate the return information
         eliminated_vars = [
@@ -1578,10 +1965,18 @@ class _NLWriter_impl(object):
             )
         else:
             scaling = None
+        var_list = [var_map[_id] for _id in variables]
+        con_list = [info[0] for info in constraints]
+        obj_list = [info[0] for info in objectives]
+        if symbolic_solver_labels:
+            # Do not hold on to the label strings: the names are
+            # regenerated on demand
+            row_labels = _ComponentLabels(con_list + obj_list, labeler)
+            col_labels = _ComponentLabels(var_list, labeler)
         info = NLWriterInfo(
-            var=[var_map[_id] for _id in variables],
-            con=[info[0] for info in constraints],
-            obj=[info[0] for info in objectives],
+            var=var_list,
+            con=con_list,
+            obj=obj_list,
             external_libs=sorted(amplfunc_libraries),
             row_labels=row_labels,
             col_labels=col_labels,
@@ -1592,6 +1987,99 @@ class _NLWriter_impl(object):
         timer.toc("Generated NL representation", delta=False)
         return info
 
+    def _compile_constraints_in_parallel(self, model, constraints, scaling_factor):
+        """Generate the (lb, ub, AMPLRepn) for each constraint in `constraints`
+
+        The constraint list is split into contiguous shards that are
+        compiled by a pool of forked worker processes.  The results are
+        merged back (in order) into this writer's state so that the
+        variable and constraint ordering (and therefore the NL file) is
+        identical to what the serial writer would produce.
+
+        """
+        global _parallel_shard_state
+
+        n_cons = len(constraints)
+        n_workers = self.config.parallel_workers
+        shard_size = self.config.parallel_shard_size
+        if shard_size is None:
+            shard_size = max(1000, -(-n_cons // (4 * n_workers)))
+        shards = [
+            (i, min(i + shard_size, n_cons)) for i in range(0, n_cons, shard_size)
+        ]
+        if len(shards) > 1:
+            try:
+                mp_context = multiprocessing.get_context('fork')
+            except ValueError:
+                logger.warning(
+                    "The NL writer 'parallel_workers' option requires the "
+                    "'fork' multiprocessing start method, which is not "
+                    "available on this platform.  Compiling constraints serially."
+                )
+                mp_context = None
+        else:
+            mp_context = None
+
+        visitor = self.visitor
+        var_map = self.var_map
+        var_components = None
+
+        if mp_context is None:
+            results = iter(())
+            pool = nullcontext()
+        else:
+            # The worker processes inherit the shard state (and the model)
+            # from this process through fork().
+            _parallel_shard_state = (
+                constraints,
+                var_map,
+                scaling_factor,
+                self.config,
+                self.sorter,
+            )
+            try:
+                pool = mp_context.Pool(min(n_workers, len(shards)))
+            finally:
+                _parallel_shard_state = None
+            results = pool.imap(_compile_constraint_shard, shards)
+
+        with pool:
+            for start, stop in shards:
+                try:
+                    ans = next(results, None)
+                except Exception:
+                    # Errors (including errors returning the results
+                    # from the worker) are regenerated by compiling the
+                    # shard serially below.
+                    ans = None
+                if ans is not None:
+                    shard_repns, shard_vars = ans
+                    if var_components is None:
+                        var_components = {
+                            id(comp): comp
+                            for comp in model.component_objects(Var, descend_into=True)
+                        }
+                    if not all(map(var_components.__contains__, shard_vars)):
+                        ans = None
+                if ans is None:
+                    for con in islice(constraints, start, stop):
+                        lb, body, ub = con.to_bounded_expression(True)
+                        yield lb, ub, visitor.walk_expression(
+                            (body, con, 0, scaling_factor(con))
+                        )
+                    continue
+                # Record the new variables encountered in this shard
+                # exactly as the AMPLRepnVisitor would have (whole
+                # components at a time)
+                for comp_id in shard_vars:
+                    for v in var_components[comp_id].values(self.sorter):
+                        if not v.fixed:
+                            var_map[id(v)] = v
+                for lb, ub, const, linear, nonlinear in shard_repns:
+                    expr_info = visitor.Result(const, linear, None)
+                    expr_info.nonlinear = nonlinear
+                    yield lb, ub, expr_info
+
     def _categorize_vars(self, comp_list, linear_by_comp):
         """Categorize compiled expression vars into linear and nonlinear
 
@@ -1981,6 +2469,18 @@ class _NLWriter_impl(object):
         else:
             self.ostream.write(self.template.const % 0)
 
+    def _write_linear_pairs(self, linear):
+        column_order = self.column_order
+        if self.binary:
+            self.ostream.write_pairs(
+                (column_order[_id], linear[_id])
+                for _id in sorted(linear, key=column_order.__getitem__)
+            )
+        else:
+            ostream = self.ostream
+            for _id in sorted(linear, key=column_order.__getitem__):
+                ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
+
     def _write_v_line(self, expr_id, k):
         ostream = self.ostream
         column_order = self.column_order
@@ -1996,7 +2496,6 @@ class _NLWriter_impl(object):
         linear = dict(item for item in info[1].linear.items() if item[1])
         #
         ostream.write(f'V{self.next_V_line_id} {len(linear)} {k}{lbl}\n')
-        for _id in sorted(linear, key=column_order.__getitem__):
-            ostream.write(f'{column_order[_id]} {linear[_id]!s}\n')
+        self._write_linear_pairs(linear)
         self._write_nl_expression(info[1], True)
         self.next_V_line_id += 1
@@ -87,6 +87,11 @@ class ParameterizedLinearStandardFormCompiler(LinearStandardFormCompiler):
 
         """
         config = self.config(options)
+        if config.structure_cache is not None:
+            raise ValueError(
+                "The ParameterizedLinearStandardFormCompiler does not support "
+                "the 'structure_cache' option"
+            )
 
         # Pause the GC, as the walker that generates the compiled LP
         # representation generates (and disposes of) a large number of
@@ -97,8 +102,8 @@ class ParameterizedLinearStandardFormCompiler(LinearStandardFormCompiler):
 
 class _SparseMatrixBase(object):
     def __init__(self, matrix_data, shape):
-        (data, indices, indptr) = matrix_data
-        (nrows, ncols) = shape
+        data, indices, indptr = matrix_data
+        nrows, ncols = shape
 
         self.data = np.array(data)
         self.indices = np.array(indices, dtype=int)
@@ -22,6 +22,7 @@ from pyomo.common.config import (
 )
 from pyomo.common.dependencies import scipy, numpy as np
 from pyomo.common.enums import ObjectiveSense
+from pyomo.common.errors import InfeasibleConstraintException
 from pyomo.common.gc_manager import PauseGC
 from pyomo.common.numeric_types import native_types, value
 from pyomo.common.timing import TicTocTimer
@@ -40,6 +41,17 @@ from pyomo.core.base import (
 from pyomo.opt import WriterFactory
 from pyomo.repn.linear import LinearRepnVisitor
 from pyomo.repn.linear_template import LinearTemplateRepnVisitor
+from pyomo.repn.structure_cache import (
+    ComponentTable,
+    StructureHasher,
+    SymbolicCoefficients,
+    SymbolicLinearRepnVisitor,
+    Uncacheable,
+    compile_evaluator,
+    resolve_components,
+    resolve_values,
+    to_structure_cache,
+)
 from pyomo.repn.util import (
     FileDeterminism,
     FileDeterminism_to_SortComponents,
@@ -59,6 +71,79 @@ logger = logging.getLogger(__name__)
 RowEntry = collections.namedtuple('RowEntry', ['constraint', 'bound_type'])
 
 
+def _template_id(con):
+    # Key used to group consecutive constraints that share the same
+    # template (see TemplateConstraintData)
+    try:
+        return id(con.template_expr())
+    except AttributeError:
+        return None
+
+
+_TemplateGroup = collections.namedtuple('_TemplateGroup', ['constraints'])
+
+
+def _component_names(components):
+    if components is None or components.__class__ is bool:
+        return components
+    return tuple(c.name for c in components)
+
+
+def _symbolic_record(head, bounds, repn, symbolic, patches, n, var_order):
+    # Convert a (symbolic) repn into a record of native values.  Any
+    # symbolic values are replaced by None and recorded in the patches
+    # list as (record number, field, coefficient position, slot).
+    record = list(head)
+    for val in bounds + (repn.constant,):
+        val = symbolic.slot(val)
+        if val.__class__ is tuple:
+            patches.append((n, len(record), None, val[0]))
+            val = None
+        record.append(val)
+    index = []
+    data = []
+    for vid, coef in repn.linear.items():
+        coef = symbolic.slot(coef)
+        if coef.__class__ is tuple:
+            patches.append((n, None, len(data), coef[0]))
+            coef = None
+        elif not coef:
+            continue
+        index.append(var_order[vid])
+        data.append(coef)
+    record.append(index)
+    record.append(data)
+    return record
+
+
+def _evaluate_records(records, patches, vals):
+    # Fill the symbolic values into the cached records.  Records are
+    # only copied if they are modified (so unmodified records are shared
+    # with the cache).
+    if not patches:
+        return records
+    records = list(records)
+    updated = {}
+    for n, field, pos, slot in patches:
+        record = updated.get(n, None)
+        if record is None:
+            record = updated[n] = list(records[n])
+            record[-1] = list(record[-1])
+        if pos is None:
+            record[field] = vals[slot]
+        else:
+            record[-1][pos] = vals[slot]
+    for n, record in updated.items():
+        data = record[-1]
+        if 0 in data:
+            index = record[-2]
+            keep = [i for i, coef in enumerate(data) if coef]
+            record[-2] = [index[i] for i in keep]
+            record[-1] = [data[i] for i in keep]
+        records[n] = record
+    return records
+
+
 # TODO: make a proper base class
 class LinearStandardFormInfo(object):
     """Return type for LinearStandardFormCompiler.write()
@@ -237,6 +322,42 @@ class LinearStandardFormCompiler(object):
             appended to the end of this list.""",
         ),
     )
+    CONFIG.declare(
+        'structure_cache',
+        ConfigValue(
+            default=None,
+            domain=to_structure_cache,
+            description='Cache of compiled model structure',
+            doc="""
+            A :class:`~pyomo.repn.structure_cache.StructureCache` (or the
+            name of a directory to hold one).  The compiled structure of
+            the model (column and row ordering, sparsity pattern, and
+            symbolic coefficients) is stored in the cache keyed on a
+            structural hash of the model.  Subsequent compilations of a
+            model with the same structure (but possibly different
+            mutable Param or fixed Var values) re-evaluate the cached
+            coefficients instead of walking all the expressions.  Not
+            used with ``slack_form``.  Cache entries stored in a directory
+            are unpickled and the generated coefficient code is executed
+            (``exec``) when they are loaded, so the cache directory must
+            be trusted.""",
+        ),
+    )
+    CONFIG.declare(
+        'structure_key',
+        ConfigValue(
+            default=None,
+            domain=str,
+            description='Key identifying the model structure in the structure_cache',
+            doc="""
+            If specified, this key is used in place of the structural
+            hash of the model when looking up the model in the
+            ``structure_cache``.  This avoids the (linear time)
+            computation of the hash, but it is the caller's
+            responsibility to ensure that all models compiled with the
+            same key have the same structure.""",
+        ),
+    )
 
     def __init__(self):
         self.config = self.CONFIG()
@@ -327,15 +448,6 @@ class _LinearStandardFormCompiler_impl(object):
                 )
             )
 
-        self.var_map = var_map = {}
-        initialize_var_map_from_column_order(model, self.config, var_map)
-
-        var_recorder = TemplateVarRecorder(var_map, None, sorter)
-        visitor = self._get_visitor({}, var_recorder=var_recorder)
-        template_visitor = LinearTemplateRepnVisitor({}, var_recorder=var_recorder)
-
-        timer.toc('Initialized column order', level=logging.DEBUG)
-
         # We don't export any suffix information to the Standard Form
         #
         if component_map[Suffix]:
@@ -360,10 +472,12 @@ class _LinearStandardFormCompiler_impl(object):
                     + "\nStandard Form compiler ignores export suffixes.  Skipping."
                 )
 
-        #
-        # Process objective
-        #
         set_sense = self.config.set_sense
+        slack_form = self.config.slack_form
+        mixed_form = self.config.mixed_form
+        if slack_form and mixed_form:
+            raise ValueError("cannot specify both slack_form and mixed_form")
+
         objectives = []
         for blk in component_map[Objective]:
             objectives.extend(
@@ -371,33 +485,55 @@ class _LinearStandardFormCompiler_impl(object):
                     Objective, active=True, descend_into=False, sort=sorter
                 )
             )
+        constraints = ordered_active_constraints(model, self.config)
+
+        #
+        # Generate the (linear) representation of the objectives and
+        # constraints, either from the structure cache or by walking
+        # the expressions
+        #
+        cached = None
+        if self.config.structure_cache is not None and not slack_form:
+            constraints = list(constraints)
+            cached = self._cached_repns(model, sorter, objectives, constraints)
+        if cached is None:
+            self.var_map = var_map = {}
+            initialize_var_map_from_column_order(model, self.config, var_map)
+            var_recorder = TemplateVarRecorder(var_map, None, sorter)
+            visitor = self._get_visitor({}, var_recorder=var_recorder)
+            template_visitor = LinearTemplateRepnVisitor({}, var_recorder=var_recorder)
+            obj_repns = self._objective_repns(
+                objectives, visitor, template_visitor, var_recorder
+            )
+            con_repns = self._constraint_repns(
+                constraints, visitor, template_visitor, var_recorder, slack_form
+            )
+            pending_entry = None
+        else:
+            (
+                var_map,
+                var_recorder,
+                template_visitor,
+                obj_repns,
+                con_repns,
+                pending_entry,
+            ) = cached
+            self.var_map = var_map
+
+        timer.toc('Initialized column order', level=logging.DEBUG)
+
+        #
+        # Process objective
+        #
         obj_nnz = 0
         obj_offset = []
         obj_data = []
         obj_index = []
         obj_index_ptr = [0]
-        for obj in objectives:
-            if hasattr(obj, 'template_expr'):
-                offset, linear_index, linear_data, _, _ = (
-                    template_visitor.expand_expression(obj, obj.template_expr())
-                )
-                N = len(linear_index)
-                obj_index.append(linear_index)
-                obj_data.append(linear_data)
-                obj_offset.append(offset)
-            else:
-                repn = visitor.walk_expression(obj.expr)
-                N = len(repn.linear)
-                obj_index.append(map(var_recorder.var_order.__getitem__, repn.linear))
-                obj_data.append(repn.linear.values())
-                obj_offset.append(repn.constant)
-
-                if repn.nonlinear is not None:
-                    raise ValueError(
-                        f"Model objective ({obj.name}) contains nonlinear terms that "
-                        "cannot be compiled to standard (linear) form."
-                    )
-
+        for obj, offset, linear_index, linear_data, N in obj_repns:
+            obj_index.append(linear_index)
+            obj_data.append(linear_data)
+            obj_offset.append(offset)
             obj_nnz += N
             if set_sense is not None and set_sense != obj.sense:
                 obj_data[-1] = -self._to_vector(obj_data[-1], float, N)
@@ -409,48 +545,50 @@ class _LinearStandardFormCompiler_impl(object):
         #
         # Tabulate constraints
         #
-        slack_form = self.config.slack_form
-        mixed_form = self.config.mixed_form
-        if slack_form and mixed_form:
-            raise ValueError("cannot specify both slack_form and mixed_form")
         rows = []
         rhs = []
         con_nnz = 0
         con_data = []
         con_index = []
         con_index_ptr = [0]
+        # Blocks of rows that have already been converted to CSR arrays
+        con_blocks = []
         last_parent = None
-        for con in ordered_active_constraints(model, self.config):
+        for con_repn in con_repns:
+            if con_repn.__class__ is _TemplateGroup:
+                con_group = con_repn.constraints
+                con = con_group[0]
+                if with_debug_timing and con._component is not last_parent:
+                    if last_parent is not None:
+                        timer.toc('Constraint %s', last_parent(), level=logging.DEBUG)
+                    last_parent = con._component
+
+                if len(con_index_ptr) > 1:
+                    con_blocks.append(
+                        self._to_csr_arrays(con_data, con_index, con_index_ptr, con_nnz)
+                    )
+                    con_nnz = 0
+                    con_data = []
+                    con_index = []
+                    con_index_ptr = [0]
+                con_blocks.append(
+                    self._expand_template_rows(
+                        template_visitor,
+                        con_group,
+                        con.template_expr(),
+                        rows,
+                        rhs,
+                        mixed_form,
+                    )
+                )
+                continue
+
+            con, lb, ub, offset, linear_index, linear_data, N = con_repn
             if with_debug_timing and con._component is not last_parent:
                 if last_parent is not None:
                     timer.toc('Constraint %s', last_parent(), level=logging.DEBUG)
                 last_parent = con._component
 
-            if hasattr(con, 'template_expr'):
-                offset, linear_index, linear_data, lb, ub = (
-                    template_visitor.expand_expression(con, con.template_expr())
-                )
-                N = len(linear_data)
-            else:
-                # Note: lb and ub could be a number, expression, or None
-                lb, body, ub = con.to_bounded_expression()
-                if lb.__class__ not in native_types:
-                    lb = value(lb)
-                if ub.__class__ not in native_types:
-                    ub = value(ub)
-                repn = visitor.walk_expression(body)
-                if repn.nonlinear is not None:
-                    raise ValueError(
-                        f"Model constraint ({con.name}) contains nonlinear terms that "
-                        "cannot be compiled to standard (linear) form."
-                    )
-
-                N = len(repn.linear)
-                # Pull out the constant: we will move it to the bounds
-                offset = repn.constant
-                linear_index = map(var_recorder.var_order.__getitem__, repn.linear)
-                linear_data = repn.linear.values()
-
             if lb is None and ub is None:
                 # Note: you *cannot* output trivial (unbounded)
                 # constraints in matrix format.  I suppose we could add a
@@ -462,7 +600,7 @@ class _LinearStandardFormCompiler_impl(object):
                 # TODO: add a (configurable) feasibility tolerance
                 if (lb is None or lb <= offset) and (ub is None or ub >= offset):
                     continue
-                raise InfeasibleError(
+                raise InfeasibleConstraintException(
                     f"model contains a trivially infeasible constraint, '{con.name}'"
                 )
 
@@ -543,13 +681,23 @@ class _LinearStandardFormCompiler_impl(object):
             # report the last constraint
             timer.toc('Constraint %s', last_parent(), level=logging.DEBUG)
 
+        if pending_entry is not None:
+            self._store_structure(var_map, *pending_entry)
+
         # Get the variable list
         columns = list(var_map.values())
         n_cols = len(columns)
 
         # Convert the compiled data to scipy sparse matrices
         c = self._create_csc(obj_data, obj_index, obj_index_ptr, obj_nnz, n_cols)
-        A = self._create_csc(con_data, con_index, con_index_ptr, con_nnz, n_cols)
+        if con_blocks:
+            if len(con_index_ptr) > 1:
+                con_blocks.append(
+                    self._to_csr_arrays(con_data, con_index, con_index_ptr, con_nnz)
+                )
+            A = self._create_csc_from_blocks(con_blocks, n_cols)
+        else:
+            A = self._create_csc(con_data, con_index, con_index_ptr, con_nnz, n_cols)
 
         if with_debug_timing:
             timer.toc('Formed matrices', level=logging.DEBUG)
@@ -596,6 +744,223 @@ class _LinearStandardFormCompiler_impl(object):
         timer.toc("Generated linear standard form representation", delta=False)
         return info
 
+    def _objective_repns(self, objectives, visitor, template_visitor, var_recorder):
+        for obj in objectives:
+            if hasattr(obj, 'template_expr'):
+                offset, linear_index, linear_data, _, _ = (
+                    template_visitor.expand_expression(obj, obj.template_expr())
+                )
+                N = len(linear_index)
+            else:
+                repn = visitor.walk_expression(obj.expr)
+                if repn.nonlinear is not None:
+                    raise ValueError(
+                        f"Model objective ({obj.name}) contains nonlinear terms that "
+                        "cannot be compiled to standard (linear) form."
+                    )
+                N = len(repn.linear)
+                linear_index = map(var_recorder.var_order.__getitem__, repn.linear)
+                linear_data = repn.linear.values()
+                offset = repn.constant
+            yield obj, offset, linear_index, linear_data, N
+
+    def _constraint_repns(
+        self, constraints, visitor, template_visitor, var_recorder, slack_form
+    ):
+        for template_id, con_group in itertools.groupby(constraints, key=_template_id):
+            if template_id is not None and not slack_form:
+                yield _TemplateGroup(list(con_group))
+                continue
+
+            for con in con_group:
+                if hasattr(con, 'template_expr'):
+                    offset, linear_index, linear_data, lb, ub = (
+                        template_visitor.expand_expression(con, con.template_expr())
+                    )
+                    N = len(linear_data)
+                else:
+                    # Note: lb and ub could be a number, expression, or None
+                    lb, body, ub = con.to_bounded_expression()
+                    if lb.__class__ not in native_types:
+                        lb = value(lb)
+                    if ub.__class__ not in native_types:
+                        ub = value(ub)
+                    repn = visitor.walk_expression(body)
+                    if repn.nonlinear is not None:
+                        raise ValueError(
+                            f"Model constraint ({con.name}) contains nonlinear terms that "
+                            "cannot be compiled to standard (linear) form."
+                        )
+
+                    N = len(repn.linear)
+                    # Pull out the constant: we will move it to the bounds
+                    offset = repn.constant
+                    linear_index = map(var_recorder.var_order.__getitem__, repn.linear)
+                    linear_data = repn.linear.values()
+                yield con, lb, ub, offset, linear_index, linear_data, N
+
+    def _cached_repns(self, model, sorter, objectives, constraints):
+        """Generate the objective / constraint repns using the structure cache
+
+        Returns None if the model cannot be processed through the cache
+        (in which case the caller should fall back on walking all the
+        expressions).
+
+        """
+        config = self.config
+        cache = config.structure_cache
+        key = config.structure_key
+        if key is None:
+            try:
+                key = StructureHasher(sorter).hash(
+                    objectives,
+                    constraints,
+                    _template_id,
+                    (
+                        _component_names(config.column_order),
+                        int(config.file_determinism),
+                    ),
+                )
+            except Uncacheable:
+                return None
+
+        var_map = {}
+        initialize_var_map_from_column_order(model, config, var_map)
+        n_initial_vars = len(var_map)
+        var_recorder = TemplateVarRecorder(var_map, None, sorter)
+        template_visitor = LinearTemplateRepnVisitor({}, var_recorder=var_recorder)
+
+        entry = cache.load(key)
+        try:
+            if entry is None:
+                table = ComponentTable(model)
+                entry, vals = self._compile_structure(
+                    table, objectives, constraints, var_recorder
+                )
+                pending_entry = cache, key, entry, table, n_initial_vars
+            else:
+                if entry['shape'] != (len(objectives), len(constraints)):
+                    raise Uncacheable(f"model does not match cache entry '{key}'")
+                components = resolve_components(model, entry['components'])
+                for i in entry['var_comps']:
+                    var_recorder.add(components[i])
+                vals = cache.evaluator(key, entry)(
+                    resolve_values(components, entry['refs'])
+                )
+                pending_entry = None
+        except Exception as e:
+            # Fall back on the normal compiler, which will generate the
+            # appropriate exception (if the model is invalid)
+            logger.debug("Not using the structure cache: %s", e)
+            return None
+
+        obj_repns = [
+            (obj, offset, index, data, len(index))
+            for obj, (offset, index, data) in zip(
+                objectives,
+                _evaluate_records(entry['objectives'], entry['obj_patches'], vals),
+            )
+        ]
+        con_repns = []
+        for record in _evaluate_records(
+            entry['constraints'], entry['con_patches'], vals
+        ):
+            if len(record) == 1:
+                con_repns.append(_TemplateGroup([constraints[i] for i in record[0]]))
+            else:
+                i, lb, ub, offset, index, data = record
+                con_repns.append(
+                    (constraints[i], lb, ub, offset, index, data, len(index))
+                )
+        return (
+            var_map,
+            var_recorder,
+            template_visitor,
+            obj_repns,
+            con_repns,
+            pending_entry,
+        )
+
+    def _compile_structure(self, table, objectives, constraints, var_recorder):
+        """Walk the model, keeping all data symbolic, and return the
+        (cacheable) compiled structure along with the current values of
+        the symbolic data"""
+        visitor = SymbolicLinearRepnVisitor({}, var_recorder)
+        var_order = var_recorder.var_order
+        symbolic = SymbolicCoefficients()
+
+        obj_records = []
+        obj_patches = []
+        for obj in objectives:
+            repn = visitor.walk_expression(obj.expr)
+            if repn.nonlinear is not None:
+                raise Uncacheable(f"nonlinear objective {obj.name}")
+            obj_records.append(
+                _symbolic_record(
+                    (), (), repn, symbolic, obj_patches, len(obj_records), var_order
+                )
+            )
+
+        con_records = []
+        con_patches = []
+        for template_id, con_group in itertools.groupby(
+            enumerate(constraints), key=lambda x: _template_id(x[1])
+        ):
+            if template_id is not None:
+                con_records.append(([i for i, con in con_group],))
+                continue
+            for i, con in con_group:
+                lb, body, ub = con.to_bounded_expression()
+                repn = visitor.walk_expression(body)
+                if repn.nonlinear is not None:
+                    raise Uncacheable(f"nonlinear constraint {con.name}")
+                con_records.append(
+                    _symbolic_record(
+                        (i,),
+                        (lb, ub),
+                        repn,
+                        symbolic,
+                        con_patches,
+                        len(con_records),
+                        var_order,
+                    )
+                )
+
+        source, groups, refs = symbolic.compile(table)
+        vals = symbolic.verify(
+            compile_evaluator(source, groups), [obj.value for obj in symbolic.data]
+        )
+        entry = {
+            'shape': (len(objectives), len(constraints)),
+            'source': source,
+            'groups': groups,
+            'refs': refs,
+            'objectives': obj_records,
+            'obj_patches': obj_patches,
+            'constraints': con_records,
+            'con_patches': con_patches,
+        }
+        return entry, vals
+
+    def _store_structure(self, var_map, cache, key, entry, table, n_initial_vars):
+        # Record the Var components in the order that they were added
+        # to the var_map so that a cache hit can reproduce the column
+        # ordering without walking the expressions.
+        var_comps = []
+        seen = set()
+        try:
+            for v in itertools.islice(var_map.values(), n_initial_vars, None):
+                comp = v.parent_component()
+                if id(comp) not in seen:
+                    seen.add(id(comp))
+                    var_comps.append(table.component(comp))
+        except Uncacheable as e:
+            logger.debug("Not storing model in the structure cache: %s", e)
+            return
+        entry['var_comps'] = var_comps
+        entry['components'] = table.names
+        cache.store(key, entry)
+
     def _create_csc(self, data, index, index_ptr, nnz, n_cols):
         if not nnz:
             # The empty CSC has no (or few) rows and a large number of
@@ -617,6 +982,124 @@ class _LinearStandardFormCompiler_impl(object):
         A.eliminate_zeros()
         return A
 
+    def _to_csr_arrays(self, data, index, index_ptr, nnz):
+        return (
+            self._to_vector(itertools.chain.from_iterable(data), np.float64, nnz),
+            self._to_vector(itertools.chain.from_iterable(index), np.int32, nnz),
+            np.array(index_ptr, dtype=np.int32),
+        )
+
+    def _create_csc_from_blocks(self, blocks, n_cols):
+        # Each block is a (data, indices, indptr) tuple of CSR arrays;
+        # stack them (in order) into a single CSR matrix.
+        data = np.concatenate([block[0] for block in blocks])
+        index = np.concatenate([block[1] for block in blocks])
+        offsets = np.cumsum([0] + [block[2][-1] for block in blocks])
+        index_ptr = np.concatenate(
+            [[0]] + [block[2][1:] + offset for block, offset in zip(blocks, offsets)]
+        ).astype(np.int32)
+        A = self._csr_matrix((data, index, index_ptr), [len(index_ptr) - 1, n_cols])
+        A = A.tocsc()
+        A.sum_duplicates()
+        A.eliminate_zeros()
+        return A
+
+    def _expand_template_rows(
+        self, template_visitor, cons, template_info, rows, rhs, mixed_form
+    ):
+        """Compile a run of constraints that share a template into CSR arrays
+
+        The template is compiled once and the linear terms for all the
+        constraints are generated into flat lists, so the rows (and
+        their right-hand sides) can be formed with vectorized NumPy
+        operations instead of per-row Python processing.
+
+        """
+        offset, indptr, index, data, lb, ub = template_visitor.expand_expressions(
+            cons, template_info
+        )
+        n = len(cons)
+        if lb is None and ub is None:
+            # Note: you *cannot* output trivial (unbounded)
+            # constraints in matrix format.
+            return (
+                np.empty(0, dtype=np.float64),
+                np.empty(0, dtype=np.int32),
+                np.zeros(1, dtype=np.int64),
+            )
+        offset = np.array(offset, dtype=np.float64)
+        indptr = np.array(indptr, dtype=np.int64)
+        index = np.array(index, dtype=np.int32)
+        data = np.array(data, dtype=np.float64)
+        has_lb = lb is not None
+        has_ub = ub is not None
+        lb = np.array(lb, dtype=np.float64) if has_lb else None
+        ub = np.array(ub, dtype=np.float64) if has_ub else None
+
+        nnz = indptr[1:] - indptr[:-1]
+        constant = nnz == 0
+        if constant.any():
+            # TODO: add a (configurable) feasibility tolerance
+            feasible = np.ones(n, dtype=bool)
+            if has_lb:
+                feasible &= lb <= offset
+            if has_ub:
+                feasible &= ub >= offset
+            infeasible = np.flatnonzero(constant & ~feasible)
+            if len(infeasible):
+                raise InfeasibleConstraintException(
+                    "model contains a trivially infeasible constraint, "
+                    f"'{cons[infeasible[0]].name}'"
+                )
+
+        # Each constraint generates (up to) 2 rows: the first "slot" is
+        # the upper bound (or equality) row and the second is the
+        # lower bound row.  We will generate both slots and then mask
+        # out the slots that do not generate a row.
+        slot_valid = np.zeros((n, 2), dtype=bool)
+        slot_tag = np.empty((n, 2), dtype=np.int8)
+        slot_sign = np.ones((n, 2), dtype=np.float64)
+        slot_rhs = np.empty((n, 2), dtype=np.float64)
+        if mixed_form:
+            eq = lb == ub if has_lb and has_ub else np.zeros(n, dtype=bool)
+            if has_ub:
+                slot_valid[:, 0] = True
+                slot_tag[:, 0] = np.where(eq, 0, 1)
+                slot_rhs[:, 0] = ub - offset
+            if has_lb:
+                slot_valid[:, 1] = ~eq
+                slot_tag[:, 1] = -1
+                slot_rhs[:, 1] = lb - offset
+        else:
+            if has_ub:
+                slot_valid[:, 0] = True
+                slot_tag[:, 0] = 1
+                slot_rhs[:, 0] = ub - offset
+            if has_lb:
+                slot_valid[:, 1] = True
+                slot_tag[:, 1] = -1
+                slot_sign[:, 1] = -1
+                slot_rhs[:, 1] = offset - lb
+        slot_valid[constant, :] = False
+
+        mask = slot_valid.ravel()
+        src = np.repeat(np.arange(n), 2)[mask]
+        sign = slot_sign.ravel()[mask]
+        rhs.extend(slot_rhs.ravel()[mask].tolist())
+        rows.extend(
+            map(
+                RowEntry,
+                map(cons.__getitem__, src.tolist()),
+                slot_tag.ravel()[mask].tolist(),
+            )
+        )
+
+        # Gather the linear terms for each generated row
+        row_nnz = nnz[src]
+        row_ptr = np.concatenate(([0], np.cumsum(row_nnz)))
+        pos = np.repeat(indptr[src] - row_ptr[:-1], row_nnz) + np.arange(row_ptr[-1])
+        return data[pos] * np.repeat(sign, row_nnz), index[pos], row_ptr
+
     def _csc_to_nonnegative_vars(self, c, A, columns):
         eliminated_vars = []
         new_columns = []
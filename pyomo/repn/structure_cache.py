@@ -0,0 +1,492 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Persistent cache of compiled model structure
+
+Compiling a model to a matrix form is dominated by walking every
+objective and constraint expression.  When a model is rebuilt (or
+re-solved) with the same *structure* but new numeric data (mutable
+Param values and fixed Var values), that walk produces the same
+variable ordering, row ordering, and sparsity pattern every time.
+
+This module provides the pieces needed to skip that walk:
+
+- :class:`StructureCache` stores compiled artifacts in memory and
+  (optionally) on disk, keyed on a structural hash of the model.
+
+- :class:`StructureHasher` computes the structural hash of a model.
+
+- :class:`ComponentTable` records references to the components and
+  data used by a compiled artifact so that they can be mapped back onto
+  a (possibly new) model instance.
+
+- :class:`SymbolicLinearRepnVisitor` generates linear representations
+  where all numeric data (mutable Params and fixed Vars) is kept
+  symbolic so that the coefficients can be compiled to Python code and
+  re-evaluated against new data.
+
+"""
+
+import hashlib
+import logging
+import math
+import os
+import pickle
+import tempfile
+
+from pyomo.common.numeric_types import native_numeric_types, native_types, value
+from pyomo.core.base.var import Var
+from pyomo.core.expr.symbol_map import SymbolMap
+from pyomo.repn.parameterized_linear import (
+    ParameterizedLinearBeforeChildDispatcher,
+    ParameterizedLinearRepnVisitor,
+)
+from pyomo.repn.util import ExprType
+
+logger = logging.getLogger(__name__)
+
+# Bump this whenever the format of the cached artifacts changes
+CACHE_VERSION = 1
+
+_FIXED = ExprType.FIXED
+
+
+class Uncacheable(Exception):
+    """Raised when a model (or expression) cannot be cached"""
+
+
+class StructureCache(object):
+    """Cache of compiled model structure
+
+    Entries are held in memory and, if `directory` is provided, are
+    also pickled to ``<directory>/<key>.pkl`` so that they can be
+    reused across processes.
+
+    Parameters
+    ----------
+    directory: str, optional
+
+        Directory to store cache entries in.  The directory is created
+        if it does not exist.  If None, the cache is only held in
+        memory.
+
+    .. warning::
+
+        Entries read from `directory` are unpickled and the compiled
+        coefficient code they contain is executed (``exec``).  Only
+        use a directory that is trusted (i.e., that cannot be written
+        by untrusted users).
+
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._entries = {}
+        self._evaluators = {}
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pkl')
+
+    def load(self, key):
+        """Return the entry stored under `key` (or None)"""
+        entry = self._entries.get(key, None)
+        if entry is not None or self.directory is None:
+            return entry
+        try:
+            with open(self._path(key), 'rb') as FILE:
+                entry = pickle.load(FILE)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(
+                f"Ignoring unreadable structure cache entry '{self._path(key)}': {e}"
+            )
+            return None
+        if entry.get('version', None) != CACHE_VERSION:
+            return None
+        self._entries[key] = entry
+        return entry
+
+    def store(self, key, entry):
+        """Store `entry` (a picklable dict) under `key`"""
+        entry['version'] = CACHE_VERSION
+        self._entries[key] = entry
+        if self.directory is None:
+            return
+        # Write to a temporary file and atomically move it into place so
+        # that concurrent readers never see a partially-written entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as FILE:
+                pickle.dump(entry, FILE, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path(key))
+        except (OSError, TypeError, AttributeError, pickle.PicklingError):
+            os.remove(tmp)
+            raise
+
+    def evaluator(self, key, entry):
+        """Return the compiled ``evaluate(d)`` function for `entry`"""
+        ans = self._evaluators.get(key, None)
+        if ans is None:
+            ans = self._evaluators[key] = compile_evaluator(
+                entry['source'], entry['groups']
+            )
+        return ans
+
+    def clear(self):
+        """Remove all entries (both in memory and on disk)"""
+        self._entries.clear()
+        self._evaluators.clear()
+        if self.directory is None:
+            return
+        for fname in os.listdir(self.directory):
+            if fname.endswith('.pkl'):
+                os.remove(os.path.join(self.directory, fname))
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def to_structure_cache(val):
+    """ConfigValue domain accepting a :class:`StructureCache` or a
+    directory name"""
+    if val is None or isinstance(val, StructureCache):
+        return val
+    return StructureCache(os.fspath(val))
+
+
+# Node categories used by StructureHasher.walk()
+_NATIVE = 0
+_EXPR = 1
+_FUNCTION = 2
+_VAR = 3
+_PARAM = 4
+_INDEXED = 5
+_OTHER = 6
+
+
+class StructureHasher(object):
+    """Compute a structural hash for a list of objectives and constraints
+
+    The hash covers the expression trees (operators, native constants,
+    immutable Param values, and the identity and fixed status of each
+    Var), but *not* the values of mutable Params or fixed Vars.
+    Components are identified by the order in which they are first
+    encountered, so two models built the same way produce the same hash.
+
+    """
+
+    def __init__(self, sorter):
+        self.sorter = sorter
+        self.components = []
+        self._comp_pos = {}
+        self._categories = {}
+
+    def _categorize(self, node):
+        cls = node.__class__
+        if cls in native_types:
+            ans = _NATIVE
+        elif node.is_expression_type():
+            ans = _FUNCTION if hasattr(node, '_name') else _EXPR
+        elif node.is_indexed():
+            ans = _INDEXED
+        elif node.is_potentially_variable():
+            ans = _VAR
+        elif node.is_parameter_type():
+            ans = _PARAM
+        else:
+            ans = _OTHER
+        self._categories[cls] = ans
+        return ans
+
+    def _pos(self, comp):
+        _id = id(comp)
+        ans = self._comp_pos.get(_id, None)
+        if ans is None:
+            ans = self._comp_pos[_id] = len(self.components)
+            self.components.append(comp)
+        return ans
+
+    def walk(self, expr, tokens):
+        """Append the structural tokens for `expr` to `tokens`"""
+        append = tokens.append
+        categories = self._categories
+        pos = self._pos
+        stack = [expr]
+        while stack:
+            node = stack.pop()
+            cat = categories.get(node.__class__, None)
+            if cat is None:
+                cat = self._categorize(node)
+            if cat == _EXPR:
+                args = node.args
+                append(node.__class__.__name__)
+                append(len(args))
+                stack.extend(args)
+            elif cat == _VAR:
+                append('v')
+                append(pos(node.parent_component()))
+                append(node._index)
+                append(node.fixed)
+            elif cat == _PARAM:
+                if node.is_constant():
+                    append(node.value)
+                else:
+                    append('p')
+                    append(pos(node.parent_component()))
+                    append(node._index)
+            elif cat == _NATIVE:
+                append(node)
+            elif cat == _FUNCTION:
+                args = node.args
+                append(node._name)
+                append(len(args))
+                stack.extend(args)
+            elif cat == _INDEXED:
+                append('i')
+                append(pos(node))
+            else:
+                try:
+                    append(value(node))
+                except (TypeError, ValueError):
+                    append(str(node))
+
+    def hash(self, objectives, constraints, template_id, options):
+        """Return the structural hash (a hex string)
+
+        Parameters
+        ----------
+        objectives: list
+            The (active) objective data objects
+        constraints: list
+            The (active) constraint data objects, in row order
+        template_id: function
+            Function returning the template group key for a constraint
+            (None for non-templated constraints)
+        options: tuple
+            Additional (repr-able) tokens that affect the compiled result
+
+        """
+        tokens = [CACHE_VERSION, options, len(objectives), len(constraints)]
+        for obj in objectives:
+            if hasattr(obj, 'template_expr'):
+                raise Uncacheable('templated objective')
+            tokens.append(('O', int(obj.sense)))
+            self.walk(obj.expr, tokens)
+        last_template = None
+        for con in constraints:
+            tid = template_id(con)
+            if tid is None:
+                tokens.append('C')
+                self.walk(con.expr, tokens)
+            elif tid == last_template:
+                tokens.append('T')
+            else:
+                tokens.append(('T', str(con.template_expr()[0])))
+                self.walk(con.template_expr()[0], tokens)
+            last_template = tid
+        # The compiled columns include *all* indices of every referenced
+        # Var component, so the key sets are part of the structure
+        for comp in self.components:
+            if comp.ctype is Var:
+                tokens.append((comp.name, tuple(comp.keys(self.sorter))))
+            else:
+                tokens.append(comp.name)
+        return hashlib.sha256(repr(tokens).encode()).hexdigest()
+
+
+class ComponentTable(object):
+    """Model-independent references to components and component data
+
+    Components are recorded by their fully qualified name (relative to
+    `model`), so that references generated for one model instance can
+    be resolved against another instance with the same structure.
+
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.names = []
+        self._pos = {}
+
+    def component(self, comp):
+        """Return the position of `comp` in the table"""
+        _id = id(comp)
+        ans = self._pos.get(_id, None)
+        if ans is None:
+            blk = comp.parent_block()
+            while blk is not self.model:
+                if blk is None:
+                    raise Uncacheable(f"component {comp.name} is not on the model")
+                blk = blk.parent_block()
+            ans = self._pos[_id] = len(self.names)
+            self.names.append(
+                comp.getname(fully_qualified=True, relative_to=self.model)
+            )
+        return ans
+
+    def data(self, obj):
+        """Return a reference to the component data `obj`"""
+        return self.component(obj.parent_component()), obj.index()
+
+
+def resolve_components(model, names):
+    """Return the components on `model` named by `names`"""
+    ans = []
+    for name in names:
+        comp = model.find_component(name)
+        if comp is None:
+            raise Uncacheable(f"component {name} not found on the model")
+        ans.append(comp)
+    return ans
+
+
+def resolve_values(components, refs):
+    """Return the current values of the component data in `refs`"""
+    return [components[pos][idx].value for pos, idx in refs]
+
+
+class SymbolicLinearBeforeChildDispatcher(ParameterizedLinearBeforeChildDispatcher):
+    @staticmethod
+    def _before_var(visitor, child):
+        _id = id(child)
+        if _id not in visitor.var_map:
+            if child.fixed:
+                return False, (_FIXED, child)
+            visitor.var_recorder.add(child)
+        ans = visitor.Result()
+        ans.linear[_id] = 1
+        return False, (ExprType.LINEAR, ans)
+
+    @staticmethod
+    def _before_param(visitor, child):
+        if not child.is_constant():
+            return False, (_FIXED, child)
+        return False, (ExprType.CONSTANT, visitor.check_constant(child.value, child))
+
+    @staticmethod
+    def _before_npv(visitor, child):
+        # Descend into NPV expressions so that we record the underlying
+        # (mutable) data and not its current value
+        return True, None
+
+
+_before_child_dispatcher = SymbolicLinearBeforeChildDispatcher()
+
+
+class SymbolicLinearRepnVisitor(ParameterizedLinearRepnVisitor):
+    """Linear repn visitor that keeps mutable Params and fixed Vars
+    (that are not already columns) as symbolic coefficients"""
+
+    def __init__(self, subexpression_cache, var_recorder):
+        super().__init__(subexpression_cache, wrt=(), var_recorder=var_recorder)
+
+    def beforeChild(self, node, child, child_idx):
+        return _before_child_dispatcher[child.__class__](self, child)
+
+
+class _DataLabeler(object):
+    """Label data objects in an expression as ``d[a0]``, ``d[a1]``, ...
+    (in order of first appearance) while recording the global position
+    of each object in the list of referenced data"""
+
+    def __init__(self, data, data_pos):
+        self.data = data
+        self.data_pos = data_pos
+        self.args = []
+
+    def __call__(self, obj):
+        _id = id(obj)
+        pos = self.data_pos.get(_id, None)
+        if pos is None:
+            pos = self.data_pos[_id] = len(self.data)
+            self.data.append(obj)
+        self.args.append(pos)
+        return 'd[a%d]' % (len(self.args) - 1)
+
+
+class SymbolicCoefficients(object):
+    """Collect symbolic coefficients and compile them to Python code
+
+    :meth:`slot` returns native numbers unchanged and registers any
+    other (fixed) expression, returning a 1-tuple holding the slot
+    number of that expression in the list returned by the compiled
+    ``evaluate(d)`` function.
+
+    Expressions are grouped by their "shape" (the expression string with
+    the data references abstracted out), and the generated code
+    evaluates each shape in a loop over the groups' data references.
+    This keeps the size of the generated code (and the time to compile
+    it) independent of the size of the model.
+
+    """
+
+    def __init__(self):
+        self.exprs = []
+        self.data = []
+
+    def slot(self, val):
+        if val.__class__ in native_numeric_types or val is None:
+            return val
+        if val.is_constant():
+            return val()
+        self.exprs.append(val)
+        return (len(self.exprs) - 1,)
+
+    def compile(self, table):
+        """Return (source, groups, refs) for the collected expressions
+
+        `refs` are the :class:`ComponentTable` references to the data
+        passed to ``evaluate(d)``.
+
+        """
+        data_pos = {}
+        shapes = {}
+        for i, expr in enumerate(self.exprs):
+            labeler = _DataLabeler(self.data, data_pos)
+            shape = expr.to_string(smap=SymbolMap(labeler))
+            group = shapes.get(shape, None)
+            if group is None:
+                group = shapes[shape] = [[] for _ in range(len(labeler.args) + 1)]
+            group[0].append(i)
+            for arg, pos in zip(group[1:], labeler.args):
+                arg.append(pos)
+        refs = [table.data(obj) for obj in self.data]
+        source = ['def evaluate(d):', '    ans = [None] * %d' % len(self.exprs)]
+        for j, (shape, group) in enumerate(shapes.items()):
+            source.append(
+                '    for i, %s in zip(*G[%d]):'
+                % (''.join('a%d, ' % k for k in range(len(group) - 1)), j)
+            )
+            source.append('        ans[i] = ' + shape)
+        source.append('    return ans\n')
+        return '\n'.join(source), list(shapes.values()), refs
+
+    def verify(self, evaluate, d):
+        """Check that the generated code reproduces the current values"""
+        computed = evaluate(d)
+        for expr, val in zip(self.exprs, computed):
+            ref = expr()
+            if val != ref and not (val != val and ref != ref):
+                if not math.isclose(val, ref, rel_tol=1e-12):
+                    raise Uncacheable(f"generated code does not reproduce {expr}")
+        return computed
+
+
+def compile_evaluator(source, groups):
+    """Compile the ``evaluate(d)`` function generated by
+    :meth:`SymbolicCoefficients.compile`"""
+    env = {k: v for k, v in math.__dict__.items() if not k.startswith('_')}
+    env['abs'] = abs
+    env['G'] = groups
+    exec(compile(source, '<structure cache>', 'exec'), env)
+    return env['evaluate']
@@ -12,11 +12,18 @@
 
 import pyomo.common.unittest as unittest
 
+import bz2
+import gzip
 import io
 import logging
+import lzma
 import math
+import multiprocessing
 import os
 import re
+import struct
+import subprocess
+import sys
 
 import pyomo.repn.util as repn_util
 import pyomo.repn.plugins.nl_writer as nl_writer
@@ -51,6 +58,113 @@ import pyomo.environ as pyo
 nan = float('nan')
 
 
+def _nl_tokens(nl):
+    """Normalize a text NL file into a list of tokens (numbers as floats)"""
+    lines = nl.splitlines()
+    tokens = [line.split('#')[0].split() for line in lines[:10]]
+    for line in lines[10:]:
+        line = line.split('#')[0].split()
+        if line[0][0].isalpha():
+            tokens.append(line[0][0])
+            line[0] = line[0][1:]
+        tokens.extend(
+            float(t) if t[0].isdigit() or t[0] == '-' else t for t in line if t
+        )
+    return tokens
+
+
+def _binary_nl_tokens(data):
+    """Decode a binary NL file into the tokens returned by _nl_tokens()"""
+    from pyomo.repn.ampl import nl_operators
+
+    lines = data.split(b'\n', 10)
+    tokens = [line.decode().split('#')[0].split() for line in lines[:10]]
+    n_vars, n_cons = map(int, tokens[1][:2])
+    buf = io.BytesIO(lines[10])
+
+    def read(fmt):
+        return struct.unpack('=' + fmt, buf.read(struct.calcsize('=' + fmt)))
+
+    def read_str():
+        (n,) = read('i')
+        return buf.read(n).decode()
+
+    def read_expr():
+        key = buf.read(1).decode()
+        tokens.append(key)
+        if key == 'n':
+            tokens.append(read('d')[0])
+        elif key == 'v':
+            tokens.append(float(read('i')[0]))
+        elif key == 'f':
+            fid, nargs = read('ii')
+            tokens.extend((float(fid), float(nargs)))
+            for i in range(nargs):
+                read_expr()
+        elif key == 'o':
+            (op,) = read('i')
+            tokens.append(float(op))
+            nargs = nl_operators[op][0]
+            if nargs is None:
+                (nargs,) = read('i')
+                tokens.append(float(nargs))
+            for i in range(nargs):
+                read_expr()
+
+    def read_pairs(n, fmt='id'):
+        for i in range(n):
+            tokens.extend(map(float, read(fmt)))
+
+    def read_bounds(n):
+        for i in range(n):
+            _type = buf.read(1).decode()
+            tokens.append(float(_type))
+            fmt = {'0': 'dd', '1': 'd', '2': 'd', '3': '', '4': 'd', '5': 'ii'}[_type]
+            tokens.extend(map(float, read(fmt)))
+
+    while True:
+        key = buf.read(1).decode()
+        if not key:
+            return tokens
+        tokens.append(key)
+        if key in 'CL':
+            tokens.append(float(read('i')[0]))
+            read_expr()
+        elif key == 'O':
+            tokens.extend(map(float, read('ii')))
+            read_expr()
+        elif key == 'V':
+            vals = read('iii')
+            tokens.extend(map(float, vals))
+            read_pairs(vals[1])
+            read_expr()
+        elif key in 'dx':
+            (n,) = read('i')
+            tokens.append(float(n))
+            read_pairs(n)
+        elif key in 'JG':
+            idx, n = read('ii')
+            tokens.extend((float(idx), float(n)))
+            read_pairs(n)
+        elif key == 'k':
+            (n,) = read('i')
+            tokens.append(float(n))
+            tokens.extend(map(float, read(f'{n}i')))
+        elif key == 'r':
+            read_bounds(n_cons)
+        elif key == 'b':
+            read_bounds(n_vars)
+        elif key == 'S':
+            kind, n = read('ii')
+            tokens.extend((float(kind), float(n), read_str()))
+            read_pairs(n, 'id' if kind & 4 else 'ii')
+        elif key == 'F':
+            tokens.extend(map(float, read('iii')))
+            tokens.append(read_str())
+        else:
+            raise ValueError(f"unknown binary NL segment '{key}'")
+
+
 class INFO(object):
     def __init__(self, symbolic=False):
         self.subexpression_cache = {}
@@ -1110,6 +1224,195 @@ class Test_NLWriter(unittest.TestCase):
             re.sub(r'\d\.\d\d\]', '#.##]', LOG.getvalue()),
         )
 
+    @unittest.skipUnless(
+        'fork' in multiprocessing.get_all_start_methods(),
+        "parallel NL writer requires the 'fork' start method",
+    )
+    def test_parallel_workers(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(40)
+        m.x = Var(m.I, bounds=(-10, 10), initialize=1)
+        m.y = Var(m.I, domain=Integers, bounds=(0, 5))
+        m.z = Var(m.I)
+        m.p = Param(m.I, initialize=lambda m, i: i / 3, mutable=True)
+        m.x[3].fix(2)
+        m.e = Expression(expr=m.x[1] ** 2 + m.x[2])
+        m.o = Objective(expr=sum(m.x[i] for i in m.I) + m.e)
+        m.c1 = Constraint(
+            m.I, rule=lambda m, i: m.p[i] * m.x[i] + 2 * m.y[i] - m.z[i] <= 10
+        )
+        m.c2 = Constraint(
+            m.I, rule=lambda m, i: (-1, m.x[i] * m.z[41 - i] + log(m.y[i] + 1), 5)
+        )
+        m.c3 = Constraint(
+            m.I, rule=lambda m, i: m.e + m.z[i] >= i if i == 20 else Constraint.Skip
+        )
+        m.c4 = Constraint(m.I, rule=lambda m, i: m.x[3] * m.p[i] + m.z[i] == 1)
+        m.scaling_factor = Suffix(direction=Suffix.EXPORT)
+        m.scaling_factor[m.c1[5]] = 0.5
+        m.scaling_factor[m.z[7]] = 4
+
+        for symbolic in (False, True):
+            serial = io.StringIO()
+            serial_info = nl_writer.NLWriter().write(
+                m, serial, symbolic_solver_labels=symbolic
+            )
+            parallel = io.StringIO()
+            parallel_info = nl_writer.NLWriter().write(
+                m,
+                parallel,
+                symbolic_solver_labels=symbolic,
+                parallel_workers=3,
+                parallel_shard_size=7,
+            )
+            self.assertEqual(serial.getvalue(), parallel.getvalue())
+            self.assertEqual(serial_info.variables, parallel_info.variables)
+            self.assertEqual(serial_info.constraints, parallel_info.constraints)
+            self.assertEqual(serial_info.scaling, parallel_info.scaling)
+
+    def test_binary_format(self):
+        m = ConcreteModel()
+        m.I = pyo.RangeSet(5)
+        m.x = Var(m.I, bounds=(-10, 10), initialize=lambda m, i: i / 7)
+        m.y = Var(m.I, domain=Integers, bounds=(0, None))
+        m.z = Var(m.I, bounds=(None, 4))
+        m.w = Var(bounds=(2, 2))
+        m.u = Var()
+        m.e = Expression(expr=m.x[1] ** 2 + 3 * m.x[2])
+        m.o = Objective(expr=sum(m.x.values()) + m.e + m.u)
+        m.c1 = Constraint(m.I, rule=lambda m, i: 0.3 * m.x[i] + 2 * m.y[i] <= 10)
+        m.c2 = Constraint(
+            m.I, rule=lambda m, i: (-1, m.x[i] * m.z[i] + log(m.y[i] + 1), 5)
+        )
+        m.c3 = Constraint(expr=m.e + m.z[1] + m.w + m.u >= -1.5)
+        m.c4 = Constraint(expr=m.e * m.z[2] == 1)
+        m.c5 = Constraint(expr=sum(m.z.values()) + m.e == 3)
+        m.priority = Suffix(direction=Suffix.EXPORT, datatype=Suffix.INT)
+        m.priority[m.y[2]] = 5
+        m.dual = Suffix(direction=Suffix.IMPORT_EXPORT)
+        m.dual[m.c1[3]] = 0.25
+        m.scaling_factor = Suffix(direction=Suffix.EXPORT)
+        m.scaling_factor[m.x[4]] = 0.5
+
+        for options in ({}, {'symbolic_solver_labels': True}):
+            text = io.StringIO()
+            text_info = nl_writer.NLWriter().write(m, text, **options)
+            binary = io.BytesIO()
+            binary_info = nl_writer.NLWriter().write(
+                m, binary, nl_format='b', **options
+            )
+            self.assertEqual(text_info.variables, binary_info.variables)
+            self.assertEqual(text_info.constraints, binary_info.constraints)
+            text_tokens = _nl_tokens(text.getvalue())
+            # The header only differs in the format and arith fields
+            text_tokens[0][0] = 'b3'
+            text_tokens[5][2] = '1' if sys.byteorder == 'little' else '2'
+            self.assertEqual(text_tokens, _binary_nl_tokens(binary.getvalue()))
+
+        with self.assertRaisesRegex(ValueError, "must be written to a binary"):
+            nl_writer.NLWriter().write(m, io.StringIO(), nl_format='b')
+
+    def test_binary_format_reference(self):
+        # Reference 'b' file assembled by hand from "Writing .nl Files"
+        # (Gay, 2005): an ASCII header whose arith field records the
+        # byte order (1: little-endian IEEE, 2: big-endian IEEE),
+        # followed by segments of single-character keys and native
+        # 4-byte ints / 8-byte doubles
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 4))
+        m.y = Var(domain=Integers, bounds=(-1, None))
+        m.o = Objective(expr=2 * m.x + m.y)
+        m.c = Constraint(expr=m.x + 3 * m.y <= 5)
+
+        order = '<' if sys.byteorder == 'little' else '>'
+
+        def i(*args):
+            return struct.pack(order + 'i' * len(args), *args)
+
+        def d(*args):
+            return struct.pack(order + 'd' * len(args), *args)
+
+        arith = b'1' if sys.byteorder == 'little' else b'2'
+        ref = (
+            b"b3 1 1 0\t# problem unknown\n"
+            b" 2 1 1 0 0 \t# vars, constraints, objectives, ranges, eqns\n"
+            b" 0 0 0 0 0 0\t# nonlinear constrs, objs; ccons: lin, nonlin, nd, nzlb\n"
+            b" 0 0\t# network constraints: nonlinear, linear\n"
+            b" 0 0 0 \t# nonlinear vars in constraints, objectives, both\n"
+            b" 0 0 " + arith + b" 1\t# linear network variables; functions; "
+            b"arith, flags\n"
+            b" 0 1 0 0 0 \t# discrete variables: binary, integer, nonlinear (b,c,o)\n"
+            b" 2 2 \t# nonzeros in Jacobian, obj. gradient\n"
+            b" 0 0\t# max name lengths: constraints, variables\n"
+            b" 0 0 0 0 0\t# common exprs: b,c,o,c1,o1\n"
+            + (b'C' + i(0) + b'n' + d(0))
+            + (b'O' + i(0, 0) + b'n' + d(0))
+            + (b'x' + i(0))
+            + (b'r' + b'1' + d(5))
+            + (b'b' + b'0' + d(0, 4) + b'2' + d(-1))
+            + (b'k' + i(1, 1))
+            + (b'J' + i(0, 2) + i(0) + d(1) + i(1) + d(3))
+            + (b'G' + i(0, 2) + i(0) + d(2) + i(1) + d(1))
+        )
+        binary = io.BytesIO()
+        nl_writer.NLWriter().write(m, binary, nl_format='b')
+        self.assertEqual(ref, binary.getvalue())
+
+    @unittest.skipUnless(
+        pyo.SolverFactory('ipopt').available(exception_flag=False),
+        "ipopt (an ASL solver) is not available",
+    )
+    def test_binary_format_asl_solve(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], bounds=(0, 4), initialize=1)
+        m.o = Objective(expr=(m.x[1] - 1.5) ** 2 + (m.x[2] - 3) ** 2)
+        m.c = Constraint(expr=m.x[1] + m.x[2] <= 4)
+
+        results = {}
+        with TempfileManager.new_context() as tempfile:
+            tmpdir = tempfile.mkdtemp()
+            for nl_format in ('g', 'b'):
+                stub = os.path.join(tmpdir, nl_format)
+                with open(stub + '.nl', 'w' if nl_format == 'g' else 'wb') as FILE:
+                    nl_writer.NLWriter().write(m, FILE, nl_format=nl_format)
+                subprocess.run(
+                    [pyo.SolverFactory('ipopt').executable(), stub, '-AMPL'],
+                    stdout=subprocess.DEVNULL,
+                    check=True,
+                )
+                with open(stub + '.sol') as FILE:
+                    results[nl_format] = FILE.read().split()[-2:]
+        self.assertEqual(results['g'], results['b'])
+        self.assertAlmostEqual(float(results['b'][0]), 1.25, places=5)
+        self.assertAlmostEqual(float(results['b'][1]), 2.75, places=5)
+
+    def test_compressed_file(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], bounds=(0, 1))
+        m.o = Objective(expr=m.x[1] + 2 * m.x[2])
+        m.c = Constraint(expr=m.x[1] ** 2 + m.x[2] >= 0.5)
+
+        with TempfileManager.new_context() as tempfile:
+            tmpdir = tempfile.mkdtemp()
+            plain = os.path.join(tmpdir, 'plain.nl')
+            m.write(plain, format='nl')
+            with open(plain) as FILE:
+                ref = FILE.read()
+            for compression, module in (('gzip', gzip), ('bz2', bz2), ('lzma', lzma)):
+                fname = os.path.join(tmpdir, f'{compression}.nl')
+                m.write(fname, format='nl', io_options={'compression': compression})
+                with module.open(fname, 'rt') as FILE:
+                    self.assertEqual(ref, FILE.read())
+
+            fname = os.path.join(tmpdir, 'binary.nl.gz')
+            m.write(
+                fname, format='nl', io_options={'compression': 'gzip', 'nl_format': 'b'}
+            )
+            with gzip.open(fname, 'rb') as FILE:
+                data = FILE.read()
+            self.assertTrue(data.startswith(b'b3 1 1 0'))
+            self.assertEqual(_nl_tokens(ref)[10:], _binary_nl_tokens(data)[10:])
+
     def test_linear_constraint_npv_const(self):
         # This tests an error possibly reported by #2810
         m = ConcreteModel()
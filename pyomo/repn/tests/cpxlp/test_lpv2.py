@@ -17,7 +17,7 @@ from pyomo.common.log import LoggingIntercept
 
 import pyomo.environ as pyo
 
-from pyomo.repn.plugins.lp_writer import LPWriter
+from pyomo.repn.plugins.lp_writer import LPWriter, PersistentLPWriter
 
 
 class TestLPv2(unittest.TestCase):
@@ -139,3 +139,84 @@ end
         self.assertEqual(LOG.getvalue(), "")
 
         self.assertEqual(ref, OUT.getvalue())
+
+    def test_persistent_writer(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(3)
+        m.p = pyo.Param(m.I, initialize=lambda m, i: i, mutable=True)
+        m.x = pyo.Var(m.I, bounds=(0, 10))
+        m.y = pyo.Var(domain=pyo.Binary)
+        m.e = pyo.Expression(expr=m.x[1] + m.x[2])
+        m.c = pyo.Constraint(m.I, rule=lambda m, i: m.p[i] * m.x[i] >= i)
+        m.d = pyo.Constraint(expr=m.e + m.y <= 5)
+        m.r = pyo.Constraint(expr=pyo.inequality(-1, m.x[1] - m.x[3], m.p[2]))
+        m.o = pyo.Objective(expr=sum(m.x.values()) + m.y)
+
+        writer = PersistentLPWriter(symbolic_solver_labels=True)
+
+        def check():
+            OUT = StringIO()
+            info = writer.write(m, OUT)
+            REF = StringIO()
+            ref_info = LPWriter().write(m, REF, symbolic_solver_labels=True)
+            self.assertEqual(REF.getvalue(), OUT.getvalue())
+            self.assertEqual(
+                ref_info.symbol_map.bySymbol.keys(), info.symbol_map.bySymbol.keys()
+            )
+            self.assertEqual(
+                ref_info.symbol_map.aliases.keys(), info.symbol_map.aliases.keys()
+            )
+            return OUT.getvalue()
+
+        check()
+        # Mutable param changes in the body and in the bounds
+        m.p[1] = 5
+        m.p[2] = 7
+        check()
+        # Replaced constraint / named expression
+        m.c[3].set_value(m.x[3] + m.y >= 1)
+        m.e.expr = m.x[1] - m.x[2]
+        check()
+        # Added, deactivated, and removed constraints
+        m.c[2].deactivate()
+        m.new = pyo.Constraint(expr=m.x[2] + m.x[3] == 4)
+        check()
+        m.del_component(m.new)
+        m.c[2].activate()
+        check()
+        # Bounds, domains, and objective changes
+        m.x[2].setub(4)
+        m.y.domain = pyo.Integers
+        m.o.sense = pyo.maximize
+        check()
+        # Fixing variables
+        m.x[3].fix(2)
+        self.assertNotIn('x(3)', check())
+        m.x[3].fix(3)
+        check()
+
+        # Labels of removed components are discarded
+        labels = writer._impl.labeler.labels
+        n_labels = len(labels)
+        for i in range(5):
+            m.tmp = pyo.Constraint(expr=m.x[1] + m.x[2] <= i)
+            check()
+            self.assertIn(id(m.tmp), labels)
+            m.del_component(m.tmp)
+            check()
+            self.assertEqual(len(labels), n_labels)
+
+        # Unfixed variables are added back to the end of the column order
+        m.x[3].unfix()
+        OUT = StringIO()
+        writer.write(m, OUT)
+        self.assertIn('c_l_c(3)_:\n+1 y\n+1 x(3)\n>= 1\n', OUT.getvalue())
+        self.assertIn('\n   -inf <= y <= +inf\n   0 <= x(3) <= 10\n', OUT.getvalue())
+
+        # Writing a different model resets the writer
+        m2 = m.clone()
+        OUT = StringIO()
+        writer.write(m2, OUT)
+        REF = StringIO()
+        LPWriter().write(m2, REF, symbolic_solver_labels=True)
+        self.assertEqual(REF.getvalue(), OUT.getvalue())
@@ -10,13 +10,17 @@
 #  ___________________________________________________________________________
 #
 
+import os
+
 import pyomo.common.unittest as unittest
 
 import pyomo.environ as pyo
 
 from pyomo.common.dependencies import numpy as np, scipy_available, numpy_available
 from pyomo.common.log import LoggingIntercept
+from pyomo.common.tempfiles import TempfileManager
 from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+from pyomo.repn.structure_cache import StructureCache
 
 for sol in ['glpk', 'cbc', 'gurobi', 'cplex', 'xpress']:
     linear_solver = pyo.SolverFactory(sol)
@@ -309,3 +313,129 @@ class TestLinearStandardFormCompiler(unittest.TestCase):
         ref = np.array([[1, -1, 0, 5, -5, 0, 0, 0, 0], [-1, 1, 0, 0, 0, -15, 0, 0, 0]])
         self.assertTrue(np.all(repn.c == ref))
         self._verify_solution(soln, repn, True)
+
+    def test_structure_cache(self):
+        def build_model(p, fix_y=False):
+            m = pyo.ConcreteModel()
+            m.I = pyo.RangeSet(4)
+            m.x = pyo.Var(m.I)
+            m.y = pyo.Var()
+            m.z = pyo.Var()
+            m.z.fix(p + 1)
+            if fix_y:
+                m.y.fix(p)
+            m.p = pyo.Param(m.I, initialize=lambda m, i: p * i, mutable=True)
+            m.q = pyo.Param(initialize=p, mutable=True)
+            m.c = pyo.Constraint(
+                m.I, rule=lambda m, i: (m.q, m.p[i] * m.x[i] + m.z * m.y, 10 * m.q)
+            )
+            m.d = pyo.Constraint(expr=sum(m.x.values()) - m.q * m.y == m.z)
+            m.e = pyo.Constraint(expr=(m.q - 1) * m.y + m.x[1] >= pyo.exp(m.q))
+            m.o = pyo.Objective(
+                expr=sum(m.p[i] * m.x[i] for i in m.I) + m.z, sense=pyo.maximize
+            )
+            return m
+
+        def check(repn, ref):
+            self.assertEqual(
+                [(c.name, t) for c, t in repn.rows], [(c.name, t) for c, t in ref.rows]
+            )
+            self.assertEqual(
+                [v.name for v in repn.columns], [v.name for v in ref.columns]
+            )
+            self.assertTrue(np.all(repn.A.toarray() == ref.A.toarray()))
+            self.assertTrue(np.all(np.array(repn.rhs) == np.array(ref.rhs)))
+            self.assertTrue(np.all(repn.c.toarray() == ref.c.toarray()))
+            self.assertTrue(np.all(repn.c_offset == ref.c_offset))
+
+        with TempfileManager.new_context() as tempfile:
+            dname = tempfile.mkdtemp()
+            cache = StructureCache(dname)
+            m = build_model(2)
+            check(
+                LinearStandardFormCompiler().write(m, structure_cache=cache),
+                LinearStandardFormCompiler().write(m),
+            )
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(len(os.listdir(dname)), 1)
+
+            # A new model with the same structure (but different data)
+            # is compiled from the on-disk cache.  Note that q == 1
+            # removes the y term from e.
+            for p in (3, 1):
+                m = build_model(p)
+                ref = LinearStandardFormCompiler().write(m)
+                for options in ({}, {'structure_key': 'model'}):
+                    cache = StructureCache(dname)
+                    repn = LinearStandardFormCompiler().write(
+                        m, structure_cache=cache, **options
+                    )
+                    check(repn, ref)
+                self.assertEqual(len(os.listdir(dname)), 2)
+            self.assertEqual(ref.A.shape, (11, 5))
+
+            # Changing the structure (fixing y) results in a new entry
+            m = build_model(2, fix_y=True)
+            check(
+                LinearStandardFormCompiler().write(m, structure_cache=dname),
+                LinearStandardFormCompiler().write(m),
+            )
+            self.assertEqual(len(os.listdir(dname)), 3)
+
+    def test_templatized_constraints(self):
+        def build_model():
+            m = pyo.ConcreteModel()
+            m.I = pyo.RangeSet(6)
+            m.J = pyo.RangeSet(3)
+            m.p = pyo.Param(m.I, initialize=lambda m, i: i, mutable=True)
+            m.x = pyo.Var(m.I, m.J)
+            m.y = pyo.Var(m.I)
+            m.z = pyo.Var()
+            m.c = pyo.Constraint(
+                m.I,
+                rule=lambda m, i: (
+                    m.p[i],
+                    sum(m.x[i, j] for j in m.J) + 2 * m.y[i],
+                    10,
+                ),
+            )
+            m.d = pyo.ConstraintList()
+            m.d.add(m.z + m.y[1] <= 4)
+            m.e = pyo.Constraint(m.I, rule=lambda m, i: m.y[i] - m.x[i, 1] == m.p[i])
+            m.f = pyo.Constraint(m.I, rule=lambda m, i: m.y[i] + 3 * m.z >= 1)
+            m.g = pyo.Constraint(m.I, rule=lambda m, i: m.x[i, 2] <= 2 * m.p[i])
+            m.o = pyo.Objective(expr=m.z + sum(m.y.values()))
+            return m
+
+        ref_model = build_model()
+        import pyomo.core.base.constraint as constraint_module
+
+        try:
+            constraint_module.TEMPLATIZE_CONSTRAINTS = True
+            m = build_model()
+        finally:
+            constraint_module.TEMPLATIZE_CONSTRAINTS = False
+        self.assertIs(type(m.c[1]), constraint_module.TemplateConstraintData)
+
+        m.g[3].deactivate()
+        ref_model.g[3].deactivate()
+        cache = StructureCache()
+        for options in (
+            {},
+            {'mixed_form': True},
+            {'slack_form': True},
+            {'structure_cache': cache},
+            {'structure_cache': cache},
+        ):
+            ref = LinearStandardFormCompiler().write(ref_model, **options)
+            repn = LinearStandardFormCompiler().write(m, **options)
+            self.assertEqual(
+                [(c.name, t) for c, t in repn.rows], [(c.name, t) for c, t in ref.rows]
+            )
+            self.assertEqual(
+                [v.name for v in repn.columns], [v.name for v in ref.columns]
+            )
+            self.assertTrue(np.all(repn.A.toarray() == ref.A.toarray()))
+            self.assertTrue(np.all(np.array(repn.rhs) == np.array(ref.rhs)))
+            self.assertTrue(np.all(repn.c.toarray() == ref.c.toarray()))
+        self.assertIs(type(m.c[1]), constraint_module.TemplateConstraintData)